@@ -0,0 +1,325 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/activationScriptLib.py    @brief [ FILE   ] - Activation script module.
+## @package mMecoSettings.activationScriptLib       @brief [ MODULE ] - Activation script module.
+#
+#  Scripts in the `script` directory source each other, for instance the Darwin scripts source the Linux ones.
+#  Each `source` is another file open on the shared file system when an env is activated. This module inlines
+#  nested scripts into one generated, self-contained script, which is written to the private temporary directory
+#  of the user, see mMecoSettings.fileSystemLib.getUserTemporaryPath.
+#
+#  Generated scripts only exist on the host they are generated on, so snapshots record them as host-local entries
+#  and generate them again on replay, see mMecoSettings.snapshotLib.HostLocal.
+#
+#  Paths derived from `${BASH_SOURCE%/*}` and `$scriptPath` in the inlined scripts are replaced with the directories
+#  of the original scripts. Name of a generated script contains the hash of the path of its script. Modification
+#  times and sizes of the inlined scripts are written next to it, so it is reused without reading and flattening the
+#  scripts again until one of them changes.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  re
+import  json
+import  hashlib
+
+import  mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Absolute path of the script directory of this package.
+SCRIPT_PATH             = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script'))
+
+#
+## [ dict ] - Keys are tuples of script kind and platform name, values are paths of scripts relative to SCRIPT_PATH.
+SCRIPTS                 = {('entry-point', 'Linux')     : 'shell/mmecosettings-entry-point.sh',
+                           ('entry-point', 'Darwin')    : 'shell/mmecosettings-entry-point.sh',
+                           ('entry-point', 'Windows')   : 'powershell/mmecosettings-entry-point.ps1',
+                           ('pre', 'Linux')             : 'shell/preEnv/mmecosettings-pre-env-linux.sh',
+                           ('pre', 'Darwin')            : 'shell/preEnv/mmecosettings-pre-env-darwin.sh',
+                           ('pre', 'Windows')           : 'powershell/preEnv/mmecosettings-pre-env-windows.ps1',
+                           ('post', 'Linux')            : 'shell/postEnv/mmecosettings-post-env-linux.sh',
+                           ('post', 'Darwin')           : 'shell/postEnv/mmecosettings-post-env-darwin.sh',
+                           ('post', 'Windows')          : 'powershell/postEnv/mmecosettings-post-env-windows.ps1',
+                           ('completion', 'Linux')      : 'shell/mmecosettings-completion.sh',
+                           ('completion', 'Darwin')     : 'shell/mmecosettings-completion.sh'}
+
+#
+## [ re.Pattern ] - Shell `source` or `.` line of a script next to the current one.
+SHELL_SOURCE_PATTERN    = re.compile(r'^\s*(?:source|\.)\s+"\$\{BASH_SOURCE%((?:/\*)+)\}/([^"]+)"\s*;?\s*$')
+
+#
+## [ re.Pattern ] - Shell parameter expansion, which provides a parent directory of the current script.
+SHELL_DIRECTORY_PATTERN = re.compile(r'\$\{BASH_SOURCE%((?:/\*)+)\}')
+
+#
+## [ re.Pattern ] - PowerShell dot-sourcing line of a script relative to `$scriptPath`.
+POWERSHELL_SOURCE_PATTERN = re.compile(r'^\s*\.\s+"\$scriptPath\\([^"]+)"\s*$')
+
+#
+## [ re.Pattern ] - PowerShell assignment of `$scriptPath` from the invocation of the current script.
+POWERSHELL_SCRIPT_PATH_PATTERN = re.compile(r'^(\s*\$Script:scriptPath\s*=\s*).*MyInvocation.*$')
+
+#
+## [ str ] - Extension of the file, which holds the modification times and sizes of the inlined scripts.
+SOURCES_EXTENSION       = '.sources'
+
+#
+## [ dict ] - Keys are tuples of script kind, platform name and directory, values are absolute paths of generated scripts.
+_SCRIPTS                = {}
+
+#
+## @brief Get the directory, which is left after removing given number of path components.
+#
+#  @param path  [ str | None | in  ] - Absolute path of a script.
+#  @param count [ int | None | in  ] - Number of components to remove.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _getParent(path, count):
+
+    for _ in range(count):
+        path = os.path.dirname(path)
+
+    return path
+
+#
+## @brief Flatten given shell script.
+#
+#  @param path    [ str         | None | in  ] - Absolute path of the script.
+#  @param visited [ list of str | None | in  ] - Scripts being flattened, used to detect cycles.
+#  @param sources [ list of str | None | out ] - Absolute paths of the inlined scripts are appended to this list.
+#
+#  @exception IOError - If a script doesn't exist or scripts source each other.
+#
+#  @return list of str - Lines.
+def flattenShellScript(path, visited=None, sources=None):
+
+    visited = list(visited or [])
+    if path in visited:
+        raise IOError('Scripts source each other: {}'.format(path))
+    visited.append(path)
+
+    if sources is not None:
+        sources.append(path)
+
+    with mMecoSettings.fileSystemLib.openFile(path, 'r') as inFile:
+        lines = inFile.read().splitlines()
+
+    result = []
+
+    for line in lines:
+
+        if line.startswith('#!') and len(visited) > 1:
+            continue
+
+        match = SHELL_SOURCE_PATTERN.match(line)
+        if match:
+            directory = _getParent(path, match.group(1).count('/*'))
+            result.extend(flattenShellScript(os.path.join(directory, match.group(2)), visited, sources))
+            continue
+
+        result.append(SHELL_DIRECTORY_PATTERN.sub(lambda x: _getParent(path, x.group(1).count('/*')), line))
+
+    return result
+
+#
+## @brief Flatten given PowerShell script.
+#
+#  @param path    [ str         | None | in  ] - Absolute path of the script.
+#  @param visited [ list of str | None | in  ] - Scripts being flattened, used to detect cycles.
+#  @param sources [ list of str | None | out ] - Absolute paths of the inlined scripts are appended to this list.
+#
+#  @exception IOError - If a script doesn't exist or scripts source each other.
+#
+#  @return list of str - Lines.
+def flattenPowerShellScript(path, visited=None, sources=None):
+
+    visited = list(visited or [])
+    if path in visited:
+        raise IOError('Scripts source each other: {}'.format(path))
+    visited.append(path)
+
+    if sources is not None:
+        sources.append(path)
+
+    with mMecoSettings.fileSystemLib.openFile(path, 'r') as inFile:
+        lines = inFile.read().splitlines()
+
+    directory = os.path.dirname(path)
+    result    = []
+
+    for line in lines:
+
+        match = POWERSHELL_SOURCE_PATTERN.match(line)
+        if match:
+            result.extend(flattenPowerShellScript(os.path.join(directory, *match.group(1).split('\\')), visited, sources))
+            continue
+
+        match = POWERSHELL_SCRIPT_PATH_PATTERN.match(line)
+        if match:
+            result.append('{}"{}"'.format(match.group(1), directory))
+            continue
+
+        result.append(line)
+
+    return result
+
+#
+## @brief Flatten given script.
+#
+#  @param path    [ str         | None | in  ] - Absolute path of a shell or PowerShell script.
+#  @param sources [ list of str | None | out ] - Absolute paths of the inlined scripts are appended to this list.
+#
+#  @exception IOError - If a script doesn't exist or scripts source each other.
+#
+#  @return str - Content.
+def flatten(path, sources=None):
+
+    if path.endswith('.ps1'):
+        return '\n'.join(flattenPowerShellScript(path, sources=sources)) + '\n'
+
+    return '\n'.join(flattenShellScript(path, sources=sources)) + '\n'
+
+#
+## @brief Get modification times and sizes of given scripts.
+#
+#  @param paths [ list of str | None | in  ] - Absolute paths of the scripts.
+#
+#  @exception N/A
+#
+#  @return list of list - Each item is a list of path, modification time and size.
+#  @return None         - If a script doesn't exist anymore.
+def getSourceStates(paths):
+
+    states = []
+
+    for path in paths:
+
+        try:
+            status = mMecoSettings.fileSystemLib.stat(path)
+        except OSError:
+            return None
+
+        states.append([path, status.st_mtime, status.st_size])
+
+    return states
+
+#
+## @brief Determine whether the scripts inlined into given generated script are unchanged.
+#
+#  @param path [ str | None | in  ] - Absolute path of a generated script.
+#
+#  @exception N/A
+#
+#  @return bool - Result, False if the script or its sources file doesn't exist.
+def isUpToDate(path):
+
+    if not mMecoSettings.fileSystemLib.isFile(path):
+        return False
+
+    try:
+        with mMecoSettings.fileSystemLib.openFile(path + SOURCES_EXTENSION, 'r') as inFile:
+            states = json.loads(inFile.read())
+    except (IOError, OSError, ValueError):
+        return False
+
+    return bool(states) and getSourceStates([x[0] for x in states]) == states
+
+#
+## @brief Write given content through a temporary file, which is renamed, so readers never see a partial file.
+#
+#  @param path    [ str | None | in  ] - Absolute path of the file.
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _write(path, content):
+
+    temporaryPath = '{}.{}'.format(path, os.getpid())
+
+    with mMecoSettings.fileSystemLib.openFile(temporaryPath, 'w') as outFile:
+        outFile.write(content)
+
+    try:
+        mMecoSettings.fileSystemLib.rename(temporaryPath, path)
+    except OSError:
+        # Written by another process at the same time
+        mMecoSettings.fileSystemLib.remove(temporaryPath)
+
+#
+## @brief Get the generated script of given kind and platform, the script is generated if it doesn't exist.
+#
+#  Scripts are read and flattened only if one of the inlined scripts has changed since the generated script has been
+#  written.
+#
+#  @param kind         [ str | None | in  ] - Kind of the script, one of the following; entry-point, pre, post, completion.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#  @param directory    [ str | None | in  ] - Absolute path of the directory of the generated scripts, private
+#                                             temporary directory of the user is used if not given.
+#
+#  @exception IOError - If a script doesn't exist or scripts source each other.
+#  @exception OSError - If the private temporary directory of the user can't be used.
+#
+#  @return str - Absolute path of the generated script.
+def getScript(kind, platformName, directory=None):
+
+    key = (kind, platformName, directory)
+
+    path = _SCRIPTS.get(key)
+    if path:
+        return path
+
+    sourcePath  = os.path.join(SCRIPT_PATH, *SCRIPTS[(kind, platformName)].split('/'))
+    name, ext   = os.path.splitext(os.path.basename(sourcePath))
+    directory   = directory or mMecoSettings.fileSystemLib.getUserTemporaryPath()
+    path        = os.path.join(directory, '{}-{}{}'.format(name, hashlib.sha1(sourcePath.encode('utf-8')).hexdigest()[:12], ext))
+
+    if not isUpToDate(path):
+
+        if not mMecoSettings.fileSystemLib.isFile(sourcePath):
+            raise IOError('Script doesn\'t exist: {}'.format(sourcePath))
+
+        sources = []
+        content = flatten(sourcePath, sources)
+
+        if not mMecoSettings.fileSystemLib.isDir(directory):
+            try:
+                mMecoSettings.fileSystemLib.makeDirs(directory)
+            except OSError:
+                # Created by another process
+                pass
+
+        # Script is written first, so a sources file never describes a script, which hasn't been written yet
+        _write(path, content)
+        _write(path + SOURCES_EXTENSION, json.dumps(getSourceStates(sources)))
+
+    _SCRIPTS[key] = path
+
+    return path
@@ -0,0 +1,98 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/appHookLib.py    @brief [ FILE   ] - App hook module.
+## @package mMecoSettings.appHookLib       @brief [ MODULE ] - App hook module.
+#
+#  App hooks set application specific environment in the post-build callback. Hook modules are registered by name
+#  with mMecoSettings.appHookLib.register and imported only when their application is launched, so launching an
+#  application never imports the hooks of the others. No hook is registered by default.
+#
+#  A hook module must implement the following function.
+#
+#  `setEnvironment(allLib, envEntryContainer, appData)`
+#
+#  Runs of the hooks, including the import of the hook modules, are recorded by mMecoSettings.profileLib.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+from    importlib import import_module
+
+import  mMecoSettings.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Name of the function hook modules must implement.
+HOOK_FUNCTION_NAME  = 'setEnvironment'
+
+#
+## [ dict ] - Keys are application names, values are names of the hook modules.
+_HOOKS              = {}
+
+#
+## @brief Register a hook module for given application.
+#
+#  @param application [ str | None | in  ] - Application name such as `maya`.
+#  @param moduleName  [ str | None | in  ] - Name of the hook module such as `mStudioHooks.mayaHookLib`.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def register(application, moduleName):
+
+    _HOOKS[application] = moduleName
+
+#
+## @brief Get names of the hook modules.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are application names, values are names of the hook modules.
+def getHooks():
+
+    return dict(_HOOKS)
+
+#
+## @brief Run the hook of given application.
+#
+#  @param application       [ str                                   | None | in  ] - Application name such as `maya`.
+#  @param allLib            [ mMeco.libs.allLib.All                 | None | in  ] - All libraries.
+#  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+#  @param appData           [ dict                                  | None | in  ] - Content of the app file.
+#
+#  @exception AttributeError - If the hook module doesn't implement mMecoSettings.appHookLib.HOOK_FUNCTION_NAME function.
+#
+#  @return bool - `True` if a hook has been run, `False` if no hook is registered for the application.
+@mMecoSettings.profileLib.profile(detail=lambda application, *args: application)
+def run(application, allLib, envEntryContainer, appData):
+
+    moduleName = _HOOKS.get(application)
+    if not moduleName:
+        return False
+
+    getattr(import_module(moduleName), HOOK_FUNCTION_NAME)(allLib, envEntryContainer, appData)
+
+    return True
@@ -34,6 +34,8 @@ import mFileSystem.jsonFileLib
 import mMecoSettings.enumLib
 import mMecoSettings.envVariablesLib
 import mMecoSettings.exceptionLib
+import mMecoSettings.fileSystemLib
+import mMecoSettings.recordLib
 
 import mMecoPackage.packageLib
 import mMecoPackage.enumLib
@@ -43,6 +45,11 @@ import mMecoPackage.enumLib
 #-----------------------------------------------------------------------------------------------------
 # CODE
 #-----------------------------------------------------------------------------------------------------
+#
+## [ dict ] - Keys are absolute paths of app files, values are tuples of modification time and size and
+#  mMecoSettings.appLib.AppFile instances.
+_CATALOG = {}
+
 #
 ## @brief [ CLASS ] - Operate on Meco App files.
 class AppFile(mFileSystem.jsonFileLib.JSONFile):
@@ -392,7 +399,7 @@ class AppFile(mFileSystem.jsonFileLib.JSONFile):
             raise mMecoSettings.exceptionLib.ValidEnvironmentIsNotError('You must initialize development environment to create a Meco App.')
 
         packagePath = os.path.join(developmentPackagesPath, AppFile.PACKAGE_NAME)
-        if not os.path.isdir(packagePath):
+        if not mMecoSettings.fileSystemLib.isDir(packagePath):
             raise mMecoSettings.exceptionLib.MissingPackageError('You must have {} package in your development environment to create a Meco App.'.format(AppFile.PACKAGE_NAME))
 
         #
@@ -400,8 +407,8 @@ class AppFile(mFileSystem.jsonFileLib.JSONFile):
         _package = mMecoPackage.packageLib.Package(packagePath)
 
         appFilePath = os.path.join(_package.getLocalPath(mMecoPackage.enumLib.PackageFolderStructure.kResourcesApp))
-        if not os.path.isdir(appFilePath):
-            os.makedirs(appFilePath)
+        if not mMecoSettings.fileSystemLib.isDir(appFilePath):
+            mMecoSettings.fileSystemLib.makeDirs(appFilePath)
 
         if not fileName.endswith(AppFile.EXTENSION):
             fileName = '{}.{}'.format(fileName, AppFile.EXTENSION)
@@ -409,10 +416,10 @@ class AppFile(mFileSystem.jsonFileLib.JSONFile):
 
         #
 
-        if os.path.isfile(appFile) and not overwrite:
+        if mMecoSettings.fileSystemLib.isFile(appFile) and not overwrite:
             raise IOError('App file already exists: {}'.format(appFile))
 
-        with open(appFile, 'w') as outFile:
+        with mMecoSettings.fileSystemLib.openFile(appFile, 'w') as outFile:
             json.dump(content, outFile, indent=4)
 
         return self.setFile(appFile)
@@ -440,6 +447,24 @@ class AppFile(mFileSystem.jsonFileLib.JSONFile):
 
         return True
 
+    #
+    ## @brief Determine whether given keyword is in the content of this app file.
+    #
+    #  @param keyword [ str | None | in  ] - Keyword.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def matches(self, keyword):
+
+        return keyword in self._developer or          \
+               keyword in self._description or        \
+               keyword in self._globalEnvClassName or \
+               keyword in self._application or        \
+               keyword in self._folderName or         \
+               keyword in self._version or            \
+               keyword in self._packages
+
     #
     # ------------------------------------------------------------------------------------------------
     # REIMPLEMENTED PUBLIC METHODS
@@ -539,24 +564,90 @@ class AppFile(mFileSystem.jsonFileLib.JSONFile):
     @staticmethod
     def list(keyword=None):
 
+        appFiles = AppFile.listFiles()
+        if appFiles is None:
+            return None
+
+        appFiles = [AppFile._getCached(x) for x in appFiles]
+
+        if keyword:
+            appFiles = [x for x in appFiles if x.matches(keyword)]
+
+        return appFiles
+
+    #
+    ## @brief List absolute paths of Meco app files available in the initialized environment, files are not read.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths.
+    #  @return None        - If app file directory doesn't exist.
+    @staticmethod
+    def listFiles():
+
         directory   = mFileSystem.directoryLib.Directory()
         package     = mMecoPackage.packageLib.Package(os.path.abspath(__file__))
 
         if not directory.setDirectory(package.getLocalPath(mMecoPackage.enumLib.PackageFolderStructure.kResourcesApp)):
             return None
 
-        appFiles = directory.listFilesWithAbsolutePath(ignoreDot=True, extension=AppFile.EXTENSION)
-        appFiles = [AppFile(x) for x in appFiles]
+        return directory.listFilesWithAbsolutePath(ignoreDot=True, extension=AppFile.EXTENSION)
 
-        if keyword:
-            appFiles = [x for x in appFiles if keyword in x.developer() or          \
-                                               keyword in x.description() or        \
-                                               keyword in x.globalEnvClassName() or \
-                                               keyword in x.application() or        \
-                                               keyword in x.folderName() or         \
-                                               keyword in x.version() or            \
-                                               keyword in x.packages()
-                        ]
+    #
+    ## @brief Iterate records of Meco app files available in the initialized environment.
+    #
+    #  Records are yielded one by one as each app file is resolved. App files are only read if a keyword is given or
+    #  fields other than mMecoSettings.recordLib.FILE_FIELDS are requested.
+    #
+    #  @param keyword [ str         | None | in  ] - Keyword to filter the app files.
+    #  @param fields  [ list of str | None | in  ] - Field names, all fields in mMecoSettings.recordLib.FIELDS are used if not given.
+    #
+    #  @exception N/A
+    #
+    #  @return generator - Each item is a record, see mMecoSettings.recordLib.getRecord.
+    @staticmethod
+    def iterRecords(keyword=None, fields=None):
 
-        return appFiles
+        fields      = fields or list(mMecoSettings.recordLib.FIELDS)
+        readContent = bool(keyword) or mMecoSettings.recordLib.requiresContent(fields)
+
+        for absFile in AppFile.listFiles() or []:
+
+            appFile = None
+
+            if readContent:
+                appFile = AppFile._getCached(absFile)
+                if keyword and not appFile.matches(keyword):
+                    continue
+
+            yield mMecoSettings.recordLib.getRecord(absFile, fields, appFile)
+
+    #
+    ## @brief Get app file instance of given path, cached instance is used unless the file has changed.
+    #
+    #  Long running processes, such as mMecoSettings.daemonLib, list the app files many times, so app files are
+    #  only read again once their modification time or size changes.
+    #
+    #  @param absFile [ str | None | in  ] - Absolute path of a Meco App file.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoSettings.appLib.AppFile - App file.
+    @staticmethod
+    def _getCached(absFile):
+
+        try:
+            fileStat = mMecoSettings.fileSystemLib.stat(absFile)
+            stamp    = (fileStat.st_mtime, fileStat.st_size)
+        except OSError:
+            return AppFile(absFile)
+
+        cached = _CATALOG.get(absFile)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        appFile = AppFile(absFile)
+        _CATALOG[absFile] = (stamp, appFile)
+
+        return appFile
 
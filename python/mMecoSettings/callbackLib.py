@@ -28,14 +28,27 @@
 import  os
 import  sys
 import  json
-import  argparse
+import  types
 
 from    importlib import import_module
 
 import  mMeco.libs.aboutLib
 
+import  mMecoSettings.activationScriptLib
+import  mMecoSettings.appHookLib
+import  mMecoSettings.completionLib
+import  mMecoSettings.envDeltaLib
+import  mMecoSettings.envViewLib
 import  mMecoSettings.envVariablesLib
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.flagLib
+import  mMecoSettings.importIndexLib
+import  mMecoSettings.logLib
+import  mMecoSettings.packageGlobalEnvLib
+import  mMecoSettings.profileLib
 import  mMecoSettings.settingsLib
+import  mMecoSettings.snapshotLib
+import  mMecoSettings.stepLib
 
 
 #
@@ -51,26 +64,44 @@ import  mMecoSettings.settingsLib
 #  @exception N/A
 #
 #  @return None - None.
+@mMecoSettings.profileLib.profile
 def getPreBuild(allLib, envEntryContainer):
-    
-    envPreScriptPath = None
 
-    if allLib.request().platform() == 'Linux':
+    # PROFILE
+    # `MECO_PROFILE` and the `--profile` flag given to the process have started profiling when mMecoSettings.profileLib
+    # was imported, the flag of a request, which isn't in the arguments of the process, starts it here
+    if mMecoSettings.profileLib.isRequested(flags=mMecoSettings.flagLib.getFlags(allLib)):
+        mMecoSettings.profileLib.start()
 
-        envPreScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'shell', 'preEnv', 'meco-env-pre-linux.sh'))
+    # IMPORT INDEX, ENV VIEW
+    # Packages accepted by a previous build in the same process mustn't end up in this one
+    mMecoSettings.importIndexLib.clearPackages()
 
-    elif allLib.request().platform() == 'Darwin':
+    if mMecoSettings.envDeltaLib.isEnabled():
+        envEntryContainer = mMecoSettings.envDeltaLib.getContainer(allLib, envEntryContainer)
 
-        envPreScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'shell', 'preEnv', 'mmecosettings-pre-env-darwin.sh'))
+    # ENV VIEW
+    # Executables and libraries are collected in an env view by the post-build callback, see mMecoSettings.envViewLib
+    mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(mMecoSettings.envViewLib.isEnabled(platformName=allLib.request().platform()))
 
-    elif allLib.request().platform() == 'Windows':
+    # SNAPSHOT
+    snapshot = mMecoSettings.snapshotLib.getLoadedSnapshot(allLib.request().platform())
+    if snapshot:
+        snapshot.replay(mMecoSettings.snapshotLib.Stage.kPreBuild, envEntryContainer, lambda key: _getHostLocalValue(allLib, key))
+        envEntryContainer.sort()
+        return
 
-        envPreScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'powershell', 'preEnv', 'mmecosettings-pre-env-windows.ps1'))
+    envEntryContainer = mMecoSettings.snapshotLib.record(mMecoSettings.snapshotLib.Stage.kPreBuild,
+                                                         envEntryContainer,
+                                                         allLib.request().platform())
 
-    if envPreScriptPath and not os.path.isfile(envPreScriptPath):
-        raise IOError('Pre script doesn\'t exist: {}'.format(envPreScriptPath))
+    # Nested scripts are inlined into one generated script, see mMecoSettings.activationScriptLib
+    envPreScriptPath = mMecoSettings.activationScriptLib.getScript('pre', allLib.request().platform())
 
-    envEntryContainer.addScript(envPreScriptPath)
+    mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                           mMecoSettings.snapshotLib.HostLocal.kPreScriptPath,
+                                           mMecoSettings.snapshotLib.EntryKind.kScript,
+                                           envPreScriptPath)
 
     #
 
@@ -95,47 +126,93 @@ def getPreBuild(allLib, envEntryContainer):
 #  @exception N/A
 #
 #  @return None - None.
+@mMecoSettings.profileLib.profile
 def getPostBuild(allLib, envEntryContainer):
 
-    envPostScriptPath = None
-
-    if allLib.request().platform() == 'Linux':
-
-        envPostScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'shell', 'postEnv', 'mmecosettings-post-env-linux.sh'))
-
-    elif allLib.request().platform() == 'Darwin':
-
-        envPostScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'shell', 'postEnv', 'mmecosettings-post-env-darwin.sh'))
-
-    elif allLib.request().platform() == 'Windows':
-
-        envPostScriptPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'script', 'powershell', 'postEnv', 'mmecosettings-post-env-windows.ps1'))
-
-    if envPostScriptPath and not os.path.isfile(envPostScriptPath):
-        raise IOError('Post script doesn\'t exist: {}'.format(envPostScriptPath))
+    # Threads of the step runners aren't needed once the environment is built
+    try:
+        _getPostBuild(allLib, envEntryContainer)
+    finally:
+        mMecoSettings.stepLib.closeThreadPool()
 
-    envEntryContainer.addScript(envPostScriptPath)
+#
+## @brief Add the entries of getPostBuild.
+#
+#  @param allLib                [ mMeco.libs.allLib.All                    | None | in  ] - All libraries.
+#  @param envEntryContainer     [ mMeco.libs.entryLib.EnvEntryContainer    | None | in  ] - Env entry container.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _getPostBuild(allLib, envEntryContainer):
+
+    deltaEnvEntryContainer = None
+
+    # Only emit the changes when switching environments in the same shell
+    if mMecoSettings.envDeltaLib.isEnabled():
+        deltaEnvEntryContainer = mMecoSettings.envDeltaLib.getContainer(allLib, envEntryContainer)
+        envEntryContainer      = deltaEnvEntryContainer
+
+    # SNAPSHOT
+    snapshot = mMecoSettings.snapshotLib.getLoadedSnapshot(allLib.request().platform())
+    if snapshot:
+        snapshot.replay(mMecoSettings.snapshotLib.Stage.kPostBuild, envEntryContainer, lambda key: _getHostLocalValue(allLib, key))
+
+        if deltaEnvEntryContainer:
+            deltaEnvEntryContainer.finalize()
+
+        envEntryContainer.sort()
+        return
+
+    envEntryContainer = mMecoSettings.snapshotLib.record(mMecoSettings.snapshotLib.Stage.kPostBuild,
+                                                         envEntryContainer,
+                                                         allLib.request().platform())
+
+    # Independent file system operations are run at the same time, see mMecoSettings.stepLib
+    # Entries are added afterwards in a fixed order so the output doesn't depend on the order the steps finish
+    # allLib isn't thread-safe, steps only get the values read from it here
+    # Paths are only string operations, they are looked up here as a step would cost more than the look up
+    platformName         = allLib.request().platform()
+    appFilePath          = allLib.settingsOperator().appFilePath()
+    completionIndexArgs  = (allLib.settingsOperator().projectNameInUse(),
+                            allLib.request().developer(),
+                            allLib.request().development(),
+                            allLib.request().stage(),
+                            platformName)
+
+    stepRunner = mMecoSettings.stepLib.StepRunner()
+    stepRunner.add('envPostScriptPath', lambda: mMecoSettings.activationScriptLib.getScript('post', platformName))
+    stepRunner.add('version', mMeco.libs.aboutLib.getVersion)
+    stepRunner.add('appData', lambda: _readAppFile(appFilePath))
+    stepRunner.add('completionIndex', lambda: _writeCompletionIndex(*completionIndexArgs))
+
+    results = stepRunner.run()
+
+    envPostScriptPath = results['envPostScriptPath']
+    paths             = _getPaths(allLib)
+
+    completionIndexFilePath, completionIndexError = results['completionIndex']
+    if completionIndexError:
+        allLib.logger().addFailure(completionIndexError)
+
+    mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                           mMecoSettings.snapshotLib.HostLocal.kPostScriptPath,
+                                           mMecoSettings.snapshotLib.EntryKind.kScript,
+                                           envPostScriptPath)
 
     #
 
     #
     # CUSTOM ARGUMENTS
-    argumentParser = argparse.ArgumentParser()
-
-    if allLib.request().platform() == 'Windows':
-        argumentParser.add_argument('-custom-flag', action='store_true', default=False)
-    else:
-        argumentParser.add_argument('--custom-flag', action='store_true', default=False)
-
-    knownArgs, unknownArgs = argumentParser.parse_known_args(allLib.request().unknownArgs())
-    customFlag = knownArgs.custom_flag
+    # Flags are registered in mMecoSettings.flagLib and parsed once per request
+    customFlag = mMecoSettings.flagLib.getFlags(allLib).custom_flag
 
 
     #
 
     # MECO
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_ES_VERSION,
-                           mMeco.libs.aboutLib.getVersion())
+                           results['version'])
 
     if allLib.request().platform() == 'Windows':
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_ES_COMMAND,
@@ -146,8 +223,11 @@ def getPostBuild(allLib, envEntryContainer):
 
 
     # PYTHON
-    envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PYTHON_EXECUTABLE_PATH,
-                           sys.executable)
+    mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                           mMecoSettings.snapshotLib.HostLocal.kPythonExecutablePath,
+                                           mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                           mMecoSettings.envVariablesLib.MECO_PYTHON_EXECUTABLE_PATH,
+                                           sys.executable)
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PYTHON_VERSION,
                            allLib.request().pythonVersion())
@@ -167,9 +247,7 @@ def getPostBuild(allLib, envEntryContainer):
 
         # Reserved packages path
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_RESERVED_PACKAGES_PATH,
-                               mMecoSettings.settingsLib.getReservedPackagesPath(allLib.request().developer(),
-                                                                                 allLib.request().platform()
-                                                                                 ))
+                               paths[mMecoSettings.envVariablesLib.MECO_RESERVED_PACKAGES_PATH])
 
     else:
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_RESERVED_ENV_NAME, '')
@@ -186,11 +264,7 @@ def getPostBuild(allLib, envEntryContainer):
 
         # Env packages path
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH,
-                               mMecoSettings.settingsLib.getDevelopmentPackagesPath(allLib.settingsOperator().projectNameInUse(),
-                                                                                    allLib.request().developer(),
-                                                                                    allLib.request().development(),
-                                                                                    allLib.request().platform()
-                                                                                    ))
+                               paths[mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH])
 
     else:
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_ENV_NAME, '')
@@ -207,11 +281,7 @@ def getPostBuild(allLib, envEntryContainer):
 
         # Env packages path
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_STAGE_PACKAGES_PATH,
-                               mMecoSettings.settingsLib.getStagePackagesPath(allLib.settingsOperator().projectNameInUse(),
-                                                                              allLib.request().developer(),
-                                                                              allLib.request().stage(),
-                                                                              allLib.request().platform()
-                                                                              ))
+                               paths[mMecoSettings.envVariablesLib.MECO_STAGE_PACKAGES_PATH])
 
     else:
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_STAGE_ENV_NAME, '')
@@ -224,20 +294,16 @@ def getPostBuild(allLib, envEntryContainer):
                            allLib.settingsOperator().projectNameInUse())
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PROJECT_INTERNAL_PACKAGES_PATH,
-                           mMecoSettings.settingsLib.getProjectInternalPackagesPath(allLib.settingsOperator().projectNameInUse(),
-                                                                                    allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_PROJECT_INTERNAL_PACKAGES_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PROJECT_EXTERNAL_PACKAGES_PATH,
-                           mMecoSettings.settingsLib.getProjectExternalPackagesPath(allLib.settingsOperator().projectNameInUse(),
-                                                                                    allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_PROJECT_EXTERNAL_PACKAGES_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PROJECT_PATH,
-                           mMecoSettings.settingsLib.getProjectsPath(allLib.request().platform(),
-                                                                     allLib.settingsOperator().projectNameInUse()))
+                           paths[mMecoSettings.envVariablesLib.MECO_PROJECT_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_PROJECT_ROOT_PATH,
-                           mMecoSettings.settingsLib.getProjectRootPath(allLib.request().platform(),
-                                                                        allLib.settingsOperator().projectNameInUse()))
+                           paths[mMecoSettings.envVariablesLib.MECO_PROJECT_ROOT_PATH])
 
     #
 
@@ -255,18 +321,16 @@ def getPostBuild(allLib, envEntryContainer):
 
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_INTERNAL_PACKAGES_PATH,
-                           mMecoSettings.settingsLib.getProjectInternalPackagesPath(mMecoSettings.settingsLib.MASTER_PROJECT_NAME,
-                                                                                    allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_INTERNAL_PACKAGES_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_EXTERNAL_PACKAGES_PATH,
-                           mMecoSettings.settingsLib.getProjectExternalPackagesPath(mMecoSettings.settingsLib.MASTER_PROJECT_NAME,
-                                                                                    allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_EXTERNAL_PACKAGES_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_PATH,
-                           mMecoSettings.settingsLib.getProjectsPath(allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_PATH])
 
     envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_ROOT_PATH,
-                           mMecoSettings.settingsLib.getProjectRootPath(allLib.request().platform()))
+                           paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_ROOT_PATH])
 
 
     # ENV
@@ -284,29 +348,10 @@ def getPostBuild(allLib, envEntryContainer):
 
         #
 
-        envFile = open(allLib.settingsOperator().appFilePath(), 'r')
-        envData = json.loads(envFile.read())
-        envFile.close()
-
-        if envData['application'] == 'houdini':
-
-            pass
-
-        elif envData['application'] == 'katana':
-
-            pass
+        envData = results['appData']
 
-        elif envData['application'] == 'mari':
-
-            pass
-
-        elif envData['application'] == 'maya':
-
-            pass
-
-        elif envData['application'] == 'nuke':
-
-            pass
+        # Hook of the application is imported only when it is launched, see mMecoSettings.appHookLib
+        mMecoSettings.appHookLib.run(envData['application'], allLib, envEntryContainer, envData)
 
     else:
 
@@ -315,12 +360,65 @@ def getPostBuild(allLib, envEntryContainer):
 
 
     if allLib.settingsOperator().logFilePath():
-        envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_ENV_LOG_FILE_PATH,
-                               allLib.settingsOperator().logFilePath())
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kLogFilePath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               mMecoSettings.envVariablesLib.MECO_ENV_LOG_FILE_PATH,
+                                               allLib.settingsOperator().logFilePath())
     else:
         envEntryContainer.addSingle(mMecoSettings.envVariablesLib.MECO_ENV_LOG_FILE_PATH,
                                '')
 
+    # IMPORT INDEX
+    # Sessions resolve top-level modules of the initialized packages with one lookup, see mMecoSettings.importIndexLib
+    if mMecoSettings.importIndexLib.isEnabled():
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kImportIndexFilePath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               mMecoSettings.envVariablesLib.MECO_IMPORT_INDEX_FILE_PATH,
+                                               _writeImportIndex())
+
+    # ENV VIEW
+    # PATH and library path get one entry each, see mMecoSettings.envViewLib
+    if mMecoSettings.envViewLib.isEnabled(platformName=allLib.request().platform()):
+
+        envView = _buildEnvView()
+
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kEnvViewBinPath,
+                                               mMecoSettings.snapshotLib.EntryKind.kMulti,
+                                               'PATH',
+                                               envView.binPath())
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kEnvViewLibPath,
+                                               mMecoSettings.snapshotLib.EntryKind.kMulti,
+                                               mMecoSettings.envViewLib.getLibraryPathName(allLib.request().platform()),
+                                               envView.libPath())
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kEnvViewPath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               mMecoSettings.envVariablesLib.MECO_ENV_VIEW_PATH,
+                                               envView.path())
+
+        report = mMecoSettings.envViewLib.getReport(envView)
+        if report and allLib.settingsOperator().logFilePath():
+            mMecoSettings.logLib.append(allLib.settingsOperator().logFilePath(), '\n'.join(report) + '\n')
+
+    # COMPLETION
+    # Shell completion reads the index without starting an interpreter, see mMecoSettings.completionLib
+    if completionIndexFilePath:
+
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kCompletionIndexFilePath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               mMecoSettings.envVariablesLib.MECO_COMPLETION_INDEX_FILE_PATH,
+                                               completionIndexFilePath)
+
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kCompletionScriptPath,
+                                               mMecoSettings.snapshotLib.EntryKind.kScript,
+                                               mMecoSettings.activationScriptLib.getScript('completion', allLib.request().platform()))
+
     # CHANGE DIRECTORY
     if allLib.settingsOperator().developmentPackagesPath():
         if allLib.request().platform() == 'Windows':
@@ -334,6 +432,13 @@ def getPostBuild(allLib, envEntryContainer):
         else:
             envEntryContainer.addCommand('cd "${}";'.format(mMecoSettings.envVariablesLib.MECO_STAGE_PACKAGES_PATH))
 
+    # DELTA
+    if deltaEnvEntryContainer:
+        deltaEnvEntryContainer.finalize()
+
+    # SNAPSHOT
+    mMecoSettings.snapshotLib.export()
+
 
     envEntryContainer.sort()
 
@@ -351,9 +456,7 @@ def getAppExecutableFlags(allLib):
     if not allLib.settingsOperator().appFilePath():
         return None
 
-    _appFile = open(allLib.settingsOperator().appFilePath(), 'r')
-    appData  = json.loads(_appFile.read())
-    _appFile.close()
+    appData = _readAppFile(allLib.settingsOperator().appFilePath())
 
     if not 'application' in appData:
         return None
@@ -390,6 +493,85 @@ def getAppExecutableFlags(allLib):
 
     return None
 
+#
+## @brief Get the value of a host-local snapshot entry on this host.
+#
+#  This function is used to replay snapshots exported on other hosts, see mMecoSettings.snapshotLib.HostLocal.
+#  Generated scripts, indices and the env view are generated again on this host. Import index and env view are built
+#  from the packages accepted by mMecoSettings.callbackLib.shouldInitializePackage, whose decisions are taken from
+#  the snapshot.
+#
+#  @param allLib [ mMeco.libs.allLib.All | None | in  ] - All libraries.
+#  @param key    [ str                   | None | in  ] - Key, see mMecoSettings.snapshotLib.HostLocal.
+#
+#  @exception N/A
+#
+#  @return str  - Value.
+#  @return None - If the key is unknown.
+def _getHostLocalValue(allLib, key):
+
+    platformName = allLib.request().platform()
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kPythonExecutablePath:
+        return sys.executable
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kLogFilePath:
+        return allLib.settingsOperator().logFilePath()
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kPreScriptPath:
+        return mMecoSettings.activationScriptLib.getScript('pre', platformName)
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kPostScriptPath:
+        return mMecoSettings.activationScriptLib.getScript('post', platformName)
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kCompletionScriptPath:
+        return mMecoSettings.activationScriptLib.getScript('completion', platformName)
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kCompletionIndexFilePath:
+        completionIndexFilePath, completionIndexError = _writeCompletionIndex(allLib.settingsOperator().projectNameInUse(),
+                                                                              allLib.request().developer(),
+                                                                              allLib.request().development(),
+                                                                              allLib.request().stage(),
+                                                                              platformName)
+        if completionIndexError:
+            allLib.logger().addFailure(completionIndexError)
+
+        return completionIndexFilePath
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kImportIndexFilePath:
+        return _writeImportIndex()
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kEnvViewPath:
+        return _buildEnvView().path()
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kEnvViewBinPath:
+        return _buildEnvView().binPath()
+
+    if key == mMecoSettings.snapshotLib.HostLocal.kEnvViewLibPath:
+        return _buildEnvView().libPath()
+
+    return None
+
+#
+## @brief Write the import index of the packages accepted by mMecoSettings.callbackLib.shouldInitializePackage.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the index file.
+def _writeImportIndex():
+
+    return mMecoSettings.importIndexLib.write(mMecoSettings.importIndexLib.build(mMecoSettings.importIndexLib.getPackages()))
+
+#
+## @brief Build the env view of the packages accepted by mMecoSettings.callbackLib.shouldInitializePackage.
+#
+#  @exception OSError - If the private temporary directory of the user can't be used.
+#
+#  @return mMecoSettings.envViewLib.EnvView - Env view.
+def _buildEnvView():
+
+    return mMecoSettings.envViewLib.build(mMecoSettings.envViewLib.getPathOrder(mMecoSettings.importIndexLib.getPackages()))
+
 #
 ## @brief This function determines whether given package should be initialized.
 #
@@ -399,8 +581,45 @@ def getAppExecutableFlags(allLib):
 #  @exception N/A
 #
 #  @return bool - `True` if the package should be initialized, `False` otherwise.
+@mMecoSettings.profileLib.profile(detail=lambda allLib, packagePath: os.path.basename(packagePath))
 def shouldInitializePackage(allLib, packagePath):
 
+    result = None
+
+    # Decisions are taken from the loaded snapshot without touching the file system
+    snapshot = mMecoSettings.snapshotLib.getLoadedSnapshot(allLib.request().platform())
+    if snapshot:
+        result = snapshot.package(packagePath)
+
+    if result is None:
+
+        result = _shouldInitializePackage(allLib, packagePath)
+
+        snapshot = mMecoSettings.snapshotLib.getExportSnapshot()
+        if snapshot:
+            snapshot.addPackage(packagePath, result)
+
+    # IMPORT INDEX, ENV VIEW
+    # Accepted packages are only collected when the import index or the env view is built from them
+    if result and (mMecoSettings.importIndexLib.isEnabled() or
+                   mMecoSettings.envViewLib.isEnabled(platformName=allLib.request().platform())):
+        mMecoSettings.importIndexLib.addPackage(packagePath)
+
+    return result
+
+#
+## @brief Determine whether given package should be initialized by checking its package info module.
+#
+#  This function is used by mMecoSettings.callbackLib.shouldInitializePackage function.
+#
+#  @param allLib         [ mMeco.libs.allLib.All | None | in  ] - All libraries.
+#  @param packagePath    [ str                   | None | in  ] - Absolute path of the root of a package.
+#
+#  @exception N/A
+#
+#  @return bool - `True` if the package should be initialized, `False` otherwise.
+def _shouldInitializePackage(allLib, packagePath):
+
     if not hasattr(sys, 'argv'):
         sys.argv  = ['']
 
@@ -410,7 +629,7 @@ def shouldInitializePackage(allLib, packagePath):
     packagePythonPath         = os.path.join(packagePath, 'python')
     packageInfoModuleFilePath = os.path.join(packagePath, 'python', packageName, 'packageInfoLib.py')
 
-    if not os.path.isdir(packagePythonPath) or not  os.path.isfile(packageInfoModuleFilePath):
+    if not mMecoSettings.fileSystemLib.isDir(packagePythonPath) or not mMecoSettings.fileSystemLib.isFile(packageInfoModuleFilePath):
         return False
 
     #
@@ -419,12 +638,19 @@ def shouldInitializePackage(allLib, packagePath):
     packageInfoModule    = None
     pathAdded            = False
 
+    # Modules, which were loaded before, for instance mMecoSettings itself, are restored afterwards
+    moduleNames          = ['packageInfoLib', packageName, packageInfoModuleStr]
+    modules              = dict((x, sys.modules[x]) for x in moduleNames if x in sys.modules)
+
     if not packagePythonPath in sys.path:
         sys.path.insert(0, packagePythonPath)
         pathAdded = True
 
     try:
-        packageInfoModule = import_module(packageInfoModuleStr)
+        if mMecoSettings.fileSystemLib.isInMemory():
+            packageInfoModule = _loadPackageInfoModule(packageInfoModuleStr, packageInfoModuleFilePath)
+        else:
+            packageInfoModule = import_module(packageInfoModuleStr)
 
         # Do not initialize this package if it is not active
         if hasattr(packageInfoModule, 'IS_ACTIVE'):
@@ -453,13 +679,17 @@ def shouldInitializePackage(allLib, packagePath):
         allLib.logger().addFailure(str(error))
         return False
 
+    # Modules are removed for rejected packages too, otherwise other versions of the package would get them
+    finally:
 
-    for module in ['packageInfoLib', packageName, packageInfoModuleStr]:
-        if module in sys.modules:
-            del sys.modules[module]
+        for module in moduleNames:
+            if module in modules:
+                sys.modules[module] = modules[module]
+            elif module in sys.modules:
+                del sys.modules[module]
 
-    if pathAdded:
-        del sys.path[0]
+        if pathAdded and packagePythonPath in sys.path:
+            sys.path.remove(packagePythonPath)
 
 
     #
@@ -481,9 +711,7 @@ def shouldInitializePackage(allLib, packagePath):
     appFileApplication = None
     if allLib.settingsOperator().appFilePath():
         # Application provided by the user so get the name of it
-        _appFile = open(allLib.settingsOperator().appFilePath(), 'r')
-        appData  = json.loads(_appFile.read())
-        _appFile.close()
+        appData = _readAppFile(allLib.settingsOperator().appFilePath())
         if 'application' in appData:
             appFileApplication = appData['application']
 
@@ -500,3 +728,122 @@ def shouldInitializePackage(allLib, packagePath):
 
     return True
 
+#
+## @brief Load a package info module through the file system in use instead of importing it.
+#
+#  Used when the file system is in memory, see mMecoSettings.fileSystemLib.isInMemory, so package info modules are
+#  never read from the disk. Module is executed in a new namespace and is not added to `sys.modules`.
+#
+#  @param moduleName [ str | None | in  ] - Module name.
+#  @param filePath   [ str | None | in  ] - Absolute path of the package info module.
+#
+#  @exception IOError - If the module can't be read.
+#
+#  @return module - Module.
+def _loadPackageInfoModule(moduleName, filePath):
+
+    with mMecoSettings.fileSystemLib.openFile(filePath, 'r') as inFile:
+        source = inFile.read()
+
+    module          = types.ModuleType(moduleName)
+    module.__file__ = filePath
+
+    exec(compile(source, filePath, 'exec'), module.__dict__)
+
+    return module
+
+#
+## @brief Read given app file.
+#
+#  @param appFilePath [ str | None | in  ] - Absolute path of an app file.
+#
+#  @exception N/A
+#
+#  @return dict - App data, empty if no app file is given.
+def _readAppFile(appFilePath):
+
+    if not appFilePath:
+        return {}
+
+    appFile = mMecoSettings.fileSystemLib.openFile(appFilePath, 'r')
+    appData = json.loads(appFile.read())
+    appFile.close()
+
+    return appData
+
+#
+## @brief Get the paths of the environment.
+#
+#  @param allLib [ mMeco.libs.allLib.All | None | in  ] - All libraries.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are env variable names, values are the paths.
+def _getPaths(allLib):
+
+    platformName   = allLib.request().platform()
+    projectName    = allLib.settingsOperator().projectNameInUse()
+    developer      = allLib.request().developer()
+    development    = allLib.request().development()
+    stage          = allLib.request().stage()
+    masterName     = mMecoSettings.settingsLib.MASTER_PROJECT_NAME
+    paths          = {}
+
+    if allLib.settingsOperator().reservedPackagesPath():
+        paths[mMecoSettings.envVariablesLib.MECO_RESERVED_PACKAGES_PATH] = \
+            mMecoSettings.settingsLib.getReservedPackagesPath(developer, platformName)
+
+    if development:
+        paths[mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH] = \
+            mMecoSettings.settingsLib.getDevelopmentPackagesPath(projectName, developer, development, platformName)
+
+    if stage:
+        paths[mMecoSettings.envVariablesLib.MECO_STAGE_PACKAGES_PATH] = \
+            mMecoSettings.settingsLib.getStagePackagesPath(projectName, developer, stage, platformName)
+
+    # PROJECT
+    paths[mMecoSettings.envVariablesLib.MECO_PROJECT_INTERNAL_PACKAGES_PATH] = \
+        mMecoSettings.settingsLib.getProjectInternalPackagesPath(projectName, platformName)
+    paths[mMecoSettings.envVariablesLib.MECO_PROJECT_EXTERNAL_PACKAGES_PATH] = \
+        mMecoSettings.settingsLib.getProjectExternalPackagesPath(projectName, platformName)
+    paths[mMecoSettings.envVariablesLib.MECO_PROJECT_PATH] = \
+        mMecoSettings.settingsLib.getProjectsPath(platformName, projectName)
+    paths[mMecoSettings.envVariablesLib.MECO_PROJECT_ROOT_PATH] = \
+        mMecoSettings.settingsLib.getProjectRootPath(platformName, projectName)
+
+    # MASTER PROJECT
+    paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_INTERNAL_PACKAGES_PATH] = \
+        mMecoSettings.settingsLib.getProjectInternalPackagesPath(masterName, platformName)
+    paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_EXTERNAL_PACKAGES_PATH] = \
+        mMecoSettings.settingsLib.getProjectExternalPackagesPath(masterName, platformName)
+    paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_PATH] = \
+        mMecoSettings.settingsLib.getProjectsPath(platformName)
+    paths[mMecoSettings.envVariablesLib.MECO_MASTER_PROJECT_ROOT_PATH] = \
+        mMecoSettings.settingsLib.getProjectRootPath(platformName)
+
+    return paths
+
+#
+## @brief Write the completion index of the environment.
+#
+#  This function is run as a step, errors are returned so they are logged by the caller.
+#
+#  @param projectName  [ str | None | in  ] - Project name.
+#  @param developer    [ str | None | in  ] - Developer name.
+#  @param development  [ str | None | in  ] - Development env name.
+#  @param stage        [ str | None | in  ] - Stage env name.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return tuple - Absolute path of the index file or None if shell completion is not supported on the platform or
+#                  the index couldn't be written, and the error message or None.
+def _writeCompletionIndex(projectName, developer, development, stage, platformName):
+
+    if not ('completion', platformName) in mMecoSettings.activationScriptLib.SCRIPTS:
+        return None, None
+
+    try:
+        return mMecoSettings.completionLib.update(projectName, developer, development, stage, platformName), None
+    except (IOError, OSError) as error:
+        return None, str(error)
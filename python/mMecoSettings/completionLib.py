@@ -0,0 +1,348 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/completionLib.py    @brief [ FILE   ] - Completion module.
+## @package mMecoSettings.completionLib       @brief [ MODULE ] - Completion module.
+#
+#  Shell completion functions in `script/shell/mmecosettings-completion.sh` never start an interpreter, they read
+#  a plain text index written by the post-build callback. Each line of the index is a kind and a name separated
+#  by a space, for instance;
+#
+#  @code
+#  app maya2020
+#  project master
+#  development myFeature
+#  stage lighting
+#  @endcode
+#
+#  App names are collected from all layers mMecoSettings.settingsLib.getAppFilePath resolves app files from, see
+#  mMecoSettings.settingsLib.getAppDirectoryPaths.
+#
+#  Each project has its own index files in mMecoSettings.completionLib.INDEX_DIRECTORY_PATH, one for each developer
+#  and environment. An index is only built again when it is stale, meaning one of the directories it lists has been
+#  modified after the index was written.
+#
+#  Path of the index of the environment built last is written into mMecoSettings.completionLib.DEFAULT_FILE_NAME,
+#  completion in a shell, in which no environment has been built, reads that index.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  hashlib
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.settingsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Kind of app names.
+KIND_APP            = 'app'
+
+#
+## [ str ] - Kind of project names.
+KIND_PROJECT        = 'project'
+
+#
+## [ str ] - Kind of development env names.
+KIND_DEVELOPMENT    = 'development'
+
+#
+## [ str ] - Kind of stage env names.
+KIND_STAGE          = 'stage'
+
+#
+## [ str ] - Absolute path of the directory of the index files.
+INDEX_DIRECTORY_PATH = os.path.join(os.path.expanduser('~'), '.mmecosettings-completion')
+
+#
+## [ str ] - Name of the file in the directory of the index files, which contains the path of the default index.
+DEFAULT_FILE_NAME    = 'default'
+
+#
+## @brief List names in given directory.
+#
+#  @param path      [ str  | None  | in  ] - Absolute path of a directory.
+#  @param extension [ str  | None  | in  ] - Extension of the files to list, directories are listed if not given.
+#
+#  @exception N/A
+#
+#  @return list of str - Names, extensions are removed.
+def _listNames(path, extension=None):
+
+    try:
+        names = mMecoSettings.fileSystemLib.listDir(path)
+    except OSError:
+        return []
+
+    if extension:
+        return [x[:-len(extension)] for x in names if x.endswith(extension)]
+
+    return [x for x in names if not x.startswith('.') and mMecoSettings.fileSystemLib.isDir(os.path.join(path, x))]
+
+#
+## @brief Get app names from all layers.
+#
+#  @param projectName        [ str | None | in  ] - Name of the project.
+#  @param developerName      [ str | None | in  ] - Name of the developer.
+#  @param developmentEnvName [ str | None | in  ] - Name of the development environment.
+#  @param stageEnvName       [ str | None | in  ] - Name of the stage environment.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - App names.
+def getAppNames(projectName, developerName, developmentEnvName, stageEnvName, platformName):
+
+    names = set()
+
+    for path in mMecoSettings.settingsLib.getAppDirectoryPaths(projectName, developerName, developmentEnvName, stageEnvName, platformName):
+        names.update(_listNames(path, '.json'))
+
+    return sorted(names)
+
+#
+## @brief Get project names.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Project names.
+def getProjectNames(platformName):
+
+    return sorted(_listNames(mMecoSettings.settingsLib.getProjectsPath(platformName)))
+
+#
+## @brief Get development or stage env names of a developer.
+#
+#  @param projectName   [ str | None | in  ] - Name of the project.
+#  @param developerName [ str | None | in  ] - Name of the developer.
+#  @param kind          [ str | None | in  ] - Kind, one of the following; development, stage.
+#  @param platformName  [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Env names.
+def getEnvNames(projectName, developerName, kind, platformName):
+
+    return sorted(_listNames(_getEnvsPath(projectName, developerName, kind, platformName)))
+
+#
+## @brief Get absolute path of the directory of the development or stage envs of a developer.
+#
+#  @param projectName   [ str | None | in  ] - Name of the project.
+#  @param developerName [ str | None | in  ] - Name of the developer.
+#  @param kind          [ str | None | in  ] - Kind, one of the following; development, stage.
+#  @param platformName  [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _getEnvsPath(projectName, developerName, kind, platformName):
+
+    return os.path.join(mMecoSettings.settingsLib.getProjectsPath(platformName, projectName),
+                        projectName,
+                        'developers',
+                        developerName,
+                        kind)
+
+#
+## @brief Get index lines.
+#
+#  @param projectName        [ str | None | in  ] - Name of the project.
+#  @param developerName      [ str | None | in  ] - Name of the developer.
+#  @param developmentEnvName [ str | None | in  ] - Name of the development environment.
+#  @param stageEnvName       [ str | None | in  ] - Name of the stage environment.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Lines.
+def getIndex(projectName, developerName, developmentEnvName, stageEnvName, platformName):
+
+    lines = ['{} {}'.format(KIND_APP, x) for x in getAppNames(projectName,
+                                                              developerName,
+                                                              developmentEnvName,
+                                                              stageEnvName,
+                                                              platformName)]
+
+    lines.extend('{} {}'.format(KIND_PROJECT, x) for x in getProjectNames(platformName))
+
+    for kind in (KIND_DEVELOPMENT, KIND_STAGE):
+        lines.extend('{} {}'.format(kind, x) for x in getEnvNames(projectName, developerName, kind, platformName))
+
+    return lines
+
+#
+## @brief Get absolute path of the index file of given environment.
+#
+#  @param projectName        [ str | None | in  ] - Name of the project.
+#  @param developerName      [ str | None | in  ] - Name of the developer.
+#  @param developmentEnvName [ str | None | in  ] - Name of the development environment.
+#  @param stageEnvName       [ str | None | in  ] - Name of the stage environment.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#  @param directory          [ str | None | in  ] - Absolute path of the directory of the index files,
+#                                                   mMecoSettings.completionLib.INDEX_DIRECTORY_PATH is used if not given.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def getIndexFilePath(projectName, developerName, developmentEnvName, stageEnvName, platformName, directory=None):
+
+    # App names depend on whether the apps of the master project are used
+    key = '|'.join([developerName or '',
+                    developmentEnvName or '',
+                    stageEnvName or '',
+                    platformName or '',
+                    str(os.environ.get(mMecoSettings.envVariablesLib.MECO_USE_PROJECT_APPS_ONLY) is None)])
+
+    return os.path.join(directory or INDEX_DIRECTORY_PATH,
+                        '{}-{}'.format(projectName, hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]))
+
+#
+## @brief Get absolute paths of the directories listed to build the index of given environment.
+#
+#  @param projectName        [ str | None | in  ] - Name of the project.
+#  @param developerName      [ str | None | in  ] - Name of the developer.
+#  @param developmentEnvName [ str | None | in  ] - Name of the development environment.
+#  @param stageEnvName       [ str | None | in  ] - Name of the stage environment.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Paths.
+def getSourcePaths(projectName, developerName, developmentEnvName, stageEnvName, platformName):
+
+    paths = mMecoSettings.settingsLib.getAppDirectoryPaths(projectName, developerName, developmentEnvName, stageEnvName, platformName)
+
+    # New versions of mMecoSettings provide other app directories
+    paths.append(os.path.join(mMecoSettings.settingsLib.getProjectInternalPackagesPath(projectName, platformName), 'mMecoSettings'))
+    paths.append(os.path.join(mMecoSettings.settingsLib.getMasterProjectInternalPackagesPath(platformName), 'mMecoSettings'))
+
+    paths.append(mMecoSettings.settingsLib.getProjectsPath(platformName))
+
+    for kind in (KIND_DEVELOPMENT, KIND_STAGE):
+        paths.append(_getEnvsPath(projectName, developerName, kind, platformName))
+
+    return paths
+
+#
+## @brief Determine whether given index file is stale.
+#
+#  @param path        [ str         | None | in  ] - Absolute path of the index file.
+#  @param sourcePaths [ list of str | None | in  ] - Absolute paths of the directories listed to build the index.
+#
+#  @exception N/A
+#
+#  @return bool - `True` if the index doesn't exist or a directory has been modified after it was written.
+def isStale(path, sourcePaths):
+
+    try:
+        indexTime = mMecoSettings.fileSystemLib.stat(path).st_mtime
+    except (IOError, OSError):
+        return True
+
+    for sourcePath in sourcePaths:
+
+        try:
+            if mMecoSettings.fileSystemLib.stat(sourcePath).st_mtime >= indexTime:
+                return True
+        except (IOError, OSError):
+            # Directory doesn't exist
+            continue
+
+    return False
+
+#
+## @brief Write the index file of given environment if it is stale.
+#
+#  @param projectName        [ str | None | in  ] - Name of the project.
+#  @param developerName      [ str | None | in  ] - Name of the developer.
+#  @param developmentEnvName [ str | None | in  ] - Name of the development environment.
+#  @param stageEnvName       [ str | None | in  ] - Name of the stage environment.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#  @param directory          [ str | None | in  ] - Absolute path of the directory of the index files,
+#                                                   mMecoSettings.completionLib.INDEX_DIRECTORY_PATH is used if not given.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the index file.
+def update(projectName, developerName, developmentEnvName, stageEnvName, platformName, directory=None):
+
+    path = getIndexFilePath(projectName, developerName, developmentEnvName, stageEnvName, platformName, directory)
+
+    if isStale(path, getSourcePaths(projectName, developerName, developmentEnvName, stageEnvName, platformName)):
+
+        if not mMecoSettings.fileSystemLib.isDir(os.path.dirname(path)):
+            try:
+                mMecoSettings.fileSystemLib.makeDirs(os.path.dirname(path))
+            except OSError:
+                # Created by another process
+                pass
+
+        write(getIndex(projectName, developerName, developmentEnvName, stageEnvName, platformName), path)
+
+    # Completion in a new shell uses the index of this environment
+    write([path], os.path.join(os.path.dirname(path), DEFAULT_FILE_NAME))
+
+    return path
+
+#
+## @brief Write the index file.
+#
+#  File is only written if its content has changed, otherwise its modification time is updated so it isn't stale.
+#
+#  @param lines [ list of str | None | in  ] - Lines.
+#  @param path  [ str         | None | in  ] - Absolute path of the index file.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the index file.
+def write(lines, path):
+
+    content = '\n'.join(lines) + '\n'
+
+    try:
+        with mMecoSettings.fileSystemLib.openFile(path, 'r') as inFile:
+            if inFile.read() == content:
+                mMecoSettings.fileSystemLib.utime(path)
+                return path
+    except (IOError, OSError):
+        pass
+
+    temporaryPath = '{}.{}'.format(path, os.getpid())
+
+    with mMecoSettings.fileSystemLib.openFile(temporaryPath, 'w') as outFile:
+        outFile.write(content)
+
+    # Completion functions mustn't read partially written indices
+    if os.name == 'nt' and mMecoSettings.fileSystemLib.isFile(path):
+        mMecoSettings.fileSystemLib.remove(path)
+
+    mMecoSettings.fileSystemLib.rename(temporaryPath, path)
+
+    return path
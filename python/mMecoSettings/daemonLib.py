@@ -0,0 +1,576 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/daemonLib.py    @brief [ FILE   ] - Settings daemon module.
+## @package mMecoSettings.daemonLib       @brief [ MODULE ] - Settings daemon module.
+#
+#  Commands such as `mmecosettings-list-app` start an interpreter and import mCore, mFileSystem and mMecoPackage
+#  before doing milliseconds of work. The optional per-user daemon, started with `mmecosettings-daemon`, keeps these
+#  modules imported and the app catalog read, see mMecoSettings.appLib.AppFile.list, and answers the commands over
+#  a Unix domain socket.
+#
+#  Commands call mMecoSettings.daemonLib.main, which only imports standard library modules. The command is sent to
+#  the daemon if it is running, otherwise it is run in-process. The daemon only serves clients of the same
+#  mMecoSettings package it has been started from, other clients run the command in-process. Commands read the
+#  MECO_* environment variables, for instance MECO_DEVELOPMENT_PACKAGES_PATH, and the current directory, so the
+#  daemon also refuses requests of clients, whose environment or current directory differs from its own.
+#
+#  The socket is created in the private temporary directory of the user, see
+#  mMecoSettings.fileSystemLib.getUserTemporaryPath, and clients only connect to a socket owned by the current user,
+#  so another user can't answer the commands in place of the daemon.
+#
+#  Client sends one JSON line. The daemon answers with one JSON line for each write of the command to its output,
+#  which the client writes to its output as it arrives, so jsonl and tsv records are streamed, followed by a line with
+#  the exit code. Exit code is null if the daemon refuses the request;
+#
+#  @code
+#  {"command": "list", "args": ["-d"], "package": "/packages/mMecoSettings/python/mMecoSettings",
+#   "environ": {"MECO_PROJECT_NAME": "master", ...}, "cwd": "/home/user"}
+#  {"output": "..."}
+#  {"output": "..."}
+#  {"exitCode": 0}
+#  @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  sys
+import  json
+import  socket
+import  threading
+
+from    importlib import import_module
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ dict ] - Keys are command names, values are tuples of program name, module name and function name.
+COMMANDS        = {'create' : ('mmecosettings-create-app', 'mMecoSettings.settingsCmd', 'createApp'),
+                   'list'   : ('mmecosettings-list-app',   'mMecoSettings.settingsCmd', 'listApps'),
+                   'search' : ('mmecosettings-search-app', 'mMecoSettings.settingsCmd', 'searchApps')}
+
+#
+## [ str ] - Command, which stops the daemon.
+STOP_COMMAND    = 'stop'
+
+#
+## [ float ] - Seconds the client waits for the daemon to accept the connection.
+CONNECT_TIMEOUT = 0.5
+
+#
+## [ float ] - Seconds the daemon keeps running without any request.
+IDLE_TIMEOUT    = 4 * 60 * 60
+
+#
+## [ int ] - Size of the chunks read from the socket.
+CHUNK_SIZE      = 64 * 1024
+
+#
+## [ str ] - Absolute path of this package, the daemon only serves clients of the same package.
+PACKAGE_PATH    = os.path.dirname(os.path.abspath(__file__))
+
+#
+## [ str ] - Prefix of the environment variables, which must match between the client and the daemon.
+ENVIRON_PREFIX  = 'MECO_'
+
+#
+## [ str ] - Name of the socket in the private temporary directory of the user.
+SOCKET_NAME     = 'daemon.sock'
+
+#
+## @brief Get absolute path of the socket of the current user.
+#
+#  @exception OSError - If the private temporary directory of the user can't be used.
+#
+#  @return str - Path.
+def getSocketPath():
+
+    path = os.environ.get(mMecoSettings.envVariablesLib.MECO_SETTINGS_DAEMON_SOCKET_PATH)
+    if path:
+        return path
+
+    return mMecoSettings.fileSystemLib.getUserTemporaryPath(SOCKET_NAME)
+
+#
+## @brief Get environment variables, which must match between the client and the daemon.
+#
+#  @param environ [ dict | os.environ | in  ] - Environment, os.environ is used if not given.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names, values are values of the variables.
+def getEnviron(environ=None):
+
+    environ = os.environ if environ is None else environ
+
+    return dict((x, y) for x, y in environ.items()
+                if x.startswith(ENVIRON_PREFIX) and x != mMecoSettings.envVariablesLib.MECO_SETTINGS_DAEMON_SOCKET_PATH)
+
+#
+## @brief Determine whether the daemon is supported on the current platform.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSupported():
+
+    return hasattr(socket, 'AF_UNIX')
+
+#
+## @brief Read one line from given socket.
+#
+#  @param connection [ socket.socket | None | in  ] - Socket.
+#
+#  @exception N/A
+#
+#  @return bytes - Line without the new line character.
+def _readLine(connection):
+
+    chunks = []
+
+    while True:
+
+        chunk = connection.recv(CHUNK_SIZE)
+        if not chunk:
+            break
+
+        chunks.append(chunk)
+        if b'\n' in chunk:
+            break
+
+    return b''.join(chunks).split(b'\n')[0]
+
+#
+## @brief Iterate over the lines read from given socket until it is closed.
+#
+#  @param connection [ socket.socket | None | in  ] - Socket.
+#
+#  @exception N/A
+#
+#  @return generator - Lines without the new line character.
+def _iterLines(connection):
+
+    buffer = b''
+
+    while True:
+
+        chunk = connection.recv(CHUNK_SIZE)
+        if not chunk:
+            break
+
+        lines  = (buffer + chunk).split(b'\n')
+        buffer = lines.pop()
+
+        for line in lines:
+            yield line
+
+    if buffer:
+        yield buffer
+
+#
+## @brief Send a request to the daemon.
+#
+#  Output of the command is written to given stream as the daemon sends it. If the connection to the daemon is lost
+#  after some output has been written, the command can't be run in-process anymore, so it fails.
+#
+#  @param command [ str         | None | in  ] - Command name, see mMecoSettings.daemonLib.COMMANDS.
+#  @param args    [ list of str | None | in  ] - Arguments of the command.
+#  @param path    [ str         | None | in  ] - Absolute path of the socket, mMecoSettings.daemonLib.getSocketPath is used if not given.
+#  @param environ [ dict        | None | in  ] - Environment of the command, os.environ is used if not given.
+#  @param stream  [ file        | None | in  ] - Stream the output is written to, output is returned if not given.
+#
+#  @exception N/A
+#
+#  @return dict - Response, keys are exitCode, output, which is empty if a stream is given, and error, which is set
+#                 if the connection has been lost.
+#  @return None - If the daemon is not running, it isn't owned by the current user or it can't serve the request.
+def request(command, args=None, path=None, environ=None, stream=None):
+
+    if not isSupported():
+        return None
+
+    try:
+        path = path or getSocketPath()
+    except OSError:
+        return None
+
+    # Socket of another user could answer anything in place of the daemon
+    if not mMecoSettings.fileSystemLib.isOwned(path):
+        return None
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(CONNECT_TIMEOUT)
+
+    output  = []
+    written = False
+
+    try:
+        connection.connect(path)
+        connection.settimeout(None)
+
+        connection.sendall(json.dumps({'command'    : command,
+                                       'args'       : list(args or []),
+                                       'package'    : PACKAGE_PATH,
+                                       'environ'    : getEnviron(environ),
+                                       'cwd'        : os.getcwd()}).encode('utf-8') + b'\n')
+
+        for line in _iterLines(connection):
+
+            # Malformed response, for instance of a daemon of another version, is run in-process
+            try:
+                message = json.loads(line.decode('utf-8'))
+            except ValueError:
+                break
+
+            if not isinstance(message, dict):
+                break
+
+            if 'output' in message:
+
+                if stream is None:
+                    output.append(message['output'])
+                else:
+                    stream.write(message['output'])
+                    stream.flush()
+
+                written = True
+                continue
+
+            if message.get('exitCode') is None:
+                break
+
+            return {'exitCode': message['exitCode'], 'output': ''.join(output)}
+
+    except (socket.error, OSError):
+        pass
+    finally:
+        connection.close()
+
+    if written:
+        return {'exitCode': 1, 'output': ''.join(output), 'error': 'Settings daemon stopped before the command finished.'}
+
+    return None
+
+#
+## @brief Run given command in this process.
+#
+#  @param command [ str         | None | in  ] - Command name, see mMecoSettings.daemonLib.COMMANDS.
+#  @param args    [ list of str | None | in  ] - Arguments of the command.
+#
+#  @exception N/A
+#
+#  @return int - Exit code.
+def run(command, args=None):
+
+    programName, moduleName, functionName = COMMANDS[command]
+
+    function = getattr(import_module(moduleName), functionName)
+
+    argv     = sys.argv
+    sys.argv = [programName] + list(args or [])
+
+    try:
+        function()
+    except SystemExit as error:
+        return error.code if isinstance(error.code, int) else (0 if error.code is None else 1)
+    finally:
+        sys.argv = argv
+
+    return 0
+
+#
+## @brief Run given command by the daemon if it is running, in this process otherwise.
+#
+#  This function is invoked by the commands in the bin directory.
+#
+#  @param command [ str         | None     | in  ] - Command name, see mMecoSettings.daemonLib.COMMANDS.
+#  @param args    [ list of str | sys.argv | in  ] - Arguments of the command, arguments of the process are used if not given.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main(command, args=None):
+
+    args = sys.argv[1:] if args is None else args
+
+    response = request(command, args, stream=sys.stdout)
+    if response is None:
+        sys.exit(run(command, args))
+
+    if response.get('error'):
+        sys.stderr.write('{}\n'.format(response['error']))
+
+    sys.exit(response['exitCode'])
+
+#
+## @brief [ CLASS ] - Stream, which sends each write to a client of the daemon as one JSON line.
+class _SocketStream(object):
+
+    def __init__(self, connection):
+
+        self._connection = connection
+
+    def write(self, text):
+
+        if text:
+            self._connection.sendall(json.dumps({'output': text}).encode('utf-8') + b'\n')
+
+    def flush(self):
+
+        pass
+
+    def isatty(self):
+
+        return False
+
+#
+## @brief [ CLASS ] - Settings daemon.
+class Daemon(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path        [ str   | None         | in  ] - Absolute path of the socket, mMecoSettings.daemonLib.getSocketPath is used if not given.
+    #  @param idleTimeout [ float | IDLE_TIMEOUT | in  ] - Seconds the daemon keeps running without any request.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None, idleTimeout=IDLE_TIMEOUT):
+
+        ## [ str ] - Absolute path of the socket.
+        self._path          = path or getSocketPath()
+
+        ## [ float ] - Seconds the daemon keeps running without any request.
+        self._idleTimeout   = idleTimeout
+
+        ## [ socket.socket ] - Server socket.
+        self._socket        = None
+
+        ## [ threading.Event ] - Set once the daemon is listening.
+        self._ready         = threading.Event()
+
+        ## [ bool ] - Whether the daemon should stop.
+        self._stop          = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Absolute path of the socket.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Wait until the daemon is listening.
+    #
+    #  @param timeout [ float | None | in  ] - Seconds to wait.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the daemon is listening.
+    def waitUntilReady(self, timeout=None):
+
+        return self._ready.wait(timeout)
+
+    #
+    ## @brief Serve requests until the daemon is stopped or idle for too long.
+    #
+    #  @exception RuntimeError - If another daemon is running with the same socket.
+    #
+    #  @return None - None.
+    def serve(self):
+
+        if os.path.exists(self._path):
+
+            if self._isListening():
+                raise RuntimeError('Settings daemon is already running: {}'.format(self._path))
+
+            # Stale socket of a daemon, which didn't exit cleanly
+            os.remove(self._path)
+
+        # Modules and the app catalog are loaded before the first request
+        if sys.version_info[0] < 3:
+            from StringIO import StringIO
+        else:
+            from io import StringIO
+
+        self._run('list', [], StringIO())
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        previousUmask = os.umask(0o077)
+        try:
+            self._socket.bind(self._path)
+        finally:
+            os.umask(previousUmask)
+
+        self._socket.listen(16)
+        self._socket.settimeout(self._idleTimeout)
+
+        self._ready.set()
+
+        try:
+            while not self._stop:
+
+                try:
+                    connection, _ = self._socket.accept()
+                except socket.timeout:
+                    break
+
+                try:
+                    self._handle(connection)
+                except (socket.error, OSError, ValueError):
+                    pass
+                finally:
+                    connection.close()
+        finally:
+            self._socket.close()
+
+            if os.path.exists(self._path):
+                os.remove(self._path)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Determine whether a daemon is listening on the socket.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isListening(self):
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(CONNECT_TIMEOUT)
+
+        try:
+            connection.connect(self._path)
+        except (socket.error, OSError):
+            return False
+        finally:
+            connection.close()
+
+        return True
+
+    #
+    ## @brief Handle a request.
+    #
+    #  @param connection [ socket.socket | None | in  ] - Client connection.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _handle(self, connection):
+
+        data     = json.loads(_readLine(connection).decode('utf-8'))
+        command  = data.get('command')
+        exitCode = None
+
+        if command == STOP_COMMAND:
+            self._stop = True
+            exitCode   = 0
+
+        # Clients of other packages, environments or directories are served in-process by themselves
+        elif (command in COMMANDS and
+              data.get('package') == PACKAGE_PATH and
+              data.get('environ') == getEnviron() and
+              data.get('cwd') == os.getcwd()):
+            exitCode = self._run(command, data.get('args'), _SocketStream(connection))
+
+        connection.sendall(json.dumps({'exitCode': exitCode}).encode('utf-8') + b'\n')
+
+    #
+    ## @brief Run given command and redirect its output.
+    #
+    #  @param command [ str         | None | in  ] - Command name, see mMecoSettings.daemonLib.COMMANDS.
+    #  @param args    [ list of str | None | in  ] - Arguments of the command.
+    #  @param output  [ file        | None | in  ] - Stream, which the output and the errors of the command are written to.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Exit code.
+    def _run(self, command, args, output):
+
+        stdout = sys.stdout
+        stderr = sys.stderr
+
+        sys.stdout = output
+        sys.stderr = output
+
+        try:
+            exitCode = run(command, args)
+        except Exception as error:
+            output.write('{}\n'.format(error))
+            exitCode = 1
+        finally:
+            sys.stdout = stdout
+            sys.stderr = stderr
+
+        return exitCode
+
+#
+## @brief Start the daemon, or stop it if `--stop` is given.
+#
+#  This function is invoked by `mmecosettings-daemon` command.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def serve():
+
+    # Clients only import the modules they need to reach the daemon, argparse is imported by the daemon only
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Start the settings daemon')
+    parser.add_argument('--stop', action='store_true', help='Stop the running settings daemon')
+
+    args = parser.parse_args()
+
+    if not isSupported():
+        sys.stderr.write('Settings daemon is not supported on this platform.\n')
+        sys.exit(1)
+
+    if args.stop:
+        sys.exit(0 if request(STOP_COMMAND) is not None else 1)
+
+    try:
+        Daemon().serve()
+    except (RuntimeError, OSError) as error:
+        sys.stderr.write('{}\n'.format(error))
+        sys.exit(1)
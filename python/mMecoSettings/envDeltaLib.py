@@ -0,0 +1,434 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/envDeltaLib.py    @brief [ FILE   ] - Env delta module.
+## @package mMecoSettings.envDeltaLib       @brief [ MODULE ] - Env delta module.
+#
+#  When environments are switched in the same shell, most of the variables added by the callbacks already have
+#  the same value. Delta mode, which is enabled by setting `MECO_ENV_DELTA` to `1`, compares the entries with
+#  the current environment and only emits the changes; variables to set, variables to unset, path entries to add and
+#  path entries of the previous environment to remove. Scripts which have already been sourced in the shell are not
+#  sourced again.
+#
+#  What the callbacks add is recorded in `MECO_ENV_DELTA_NAMES`, `MECO_ENV_DELTA_SCRIPTS` and `MECO_ENV_DELTA_PATHS`,
+#  so the next environment knows what to remove. Pre-build and post-build callbacks of an environment share one
+#  container, see mMecoSettings.envDeltaLib.getContainer.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  weakref
+
+import  mMecoSettings.envVariablesLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Separator used in the value of names, scripts and paths variables.
+SEPARATOR           = '|'
+
+#
+## [ str ] - Separator of a variable name and its path entries in the value of paths variable.
+NAME_SEPARATOR      = '='
+
+#
+## [ weakref.WeakKeyDictionary ] - Keys are `mMeco.libs.allLib.All` instances, values are containers of their builds.
+_CONTAINERS         = weakref.WeakKeyDictionary()
+
+#
+## @brief [ CLASS ] - Env entry container, which only passes the changes to the wrapped container.
+class DeltaEnvEntryContainer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None       | in  ] - Env entry container.
+    #  @param platformName      [ str                                   | None       | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #  @param environ           [ dict                                  | os.environ | in  ] - Current environment.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, envEntryContainer, platformName, environ=None):
+
+        ## [ mMeco.libs.entryLib.EnvEntryContainer ] - Wrapped env entry container.
+        self._envEntryContainer = envEntryContainer
+
+        ## [ str ] - Platform name.
+        self._platformName      = platformName
+
+        ## [ dict ] - Current environment.
+        self._environ           = os.environ if environ is None else environ
+
+        ## [ list of str ] - Names of the variables, which have been skipped since they haven't changed.
+        self._skipped           = []
+
+        ## [ set of str ] - Names of the variables added by the callbacks.
+        self._names             = set()
+
+        ## [ set of str ] - Scripts added by the callbacks.
+        self._scripts           = set()
+
+        ## [ dict ] - Keys are path variable names, values are lists of the entries added by the callbacks.
+        self._paths             = {}
+
+        ## [ dict ] - Path entries added by the callbacks of the previous environment, see
+        #  mMecoSettings.envDeltaLib.parsePaths.
+        self._previousPaths     = parsePaths(self._environ.get(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_PATHS, ''),
+                                             getPathSeparator(platformName))
+
+    #
+    ## @brief Forward everything else to the wrapped container.
+    #
+    #  @param name [ str | None | in  ] - Attribute name.
+    #
+    #  @exception AttributeError - If the wrapped container doesn't have the attribute.
+    #
+    #  @return variant - Attribute.
+    def __getattr__(self, name):
+
+        return getattr(self._envEntryContainer, name)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Names of the variables, which have been skipped since they haven't changed.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Variable names.
+    def skipped(self):
+
+        return self._skipped
+
+    #
+    ## @brief Set the wrapped container, entries added afterwards are passed to it.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setEnvEntryContainer(self, envEntryContainer):
+
+        self._envEntryContainer = envEntryContainer
+
+    #
+    ## @brief Add single entry if its value differs from the current environment.
+    #
+    #  @param name  [ str | None | in  ] - Variable name.
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addSingle(self, name, value):
+
+        self._names.add(name)
+
+        if isSameValue(self._environ.get(name), value):
+            self._skipped.append(name)
+            return
+
+        self._envEntryContainer.addSingle(name, value)
+
+    #
+    ## @brief Add multi entry if the value is not in the current environment.
+    #
+    #  Entries, which were in the variable before any environment was built, aren't recorded, so they are never
+    #  removed when switching environments.
+    #
+    #  @param name  [ str | None | in  ] - Variable name.
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addMulti(self, name, value):
+
+        currentValue = self._environ.get(name)
+        if currentValue and value in currentValue.split(getPathSeparator(self._platformName)):
+
+            self._skipped.append(name)
+
+            if value in self._previousPaths.get(name, []):
+                self._addPath(name, value)
+
+            return
+
+        self._addPath(name, value)
+        self._envEntryContainer.addMulti(name, value)
+
+    #
+    ## @brief Add script unless it has been sourced in the current environment.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the script.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addScript(self, path):
+
+        self._scripts.add(path)
+
+        if path in self._environ.get(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_SCRIPTS, '').split(SEPARATOR):
+            self._skipped.append(path)
+            return
+
+        self._envEntryContainer.addScript(path)
+
+    #
+    ## @brief Add commands, which unset the variables and remove the path entries of the previous environment that
+    #         are not set anymore.
+    #
+    #  This method must be invoked once all entries are added by the post-build callback.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the unset variables.
+    def finalize(self):
+
+        separator     = getPathSeparator(self._platformName)
+        previousNames = self._environ.get(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_NAMES, '')
+        staleNames    = sorted(x for x in previousNames.split(SEPARATOR) if x and x not in self._names and x in self._environ)
+
+        for name in staleNames:
+            self._envEntryContainer.addCommand(getUnsetCommand(name, self._platformName))
+
+        for name, values in sorted(self._previousPaths.items()):
+
+            currentValues = self._environ.get(name, '').split(separator)
+
+            for value in values:
+                if value in currentValues and not value in self._paths.get(name, []):
+                    self._envEntryContainer.addCommand(getRemovePathCommand(name, value, self._platformName))
+
+        names = self._names | set([mMecoSettings.envVariablesLib.MECO_ENV_DELTA_NAMES,
+                                   mMecoSettings.envVariablesLib.MECO_ENV_DELTA_SCRIPTS,
+                                   mMecoSettings.envVariablesLib.MECO_ENV_DELTA_PATHS])
+
+        self.addSingle(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_NAMES,
+                       _quote(SEPARATOR.join(sorted(names)), self._platformName))
+
+        self.addSingle(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_SCRIPTS,
+                       _quote(SEPARATOR.join(sorted(self._scripts)), self._platformName))
+
+        self.addSingle(mMecoSettings.envVariablesLib.MECO_ENV_DELTA_PATHS,
+                       _quote(formatPaths(self._paths, separator), self._platformName))
+
+        return staleNames
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Record a path entry added by the callbacks.
+    #
+    #  @param name  [ str | None | in  ] - Variable name.
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addPath(self, name, value):
+
+        values = self._paths.setdefault(name, [])
+        if not value in values:
+            values.append(value)
+
+#
+## @brief Get the delta container of an environment build.
+#
+#  Pre-build and post-build callbacks of the same build get the same container, so the variables added by both are
+#  known when mMecoSettings.envDeltaLib.DeltaEnvEntryContainer.finalize is invoked. A new build starts with a new
+#  container, so nothing is carried over between builds of the same process.
+#
+#  @param allLib            [ mMeco.libs.allLib.All                 | None       | in  ] - All libraries of the build.
+#  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None       | in  ] - Env entry container.
+#  @param environ           [ dict                                  | os.environ | in  ] - Current environment.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.envDeltaLib.DeltaEnvEntryContainer - Container.
+def getContainer(allLib, envEntryContainer, environ=None):
+
+    try:
+        container = _CONTAINERS.get(allLib)
+    except TypeError:
+        # Not weak referenceable, container isn't shared
+        return DeltaEnvEntryContainer(envEntryContainer, allLib.request().platform(), environ)
+
+    if container is None:
+        container = DeltaEnvEntryContainer(envEntryContainer, allLib.request().platform(), environ)
+        _CONTAINERS[allLib] = container
+    else:
+        container.setEnvEntryContainer(envEntryContainer)
+
+    return container
+
+#
+## @brief Determine whether delta mode is enabled.
+#
+#  @param environ [ dict | os.environ | in  ] - Current environment.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isEnabled(environ=None):
+
+    environ = os.environ if environ is None else environ
+
+    return environ.get(mMecoSettings.envVariablesLib.MECO_ENV_DELTA, '').lower() in ('1', 'true', 'yes', 'on')
+
+#
+## @brief Determine whether given entry value is the same as the current value of a variable.
+#
+#  Values written for shells may be quoted, such as `"0"`, in which case the unquoted value is compared as well.
+#
+#  @param currentValue [ str | None | in  ] - Current value, `None` if the variable is not set.
+#  @param value        [ str | None | in  ] - Entry value.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSameValue(currentValue, value):
+
+    if currentValue is None:
+        return False
+
+    value = str(value)
+
+    if currentValue == value:
+        return True
+
+    if len(value) > 1 and value[0] == value[-1] and value[0] in ('"', '\''):
+        return currentValue == value[1:-1]
+
+    return False
+
+#
+## @brief Get path separator of given platform.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Separator.
+def getPathSeparator(platformName):
+
+    return ';' if platformName == 'Windows' else ':'
+
+#
+## @brief Parse the value of paths variable.
+#
+#  @param text      [ str | None | in  ] - Value such as `PATH=/a:/b|PYTHONPATH=/c`.
+#  @param separator [ str | None | in  ] - Path separator.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are variable names, values are lists of path entries.
+def parsePaths(text, separator):
+
+    paths = {}
+
+    for item in text.split(SEPARATOR):
+
+        name, _, values = item.partition(NAME_SEPARATOR)
+        if name and values:
+            paths[name] = values.split(separator)
+
+    return paths
+
+#
+## @brief Format the value of paths variable.
+#
+#  @param paths     [ dict | None | in  ] - Keys are variable names, values are lists of path entries.
+#  @param separator [ str  | None | in  ] - Path separator.
+#
+#  @exception N/A
+#
+#  @return str - Value, see mMecoSettings.envDeltaLib.parsePaths.
+def formatPaths(paths, separator):
+
+    return SEPARATOR.join('{}{}{}'.format(name, NAME_SEPARATOR, separator.join(values))
+                          for name, values in sorted(paths.items()) if values)
+
+#
+## @brief Get command which unsets given variable.
+#
+#  @param name         [ str | None | in  ] - Variable name.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Command.
+def getUnsetCommand(name, platformName):
+
+    if platformName == 'Windows':
+        return 'Remove-Item Env:{} -ErrorAction SilentlyContinue;'.format(name)
+
+    return 'unset {};'.format(name)
+
+#
+## @brief Get command which removes given entry from a path variable.
+#
+#  @param name         [ str | None | in  ] - Variable name.
+#  @param value        [ str | None | in  ] - Path entry.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Command.
+def getRemovePathCommand(name, value, platformName):
+
+    if platformName == 'Windows':
+        return ('$env:{0} = (($env:{0} -split \';\') | Where-Object {{ $_ -ne \'{1}\' }}) -join \';\';'
+                .format(name, value.replace('\'', '\'\'')))
+
+    value = value.replace('\\', '\\\\').replace('"', '\\"').replace('$', '\\$').replace('`', '\\`')
+
+    return ('{0}=:${{{0}}}:; {0}=${{{0}//:"{1}":/:}}; {0}=${{{0}#:}}; {0}=${{{0}%:}}; export {0};'.format(name, value))
+
+#
+## @brief Quote given value for the shell of given platform.
+#
+#  @param value        [ str | None | in  ] - Value.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Quoted value.
+def _quote(value, platformName):
+
+    if platformName == 'Windows':
+        return value
+
+    return '\'{}\''.format(value)
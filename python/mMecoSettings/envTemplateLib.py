@@ -0,0 +1,237 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/envTemplateLib.py    @brief [ FILE   ] - Env template module.
+## @package mMecoSettings.envTemplateLib       @brief [ MODULE ] - Env template module.
+#
+#  Classes of mMecoSettings.packageGlobalEnvLib hold relative path templates such as `FOLDER_NAME/VERSION/python`.
+#  Each class is compiled into a template table once, placeholders are located when the table is compiled.
+#  A table expands all packages and variables in one pass; templates are resolved once for given folder name
+#  and version, then joined with the root of each package.
+#
+#  Entries of `PATH` and the library path are expanded for all initialized packages by mMecoSettings.envViewLib,
+#  which collects them into an env view, see mMecoSettings.envTemplateLib.getEnvViewTable.
+#
+#  @code
+#  table = mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Linux')
+#  paths = table.expand(['/packages/mMecoPackage', '/packages/mMecoSettings'], folderName='maya', version='2020')
+#  paths['PYTHONPATH']
+#  # ['/packages/mMecoPackage/maya/2020/python', '/packages/mMecoSettings/maya/2020/python']
+#  @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  mMecoSettings.packageGlobalEnvLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Folder name placeholder, such as the folder of an application in a package.
+FOLDER_NAME = 'FOLDER_NAME'
+
+#
+## [ str ] - Version placeholder.
+VERSION     = 'VERSION'
+
+#
+## [ dict ] - Keys are tuples of separator and variables, values are mMecoSettings.envTemplateLib.TemplateTable instances.
+_TABLES     = {}
+
+#
+## @brief [ CLASS ] - Compiled templates of a class of mMecoSettings.packageGlobalEnvLib.
+class TemplateTable(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param variables [ list of tuple | None | in  ] - Each item is a tuple of variable name and list of templates.
+    #  @param separator [ str           | None | in  ] - Path separator of the templates.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, variables, separator):
+
+        ## [ str ] - Path separator of the templates.
+        self._separator = separator
+
+        ## [ list of tuple ] - Each item is a tuple of variable name and list of compiled templates, a compiled
+        #  template is a list of segments.
+        self._variables = [(name, [x.split(separator) for x in templates]) for name, templates in variables]
+
+        ## [ dict ] - Keys are tuples of folder name and version, values are resolved relative paths by variable.
+        self._resolved  = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Path separator of the templates.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Separator.
+    def separator(self):
+
+        return self._separator
+
+    #
+    ## @brief Variable names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Variable names.
+    def variables(self):
+
+        return [x[0] for x in self._variables]
+
+    #
+    ## @brief Resolve the templates for given folder name and version.
+    #
+    #  @param folderName [ str | None | in  ] - Value of the folder name placeholder.
+    #  @param version    [ str | None | in  ] - Value of the version placeholder.
+    #
+    #  @exception ValueError - If a template has a placeholder whose value is not given.
+    #
+    #  @return list of tuple - Each item is a tuple of variable name and list of relative paths.
+    def resolve(self, folderName=None, version=None):
+
+        key = (folderName, version)
+
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+            return resolved
+
+        values   = {FOLDER_NAME: folderName, VERSION: version}
+        resolved = []
+
+        for name, templates in self._variables:
+
+            paths = []
+            for segments in templates:
+
+                for segment in segments:
+                    if segment in values and values[segment] is None:
+                        raise ValueError('Value of {} is not given for variable: {}'.format(segment, name))
+
+                paths.append(self._separator.join([values.get(x) or x for x in segments]))
+
+            resolved.append((name, paths))
+
+        self._resolved[key] = resolved
+
+        return resolved
+
+    #
+    ## @brief Expand the templates for given packages.
+    #
+    #  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages.
+    #  @param folderName   [ str         | None | in  ] - Value of the folder name placeholder.
+    #  @param version      [ str         | None | in  ] - Value of the version placeholder.
+    #
+    #  @exception ValueError - If a template has a placeholder whose value is not given.
+    #
+    #  @return dict - Keys are variable names, values are lists of absolute paths ordered by package then template.
+    def expand(self, packagePaths, folderName=None, version=None):
+
+        roots = [x.rstrip(self._separator) + self._separator for x in packagePaths]
+
+        return dict((name, [root + path for root in roots for path in paths])
+                    for name, paths in self.resolve(folderName, version))
+
+#
+## @brief Get template table of given variables.
+#
+#  @param variables [ list of tuple | None | in  ] - Each item is a tuple of variable name and list of templates.
+#  @param separator [ str           | None | in  ] - Path separator of the templates.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.envTemplateLib.TemplateTable - Template table.
+def compileTemplates(variables, separator):
+
+    # Classes of mMecoSettings.packageGlobalEnvLib are changed by the env view, so tables are found by their templates
+    key   = (separator, tuple((name, tuple(templates)) for name, templates in variables))
+
+    table = _TABLES.get(key)
+    if table is None:
+        table = TemplateTable(variables, separator)
+        _TABLES[key] = table
+
+    return table
+
+#
+## @brief Get template table of given kind and platform.
+#
+#  @param kind         [ str | None | in  ] - Kind of the templates, such as `Package` or `Maya`.
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception AttributeError - If mMecoSettings.packageGlobalEnvLib doesn't have a class for given kind and platform.
+#
+#  @return mMecoSettings.envTemplateLib.TemplateTable - Template table.
+def getTemplateTable(kind, platformName):
+
+    templateClass = getattr(mMecoSettings.packageGlobalEnvLib, '{}{}'.format(kind, platformName))
+    variables     = []
+
+    for name in sorted(dir(templateClass)):
+
+        if name.startswith('_') or not name.isupper():
+            continue
+
+        templates = getattr(templateClass, name)
+        if templates:
+            variables.append((name, templates))
+
+    return compileTemplates(variables, _getSeparator(platformName))
+
+#
+## @brief Get template table of the package entries, which are replaced by the env view.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.envTemplateLib.TemplateTable - Template table.
+def getEnvViewTable(platformName):
+
+    return compileTemplates(sorted(mMecoSettings.packageGlobalEnvLib.getEnvViewEntries(platformName).items()),
+                            _getSeparator(platformName))
+
+#
+## @brief Get path separator of the templates of given platform.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Separator.
+def _getSeparator(platformName):
+
+    return '\\' if platformName == 'Windows' else '/'
@@ -143,4 +143,75 @@ MECO_USE_PROJECT_APPS_ONLY                 = 'MECO_USE_PROJECT_APPS_ONLY'
 MECO_ENV_SCRIPT_FILE_PATH                  = 'MECO_ENV_SCRIPT_FILE_PATH'
 
 ## [ str ] - Log file path environment variable.
-MECO_ENV_LOG_FILE_PATH                     = 'MECO_ENV_LOG_FILE_PATH'
\ No newline at end of file
+MECO_ENV_LOG_FILE_PATH                     = 'MECO_ENV_LOG_FILE_PATH'
+
+
+
+# SNAPSHOT
+
+## [ str ] - Absolute path of an env snapshot file to load instead of resolving the environment.
+MECO_ENV_SNAPSHOT_FILE_PATH                = 'MECO_ENV_SNAPSHOT_FILE_PATH'
+
+## [ str ] - Absolute path of an env snapshot file to export the resolved environment to.
+MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH         = 'MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH'
+
+
+
+# DELTA
+
+## [ str ] - Whether only changed variables are emitted when switching environments, `1` to enable.
+MECO_ENV_DELTA                             = 'MECO_ENV_DELTA'
+
+## [ str ] - Names of the variables set by the callbacks in the current environment, used to unset the stale ones.
+MECO_ENV_DELTA_NAMES                       = 'MECO_ENV_DELTA_NAMES'
+
+## [ str ] - Scripts sourced by the callbacks in the current environment.
+MECO_ENV_DELTA_SCRIPTS                     = 'MECO_ENV_DELTA_SCRIPTS'
+
+## [ str ] - Path entries added by the callbacks in the current environment, for each path variable.
+MECO_ENV_DELTA_PATHS                       = 'MECO_ENV_DELTA_PATHS'
+
+
+# PROFILE
+
+## [ str ] - Whether the env build is profiled, `1` to enable.
+MECO_PROFILE                               = 'MECO_PROFILE'
+
+## [ str ] - Absolute path of the profile files without extension, a temporary path is used if not set.
+MECO_PROFILE_FILE_PATH                     = 'MECO_PROFILE_FILE_PATH'
+
+
+# IMPORT INDEX
+
+## [ str ] - Whether an import index of the packages is generated, `1` to enable.
+MECO_IMPORT_INDEX                          = 'MECO_IMPORT_INDEX'
+
+## [ str ] - Absolute path of the import index file of the environment.
+MECO_IMPORT_INDEX_FILE_PATH                = 'MECO_IMPORT_INDEX_FILE_PATH'
+
+
+# ENV VIEW
+
+## [ str ] - Whether executables and libraries of the packages are collected in an env view, `1` to enable.
+MECO_ENV_VIEW                              = 'MECO_ENV_VIEW'
+
+## [ str ] - Absolute path of the env view of the environment.
+MECO_ENV_VIEW_PATH                         = 'MECO_ENV_VIEW_PATH'
+
+
+# COMPLETION
+
+## [ str ] - Absolute path of the completion index file read by the shell completion functions.
+MECO_COMPLETION_INDEX_FILE_PATH            = 'MECO_COMPLETION_INDEX_FILE_PATH'
+
+
+# DAEMON
+
+## [ str ] - Absolute path of the Unix domain socket of the settings daemon.
+MECO_SETTINGS_DAEMON_SOCKET_PATH           = 'MECO_SETTINGS_DAEMON_SOCKET_PATH'
+
+
+# FILE SYSTEM
+
+## [ str ] - Delay in milliseconds added to each file system call of mMecoSettings.fileSystemLib, used to simulate NFS.
+MECO_FILE_SYSTEM_LATENCY                   = 'MECO_FILE_SYSTEM_LATENCY'
\ No newline at end of file
@@ -0,0 +1,409 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/envViewLib.py    @brief [ FILE   ] - Env view module.
+## @package mMecoSettings.envViewLib       @brief [ MODULE ] - Env view module.
+#
+#  Each package adds its `bin/<system>`, `python/bin` and `lib/<system>` directories to `PATH` and the library
+#  path, so the shell and the dynamic loader search dozens of directories. When `MECO_ENV_VIEW` is set to `1` on
+#  Linux or Darwin, these entries are removed from mMecoSettings.packageGlobalEnvLib by the pre-build callback. Instead an env view, which is
+#  a directory containing a `bin` and a `lib` directory of symlinks to the files of all initialized packages,
+#  is created and `PATH` and the library path get one entry each.
+#
+#  Env views are cached by a fingerprint of the packages and their directories. Links are created in the order the
+#  package entries would have in `PATH`, see mMecoSettings.envViewLib.getPathOrder, so if several packages provide a
+#  file with the same name, the file, which the shell would have found first, is used and the collision is reported.
+#
+#  Env views are kept in the private temporary directory of the user, see
+#  mMecoSettings.fileSystemLib.getUserTemporaryPath, so another user can't create a view, which ends up in `PATH`.
+#  Each use of a view updates its modification time, and views, which haven't been used for `MAX_AGE` seconds, are
+#  removed when a new view is created.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  json
+import  time
+import  hashlib
+
+from    platform import system
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.envTemplateLib
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.pathMergeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ tuple of str ] - Platforms, which support env views.
+PLATFORMS           = ('Linux', 'Darwin')
+
+#
+## [ list of str ] - Names of the directories in the env view, the entries of `PATH` and the library path of the
+#  packages are collected into them in this order, see mMecoSettings.envViewLib.getSourceDirectories.
+VIEW_DIRECTORIES    = ['bin', 'lib']
+
+#
+## [ str ] - Name of the file, which contains the collisions of an env view, it is written once the view is complete.
+COLLISIONS_FILE_NAME = 'collisions.json'
+
+#
+## [ int ] - Age in seconds of the env views, which are removed when a new view is created.
+MAX_AGE             = 7 * 24 * 60 * 60
+
+#
+## [ str ] - Name of the directory of the env views in the private temporary directory of the user.
+DIRECTORY_NAME      = 'env-view'
+
+#
+## @brief [ CLASS ] - Env view.
+class EnvView(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path       [ str         | None | in  ] - Absolute path of the env view.
+    #  @param collisions [ list of list | None | in  ] - Collisions, each item is a list of the path of the file in the
+    #                                                    view, the used file and the ignored file.
+    #  @param cached     [ bool        | None | in  ] - Whether the env view has been created before.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path, collisions, cached):
+
+        ## [ str ] - Absolute path.
+        self._path          = path
+
+        ## [ list of list ] - Collisions.
+        self._collisions    = collisions
+
+        ## [ bool ] - Whether the env view has been created before.
+        self._cached        = cached
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Absolute path of the env view.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Absolute path of the bin directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def binPath(self):
+
+        return os.path.join(self._path, 'bin')
+
+    #
+    ## @brief Absolute path of the lib directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def libPath(self):
+
+        return os.path.join(self._path, 'lib')
+
+    #
+    ## @brief Collisions.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Each item is a list of the path of the file in the view, the used file and the ignored file.
+    def collisions(self):
+
+        return self._collisions
+
+    #
+    ## @brief Whether the env view has been created before.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isCached(self):
+
+        return self._cached
+
+#
+## @brief Determine whether env view mode is enabled.
+#
+#  @param environ      [ dict | os.environ | in  ] - Current environment.
+#  @param platformName [ str  | None       | in  ] - Platform name, current platform is used if not given.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isEnabled(environ=None, platformName=None):
+
+    environ = os.environ if environ is None else environ
+
+    if not (platformName or system()) in PLATFORMS:
+        return False
+
+    return environ.get(mMecoSettings.envVariablesLib.MECO_ENV_VIEW, '').lower() in ('1', 'true', 'yes', 'on')
+
+#
+## @brief Get library path variable name of given platform.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin.
+#
+#  @exception N/A
+#
+#  @return str - Variable name.
+def getLibraryPathName(platformName):
+
+    return 'DYLD_FALLBACK_LIBRARY_PATH' if platformName == 'Darwin' else 'LD_LIBRARY_PATH'
+
+#
+## @brief Get the directories of given packages, which are collected into the env view.
+#
+#  Directories are the entries of mMecoSettings.packageGlobalEnvLib replaced by the env view, they are expanded for
+#  all packages at once, see mMecoSettings.envTemplateLib.getEnvViewTable. Duplicate directories and directories,
+#  which don't exist, are removed keeping the order, see mMecoSettings.pathMergeLib.mergeVariables.
+#
+#  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages.
+#  @param platformName [ str         | None | in  ] - Platform name, one of the following; Linux, Darwin, current
+#                                                     platform is used if not given.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Each item is a tuple of the name of a directory in the env view and absolute paths of the
+#                          directories collected into it ordered by package.
+def getSourceDirectories(packagePaths, platformName=None):
+
+    platformName = platformName or system()
+    names        = ['PATH', getLibraryPathName(platformName)]
+    paths        = mMecoSettings.envTemplateLib.getEnvViewTable(platformName).expand(packagePaths)
+    results      = mMecoSettings.pathMergeLib.mergeVariables(dict((x, paths.get(x, [])) for x in names))
+
+    return [(x, results[y].paths()) for x, y in zip(VIEW_DIRECTORIES, names)]
+
+#
+## @brief Get given packages in the order their entries have in `PATH`.
+#
+#  Meco adds the entries of each package when the package is accepted by
+#  mMecoSettings.callbackLib.shouldInitializePackage, and each entry is prepended to its variable, so the entries of
+#  the package accepted last come first.
+#
+#  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages in the order they
+#                                                     have been accepted, see mMecoSettings.importIndexLib.getPackages.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the roots of the packages.
+def getPathOrder(packagePaths):
+
+    return list(reversed(packagePaths))
+
+#
+## @brief Get fingerprint of given packages.
+#
+#  Modification time of each collected directory is part of the fingerprint, so adding or removing a file in a
+#  package creates a new env view.
+#
+#  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages.
+#
+#  @exception N/A
+#
+#  @return str - Fingerprint.
+def getFingerprint(packagePaths):
+
+    return _getFingerprint(getSourceDirectories(packagePaths))
+
+#
+## @brief Get env view of given packages, it is created if it doesn't exist.
+#
+#  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages in the order of `PATH`,
+#                                                     see mMecoSettings.envViewLib.getPathOrder.
+#  @param directory    [ str         | None | in  ] - Absolute path of the directory of the env views, a directory in
+#                                                     the private temporary directory of the user is used if not given.
+#
+#  @exception OSError - If the private temporary directory of the user can't be used.
+#
+#  @return mMecoSettings.envViewLib.EnvView - Env view.
+def build(packagePaths, directory=None):
+
+    directory         = directory or mMecoSettings.fileSystemLib.getUserTemporaryPath(DIRECTORY_NAME)
+    sourceDirectories = getSourceDirectories(packagePaths)
+    path              = os.path.join(directory, _getFingerprint(sourceDirectories))
+
+    collisionsFilePath = os.path.join(path, COLLISIONS_FILE_NAME)
+    if mMecoSettings.fileSystemLib.isFile(collisionsFilePath):
+
+        with mMecoSettings.fileSystemLib.openFile(collisionsFilePath, 'r') as inFile:
+            collisions = json.loads(inFile.read())
+
+        # View is in use, so it isn't removed as a stale one
+        try:
+            mMecoSettings.fileSystemLib.utime(path)
+        except OSError:
+            pass
+
+        return EnvView(path, collisions, True)
+
+    if not mMecoSettings.fileSystemLib.isDir(directory):
+        try:
+            mMecoSettings.fileSystemLib.makeDirs(directory)
+        except OSError:
+            # Created by another process
+            pass
+
+    # The view is created in a temporary directory and renamed, so other processes never use a partial view
+    temporaryPath = '{}.{}'.format(path, os.getpid())
+    collisions    = []
+
+    # Left by a process with the same pid, which didn't finish
+    if mMecoSettings.fileSystemLib.isDir(temporaryPath):
+        mMecoSettings.fileSystemLib.removeTree(temporaryPath)
+
+    for viewDirectoryName, viewSourceDirectories in sourceDirectories:
+
+        viewDirectory = os.path.join(temporaryPath, viewDirectoryName)
+        mMecoSettings.fileSystemLib.makeDirs(viewDirectory)
+
+        files = {}
+
+        for sourceDirectory in viewSourceDirectories:
+
+            try:
+                names = sorted(mMecoSettings.fileSystemLib.listDir(sourceDirectory))
+            except OSError:
+                continue
+
+            for name in names:
+
+                sourcePath = os.path.join(sourceDirectory, name)
+
+                if name in files:
+                    collisions.append([os.path.join(path, viewDirectoryName, name), files[name], sourcePath])
+                    continue
+
+                files[name] = sourcePath
+                mMecoSettings.fileSystemLib.symlink(sourcePath, os.path.join(viewDirectory, name))
+
+    with mMecoSettings.fileSystemLib.openFile(os.path.join(temporaryPath, COLLISIONS_FILE_NAME), 'w') as outFile:
+        outFile.write(json.dumps(collisions, indent=4))
+
+    try:
+        mMecoSettings.fileSystemLib.rename(temporaryPath, path)
+    except OSError:
+        # Created by another process at the same time
+        try:
+            mMecoSettings.fileSystemLib.removeTree(temporaryPath)
+        except OSError:
+            pass
+
+    removeStaleViews(directory, [path])
+
+    return EnvView(path, collisions, False)
+
+#
+## @brief Remove env views and unfinished temporary views, which haven't been used for given time.
+#
+#  @param directory [ str         | None                                | in  ] - Absolute path of the directory of the env views.
+#  @param keepPaths [ list of str | None                                | in  ] - Absolute paths of the env views to keep.
+#  @param maxAge    [ int         | mMecoSettings.envViewLib.MAX_AGE    | in  ] - Age in seconds.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the removed env views.
+def removeStaleViews(directory, keepPaths=None, maxAge=MAX_AGE):
+
+    try:
+        names = mMecoSettings.fileSystemLib.listDir(directory)
+    except OSError:
+        return []
+
+    removed = []
+    now     = time.time()
+
+    for name in names:
+
+        path = os.path.join(directory, name)
+        if path in (keepPaths or []):
+            continue
+
+        try:
+            if now - mMecoSettings.fileSystemLib.stat(path).st_mtime <= maxAge:
+                continue
+            mMecoSettings.fileSystemLib.removeTree(path)
+        except OSError:
+            # Removed by another process
+            continue
+
+        removed.append(path)
+
+    return removed
+
+#
+## @brief Get report of the collisions of given env view.
+#
+#  @param envView [ mMecoSettings.envViewLib.EnvView | None | in  ] - Env view.
+#
+#  @exception N/A
+#
+#  @return list of str - Lines, empty if there is no collision.
+def getReport(envView):
+
+    return ['Env view collision: {} -> {}, ignored: {}'.format(*x) for x in envView.collisions()]
+
+#
+## @brief Get fingerprint of given source directories.
+#
+#  @param sourceDirectories [ list of tuple | None | in  ] - Directories returned by mMecoSettings.envViewLib.getSourceDirectories.
+#
+#  @exception N/A
+#
+#  @return str - Fingerprint.
+def _getFingerprint(sourceDirectories):
+
+    fingerprint = hashlib.sha1()
+
+    for _, paths in sourceDirectories:
+        for path in paths:
+
+            try:
+                modificationTime = mMecoSettings.fileSystemLib.stat(path).st_mtime
+            except OSError:
+                continue
+
+            fingerprint.update('{}|{}\n'.format(path, modificationTime).encode('utf-8'))
+
+    return fingerprint.hexdigest()
@@ -41,4 +41,10 @@ class ValidEnvironmentIsNotError(Exception):
 ## @brief [ EXCEPTION CLASS ] - Missing package error.
 class MissingPackageError(Exception):
 
+    pass
+
+#
+## @brief [ EXCEPTION CLASS ] - Invalid env snapshot error.
+class InvalidSnapshotError(Exception):
+
     pass
\ No newline at end of file
@@ -0,0 +1,1426 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/fileSystemLib.py    @brief [ FILE   ] - File system module.
+## @package mMecoSettings.fileSystemLib       @brief [ MODULE ] - File system module.
+#
+#  Modules on the launch path access the file system through the functions of this module, which forward the calls
+#  to the file system set by mMecoSettings.fileSystemLib.setFileSystem;
+#
+#  - mMecoSettings.settingsLib, mMecoSettings.appLib and mMecoSettings.callbackLib.
+#  - mMecoSettings.logLib rotation, mMecoSettings.completionLib, mMecoSettings.activationScriptLib including the
+#    scripts read while flattening, mMecoSettings.importIndexLib, mMecoSettings.envViewLib and
+#    mMecoSettings.snapshotLib.
+#
+#  Launch problems show up on NFS, where each metadata operation takes several milliseconds. When
+#  `MECO_FILE_SYSTEM_LATENCY` is set to a number of milliseconds, every call is delayed by that much and counted by
+#  a mMecoSettings.fileSystemLib.LatencyFileSystem, so the sensitivity of each feature to storage latency can be
+#  measured on a local disk.
+#
+#  mMecoSettings.fileSystemLib.CachingFileSystem keeps the results of the calls, and
+#  mMecoSettings.fileSystemLib.MemoryFileSystem holds a project tree in memory, so path resolution, including the
+#  log rotation of mMecoSettings.settingsLib.getLogFilePath, and package filtering can be simulated without touching
+#  the disk, apart from the calls listed as not routed below. A tree is captured and loaded as follows;
+#
+#  @code
+#  fileSystem = mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory('/projects')
+#  fileSystem.write('/tmp/projects.json')
+#
+#  mMecoSettings.fileSystemLib.setFileSystem(mMecoSettings.fileSystemLib.MemoryFileSystem.read('/tmp/projects.json'))
+#  @endcode
+#
+#  Not routed through this module;
+#
+#  - Calls made by other packages, such as the app listing of mMecoSettings.appLib, which uses mFileSystem.
+#  - Imports, including the package info modules imported by mMecoSettings.callbackLib unless the file system is in
+#    memory, and the file finders of mMecoSettings.importIndexLib.
+#  - Records written by mMecoSettings.logLib.append and mMecoSettings.logLib.AppendLogWriter, which need a file
+#    descriptor opened with `O_APPEND`.
+#  - Profile files written by mMecoSettings.profileLib, which measures the calls of this module.
+#  - Temporary directory lookups of `tempfile.gettempdir`, and the creation and the ownership checks of the private
+#    temporary directory of the user by mMecoSettings.fileSystemLib.getUserTemporaryPath, which are skipped when the
+#    file system is in memory.
+#
+#  Files, which are reused by other processes of the user, such as generated activation scripts, import indices and
+#  env views, are kept in the private temporary directory of the user, which only the user can write into. Otherwise
+#  another user could create them first in the shared temporary directory and get their content used.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  io
+import  os
+import  json
+import  time
+import  errno
+import  shutil
+import  tempfile
+import  threading
+
+from    stat    import S_IFDIR, S_IFREG, S_ISDIR
+from    getpass import getuser
+
+import  mMecoSettings.envVariablesLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Version of the memory file system format.
+FORMAT_VERSION      = 1
+
+#
+## [ tuple ] - Extensions of the files, whose content is kept by mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory.
+CONTENT_EXTENSIONS  = ('.py', '.json')
+
+#
+## [ int ] - Size in bytes of the largest file, whose content is kept by mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory.
+MAX_CONTENT_SIZE    = 1024 * 1024
+
+#
+## [ str ] - Name of the private temporary directory of a user, formatted with the user id.
+USER_TEMPORARY_NAME = 'mmecosettings-{}'
+
+#
+## @brief [ CLASS ] - File system of the operating system.
+class FileSystem(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Determine whether given path is a file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isFile(self, path):
+
+        return os.path.isfile(path)
+
+    #
+    ## @brief Determine whether given path is a directory.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isDir(self, path):
+
+        return os.path.isdir(path)
+
+    #
+    ## @brief Determine whether given path exists.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def exists(self, path):
+
+        return os.path.exists(path)
+
+    #
+    ## @brief List names in given directory.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception OSError - If the directory doesn't exist.
+    #
+    #  @return list of str - Names.
+    def listDir(self, path):
+
+        return os.listdir(path)
+
+    #
+    ## @brief Create given directory and its parents.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception OSError - If the directory can't be created.
+    #
+    #  @return None - None.
+    def makeDirs(self, path):
+
+        os.makedirs(path)
+
+    #
+    ## @brief Get status of given path.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception OSError - If the path doesn't exist.
+    #
+    #  @return os.stat_result - Status.
+    def stat(self, path):
+
+        return os.stat(path)
+
+    #
+    ## @brief Open given file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #  @param mode [ str | r    | in  ] - Mode.
+    #
+    #  @exception IOError - If the file can't be opened.
+    #
+    #  @return file - File object.
+    def openFile(self, path, mode='r'):
+
+        return open(path, mode)
+
+    #
+    ## @brief Rename given path, an existing file at the destination is replaced on POSIX.
+    #
+    #  @param path            [ str | None | in  ] - Absolute path.
+    #  @param destinationPath [ str | None | in  ] - Absolute path of the destination.
+    #
+    #  @exception OSError - If the path can't be renamed.
+    #
+    #  @return None - None.
+    def rename(self, path, destinationPath):
+
+        os.rename(path, destinationPath)
+
+    #
+    ## @brief Remove given file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a file.
+    #
+    #  @exception OSError - If the file can't be removed.
+    #
+    #  @return None - None.
+    def remove(self, path):
+
+        os.remove(path)
+
+    #
+    ## @brief Remove given directory and its content.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception OSError - If the directory can't be removed.
+    #
+    #  @return None - None.
+    def removeTree(self, path):
+
+        shutil.rmtree(path)
+
+    #
+    ## @brief Create a symlink.
+    #
+    #  @param sourcePath [ str | None | in  ] - Absolute path the symlink points to.
+    #  @param path       [ str | None | in  ] - Absolute path of the symlink.
+    #
+    #  @exception OSError - If the symlink can't be created.
+    #
+    #  @return None - None.
+    def symlink(self, sourcePath, path):
+
+        os.symlink(sourcePath, path)
+
+    #
+    ## @brief Set access and modification times of given path.
+    #
+    #  @param path  [ str   | None | in  ] - Absolute path.
+    #  @param times [ tuple | None | in  ] - Access and modification times, current time is used if not given.
+    #
+    #  @exception OSError - If the path doesn't exist.
+    #
+    #  @return None - None.
+    def utime(self, path, times=None):
+
+        os.utime(path, times)
+
+#
+## @brief [ CLASS ] - File system, which delays and counts the calls made to another file system.
+class LatencyFileSystem(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param fileSystem [ object | None | in  ] - File system the calls are forwarded to,
+    #                                             mMecoSettings.fileSystemLib.FileSystem is used if not given.
+    #  @param latency    [ float  | 0.0  | in  ] - Delay of each call in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, fileSystem=None, latency=0.0):
+
+        ## [ object ] - File system the calls are forwarded to.
+        self._fileSystem    = fileSystem or FileSystem()
+
+        ## [ float ] - Delay of each call in seconds.
+        self._latency       = latency
+
+        ## [ threading.Lock ] - Lock.
+        self._lock          = threading.Lock()
+
+        ## [ dict ] - Keys are method names, values are numbers of calls.
+        self._calls         = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief File system the calls are forwarded to.
+    #
+    #  @exception N/A
+    #
+    #  @return object - File system.
+    def fileSystem(self):
+
+        return self._fileSystem
+
+    #
+    ## @brief Delay of each call in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Seconds.
+    def latency(self):
+
+        return self._latency
+
+    #
+    ## @brief Numbers of calls.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are method names, values are numbers of calls.
+    def calls(self):
+
+        with self._lock:
+            return dict(self._calls)
+
+    #
+    ## @brief Total number of calls.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of calls.
+    def callCount(self):
+
+        with self._lock:
+            return sum(self._calls.values())
+
+    #
+    ## @brief Reset numbers of calls.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def reset(self):
+
+        with self._lock:
+            self._calls.clear()
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isFile.
+    def isFile(self, path):
+
+        return self._call('isFile', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isDir.
+    def isDir(self, path):
+
+        return self._call('isDir', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.exists.
+    def exists(self, path):
+
+        return self._call('exists', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.listDir.
+    def listDir(self, path):
+
+        return self._call('listDir', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.makeDirs.
+    def makeDirs(self, path):
+
+        return self._call('makeDirs', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.stat.
+    def stat(self, path):
+
+        return self._call('stat', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.openFile.
+    def openFile(self, path, mode='r'):
+
+        return self._call('openFile', path, mode)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.rename.
+    def rename(self, path, destinationPath):
+
+        return self._call('rename', path, destinationPath)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.remove.
+    def remove(self, path):
+
+        return self._call('remove', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.removeTree.
+    def removeTree(self, path):
+
+        return self._call('removeTree', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.symlink.
+    def symlink(self, sourcePath, path):
+
+        return self._call('symlink', sourcePath, path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.utime.
+    def utime(self, path, times=None):
+
+        return self._call('utime', path, times)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Count, delay and forward a call.
+    #
+    #  @param name [ str   | None | in  ] - Method name.
+    #  @param args [ tuple | None | in  ] - Arguments.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Return value of the method.
+    def _call(self, name, *args):
+
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+        # Sleeping releases the GIL, so calls made by the steps of mMecoSettings.stepLib overlap as they would on NFS
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+        return getattr(self._fileSystem, name)(*args)
+
+#
+## @brief [ CLASS ] - File system, which keeps the results of the calls made to another file system.
+#
+#  Results are kept until a directory or a file is created, changed or removed through this file system, or
+#  mMecoSettings.fileSystemLib.CachingFileSystem.clear is invoked. Changes made by other processes are not seen, so
+#  it must not be used by long running processes, such as mMecoSettings.daemonLib.
+class CachingFileSystem(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param fileSystem [ object | None | in  ] - File system the calls are forwarded to,
+    #                                             mMecoSettings.fileSystemLib.FileSystem is used if not given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, fileSystem=None):
+
+        ## [ object ] - File system the calls are forwarded to.
+        self._fileSystem    = fileSystem or FileSystem()
+
+        ## [ threading.Lock ] - Lock.
+        self._lock          = threading.Lock()
+
+        ## [ dict ] - Keys are tuples of method name and path, values are results.
+        self._cache         = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief File system the calls are forwarded to.
+    #
+    #  @exception N/A
+    #
+    #  @return object - File system.
+    def fileSystem(self):
+
+        return self._fileSystem
+
+    #
+    ## @brief Clear the results.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def clear(self):
+
+        with self._lock:
+            self._cache.clear()
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isFile.
+    def isFile(self, path):
+
+        return self._get('isFile', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isDir.
+    def isDir(self, path):
+
+        return self._get('isDir', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.exists.
+    def exists(self, path):
+
+        return self._get('exists', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.listDir.
+    def listDir(self, path):
+
+        return list(self._get('listDir', path))
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.makeDirs.
+    def makeDirs(self, path):
+
+        self.clear()
+
+        return self._fileSystem.makeDirs(path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.stat.
+    def stat(self, path):
+
+        return self._get('stat', path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.openFile.
+    #
+    #  Content of the files opened for reading in text mode is kept.
+    def openFile(self, path, mode='r'):
+
+        if mode in ('r', 'rt'):
+            return _getStringIO(self._get('read', path))
+
+        if not mode.startswith('r'):
+            self.clear()
+
+        return self._fileSystem.openFile(path, mode)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.rename.
+    def rename(self, path, destinationPath):
+
+        self.clear()
+
+        return self._fileSystem.rename(path, destinationPath)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.remove.
+    def remove(self, path):
+
+        self.clear()
+
+        return self._fileSystem.remove(path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.removeTree.
+    def removeTree(self, path):
+
+        self.clear()
+
+        return self._fileSystem.removeTree(path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.symlink.
+    def symlink(self, sourcePath, path):
+
+        self.clear()
+
+        return self._fileSystem.symlink(sourcePath, path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.utime.
+    def utime(self, path, times=None):
+
+        self.clear()
+
+        return self._fileSystem.utime(path, times)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the result of a call, the call is forwarded if its result is not kept.
+    #
+    #  Exceptions aren't kept, so missing paths are looked up again by listDir and stat.
+    #
+    #  @param name [ str | None | in  ] - Method name, `read` reads the content of a file.
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Result.
+    def _get(self, name, path):
+
+        key = (name, path)
+
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        if name == 'read':
+            with self._fileSystem.openFile(path, 'r') as inFile:
+                result = inFile.read()
+        else:
+            result = getattr(self._fileSystem, name)(path)
+
+        with self._lock:
+            self._cache[key] = result
+
+        return result
+
+#
+## @brief [ CLASS ] - File system, which holds directories and files in memory.
+#
+#  Content of a file may be missing, in which case the file exists but can't be read. This is the case for the files
+#  which aren't kept by mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory. Files written in binary mode keep
+#  bytes, which aren't written by mMecoSettings.fileSystemLib.MemoryFileSystem.write unless they are UTF-8 text.
+#  Symlinks are kept as copies of the file they point to, symlinks to directories are kept as files without content.
+class MemoryFileSystem(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param root [ str | None | in  ] - Absolute path of the directory the paths are written relative to,
+    #                                     absolute paths are written if not given.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, root=None):
+
+        ## [ str ] - Absolute path of the directory the paths are written relative to.
+        self._root          = os.path.normpath(root) if root else None
+
+        ## [ threading.RLock ] - Lock.
+        self._lock          = threading.RLock()
+
+        ## [ dict ] - Keys are absolute paths of the directories, values are sets of the names in them.
+        self._directories   = {}
+
+        ## [ dict ] - Keys are absolute paths of the files, values are contents, None if content is missing.
+        self._files         = {}
+
+        ## [ float ] - Modification time of the directories and files, which haven't been written.
+        self._time          = time.time()
+
+        ## [ dict ] - Keys are absolute paths, values are modification times of the written directories and files.
+        self._times         = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Absolute path of the directory the paths are written relative to.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute path.
+    #  @return None - If absolute paths are written.
+    def root(self):
+
+        return self._root
+
+    #
+    ## @brief Add a directory and its parents.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a directory.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addDir(self, path):
+
+        path      = os.path.normpath(path)
+        childName = None
+
+        with self._lock:
+
+            while True:
+
+                names   = self._directories.get(path)
+                existed = names is not None
+
+                if not existed:
+                    names = self._directories[path] = set()
+
+                if childName:
+                    names.add(childName)
+
+                parentPath = os.path.dirname(path)
+                if existed or parentPath == path:
+                    break
+
+                childName = os.path.basename(path)
+                path      = parentPath
+
+    #
+    ## @brief Add a file and its parent directories.
+    #
+    #  @param path    [ str | None | in  ] - Absolute path of a file.
+    #  @param content [ str | ''   | in  ] - Content, None if the content is missing.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addFile(self, path, content=''):
+
+        path = os.path.normpath(path)
+
+        with self._lock:
+            self.addDir(os.path.dirname(path))
+            self._directories[os.path.dirname(path)].add(os.path.basename(path))
+            self._files[path] = content
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isFile.
+    def isFile(self, path):
+
+        return os.path.normpath(path) in self._files
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.isDir.
+    def isDir(self, path):
+
+        return os.path.normpath(path) in self._directories
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.exists.
+    def exists(self, path):
+
+        return self.isFile(path) or self.isDir(path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.listDir.
+    def listDir(self, path):
+
+        with self._lock:
+
+            names = self._directories.get(os.path.normpath(path))
+            if names is None:
+                raise _getError(OSError, errno.ENOTDIR if self.isFile(path) else errno.ENOENT, path)
+
+            return sorted(names)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.makeDirs.
+    def makeDirs(self, path):
+
+        if self.exists(path):
+            raise _getError(OSError, errno.EEXIST, path)
+
+        self.addDir(path)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.stat.
+    def stat(self, path):
+
+        path = os.path.normpath(path)
+
+        if path in self._files:
+            mode = S_IFREG | 0o644
+            size = len(self._files[path] or '')
+        elif path in self._directories:
+            mode = S_IFDIR | 0o755
+            size = 0
+        else:
+            raise _getError(OSError, errno.ENOENT, path)
+
+        modificationTime = self._times.get(path, self._time)
+
+        return os.stat_result((mode, 0, 0, 1, 0, 0, size, modificationTime, modificationTime, modificationTime))
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.openFile.
+    def openFile(self, path, mode='r'):
+
+        path = os.path.normpath(path)
+
+        if mode.startswith('r'):
+
+            if not path in self._files:
+                raise _getError(IOError, errno.ENOENT, path)
+
+            if self._files[path] is None:
+                raise IOError('Content of the file is not in memory: {}'.format(path))
+
+            if 'b' in mode:
+                return io.BytesIO(_getBytes(self._files[path]))
+
+            return _getStringIO(self._files[path])
+
+        if not self.isDir(os.path.dirname(path)):
+            raise _getError(IOError, errno.ENOENT, path)
+
+        content = (self._files.get(path) or '') if mode.startswith('a') else ''
+
+        if 'b' in mode:
+            return _MemoryBinaryFile(self, path, _getBytes(content))
+
+        return _MemoryFile(self, path, content)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.rename.
+    def rename(self, path, destinationPath):
+
+        path            = os.path.normpath(path)
+        destinationPath = os.path.normpath(destinationPath)
+
+        with self._lock:
+
+            if not self.exists(path):
+                raise _getError(OSError, errno.ENOENT, path)
+
+            if not self.isDir(os.path.dirname(destinationPath)):
+                raise _getError(OSError, errno.ENOENT, destinationPath)
+
+            if path == destinationPath:
+                return
+
+            if path in self._files:
+
+                if self.isDir(destinationPath):
+                    raise _getError(OSError, errno.EISDIR, destinationPath)
+
+                modificationTime = self._times.get(path, self._time)
+
+                self.addFile(destinationPath, self._files[path])
+                self.remove(path)
+
+                self._times[destinationPath] = modificationTime
+                self._setModified(os.path.dirname(destinationPath))
+                return
+
+            if self.isFile(destinationPath) or self._directories.get(destinationPath):
+                raise _getError(OSError, errno.ENOTEMPTY if self.isDir(destinationPath) else errno.ENOTDIR, destinationPath)
+
+            prefix = path + os.sep
+
+            for directoryPath in sorted(x for x in self._directories if x == path or x.startswith(prefix)):
+                self.addDir(destinationPath + directoryPath[len(path):])
+
+            for filePath in [x for x in self._files if x.startswith(prefix)]:
+                self.addFile(destinationPath + filePath[len(path):], self._files[filePath])
+
+            self.removeTree(path)
+
+            self._setModified(os.path.dirname(destinationPath))
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.remove.
+    def remove(self, path):
+
+        path = os.path.normpath(path)
+
+        with self._lock:
+
+            if not path in self._files:
+                raise _getError(OSError, errno.EISDIR if self.isDir(path) else errno.ENOENT, path)
+
+            del self._files[path]
+            self._times.pop(path, None)
+            self._directories[os.path.dirname(path)].discard(os.path.basename(path))
+
+            self._setModified(os.path.dirname(path))
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.removeTree.
+    def removeTree(self, path):
+
+        path   = os.path.normpath(path)
+        prefix = path + os.sep
+
+        with self._lock:
+
+            if not path in self._directories:
+                raise _getError(OSError, errno.ENOTDIR if self.isFile(path) else errno.ENOENT, path)
+
+            for filePath in [x for x in self._files if x.startswith(prefix)]:
+                del self._files[filePath]
+                self._times.pop(filePath, None)
+
+            for directoryPath in [x for x in self._directories if x == path or x.startswith(prefix)]:
+                del self._directories[directoryPath]
+                self._times.pop(directoryPath, None)
+
+            parentPath = os.path.dirname(path)
+            if parentPath != path and parentPath in self._directories:
+                self._directories[parentPath].discard(os.path.basename(path))
+                self._setModified(parentPath)
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.symlink.
+    def symlink(self, sourcePath, path):
+
+        path = os.path.normpath(path)
+
+        with self._lock:
+
+            if self.exists(path):
+                raise _getError(OSError, errno.EEXIST, path)
+
+            if not self.isDir(os.path.dirname(path)):
+                raise _getError(OSError, errno.ENOENT, path)
+
+            self.addFile(path, self._files.get(os.path.normpath(sourcePath)))
+
+            self._setModified(os.path.dirname(path))
+
+    #
+    ## @brief See mMecoSettings.fileSystemLib.FileSystem.utime.
+    def utime(self, path, times=None):
+
+        path = os.path.normpath(path)
+
+        with self._lock:
+
+            if not self.exists(path):
+                raise _getError(OSError, errno.ENOENT, path)
+
+            self._times[path] = times[1] if times else time.time()
+
+    #
+    ## @brief Get the directories and files as a dict.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Directories and files.
+    def asDict(self):
+
+        with self._lock:
+            return {'version'       : FORMAT_VERSION,
+                    'root'          : self._root or '',
+                    'directories'   : sorted(_getRelativePath(x, self._root) for x, y in self._directories.items() if not y),
+                    'files'         : dict((_getRelativePath(x, self._root), _getText(y)) for x, y in self._files.items())}
+
+    #
+    ## @brief Write the directories and files.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a JSON file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, path):
+
+        with open(path, 'w') as outFile:
+            outFile.write(json.dumps(self.asDict(), sort_keys=True))
+
+    #
+    ## @brief Create a file system from a dict.
+    #
+    #  @param data [ dict | None | in  ] - Directories and files, see mMecoSettings.fileSystemLib.MemoryFileSystem.asDict.
+    #  @param root [ str  | None | in  ] - Absolute path the relative paths are resolved against, the root of the
+    #                                      data is used if not given.
+    #
+    #  @exception ValueError - If the format of the data is not supported.
+    #
+    #  @return mMecoSettings.fileSystemLib.MemoryFileSystem - File system.
+    @staticmethod
+    def fromDict(data, root=None):
+
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError('Unsupported memory file system format: {}'.format(data.get('version')))
+
+        root       = root or data.get('root') or None
+        fileSystem = MemoryFileSystem(root)
+
+        for path in data.get('directories', []):
+            fileSystem.addDir(os.path.join(root or '', path))
+
+        for path, content in data.get('files', {}).items():
+            fileSystem.addFile(os.path.join(root or '', path), content)
+
+        return fileSystem
+
+    #
+    ## @brief Read a file system written by mMecoSettings.fileSystemLib.MemoryFileSystem.write.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a JSON file.
+    #  @param root [ str | None | in  ] - Absolute path the relative paths are resolved against, the root of the
+    #                                     file is used if not given.
+    #
+    #  @exception IOError    - If the file can't be read.
+    #  @exception ValueError - If the format of the file is not supported.
+    #
+    #  @return mMecoSettings.fileSystemLib.MemoryFileSystem - File system.
+    @staticmethod
+    def read(path, root=None):
+
+        with open(path, 'r') as inFile:
+            return MemoryFileSystem.fromDict(json.loads(inFile.read()), root)
+
+    #
+    ## @brief Create a file system from a directory on disk.
+    #
+    #  @param path              [ str   | None               | in  ] - Absolute path of a directory.
+    #  @param contentExtensions [ tuple | CONTENT_EXTENSIONS | in  ] - Extensions of the files whose content is kept,
+    #                                                                  content of the other files is missing.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoSettings.fileSystemLib.MemoryFileSystem - File system.
+    @staticmethod
+    def fromDirectory(path, contentExtensions=CONTENT_EXTENSIONS):
+
+        fileSystem = MemoryFileSystem(path)
+        fileSystem.addDir(path)
+
+        for directoryPath, directoryNames, fileNames in os.walk(path):
+
+            for name in directoryNames:
+                fileSystem.addDir(os.path.join(directoryPath, name))
+
+            for name in fileNames:
+
+                filePath = os.path.join(directoryPath, name)
+                content  = None
+
+                if name.endswith(contentExtensions) and os.path.getsize(filePath) <= MAX_CONTENT_SIZE:
+                    try:
+                        with open(filePath, 'r') as inFile:
+                            content = inFile.read()
+                    except (IOError, UnicodeDecodeError):
+                        content = None
+
+                fileSystem.addFile(filePath, content)
+
+        return fileSystem
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set modification time of given directory or file to the current time.
+    #
+    #  @param path [ str | None | in  ] - Absolute path.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _setModified(self, path):
+
+        self._times[os.path.normpath(path)] = time.time()
+
+#
+## @brief [ CLASS ] - File opened for writing in a mMecoSettings.fileSystemLib.MemoryFileSystem.
+class _MemoryFile(io.StringIO):
+
+    def __init__(self, fileSystem, path, content=''):
+
+        super(_MemoryFile, self).__init__(_getUnicode(content))
+
+        self._fileSystem    = fileSystem
+        self._path          = path
+
+        self.seek(0, io.SEEK_END)
+
+    def close(self):
+
+        if not self.closed:
+            self._fileSystem.addFile(self._path, self.getvalue())
+            self._fileSystem._setModified(self._path)
+            self._fileSystem._setModified(os.path.dirname(self._path))
+
+        super(_MemoryFile, self).close()
+
+#
+## @brief [ CLASS ] - File opened for writing in binary mode in a mMecoSettings.fileSystemLib.MemoryFileSystem.
+class _MemoryBinaryFile(io.BytesIO):
+
+    def __init__(self, fileSystem, path, content=b''):
+
+        super(_MemoryBinaryFile, self).__init__(content)
+
+        self._fileSystem    = fileSystem
+        self._path          = path
+
+        self.seek(0, io.SEEK_END)
+
+    def close(self):
+
+        if not self.closed:
+            self._fileSystem.addFile(self._path, self.getvalue())
+            self._fileSystem._setModified(self._path)
+            self._fileSystem._setModified(os.path.dirname(self._path))
+
+        super(_MemoryBinaryFile, self).close()
+
+#
+## @brief Get given text as unicode.
+#
+#  @param text [ str | None | in  ] - Text.
+#
+#  @exception N/A
+#
+#  @return unicode - Text.
+def _getUnicode(text):
+
+    if isinstance(text, bytes) and not isinstance(text, type(u'')):
+        return text.decode('utf-8')
+
+    return text
+
+#
+## @brief Get given content as bytes.
+#
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return bytes - Content.
+def _getBytes(content):
+
+    if isinstance(content, bytes):
+        return content
+
+    return content.encode('utf-8')
+
+#
+## @brief Get given content as text, which can be written into a JSON file.
+#
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return unicode - Content.
+#  @return None    - If the content is missing or it is not UTF-8 text.
+def _getText(content):
+
+    if content is None:
+        return None
+
+    try:
+        return _getUnicode(content)
+    except UnicodeDecodeError:
+        return None
+
+#
+## @brief Get a file object, which reads given content.
+#
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return io.StringIO - File object.
+def _getStringIO(content):
+
+    return io.StringIO(_getUnicode(content))
+
+#
+## @brief Get an error of a missing or an existing path.
+#
+#  @param errorClass [ type | None | in  ] - Exception class.
+#  @param code       [ int  | None | in  ] - Error code.
+#  @param path       [ str  | None | in  ] - Absolute path.
+#
+#  @exception N/A
+#
+#  @return Exception - Error.
+def _getError(errorClass, code, path):
+
+    return errorClass(code, os.strerror(code), path)
+
+#
+## @brief Get given path relative to given root.
+#
+#  @param path [ str | None | in  ] - Absolute path.
+#  @param root [ str | None | in  ] - Absolute path of the root, path is returned as is if not given.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def _getRelativePath(path, root):
+
+    if not root:
+        return path
+
+    return os.path.relpath(path, root)
+
+#
+## [ object ] - File system in use.
+_FILE_SYSTEM = FileSystem()
+
+#
+## @brief Get the file system in use.
+#
+#  @exception N/A
+#
+#  @return object - File system.
+def getFileSystem():
+
+    return _FILE_SYSTEM
+
+#
+## @brief Set the file system in use.
+#
+#  @param fileSystem [ object | None | in  ] - File system, mMecoSettings.fileSystemLib.FileSystem is used if not given.
+#
+#  @exception N/A
+#
+#  @return object - Previous file system.
+def setFileSystem(fileSystem=None):
+
+    global _FILE_SYSTEM
+
+    previous     = _FILE_SYSTEM
+    _FILE_SYSTEM = fileSystem or FileSystem()
+
+    return previous
+
+#
+## @brief Determine whether the calls are eventually forwarded to a mMecoSettings.fileSystemLib.MemoryFileSystem.
+#
+#  @param fileSystem [ object | None | in  ] - File system, the file system in use is checked if not given.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isInMemory(fileSystem=None):
+
+    fileSystem = fileSystem or _FILE_SYSTEM
+
+    while not isinstance(fileSystem, MemoryFileSystem) and hasattr(fileSystem, 'fileSystem'):
+        fileSystem = fileSystem.fileSystem()
+
+    return isinstance(fileSystem, MemoryFileSystem)
+
+#
+## @brief Get the latency requested by the environment.
+#
+#  @param environ [ dict | os.environ | in  ] - Current environment.
+#
+#  @exception N/A
+#
+#  @return float - Seconds.
+#  @return None  - If no latency is requested or the value is invalid.
+def getRequestedLatency(environ=None):
+
+    environ = os.environ if environ is None else environ
+
+    try:
+        milliseconds = float(environ.get(mMecoSettings.envVariablesLib.MECO_FILE_SYSTEM_LATENCY, ''))
+    except ValueError:
+        return None
+
+    return max(milliseconds, 0.0) / 1000.0
+
+#
+## @brief Get the id of the current user.
+#
+#  @exception N/A
+#
+#  @return str - User id on POSIX, user name on Windows.
+def getUserId():
+
+    if hasattr(os, 'getuid'):
+        return str(os.getuid())
+
+    return getuser()
+
+#
+## @brief Determine whether given path on the disk is owned by the current user.
+#
+#  Symbolic links aren't followed, so a link created by another user isn't owned by the current user. Paths are
+#  considered owned on Windows, where the temporary directory is private to the user.
+#
+#  @param path [ str | None | in  ] - Absolute path.
+#
+#  @exception N/A
+#
+#  @return bool - Result, False if the path doesn't exist.
+def isOwned(path):
+
+    try:
+        status = os.lstat(path)
+    except OSError:
+        return False
+
+    if not hasattr(os, 'getuid'):
+        return True
+
+    return status.st_uid == os.getuid()
+
+#
+## @brief Determine whether given path on the disk is a directory, which only the current user can access.
+#
+#  @param path [ str | None | in  ] - Absolute path.
+#
+#  @exception N/A
+#
+#  @return bool - Result, False if the path doesn't exist.
+def isPrivateDir(path):
+
+    if not isOwned(path):
+        return False
+
+    status = os.lstat(path)
+    if not S_ISDIR(status.st_mode):
+        return False
+
+    return not hasattr(os, 'getuid') or not status.st_mode & 0o077
+
+#
+## @brief Get absolute path in the private temporary directory of the current user.
+#
+#  The directory is created with mode `0700` in the temporary directory if it doesn't exist. It isn't used if it is
+#  owned by another user, if it is a symbolic link or if other users can access it.
+#
+#  @param names [ tuple of str | None | in  ] - Names joined to the path of the directory.
+#
+#  @exception OSError - If the directory can't be created or it isn't private.
+#
+#  @return str - Absolute path.
+def getUserTemporaryPath(*names):
+
+    path = os.path.join(tempfile.gettempdir(), USER_TEMPORARY_NAME.format(getUserId()))
+
+    # Memory file systems have no other users
+    if not isInMemory():
+
+        try:
+            os.mkdir(path, 0o700)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+        if not isPrivateDir(path):
+            raise OSError(errno.EPERM, 'Temporary directory isn\'t private to the current user', path)
+
+    return os.path.join(path, *names)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.isFile.
+def isFile(path):
+
+    return _FILE_SYSTEM.isFile(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.isDir.
+def isDir(path):
+
+    return _FILE_SYSTEM.isDir(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.exists.
+def exists(path):
+
+    return _FILE_SYSTEM.exists(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.listDir.
+def listDir(path):
+
+    return _FILE_SYSTEM.listDir(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.makeDirs.
+def makeDirs(path):
+
+    return _FILE_SYSTEM.makeDirs(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.stat.
+def stat(path):
+
+    return _FILE_SYSTEM.stat(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.openFile.
+def openFile(path, mode='r'):
+
+    return _FILE_SYSTEM.openFile(path, mode)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.rename.
+def rename(path, destinationPath):
+
+    return _FILE_SYSTEM.rename(path, destinationPath)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.remove.
+def remove(path):
+
+    return _FILE_SYSTEM.remove(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.removeTree.
+def removeTree(path):
+
+    return _FILE_SYSTEM.removeTree(path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.symlink.
+def symlink(sourcePath, path):
+
+    return _FILE_SYSTEM.symlink(sourcePath, path)
+
+#
+## @brief See mMecoSettings.fileSystemLib.FileSystem.utime.
+def utime(path, times=None):
+
+    return _FILE_SYSTEM.utime(path, times)
+
+#
+# Latency is applied as soon as this module is imported, so the calls made before the callbacks,
+# such as the ones made by mMecoSettings.settingsLib.getAppFilePath, are delayed as well
+if getRequestedLatency() is not None:
+    setFileSystem(LatencyFileSystem(FileSystem(), getRequestedLatency()))
@@ -0,0 +1,204 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/flagLib.py    @brief [ FILE   ] - Custom flag module.
+## @package mMecoSettings.flagLib       @brief [ MODULE ] - Custom flag module.
+#
+#  Custom flags are the flags Meco doesn't know about, which are provided by `allLib.request().unknownArgs()`.
+#  Flags are registered once in this module, parser of each platform is built once and the arguments of a request
+#  are parsed once, parsed flags are shared by all callbacks.
+#
+#  Flags are prefixed with `-` on Windows and `--` on other platforms, for instance `-custom-flag` and `--custom-flag`.
+#  Parsed values are available as attributes, dashes are replaced with underscores, for instance `custom_flag`.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  sys
+import  argparse
+
+from    platform import system
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Custom flag registry.
+class FlagRegistry(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of tuple ] - Flags, each item is a tuple of flag name and keyword arguments of `add_argument`.
+        self._flags     = []
+
+        ## [ dict ] - Keys are platform names, values are argparse.ArgumentParser instances.
+        self._parsers   = {}
+
+        ## [ dict ] - Keys are tuples of platform name and arguments, values are argparse.Namespace instances.
+        self._results   = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Register a flag.
+    #
+    #  @param name   [ str  | None | in  ] - Name of the flag without the prefix such as `custom-flag`.
+    #  @param kwargs [ dict | None | in  ] - Keyword arguments of `argparse.ArgumentParser.add_argument`.
+    #
+    #  @exception ValueError - If given flag is already registered.
+    #
+    #  @return None - None.
+    def register(self, name, **kwargs):
+
+        if name in self.names():
+            raise ValueError('Flag is already registered: {}'.format(name))
+
+        self._flags.append((name, kwargs))
+
+        self._parsers   = {}
+        self._results   = {}
+
+    #
+    ## @brief Names of the registered flags.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Flag names.
+    def names(self):
+
+        return [x[0] for x in self._flags]
+
+    #
+    ## @brief Get parser of given platform.
+    #
+    #  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #
+    #  @exception N/A
+    #
+    #  @return argparse.ArgumentParser - Parser.
+    def parser(self, platformName):
+
+        parser = self._parsers.get(platformName)
+        if parser:
+            return parser
+
+        prefix = getPrefix(platformName)
+
+        parser = argparse.ArgumentParser(add_help=False)
+        for name, kwargs in self._flags:
+            parser.add_argument('{}{}'.format(prefix, name), dest=name.replace('-', '_'), **kwargs)
+
+        self._parsers[platformName] = parser
+
+        return parser
+
+    #
+    ## @brief Parse given arguments.
+    #
+    #  @param platformName [ str         | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #  @param args         [ list of str | None | in  ] - Arguments.
+    #
+    #  @exception N/A
+    #
+    #  @return argparse.Namespace - Parsed flags.
+    def parse(self, platformName, args):
+
+        key = (platformName, tuple(args or []))
+
+        result = self._results.get(key)
+        if result is None:
+            result = self.parser(platformName).parse_known_args(list(key[1]))[0]
+            self._results[key] = result
+
+        return result
+
+#
+## [ mMecoSettings.flagLib.FlagRegistry ] - Flag registry shared by all callbacks.
+_REGISTRY = FlagRegistry()
+
+#
+## @brief Get prefix of the flags for given platform.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return str - Prefix.
+def getPrefix(platformName):
+
+    return '-' if platformName == 'Windows' else '--'
+
+#
+## @brief Register a flag.
+#
+#  @param name   [ str  | None | in  ] - Name of the flag without the prefix such as `custom-flag`.
+#  @param kwargs [ dict | None | in  ] - Keyword arguments of `argparse.ArgumentParser.add_argument`.
+#
+#  @exception ValueError - If given flag is already registered.
+#
+#  @return None - None.
+def register(name, **kwargs):
+
+    _REGISTRY.register(name, **kwargs)
+
+#
+## @brief Get flags of the current request.
+#
+#  @param allLib [ mMeco.libs.allLib.All | None | in  ] - All libraries.
+#
+#  @exception N/A
+#
+#  @return argparse.Namespace - Parsed flags.
+def getFlags(allLib):
+
+    return _REGISTRY.parse(allLib.request().platform(), allLib.request().unknownArgs())
+
+#
+## @brief Get flags given to the current process.
+#
+#  Used before a request exists, for instance by the settings functions, which Meco invokes before the callbacks.
+#
+#  @exception N/A
+#
+#  @return argparse.Namespace - Parsed flags.
+def getProcessFlags():
+
+    return _REGISTRY.parse(system(), sys.argv[1:])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# FLAGS
+#-----------------------------------------------------------------------------------------------------
+register('custom-flag', action='store_true', default=False, help='Custom flag')
+register('profile',     action='store_true', default=False, help='Profile the env build, see mMecoSettings.profileLib')
@@ -0,0 +1,399 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/importIndexLib.py    @brief [ FILE   ] - Import index module.
+## @package mMecoSettings.importIndexLib       @brief [ MODULE ] - Import index module.
+#
+#  With hundreds of packages `sys.path` contains hundreds of directories and every import stats through them
+#  in order. When `MECO_IMPORT_INDEX` is set to `1`, the post-build callback writes an index, which maps top-level
+#  module names to the Python directories of the initialized packages, and sets `MECO_IMPORT_INDEX_FILE_PATH`.
+#
+#  Module names are taken from `PYTHON_PACKAGES` of the package info module of each package, which is parsed
+#  without being imported. The Python directory of the package is listed if `PYTHON_PACKAGES` is not available.
+#
+#  Sessions, for instance Maya via `userSetup.py`, call mMecoSettings.importIndexLib.install so a `sys.meta_path`
+#  finder resolves the indexed modules with one lookup. Modules which are not indexed are found by the regular
+#  path finder.
+#
+#  The index keeps every package, which provides a module. If more than one package provides a module, the one whose
+#  Python directory comes first in `sys.path` of the session wins, so the index resolves modules in `PYTHONPATH`
+#  order like the regular path finder does, regardless of the order Meco accepts the packages in.
+#
+#  Index files are written to the private temporary directory of the user, see
+#  mMecoSettings.fileSystemLib.getUserTemporaryPath, and an index file owned by another user is never installed.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  sys
+import  ast
+import  json
+import  hashlib
+import  collections
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.stepLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Version of the index format.
+FORMAT_VERSION  = 2
+
+#
+## [ collections.OrderedDict ] - Keys are absolute paths of the packages accepted by
+#  mMecoSettings.callbackLib.shouldInitializePackage in the order they are accepted, values are None.
+_PACKAGES       = collections.OrderedDict()
+
+#
+## @brief [ CLASS ] - Meta path finder, which resolves top-level modules by using an import index.
+class IndexFinder(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param modules [ dict | None | in  ] - Keys are top-level module names, values are absolute paths of directories.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, modules):
+
+        ## [ dict ] - Keys are top-level module names, values are absolute paths of directories.
+        self._modules = modules
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Modules.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are top-level module names, values are absolute paths of directories.
+    def modules(self):
+
+        return self._modules
+
+    #
+    ## @brief Find spec of given module, Python 3.
+    #
+    #  @param fullname [ str         | None | in  ] - Full name of the module.
+    #  @param path     [ list of str | None | in  ] - Path of the parent package, `None` for top-level modules.
+    #  @param target   [ module      | None | in  ] - Target module.
+    #
+    #  @exception N/A
+    #
+    #  @return importlib.machinery.ModuleSpec - Spec.
+    #  @return None                           - If the module is not indexed.
+    def find_spec(self, fullname, path=None, target=None):
+
+        if path is not None:
+            return None
+
+        directory = self._modules.get(fullname)
+        if not directory:
+            return None
+
+        return _getFileFinder(directory).find_spec(fullname)
+
+    #
+    ## @brief Find loader of given module, used by Python versions, which don't call find_spec.
+    #
+    #  @param fullname [ str         | None | in  ] - Full name of the module.
+    #  @param path     [ list of str | None | in  ] - Path of the parent package, `None` for top-level modules.
+    #
+    #  @exception N/A
+    #
+    #  @return object - Loader.
+    #  @return None   - If the module is not indexed.
+    def find_module(self, fullname, path=None):
+
+        spec = self.find_spec(fullname, path)
+
+        return spec.loader if spec else None
+
+#
+## @brief Add a package, which is going to be initialized.
+#
+#  @param packagePath [ str | None | in  ] - Absolute path of the root of a package.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def addPackage(packagePath):
+
+    _PACKAGES.setdefault(packagePath)
+
+#
+## @brief Get packages, which are going to be initialized.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the packages in the order they have been added.
+def getPackages():
+
+    return list(_PACKAGES)
+
+#
+## @brief Clear the packages, invoked when a build starts so packages of a previous build in the same process are
+#  not used.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clearPackages():
+
+    _PACKAGES.clear()
+
+#
+## @brief Determine whether generating import index is enabled.
+#
+#  @param environ [ dict | os.environ | in  ] - Current environment.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isEnabled(environ=None):
+
+    environ = os.environ if environ is None else environ
+
+    return environ.get(mMecoSettings.envVariablesLib.MECO_IMPORT_INDEX, '').lower() in ('1', 'true', 'yes', 'on')
+
+#
+## @brief Get top-level module names of given package.
+#
+#  @param packagePath [ str | None | in  ] - Absolute path of the root of a package.
+#
+#  @exception N/A
+#
+#  @return list of str - Module names.
+def getModuleNames(packagePath):
+
+    packageName       = os.path.basename(packagePath)
+    packagePythonPath = os.path.join(packagePath, 'python')
+
+    try:
+        with mMecoSettings.fileSystemLib.openFile(os.path.join(packagePythonPath, packageName, 'packageInfoLib.py'), 'r') as infoFile:
+            tree = ast.parse(infoFile.read())
+    except (IOError, OSError, SyntaxError):
+        tree = None
+
+    if tree:
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(getattr(x, 'id', None) == 'PYTHON_PACKAGES' for x in node.targets):
+                try:
+                    return list(ast.literal_eval(node.value))
+                except ValueError:
+                    break
+
+    # PYTHON_PACKAGES is not available, list the Python directory
+    moduleNames = []
+
+    try:
+        names = sorted(mMecoSettings.fileSystemLib.listDir(packagePythonPath))
+    except OSError:
+        return moduleNames
+
+    for name in names:
+
+        if name.endswith('.py'):
+            moduleNames.append(name[:-3])
+
+        elif mMecoSettings.fileSystemLib.isFile(os.path.join(packagePythonPath, name, '__init__.py')):
+            moduleNames.append(name)
+
+    return moduleNames
+
+#
+## @brief Build import index of given packages.
+#
+#  @param packagePaths [ list of str | None | in  ] - Absolute paths of the roots of the packages.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are top-level module names, values are lists of absolute paths of the directories, which
+#                 provide the module, in the order of the given packages.
+def build(packagePaths):
+
+    moduleNames = mMecoSettings.stepLib.getThreadPool().map(getModuleNames, packagePaths) if packagePaths else []
+
+    modules = {}
+    for packagePath, names in zip(packagePaths, moduleNames):
+        for name in names:
+            directories = modules.setdefault(name, [])
+            directory   = os.path.join(packagePath, 'python')
+            if not directory in directories:
+                directories.append(directory)
+
+    return modules
+
+#
+## @brief Resolve each module of given import index to the directory, which comes first in given search path.
+#
+#  Modules none of whose directories are in the search path are left out, so they are found by the regular path
+#  finder like they would be without an index.
+#
+#  @param modules [ dict        | None | in  ] - Import index returned by mMecoSettings.importIndexLib.build.
+#  @param paths   [ list of str | None | in  ] - Search path such as `sys.path`, an empty entry is the current directory.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are top-level module names, values are absolute paths of directories.
+def resolve(modules, paths):
+
+    order = {}
+    for index, path in enumerate(paths):
+        order.setdefault(_getPathKey(path), index)
+
+    result = {}
+
+    for name, directories in modules.items():
+
+        ranked = [(order[_getPathKey(x)], x) for x in directories if _getPathKey(x) in order]
+        if ranked:
+            result[name] = min(ranked)[1]
+
+    return result
+
+#
+## @brief Write an import index.
+#
+#  Name of the file is derived from its content, so an existing index is reused.
+#
+#  @param modules   [ dict | None | in  ] - Import index returned by mMecoSettings.importIndexLib.build.
+#  @param directory [ str  | None | in  ] - Absolute path of a directory, private temporary directory of the user is
+#                                          used if not given.
+#
+#  @exception OSError - If the private temporary directory of the user can't be used.
+#
+#  @return str - Absolute path of the index file.
+def write(modules, directory=None):
+
+    content = json.dumps({'version': FORMAT_VERSION, 'modules': modules}, separators=(',', ':'), sort_keys=True)
+    path    = os.path.join(directory or mMecoSettings.fileSystemLib.getUserTemporaryPath(),
+                           'mmecosettings-import-index-{}.json'.format(hashlib.sha1(content.encode('utf-8')).hexdigest()))
+
+    if mMecoSettings.fileSystemLib.isFile(path):
+        return path
+
+    temporaryPath = '{}.{}'.format(path, os.getpid())
+
+    with mMecoSettings.fileSystemLib.openFile(temporaryPath, 'w') as outFile:
+        outFile.write(content)
+
+    # Sessions mustn't read partially written indices
+    mMecoSettings.fileSystemLib.rename(temporaryPath, path)
+
+    return path
+
+#
+## @brief Read an import index.
+#
+#  @param path [ str | None | in  ] - Absolute path of the index file.
+#
+#  @exception ValueError - If the version of the index is not supported.
+#
+#  @return dict - Import index, see mMecoSettings.importIndexLib.build.
+def read(path):
+
+    with mMecoSettings.fileSystemLib.openFile(path, 'r') as inFile:
+        data = json.loads(inFile.read())
+
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError('Import index version is not supported: {}'.format(data.get('version')))
+
+    return data['modules']
+
+#
+## @brief Install the finder of the import index of the environment.
+#
+#  Modules are resolved in the order of `sys.path` when the finder is installed.
+#
+#  @param path [ str | None | in  ] - Absolute path of the index file, `MECO_IMPORT_INDEX_FILE_PATH` is used if not given.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.importIndexLib.IndexFinder - Finder.
+#  @return None                                     - If there is no index or it is owned by another user.
+def install(path=None):
+
+    for finder in sys.meta_path:
+        if isinstance(finder, IndexFinder):
+            return finder
+
+    path = path or os.environ.get(mMecoSettings.envVariablesLib.MECO_IMPORT_INDEX_FILE_PATH)
+    if not path or not mMecoSettings.fileSystemLib.isFile(path):
+        return None
+
+    # Index decides which module is imported, so an index written by another user is never used
+    if not mMecoSettings.fileSystemLib.isInMemory() and not mMecoSettings.fileSystemLib.isOwned(path):
+        return None
+
+    try:
+        import importlib.machinery
+    except ImportError:
+        # Finder requires importlib.machinery, modules are found by the regular path finder
+        return None
+
+    finder = IndexFinder(resolve(read(path), sys.path))
+    sys.meta_path.insert(0, finder)
+
+    return finder
+
+#
+## @brief Get the key of given search path entry, which is used to compare entries.
+#
+#  @param path [ str | None | in  ] - Search path entry, an empty entry is the current directory.
+#
+#  @exception N/A
+#
+#  @return str - Key.
+def _getPathKey(path):
+
+    return os.path.normcase(os.path.abspath(path or os.curdir))
+
+#
+## @brief Get a file finder of given directory.
+#
+#  @param directory [ str | None | in  ] - Absolute path of a directory.
+#
+#  @exception N/A
+#
+#  @return importlib.machinery.FileFinder - Finder.
+def _getFileFinder(directory):
+
+    from importlib.machinery import FileFinder, ExtensionFileLoader, SourceFileLoader, SourcelessFileLoader
+    from importlib.machinery import EXTENSION_SUFFIXES, SOURCE_SUFFIXES, BYTECODE_SUFFIXES
+
+    return FileFinder(directory,
+                      (ExtensionFileLoader,  EXTENSION_SUFFIXES),
+                      (SourceFileLoader,     SOURCE_SUFFIXES),
+                      (SourcelessFileLoader, BYTECODE_SUFFIXES))
@@ -0,0 +1,492 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/logLib.py    @brief [ FILE   ] - Log file module.
+## @package mMecoSettings.logLib       @brief [ MODULE ] - Log file module.
+#
+#  Env log files provided by mMecoSettings.settingsLib.getLogFilePath are rotated by size and age.
+#  Rotation usually costs a single stat on the launch path. When a log file is rotated, it is only renamed and the
+#  rotated segments are compressed with gzip by a detached process, see mMecoSettings.logLib.startCompression.
+#  Launcher processes are short lived, so compression isn't left to a background thread, which would be killed at
+#  exit. If the process can't be started, segments are compressed right away; segments larger than
+#  mMecoSettings.logLib.MAX_COMPRESSION_BYTES are kept uncompressed, so the cost stays bounded. Temporary files left
+#  by killed processes are removed by the next compression.
+#
+#  Several Meco processes may write into the same log file at once. Records are written with a single `write`
+#  call on a file descriptor opened with `O_APPEND`, so lines of concurrent processes never interleave.
+#  No file locks are used since they may stall on NFS.
+#
+#  Rotation goes through mMecoSettings.fileSystemLib. Records are written to the file descriptor directly, since
+#  file objects of the file systems don't guarantee a single `write` call.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  re
+import  sys
+import  gzip
+import  time
+import  shutil
+
+import  mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Size in bytes, log files larger than this are rotated.
+MAX_BYTES               = 5 * 1024 * 1024
+
+#
+## [ int ] - Age in seconds, log files which haven't been written for longer than this are rotated and
+#  rotated segments older than this are removed.
+MAX_AGE                 = 14 * 24 * 60 * 60
+
+#
+## [ int ] - Number of rotated segments kept for each log file.
+BACKUP_COUNT            = 5
+
+#
+## [ int ] - Size in bytes, rotated segments larger than this are not compressed.
+MAX_COMPRESSION_BYTES   = 2 * MAX_BYTES
+
+#
+## [ str ] - Code run by the compression process, arguments are the root of the Python package, path of the log
+#  file, maximum age and number of rotated segments to keep.
+COMPRESSION_CODE        = ('import sys; sys.path.insert(0, sys.argv[1]); import mMecoSettings.logLib; '
+                           'mMecoSettings.logLib.compressSegments(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))')
+
+#
+## [ int ] - Age in seconds, temporary files of compression older than this are left by killed processes.
+STALE_TEMPORARY_AGE     = 60 * 60
+
+#
+## [ list of subprocess.Popen ] - Compression processes started by this process, they are kept referenced since the
+#  launcher doesn't wait for them.
+_COMPRESSION_PROCESSES  = []
+
+#
+## [ str ] - Extension of compressed segments.
+COMPRESSED_EXTENSION    = 'gz'
+
+#
+## [ str ] - Time format used in names of rotated segments.
+SEGMENT_TIME_FORMAT     = '%Y%m%d-%H%M%S'
+
+#
+## [ int ] - Flags used to open log files for appending.
+APPEND_FLAGS            = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+#
+## [ int ] - Mode of created log files, umask is applied.
+FILE_MODE               = 0o666
+
+
+#
+## @brief [ CLASS ] - Multi-process safe append only log writer.
+#
+#  Each record or batch of records is written with a single `write` call, therefore records written by
+#  concurrent processes don't interleave.
+#
+#  Log file is kept open, it should be rotated before the writer is created, which is the case for the log files
+#  provided by mMecoSettings.settingsLib.getLogFilePath.
+class AppendLogWriter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the log file.
+    #
+    #  @exception OSError - If the log file can't be opened.
+    #
+    #  @return None - None.
+    def __init__(self, path):
+
+        ## [ str ] - Absolute path of the log file.
+        self._path          = path
+
+        ## [ int ] - File descriptor.
+        self._fileDescriptor = os.open(path, APPEND_FLAGS, FILE_MODE)
+
+    #
+    ## @brief Enter context.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoSettings.logLib.AppendLogWriter - This instance.
+    def __enter__(self):
+
+        return self
+
+    #
+    ## @brief Exit context.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __exit__(self, excType, excValue, traceback):
+
+        self.close()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Absolute path of the log file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Write given line as a single record.
+    #
+    #  @param line [ str | None | in  ] - Line, new line character is added if it is missing.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def writeLine(self, line):
+
+        if not line.endswith('\n'):
+            line = '{}\n'.format(line)
+
+        _write(self._fileDescriptor, line)
+
+    #
+    ## @brief Write given lines as a single record.
+    #
+    #  @param lines [ list of str | None | in  ] - Lines, new line characters are added if they are missing.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def writeLines(self, lines):
+
+        if not lines:
+            return
+
+        _write(self._fileDescriptor, ''.join(x if x.endswith('\n') else '{}\n'.format(x) for x in lines))
+
+    #
+    ## @brief Close the log file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._fileDescriptor is None:
+            return
+
+        os.close(self._fileDescriptor)
+        self._fileDescriptor = None
+
+#
+## @brief Append given content to given log file as a single record.
+#
+#  Log file is opened for each call, so content always ends up in the current log file even if it has been rotated
+#  by another process.
+#
+#  @param path    [ str | None | in  ] - Absolute path of the log file.
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def append(path, content):
+
+    fileDescriptor = os.open(path, APPEND_FLAGS, FILE_MODE)
+
+    try:
+        _write(fileDescriptor, content)
+    finally:
+        os.close(fileDescriptor)
+
+#
+## @brief Rotate given log file if it is larger or older than given limits.
+#
+#  Log file is renamed, rotated segments are compressed by mMecoSettings.logLib.compressSegments.
+#
+#  @param path        [ str  | None                              | in  ] - Absolute path of the log file.
+#  @param maxBytes    [ int  | mMecoSettings.logLib.MAX_BYTES    | in  ] - Maximum size in bytes.
+#  @param maxAge      [ int  | mMecoSettings.logLib.MAX_AGE      | in  ] - Maximum age in seconds.
+#  @param backupCount [ int  | mMecoSettings.logLib.BACKUP_COUNT | in  ] - Number of rotated segments to keep.
+#  @param background  [ bool | True                              | in  ] - Whether segments are compressed by a
+#                                                                          detached process.
+#
+#  @exception N/A
+#
+#  @return bool - `True` if the log file has been rotated, `False` otherwise.
+def rotate(path, maxBytes=MAX_BYTES, maxAge=MAX_AGE, backupCount=BACKUP_COUNT, background=True):
+
+    try:
+        stat = mMecoSettings.fileSystemLib.stat(path)
+    except OSError:
+        return False
+
+    now = time.time()
+
+    if stat.st_size < maxBytes and now - stat.st_mtime < maxAge:
+        return False
+
+    segmentPath = getSegmentPath(path, now)
+
+    try:
+        mMecoSettings.fileSystemLib.rename(path, segmentPath)
+    except OSError:
+        # Another process has rotated the file already
+        return False
+
+    if not (background and startCompression(path, maxAge, backupCount)):
+        compressSegments(path, maxAge, backupCount)
+
+    return True
+
+#
+## @brief Start a detached process, which compresses the rotated segments of given log file.
+#
+#  The process outlives the launcher. Segments of a log file on an in-memory file system of
+#  mMecoSettings.fileSystemLib can't be reached by another process, so no process is started for them.
+#
+#  @param path        [ str | None                              | in  ] - Absolute path of the log file.
+#  @param maxAge      [ int | mMecoSettings.logLib.MAX_AGE      | in  ] - Maximum age in seconds.
+#  @param backupCount [ int | mMecoSettings.logLib.BACKUP_COUNT | in  ] - Number of rotated segments to keep.
+#
+#  @exception N/A
+#
+#  @return subprocess.Popen - Process.
+#  @return None             - If the process couldn't be started.
+def startCompression(path, maxAge=MAX_AGE, backupCount=BACKUP_COUNT):
+
+    if not sys.executable or mMecoSettings.fileSystemLib.isInMemory():
+        return None
+
+    # Only imported when a log file is rotated
+    import subprocess
+
+    packageRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    kwargs      = {}
+
+    if os.name == 'nt':
+        # DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+        kwargs['creationflags'] = 0x00000008 | 0x00000200
+    elif sys.version_info[0] > 2:
+        kwargs['start_new_session'] = True
+    else:
+        kwargs['preexec_fn'] = os.setsid
+
+    try:
+        with open(os.devnull, 'r+b') as devNull:
+            process = subprocess.Popen([sys.executable, '-c', COMPRESSION_CODE, packageRoot, path, str(maxAge), str(backupCount)],
+                                       stdin=devNull,
+                                       stdout=devNull,
+                                       stderr=devNull,
+                                       close_fds=os.name != 'nt',
+                                       **kwargs)
+    except (IOError, OSError):
+        return None
+
+    _COMPRESSION_PROCESSES.append(process)
+
+    return process
+
+#
+## @brief Compress rotated segments of given log file and remove the ones which aren't needed anymore.
+#
+#  Segments left uncompressed by a previous process are compressed as well, temporary files left by killed
+#  processes are removed. Rotated segments beyond `backupCount` or older than `maxAge` are removed.
+#
+#  @param path        [ str | None                              | in  ] - Absolute path of the log file.
+#  @param maxAge      [ int | mMecoSettings.logLib.MAX_AGE      | in  ] - Maximum age in seconds.
+#  @param backupCount [ int | mMecoSettings.logLib.BACKUP_COUNT | in  ] - Number of rotated segments to keep.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def compressSegments(path, maxAge=MAX_AGE, backupCount=BACKUP_COUNT):
+
+    compressedSuffix = '.{}'.format(COMPRESSED_EXTENSION)
+    now              = time.time()
+
+    for temporarySegment in getTemporarySegments(path):
+        try:
+            if now - mMecoSettings.fileSystemLib.stat(temporarySegment).st_mtime > STALE_TEMPORARY_AGE:
+                mMecoSettings.fileSystemLib.remove(temporarySegment)
+        except OSError:
+            pass
+
+    for segment in getSegments(path):
+
+        if segment.endswith(compressedSuffix):
+            continue
+
+        try:
+            if mMecoSettings.fileSystemLib.stat(segment).st_size > MAX_COMPRESSION_BYTES:
+                continue
+        except OSError:
+            continue
+
+        compressedSegment   = '{}{}'.format(segment, compressedSuffix)
+        temporarySegment    = '{}.{}'.format(compressedSegment, os.getpid())
+
+        try:
+            with mMecoSettings.fileSystemLib.openFile(segment, 'rb') as inFile:
+                with mMecoSettings.fileSystemLib.openFile(temporarySegment, 'wb') as outFile:
+                    with gzip.GzipFile(os.path.basename(segment), 'wb', fileobj=outFile) as gzipFile:
+                        shutil.copyfileobj(inFile, gzipFile)
+
+            mMecoSettings.fileSystemLib.rename(temporarySegment, compressedSegment)
+            mMecoSettings.fileSystemLib.remove(segment)
+
+        except (IOError, OSError):
+            # Another process is compressing the same segment
+            if mMecoSettings.fileSystemLib.isFile(temporarySegment):
+                mMecoSettings.fileSystemLib.remove(temporarySegment)
+
+    #
+
+    segments = getSegments(path)
+
+    for index, segment in enumerate(segments):
+        try:
+            if index < len(segments) - backupCount or now - mMecoSettings.fileSystemLib.stat(segment).st_mtime > maxAge:
+                mMecoSettings.fileSystemLib.remove(segment)
+        except OSError:
+            pass
+
+#
+## @brief Get path of a rotated segment of given log file.
+#
+#  @param path      [ str   | None | in  ] - Absolute path of the log file.
+#  @param timeStamp [ float | None | in  ] - Time stamp of the rotation.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the segment.
+def getSegmentPath(path, timeStamp):
+
+    base, extension = os.path.splitext(path)
+
+    segmentPath = '{}.{}{}'.format(base, time.strftime(SEGMENT_TIME_FORMAT, time.localtime(timeStamp)), extension)
+
+    index = 1
+    while (mMecoSettings.fileSystemLib.exists(segmentPath) or
+           mMecoSettings.fileSystemLib.exists('{}.{}'.format(segmentPath, COMPRESSED_EXTENSION))):
+        segmentPath = '{}.{}.{}{}'.format(base, time.strftime(SEGMENT_TIME_FORMAT, time.localtime(timeStamp)), index, extension)
+        index += 1
+
+    return segmentPath
+
+#
+## @brief Get rotated segments of given log file.
+#
+#  @param path [ str | None | in  ] - Absolute path of the log file.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the segments, oldest first.
+def getSegments(path):
+
+    base, extension = os.path.splitext(path)
+
+    baseName = re.escape(os.path.basename(base))
+    pattern  = re.compile(r'^{}\.([0-9]{{8}}-[0-9]{{6}})(?:\.([0-9]+))?{}(?:\.{})?$'.format(baseName,
+                                                                                      re.escape(extension),
+                                                                                      COMPRESSED_EXTENSION))
+
+    segments = []
+
+    for segment in _getCandidates(base):
+
+        match = pattern.match(os.path.basename(segment))
+        if match:
+            segments.append((match.group(1), int(match.group(2) or 0), segment))
+
+    return [x[2] for x in sorted(segments)]
+
+#
+## @brief Get temporary files of compression of given log file.
+#
+#  @param path [ str | None | in  ] - Absolute path of the log file.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the temporary files.
+def getTemporarySegments(path):
+
+    base, extension = os.path.splitext(path)
+
+    baseName = re.escape(os.path.basename(base))
+    pattern  = re.compile(r'^{}\.[0-9]{{8}}-[0-9]{{6}}(?:\.[0-9]+)?{}\.{}\.[0-9]+$'.format(baseName,
+                                                                                  re.escape(extension),
+                                                                                  COMPRESSED_EXTENSION))
+
+    return sorted(x for x in _getCandidates(base) if pattern.match(os.path.basename(x)))
+
+#
+## @brief Get the files next to given log file, whose names start with the name of the log file without extension.
+#
+#  @param base [ str | None | in  ] - Absolute path of the log file without extension.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths.
+def _getCandidates(base):
+
+    directory = os.path.dirname(base)
+    prefix    = '{}.'.format(os.path.basename(base))
+
+    try:
+        names = mMecoSettings.fileSystemLib.listDir(directory)
+    except OSError:
+        return []
+
+    return [os.path.join(directory, x) for x in names if x.startswith(prefix)]
+
+#
+## @brief Write given content with a single write call.
+#
+#  Regular files get the whole content in one call, remaining part is only written if the call is interrupted.
+#
+#  @param fileDescriptor [ int | None | in  ] - File descriptor opened with `O_APPEND`.
+#  @param content        [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _write(fileDescriptor, content):
+
+    if not isinstance(content, bytes):
+        content = content.encode('utf-8')
+
+    while content:
+        content = content[os.write(fileDescriptor, content):]
@@ -119,3 +119,58 @@ class MayaWindows(object):
     XBMLANGPATH         = ['FOLDER_NAME\\VERSION\\xbm']
 
 
+
+#
+# ENV VIEW
+#
+## [ list of tuple ] - Each item is a tuple of a class and the name of its variable, whose entries are replaced by the
+#  env view, see mMecoSettings.envViewLib.
+ENV_VIEW_VARIABLES = [(PackageLinux,  'PATH'),
+                      (PackageLinux,  'LD_LIBRARY_PATH'),
+                      (PackageDarwin, 'DYLD_FALLBACK_LIBRARY_PATH')]
+
+#
+## [ dict ] - Keys are items of mMecoSettings.packageGlobalEnvLib.ENV_VIEW_VARIABLES, values are their original entries.
+_ENV_VIEW_ENTRIES  = dict((x, getattr(*x)) for x in ENV_VIEW_VARIABLES)
+
+#
+## @brief Set whether executables and libraries of the packages are collected in an env view.
+#
+#  Entries replaced by the env view are removed when enabled and restored when disabled. This function is invoked by
+#  mMecoSettings.callbackLib.getPreBuild before the environment is resolved.
+#
+#  @param enabled [ bool | None | in  ] - Whether the env view is enabled.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def setEnvViewEnabled(enabled):
+
+    for (templateClass, name), entries in _ENV_VIEW_ENTRIES.items():
+        setattr(templateClass, name, None if enabled else entries)
+
+#
+## @brief Get the original entries of the variables of the package folder structure, which are replaced by the env view.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are variable names, values are their entries.
+def getEnvViewEntries(platformName):
+
+    templateClass = globals()['Package{}'.format(platformName)]
+    entries       = {}
+
+    for _, name in ENV_VIEW_VARIABLES:
+
+        # Class, which defines the variable for the platform, such as PackageDarwin unsetting LD_LIBRARY_PATH
+        definingClass = next((x for x in templateClass.__mro__ if name in vars(x)), None)
+        if definingClass is None:
+            continue
+
+        value = _ENV_VIEW_ENTRIES.get((definingClass, name), getattr(definingClass, name))
+        if value:
+            entries[name] = value
+
+    return entries
@@ -0,0 +1,271 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/paletteLib.py    @brief [ FILE   ] - Terminal palette module.
+## @package mMecoSettings.paletteLib       @brief [ MODULE ] - Terminal palette module.
+#
+#  Terminal display color tables are defined in mMecoSettings.settingsLib. This module turns them into palettes,
+#  which are built once per platform, so rendering an env line is a plain string concatenation of a prefix, the text
+#  and a suffix. Env display gets the palette of a platform with mMecoSettings.paletteLib.getPalette, whereas
+#  mMecoSettings.settingsLib.getTerminalDisplayColors returns a copy of the color table, which callers may modify.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Placeholder used by color format strings.
+PLACEHOLDER = '{}'
+
+#
+## @brief [ CLASS ] - Read only dict.
+#
+#  Color tables are shared between all callers, therefore they can't be modified.
+class FrozenDict(dict):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Prevent item assignment.
+    #
+    #  @exception TypeError - Always.
+    #
+    #  @return None - None.
+    def __setitem__(self, key, value):
+
+        raise TypeError('{} instance can\'t be modified.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Prevent item deletion.
+    #
+    #  @exception TypeError - Always.
+    #
+    #  @return None - None.
+    def __delitem__(self, key):
+
+        raise TypeError('{} instance can\'t be modified.'.format(self.__class__.__name__))
+
+    #
+    ## @brief Reduce so the instance can be copied and pickled.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Class and its arguments.
+    def __reduce__(self):
+
+        return (self.__class__, (dict(self),))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # REIMPLEMENTED PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Prevent modification.
+    #
+    #  @exception TypeError - Always.
+    #
+    #  @return None - None.
+    def _readOnly(self, *args, **kwargs):
+
+        raise TypeError('{} instance can\'t be modified.'.format(self.__class__.__name__))
+
+    clear       = _readOnly
+    pop         = _readOnly
+    popitem     = _readOnly
+    setdefault  = _readOnly
+    update      = _readOnly
+
+#
+## @brief [ CLASS ] - Terminal palette of a platform.
+class Palette(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param colors [ dict | None | in  ] - Color table, see mMecoSettings.settingsLib.getTerminalDisplayColors.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, colors):
+
+        ## [ mMecoSettings.paletteLib.FrozenDict ] - Color table.
+        self._colors    = freeze(colors)
+
+        ## [ dict ] - Keys are (category, key) tuples, values are (prefix, suffix) tuples.
+        self._pairs     = {}
+
+        for category, categoryColors in self._colors.items():
+            for key, color in categoryColors.items():
+                self._pairs[(category, key)] = splitColor(color)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Color table.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoSettings.paletteLib.FrozenDict - Color table.
+    def colors(self):
+
+        return self._colors
+
+    #
+    ## @brief Get a copy of the color table, which can be modified.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Color table.
+    def copyColors(self):
+
+        return thaw(self._colors)
+
+    #
+    ## @brief Get prefix and suffix of a color.
+    #
+    #  @param category [ str | None | in  ] - Category such as `development`, `post-build`.
+    #  @param key      [ str | None | in  ] - Key such as `singleVariable`, `colon`.
+    #
+    #  @exception KeyError - If given category and key is not in the palette.
+    #
+    #  @return tuple of str - Prefix and suffix.
+    def pair(self, category, key):
+
+        return self._pairs[(category, key)]
+
+    #
+    ## @brief Colorize given text.
+    #
+    #  @param category [ str | None | in  ] - Category such as `development`, `post-build`.
+    #  @param key      [ str | None | in  ] - Key such as `singleVariable`, `colon`.
+    #  @param text     [ str | None | in  ] - Text to colorize.
+    #
+    #  @exception KeyError - If given category and key is not in the palette.
+    #
+    #  @return str - Colorized text.
+    def colorize(self, category, key, text):
+
+        prefix, suffix = self._pairs[(category, key)]
+
+        return prefix + text + suffix
+
+#
+## [ dict ] - Keys are platform names, values are mMecoSettings.paletteLib.Palette instances.
+_PALETTES = {}
+
+#
+## @brief Freeze given color table recursively.
+#
+#  @param colors [ dict | None | in  ] - Color table.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.paletteLib.FrozenDict - Frozen color table.
+def freeze(colors):
+
+    if isinstance(colors, FrozenDict):
+        return colors
+
+    return FrozenDict((key, freeze(value) if isinstance(value, dict) else value) for key, value in colors.items())
+
+#
+## @brief Copy given color table recursively into dicts, which can be modified.
+#
+#  @param colors [ dict | None | in  ] - Color table.
+#
+#  @exception N/A
+#
+#  @return dict - Color table.
+def thaw(colors):
+
+    return dict((key, thaw(value) if isinstance(value, dict) else value) for key, value in colors.items())
+
+#
+## @brief Split given color into prefix and suffix.
+#
+#  Colors which have no placeholder, such as Windows color names, have no prefix and suffix.
+#
+#  @param color [ str | None | in  ] - Color such as `\e[38;5;9m{}\e[m`.
+#
+#  @exception N/A
+#
+#  @return tuple of str - Prefix and suffix.
+def splitColor(color):
+
+    if PLACEHOLDER not in color:
+        return ('', '')
+
+    prefix, suffix = color.split(PLACEHOLDER, 1)
+
+    return (prefix, suffix)
+
+#
+## @brief Register palette of given platform.
+#
+#  Platforms sharing the same color table share the same palette.
+#
+#  @param platformName [ str  | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#  @param colors       [ dict | None | in  ] - Color table, see mMecoSettings.settingsLib.getTerminalDisplayColors.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.paletteLib.Palette - Palette.
+def registerPalette(platformName, colors):
+
+    for palette in _PALETTES.values():
+        if palette.colors() is colors:
+            break
+    else:
+        palette = Palette(colors)
+
+    _PALETTES[platformName] = palette
+
+    return palette
+
+#
+## @brief Get palette of given platform.
+#
+#  Palettes are registered by mMecoSettings.settingsLib when it is imported and shared afterwards.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.paletteLib.Palette - Palette.
+#  @return None                             - If given platform is not supported.
+def getPalette(platformName):
+
+    if not _PALETTES:
+        import mMecoSettings.settingsLib
+
+    return _PALETTES.get(platformName)
@@ -0,0 +1,237 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/pathMergeLib.py    @brief [ FILE   ] - Path merge module.
+## @package mMecoSettings.pathMergeLib       @brief [ MODULE ] - Path merge module.
+#
+#  Path variables such as `PATH`, `LD_LIBRARY_PATH` and `PYTHONPATH` built for hundreds of packages contain
+#  duplicate entries and entries which don't exist, such as `lib/linux` of pure Python packages. Every extra entry
+#  costs a lookup, therefore entries are merged before they are used; duplicates are removed keeping the first
+#  occurrence and entries which don't exist are pruned. Existence of the unique entries of all variables is checked
+#  in one batch on the thread pool of mMecoSettings.stepLib.
+#
+#  Entries of `PATH` and the library path of all initialized packages are merged by mMecoSettings.envViewLib before
+#  they are collected into an env view.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.stepLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Result of merging the entries of a variable.
+class MergeResult(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param paths      [ list of str | None | in  ] - Merged entries.
+    #  @param duplicates [ list of str | None | in  ] - Removed duplicate entries.
+    #  @param missing    [ list of str | None | in  ] - Removed entries, which don't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, paths, duplicates, missing):
+
+        ## [ list of str ] - Merged entries.
+        self._paths         = paths
+
+        ## [ list of str ] - Removed duplicate entries.
+        self._duplicates    = duplicates
+
+        ## [ list of str ] - Removed entries, which don't exist.
+        self._missing       = missing
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Merged entries.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Entries.
+    def paths(self):
+
+        return self._paths
+
+    #
+    ## @brief Removed duplicate entries.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Entries.
+    def duplicates(self):
+
+        return self._duplicates
+
+    #
+    ## @brief Removed entries, which don't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Entries.
+    def missing(self):
+
+        return self._missing
+
+    #
+    ## @brief Join merged entries.
+    #
+    #  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value of the variable.
+    def join(self, platformName):
+
+        return (';' if platformName == 'Windows' else ':').join(self._paths)
+
+#
+## @brief Normalize given entry so the same directory written differently is found as a duplicate.
+#
+#  @param path [ str | None | in  ] - Entry.
+#
+#  @exception N/A
+#
+#  @return str - Normalized entry.
+def normalize(path):
+
+    return os.path.normcase(os.path.normpath(path)) if path else path
+
+#
+## @brief Get existence of given entries, checked at the same time.
+#
+#  @param paths [ list of str | None | in  ] - Entries.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are entries, values are whether they exist.
+def getExistence(paths):
+
+    paths = list(set(paths))
+
+    if len(paths) < 2:
+        return dict((x, mMecoSettings.fileSystemLib.exists(x)) for x in paths)
+
+    return dict(zip(paths, mMecoSettings.stepLib.getThreadPool().map(mMecoSettings.fileSystemLib.exists, paths)))
+
+#
+## @brief Merge the entries of given variables.
+#
+#  @param pathsByVariable [ dict | None | in  ] - Keys are variable names, values are lists of entries.
+#  @param prune           [ bool | True | in  ] - Whether entries which don't exist are removed.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are variable names, values are mMecoSettings.pathMergeLib.MergeResult instances.
+def mergeVariables(pathsByVariable, prune=True):
+
+    # Unique entries of all variables, first occurrence wins
+    uniquePaths = {}
+
+    for name, paths in pathsByVariable.items():
+
+        seen        = set()
+        unique      = []
+        duplicates  = []
+
+        for path in paths:
+
+            if not path:
+                continue
+
+            normalizedPath = normalize(path)
+            if normalizedPath in seen:
+                duplicates.append(path)
+                continue
+
+            seen.add(normalizedPath)
+            unique.append(path)
+
+        uniquePaths[name] = (unique, duplicates)
+
+    existence = {}
+    if prune:
+        existence = getExistence([y for x in uniquePaths.values() for y in x[0]])
+
+    results = {}
+
+    for name, (unique, duplicates) in uniquePaths.items():
+
+        if prune:
+            results[name] = MergeResult([x for x in unique if existence[x]],
+                                        duplicates,
+                                        [x for x in unique if not existence[x]])
+        else:
+            results[name] = MergeResult(unique, duplicates, [])
+
+    return results
+
+#
+## @brief Merge the entries of a variable.
+#
+#  @param paths [ list of str | None | in  ] - Entries.
+#  @param prune [ bool        | True | in  ] - Whether entries which don't exist are removed.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.pathMergeLib.MergeResult - Result.
+def merge(paths, prune=True):
+
+    return mergeVariables({None: paths}, prune)[None]
+
+#
+## @brief Get report of the removed entries.
+#
+#  @param results [ dict | None | in  ] - Keys are variable names, values are mMecoSettings.pathMergeLib.MergeResult instances.
+#
+#  @exception N/A
+#
+#  @return list of str - Lines, empty if no entry has been removed.
+def getReport(results):
+
+    lines = []
+
+    for name in sorted(results, key=str):
+
+        result = results[name]
+
+        for path in result.duplicates():
+            lines.append('{}: duplicate: {}'.format(name, path))
+
+        for path in result.missing():
+            lines.append('{}: missing: {}'.format(name, path))
+
+    return lines
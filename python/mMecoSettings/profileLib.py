@@ -0,0 +1,537 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/profileLib.py    @brief [ FILE   ] - Profile module.
+## @package mMecoSettings.profileLib       @brief [ MODULE ] - Profile module.
+#
+#  Profiling is enabled by setting `MECO_PROFILE` to `1` or by the `--profile` flag (`-profile` on Windows), which
+#  is registered in mMecoSettings.flagLib. Both start profiling when this module is imported, the flag is read from
+#  the arguments of the process by mMecoSettings.flagLib.getProcessFlags, so the functions invoked by Meco before
+#  the callbacks are recorded as well. Functions decorated with mMecoSettings.profileLib.profile record their wall
+#  time, the number of file system calls and the number of modules imported while they run. Imports are counted
+#  when the import system looks a module up, so modules removed from `sys.modules` afterwards are counted too.
+#  When the process exits two files are written;
+#
+#  - `<path>.folded` - Stacks in the folded format of flamegraph tools, weights are self times in microseconds.
+#  - `<path>.txt`    - Summary table, one row for each profiled function.
+#
+#  `<path>` is the value of `MECO_PROFILE_FILE_PATH` or a path in the temporary directory. When profiling is not
+#  enabled, decorated functions cost one extra call.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  sys
+import  time
+import  atexit
+import  tempfile
+import  threading
+import  functools
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.flagLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Extension of the stack file.
+STACK_EXTENSION     = '.folded'
+
+#
+## [ str ] - Extension of the summary file.
+SUMMARY_EXTENSION   = '.txt'
+
+#
+## [ list of tuple ] - File system functions counted while profiling, each item is a tuple of module and
+#  function name.
+FILE_SYSTEM_FUNCTIONS = [(os,       'stat'),
+                         (os,       'lstat'),
+                         (os,       'listdir'),
+                         (os,       'mkdir'),
+                         (os,       'makedirs'),
+                         (os,       'remove'),
+                         (os,       'rename'),
+                         (os.path,  'exists'),
+                         (os.path,  'isfile'),
+                         (os.path,  'isdir'),
+                         (os.path,  'islink'),
+                         (os.path,  'getsize'),
+                         (os.path,  'getmtime')]
+
+if hasattr(os, 'scandir'):
+    FILE_SYSTEM_FUNCTIONS.append((os, 'scandir'))
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+FILE_SYSTEM_FUNCTIONS.append((builtins, 'open'))
+
+#
+## @brief [ CLASS ] - Meta path finder, which counts the modules looked up by the import system.
+#
+#  The finder never finds a module, the lookup continues with the next finder of `sys.meta_path`.
+class ImportCounter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ threading.Lock ] - Lock.
+        self._lock  = threading.Lock()
+
+        ## [ int ] - Number of modules looked up.
+        self._count = 0
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Number of modules looked up.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of modules.
+    def count(self):
+
+        return self._count
+
+    #
+    ## @brief Count a module lookup, invoked by the import system of Python 3.
+    #
+    #  @param name   [ str              | None | in  ] - Full name of the module.
+    #  @param path   [ list of str      | None | in  ] - Search path of the parent package.
+    #  @param target [ types.ModuleType | None | in  ] - Module, which is reloaded.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def find_spec(self, name, path, target=None):
+
+        with self._lock:
+            self._count += 1
+
+        return None
+
+    #
+    ## @brief Count a module lookup, invoked by the import system of Python 2.
+    #
+    #  @param name [ str         | None | in  ] - Full name of the module.
+    #  @param path [ list of str | None | in  ] - Search path of the parent package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def find_module(self, name, path=None):
+
+        return self.find_spec(name, path)
+
+#
+## @brief [ CLASS ] - Profiler.
+class Profiler(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ bool ] - Whether profiling is enabled.
+        self._enabled           = False
+
+        ## [ threading.Lock ] - Lock.
+        self._lock              = threading.Lock()
+
+        ## [ threading.local ] - Stack of the current thread and whether a file system call is being counted.
+        self._local             = threading.local()
+
+        ## [ int ] - Number of file system calls made since profiling is enabled.
+        self._fileSystemCalls   = 0
+
+        ## [ dict ] - Keys are stacks, values are self times in seconds.
+        self._stacks            = {}
+
+        ## [ dict ] - Keys are function names, values are lists of calls, time, file system calls and imports.
+        self._summary           = {}
+
+        ## [ dict ] - Keys are tuples of module and function name, values are original functions.
+        self._originals         = {}
+
+        ## [ mMecoSettings.profileLib.ImportCounter ] - Counter of the imports, which is in `sys.meta_path` while enabled.
+        self._importCounter     = ImportCounter()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Whether profiling is enabled.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def isEnabled(self):
+
+        return self._enabled
+
+    #
+    ## @brief Number of file system calls made since profiling is enabled.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of calls.
+    def fileSystemCalls(self):
+
+        return self._fileSystemCalls
+
+    #
+    ## @brief Number of modules looked up by the import system since profiling is enabled.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of modules.
+    def imports(self):
+
+        return self._importCounter.count()
+
+    #
+    ## @brief Enable profiling, file system functions are wrapped and imports are counted.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def enable(self):
+
+        if self._enabled:
+            return
+
+        for module, name in FILE_SYSTEM_FUNCTIONS:
+            function = getattr(module, name)
+            self._originals[(module, name)] = function
+            setattr(module, name, self._countFileSystemCall(function))
+
+        sys.meta_path.insert(0, self._importCounter)
+
+        self._enabled = True
+
+    #
+    ## @brief Disable profiling, original file system functions are restored and imports are no longer counted.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def disable(self):
+
+        if not self._enabled:
+            return
+
+        for (module, name), function in self._originals.items():
+            setattr(module, name, function)
+
+        if self._importCounter in sys.meta_path:
+            sys.meta_path.remove(self._importCounter)
+
+        self._originals = {}
+        self._enabled   = False
+
+    #
+    ## @brief Call given function and record it.
+    #
+    #  @param name     [ str      | None | in  ] - Name of the function.
+    #  @param function [ callable | None | in  ] - Function.
+    #  @param args     [ tuple    | None | in  ] - Arguments.
+    #  @param kwargs   [ dict     | None | in  ] - Keyword arguments.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Return value of the function.
+    def call(self, name, function, args, kwargs):
+
+        stack = self._stack()
+        stack.append([name, 0.0])
+
+        startTime            = time.time()
+        startFileSystemCalls = self._fileSystemCalls
+        startImports         = self.imports()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+
+            elapsed         = time.time() - startTime
+            fileSystemCalls = self._fileSystemCalls - startFileSystemCalls
+            imports         = self.imports() - startImports
+
+            frameName, childTime = stack.pop()
+            stackName            = ';'.join([x[0] for x in stack] + [frameName])
+
+            if stack:
+                stack[-1][1] += elapsed
+
+            with self._lock:
+
+                self._stacks[stackName] = self._stacks.get(stackName, 0.0) + max(elapsed - childTime, 0.0)
+
+                summaryName = name.split('[')[0]
+                summary     = self._summary.setdefault(summaryName, [0, 0.0, 0, 0])
+                summary[0] += 1
+                summary[1] += elapsed
+                summary[2] += fileSystemCalls
+                summary[3] += imports
+
+    #
+    ## @brief Stacks in folded format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Lines.
+    def stacks(self):
+
+        return ['{} {}'.format(x, int(round(y * 1000000))) for x, y in sorted(self._stacks.items())]
+
+    #
+    ## @brief Summary table.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Lines.
+    def summary(self):
+
+        rows = sorted(self._summary.items(), key=lambda x: x[1][1], reverse=True)
+
+        lines = ['{:<40} {:>8} {:>12} {:>12} {:>8} {:>8}'.format('FUNCTION', 'CALLS', 'TOTAL (ms)', 'MEAN (ms)', 'FS', 'IMPORTS')]
+        for name, (calls, elapsed, fileSystemCalls, imports) in rows:
+            lines.append('{:<40} {:>8} {:>12.3f} {:>12.3f} {:>8} {:>8}'.format(name,
+                                                                             calls,
+                                                                             elapsed * 1000.0,
+                                                                             elapsed * 1000.0 / calls,
+                                                                             fileSystemCalls,
+                                                                             imports))
+
+        return lines
+
+    #
+    ## @brief Write the stack and summary files.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the files without extension.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the written files.
+    def write(self, path):
+
+        files = []
+
+        for extension, lines in ((STACK_EXTENSION, self.stacks()), (SUMMARY_EXTENSION, self.summary())):
+
+            filePath = '{}{}'.format(path, extension)
+
+            profileFile = open(filePath, 'w')
+            profileFile.write('\n'.join(lines) + '\n')
+            profileFile.close()
+
+            files.append(filePath)
+
+        return files
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Stack of the current thread.
+    #
+    #  @exception N/A
+    #
+    #  @return list - Stack, each item is a list of function name and the time spent in its children.
+    def _stack(self):
+
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+
+        return self._local.stack
+
+    #
+    ## @brief Wrap given file system function to count its calls.
+    #
+    #  Calls made by the file system functions themselves, such as `os.stat` invoked by `os.path.isfile`,
+    #  are not counted.
+    #
+    #  @param function [ callable | None | in  ] - Function.
+    #
+    #  @exception N/A
+    #
+    #  @return callable - Wrapped function.
+    def _countFileSystemCall(self, function):
+
+        def wrapper(*args, **kwargs):
+
+            if getattr(self._local, 'counting', False):
+                return function(*args, **kwargs)
+
+            with self._lock:
+                self._fileSystemCalls += 1
+
+            self._local.counting = True
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._local.counting = False
+
+        return wrapper
+
+#
+## [ mMecoSettings.profileLib.Profiler ] - Profiler of the process.
+_PROFILER           = Profiler()
+
+#
+## [ bool ] - Whether the profile files are written when the process exits.
+_WRITE_REGISTERED   = False
+
+#
+## @brief Decorator, which profiles given function.
+#
+#  Can be used as `@profile` or `@profile(detail=callable)`. The `detail` callable receives the arguments
+#  of the function and returns a string, which is appended to the name of the function in the stacks.
+#
+#  @param function [ callable | None | in  ] - Function.
+#  @param detail   [ callable | None | in  ] - Callable, which provides the details of a call.
+#
+#  @exception N/A
+#
+#  @return callable - Decorated function.
+def profile(function=None, detail=None):
+
+    if function is None:
+        return lambda x: profile(x, detail)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+
+        if not _PROFILER.isEnabled():
+            return function(*args, **kwargs)
+
+        name = function.__name__
+        if detail:
+            name = '{}[{}]'.format(name, detail(*args, **kwargs))
+
+        return _PROFILER.call(name, function, args, kwargs)
+
+    return wrapper
+
+#
+## @brief Get the profiler of the process.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.profileLib.Profiler - Profiler.
+def getProfiler():
+
+    return _PROFILER
+
+#
+## @brief Determine whether profiling is requested by the environment or the flags.
+#
+#  @param environ [ dict               | os.environ | in  ] - Current environment.
+#  @param flags   [ argparse.Namespace | None       | in  ] - Flags returned by mMecoSettings.flagLib.getFlags.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isRequested(environ=None, flags=None):
+
+    environ = os.environ if environ is None else environ
+
+    if environ.get(mMecoSettings.envVariablesLib.MECO_PROFILE, '').lower() in ('1', 'true', 'yes', 'on'):
+        return True
+
+    return bool(getattr(flags, 'profile', False))
+
+#
+## @brief Start profiling, profile files are written when the process exits.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def start():
+
+    global _WRITE_REGISTERED
+
+    _PROFILER.enable()
+
+    if not _WRITE_REGISTERED:
+        atexit.register(_write)
+        _WRITE_REGISTERED = True
+
+#
+## @brief Get absolute path of the profile files without extension.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def getFilePath():
+
+    path = os.environ.get(mMecoSettings.envVariablesLib.MECO_PROFILE_FILE_PATH)
+    if path:
+        return path
+
+    return os.path.join(tempfile.gettempdir(), 'mmecosettings-profile-{}'.format(os.getpid()))
+
+#
+## @brief Write the profile files, invoked when the process exits.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _write():
+
+    _PROFILER.disable()
+
+    try:
+        for filePath in _PROFILER.write(getFilePath()):
+            sys.stderr.write('Profile: {}\n'.format(filePath))
+    except (IOError, OSError) as error:
+        sys.stderr.write('Profile couldn\'t be written: {}\n'.format(error))
+
+#
+# Profiling starts as soon as this module is imported so the functions invoked by Meco before the callbacks,
+# such as mMecoSettings.settingsLib.getAppFilePath, are recorded as well
+if isRequested(flags=mMecoSettings.flagLib.getProcessFlags()):
+    start()
@@ -0,0 +1,218 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/recordLib.py    @brief [ FILE   ] - App record module.
+## @package mMecoSettings.recordLib       @brief [ MODULE ] - App record module.
+#
+#  Machine-readable output of `mmecosettings-list-app` and `mmecosettings-search-app`. Each app file is a record,
+#  which is written as soon as it is resolved, either as a JSON line or a tab separated line.
+#
+#  Fields in FILE_FIELDS are derived from the path of an app file, so app files are not read at all if only these
+#  fields are requested and no keyword is given.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  json
+import  errno
+
+from    collections import OrderedDict
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Human readable output.
+FORMAT_TEXT     = 'text'
+
+#
+## [ str ] - One JSON object per line.
+FORMAT_JSONL    = 'jsonl'
+
+#
+## [ str ] - Tab separated values, the first line is the header.
+FORMAT_TSV      = 'tsv'
+
+#
+## [ tuple of str ] - Formats.
+FORMATS         = (FORMAT_TEXT, FORMAT_JSONL, FORMAT_TSV)
+
+#
+## [ tuple of str ] - Fields, which are derived from the path of an app file.
+FILE_FIELDS     = ('name', 'file')
+
+#
+## [ tuple of str ] - Fields, field names other than FILE_FIELDS are getter methods of mMecoSettings.appLib.AppFile.
+FIELDS          = FILE_FIELDS + ('developer',
+                                 'description',
+                                 'darwinExecutable',
+                                 'linuxExecutable',
+                                 'windowsExecutable',
+                                 'globalEnvClassName',
+                                 'application',
+                                 'folderName',
+                                 'version',
+                                 'packages')
+
+#
+## [ list of tuple ] - Characters escaped in tab separated values.
+TSV_ESCAPES     = [('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r')]
+
+#
+## @brief Parse comma separated field names.
+#
+#  @param text [ str | None | in  ] - Field names, all fields are used if not given.
+#
+#  @exception ValueError - If a field doesn't exist.
+#
+#  @return list of str - Field names.
+def parseFields(text=None):
+
+    if not text:
+        return list(FIELDS)
+
+    fields = [x.strip() for x in text.split(',') if x.strip()]
+
+    for field in fields:
+        if not field in FIELDS:
+            raise ValueError('Field doesn\'t exist: {}, available fields: {}'.format(field, ', '.join(FIELDS)))
+
+    return fields
+
+#
+## @brief Determine whether given fields require reading app files.
+#
+#  @param fields [ list of str | None | in  ] - Field names.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def requiresContent(fields):
+
+    return any(not x in FILE_FIELDS for x in fields)
+
+#
+## @brief Get record of an app file.
+#
+#  @param absFile [ str                          | None | in  ] - Absolute path of a Meco App file.
+#  @param fields  [ list of str                  | None | in  ] - Field names.
+#  @param appFile [ mMecoSettings.appLib.AppFile | None | in  ] - App file, required if fields other than FILE_FIELDS are given.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Each item is a tuple of a field name and its value, in the order of the fields.
+def getRecord(absFile, fields, appFile=None):
+
+    record = []
+
+    for field in fields:
+
+        if field == 'name':
+            value = os.path.splitext(os.path.basename(absFile))[0]
+        elif field == 'file':
+            value = absFile
+        else:
+            value = getattr(appFile, field)()
+
+        record.append((field, value))
+
+    return record
+
+#
+## @brief Format a record as a JSON line.
+#
+#  @param record [ list of tuple | None | in  ] - Record.
+#
+#  @exception N/A
+#
+#  @return str - Line without line break.
+def formatJSONL(record):
+
+    return json.dumps(OrderedDict(record))
+
+#
+## @brief Format a value as a tab separated value.
+#
+#  @param value [ variant | None | in  ] - Value, items of lists are separated by commas.
+#
+#  @exception N/A
+#
+#  @return str - Value.
+def formatTSVValue(value):
+
+    if isinstance(value, (list, tuple)):
+        value = ','.join(value)
+
+    value = '{}'.format('' if value is None else value)
+
+    for character, escape in TSV_ESCAPES:
+        value = value.replace(character, escape)
+
+    return value
+
+#
+## @brief Format a record as a tab separated line.
+#
+#  @param record [ list of tuple | None | in  ] - Record.
+#
+#  @exception N/A
+#
+#  @return str - Line without line break.
+def formatTSV(record):
+
+    return '\t'.join(formatTSVValue(value) for _, value in record)
+
+#
+## @brief Write records to given stream, each record is flushed once it is written.
+#
+#  @param records    [ iterable of list | None | in  ] - Records.
+#  @param fields     [ list of str      | None | in  ] - Field names.
+#  @param formatName [ str              | None | in  ] - Format, one of the following; jsonl, tsv.
+#  @param stream     [ file             | None | in  ] - Stream.
+#
+#  @exception IOError - If writing to the stream fails for a reason other than a closed pipe.
+#
+#  @return int - Number of records written.
+def write(records, fields, formatName, stream):
+
+    count = 0
+
+    try:
+        if formatName == FORMAT_TSV:
+            stream.write('{}\n'.format('\t'.join(fields)))
+            stream.flush()
+
+        for record in records:
+
+            stream.write('{}\n'.format(formatTSV(record) if formatName == FORMAT_TSV else formatJSONL(record)))
+            stream.flush()
+
+            count += 1
+
+    except IOError as error:
+        # Reader of a pipeline, for instance `head`, has exited
+        if error.errno != errno.EPIPE:
+            raise
+
+    return count
@@ -26,10 +26,12 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import argparse
+import sys
 
-import mCore.displayLib
+import mMecoSettings.recordLib
 
-import mMecoSettings.appLib
+# mCore.displayLib and mMecoSettings.appLib are imported by the functions once the arguments are parsed,
+# so `--help` and invalid arguments don't import mCore, mFileSystem and mMecoPackage
 
 
 #
@@ -52,6 +54,9 @@ def createApp():
 
     _args       = parser.parse_args()
 
+    import mCore.displayLib
+    import mMecoSettings.appLib
+
     mecoApp     = mMecoSettings.appLib.AppFile()
 
     try:
@@ -81,9 +86,11 @@ def listApps():
                         action='store_true',
                         help='Display details about the app files')
 
+    _addFormatArguments(parser)
+
     _args = parser.parse_args()
 
-    _listApps(detail=_args.detail)
+    _listApps(detail=_args.detail, formatName=_args.format, fields=_parseFields(parser, _args.fields))
 
 #
 ## @brief Search Meco App files.
@@ -104,9 +111,53 @@ def searchApps():
                         action='store_true',
                         help='Display details about the app files')
 
+    _addFormatArguments(parser)
+
     _args = parser.parse_args()
 
-    _listApps(keyword=_args.keyword, detail=_args.detail)
+    _listApps(keyword=_args.keyword, detail=_args.detail, formatName=_args.format, fields=_parseFields(parser, _args.fields))
+
+#
+## @brief Add output format arguments to given parser.
+#
+#  This function is used by the following functions.
+#
+#  - mMecoSettings.settingsCmd.listApps
+#  - mMecoSettings.settingsCmd.searchApps
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _addFormatArguments(parser):
+
+    parser.add_argument('-f',
+                        '--format',
+                        choices=mMecoSettings.recordLib.FORMATS,
+                        default=mMecoSettings.recordLib.FORMAT_TEXT,
+                        help='Output format, jsonl and tsv stream one record per app file')
+
+    parser.add_argument('--fields',
+                        type=str,
+                        default=None,
+                        help='Comma separated fields of jsonl and tsv records, available fields: {}'.format(', '.join(mMecoSettings.recordLib.FIELDS)))
+
+#
+## @brief Parse fields argument.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser, which reports invalid fields.
+#  @param text   [ str                     | None | in  ] - Comma separated fields.
+#
+#  @exception N/A
+#
+#  @return list of str - Field names.
+def _parseFields(parser, text):
+
+    try:
+        return mMecoSettings.recordLib.parseFields(text)
+    except ValueError as error:
+        parser.error(str(error))
 
 #
 ## @brief List Meco App files.
@@ -116,13 +167,24 @@ def searchApps():
 #  - mMecoSettings.settingsCmd.listApps
 #  - mMecoSettings.settingsCmd.searchApps
 #
-#  @param keyword [ str  | None  | in  ] - Keyword.
-#  @param detail  [ bool | False | in  ] - Display detail.
+#  @param keyword    [ str         | None  | in  ] - Keyword.
+#  @param detail     [ bool        | False | in  ] - Display detail.
+#  @param formatName [ str         | text  | in  ] - Output format, see mMecoSettings.recordLib.FORMATS.
+#  @param fields     [ list of str | None  | in  ] - Fields of jsonl and tsv records.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def _listApps(keyword=None, detail=False):
+def _listApps(keyword=None, detail=False, formatName=mMecoSettings.recordLib.FORMAT_TEXT, fields=None):
+
+    import mMecoSettings.appLib
+
+    if formatName != mMecoSettings.recordLib.FORMAT_TEXT:
+        fields = fields or list(mMecoSettings.recordLib.FIELDS)
+        mMecoSettings.recordLib.write(mMecoSettings.appLib.AppFile.iterRecords(keyword, fields), fields, formatName, sys.stdout)
+        return
+
+    import mCore.displayLib
 
     appFiles = mMecoSettings.appLib.AppFile.list(keyword)
 
@@ -40,7 +40,10 @@ import  re
 from    getpass  import getuser
 from    platform import system
 
-import  mMeco.core.packageLib
+import  mMecoSettings.fileSystemLib
+import  mMecoSettings.logLib
+import  mMecoSettings.paletteLib
+import  mMecoSettings.profileLib
 from    mMecoSettings.envVariablesLib import MECO_USE_PROJECT_APPS_ONLY
 
 
@@ -210,8 +213,8 @@ def getDevelopmentPackagesPath(projectName, developerName, developmentEnvName, p
                         'development',
                         developmentEnvName)
 
-    if create and not os.path.isdir(path):
-        os.makedirs(path)
+    if create and not mMecoSettings.fileSystemLib.isDir(path):
+        mMecoSettings.fileSystemLib.makeDirs(path)
 
     return path
 
@@ -350,6 +353,9 @@ def getMasterProjectExternalPackagesPath(platformName):
 #
 #  Log file would contain useful information for debugging purposes.
 #
+#  Log file is rotated once it gets larger or older than the limits set in mMecoSettings.logLib module,
+#  rotated segments are gzip compressed by a detached process.
+#
 #  The following example path is also the one Meco uses by default.
 #
 #  `/projectsPath/PROJECT_NAME/users/USER_NAME/env/log/log.txt`
@@ -363,6 +369,7 @@ def getMasterProjectExternalPackagesPath(platformName):
 #  @exception N/A
 #
 #  @return str - Absolute path of the log file.
+@mMecoSettings.profileLib.profile
 def getLogFilePath(projectName, userName, developmentEnvName, stageEnvName, platformName):
 
     # sys.stdout.write('\n')
@@ -377,7 +384,7 @@ def getLogFilePath(projectName, userName, developmentEnvName, stageEnvName, plat
         projectName = MASTER_PROJECT_NAME
 
     projectPath = getProjectsPath(platformName, projectName)
-    if not os.path.isdir(projectPath):
+    if not mMecoSettings.fileSystemLib.isDir(projectPath):
         return ''
 
     logPath = os.path.join(projectPath,
@@ -387,8 +394,8 @@ def getLogFilePath(projectName, userName, developmentEnvName, stageEnvName, plat
                            'env',
                            'log')
 
-    if not os.path.isdir(logPath):
-        os.makedirs(logPath)
+    if not mMecoSettings.fileSystemLib.isDir(logPath):
+        mMecoSettings.fileSystemLib.makeDirs(logPath)
 
     #
 
@@ -401,7 +408,60 @@ def getLogFilePath(projectName, userName, developmentEnvName, stageEnvName, plat
     else:
         logFileName = '{}.txt'.format(logFileName)
 
-    return os.path.join(logPath, logFileName)
+    logFilePath = os.path.join(logPath, logFileName)
+
+    # Rotated log file is only renamed here and compressed by a detached process, see mMecoSettings.logLib
+    mMecoSettings.logLib.rotate(logFilePath)
+
+    return logFilePath
+
+#
+## [ re.Pattern ] - Version directory name, three to six numbers separated by `.` like the versions matched by
+#  mMecoSettings.settingsLib.getProjectsPath.
+VERSION_PATTERN     = re.compile(r'^[0-9]+(\.[0-9]+){2,5}$')
+
+#
+## @brief Get the latest of given versions.
+#
+#  Names, which aren't versions, such as `.snapshot` directories of NFS filers, `dev` or `1.2.0.bak`, are skipped.
+#  Components are compared as numbers, so `1.10.0` is later than `1.9.0`. This is the only version ordering of
+#  mMecoSettings, it is used for all file systems, see mMecoSettings.fileSystemLib.
+#
+#  @param versions [ list of str | None | in  ] - Versions.
+#
+#  @exception N/A
+#
+#  @return str - Version, empty if no version is given.
+def getLatestVersion(versions):
+
+    versions = [x for x in versions if VERSION_PATTERN.match(x)]
+    if not versions:
+        return ''
+
+    return max(versions, key=lambda x: [int(y) for y in x.split('.')])
+
+#
+## @brief Get the latest version of a package.
+#
+#  Version directories are listed through mMecoSettings.fileSystemLib, so the same version is resolved from the disk
+#  and from a file system in memory, and the latest one is picked by mMecoSettings.settingsLib.getLatestVersion.
+#
+#  @param packagesPath [ str | None | in  ] - Absolute path of the directory, which contains the packages.
+#  @param packageName  [ str | None | in  ] - Package name.
+#
+#  @exception N/A
+#
+#  @return str - Version, empty if the package has no versions.
+def _getVersionOfAPackage(packagesPath, packageName):
+
+    packagePath = os.path.join(packagesPath, packageName)
+
+    try:
+        names = mMecoSettings.fileSystemLib.listDir(packagePath)
+    except OSError:
+        return ''
+
+    return getLatestVersion([x for x in names if mMecoSettings.fileSystemLib.isDir(os.path.join(packagePath, x))])
 
 #
 ## @brief Get absolute path of an app file.
@@ -438,6 +498,7 @@ def getLogFilePath(projectName, userName, developmentEnvName, stageEnvName, plat
 #  @exception IOError - If no app file found for given `app`.
 #
 #  @return str - Absolute path of the app file.
+@mMecoSettings.profileLib.profile
 def getAppFilePath(projectName, developerName, developmentEnvName, stageEnvName, platformName, app):
 
     # sys.stdout.write('\n')
@@ -451,63 +512,71 @@ def getAppFilePath(projectName, developerName, developmentEnvName, stageEnvName,
     if not app:
         return ''
 
-    if os.path.isfile(app):
+    if mMecoSettings.fileSystemLib.isFile(app):
         return app
 
     missingAppFiles  = []
     appFileExtension = 'json'
-    appPath          = os.path.join('mMecoSettings', 'resources', 'apps')
 
+    for appDirectoryPath in getAppDirectoryPaths(projectName, developerName, developmentEnvName, stageEnvName, platformName):
 
-    if developmentEnvName:
-        appFile = os.path.join(getDevelopmentPackagesPath(projectName, developerName, developmentEnvName, platformName, False),
-                               appPath,
-                               '{}.{}'.format(app, appFileExtension))
-        if os.path.isfile(appFile):
+        appFile = os.path.join(appDirectoryPath, '{}.{}'.format(app, appFileExtension))
+        if mMecoSettings.fileSystemLib.isFile(appFile):
             return appFile
         else:
             missingAppFiles.append(appFile)
 
-    if stageEnvName:
-        appFile = os.path.join(getStagePackagesPath(projectName, developerName, stageEnvName, platformName),
-                               appPath,
-                               '{}.{}'.format(app, appFileExtension))
-        if os.path.isfile(appFile):
-            return appFile
-        else:
-            missingAppFiles.append(appFile)
+    raise IOError('None of the following app file exist: {}'.format(', '.join(missingAppFiles)))
 
-    #
+#
+## @brief Get absolute paths of the directories app files are searched for in.
+#
+#  Directories are returned in the order mMecoSettings.settingsLib.getAppFilePath searches them; development
+#  environment, stage environment, project and master project. Directories may not exist.
+#
+#  @param projectName        [ str | None | in  ] - Project name.
+#  @param developerName      [ str | None | in  ] - Developer name.
+#  @param developmentEnvName [ str | None | in  ] - Development environment name.
+#  @param stageEnvName       [ str | None | in  ] - Stage environment name.
+#  @param platformName       [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the directories.
+def getAppDirectoryPaths(projectName, developerName, developmentEnvName, stageEnvName, platformName):
+
+    appPath           = os.path.join('mMecoSettings', 'resources', 'apps')
+    appDirectoryPaths = []
+
+    if developmentEnvName:
+        appDirectoryPaths.append(os.path.join(getDevelopmentPackagesPath(projectName, developerName, developmentEnvName, platformName, False),
+                                              appPath))
 
-    latestVersion = mMeco.core.packageLib.getVersionOfAPackage(getProjectInternalPackagesPath(projectName, platformName),
-                                                               'mMecoSettings')
-    if latestVersion:
-        appPath = os.path.join('mMecoSettings', latestVersion, 'mMecoSettings', 'resources', 'apps')
+    if stageEnvName:
+        appDirectoryPaths.append(os.path.join(getStagePackagesPath(projectName, developerName, stageEnvName, platformName),
+                                              appPath))
 
-        if projectName != MASTER_PROJECT_NAME:
-            appFile = os.path.join(getProjectInternalPackagesPath(projectName, platformName),
-                                   appPath,
-                                   '{}.{}'.format(app, appFileExtension))
-            if os.path.isfile(appFile):
-                return appFile
-            else:
-                missingAppFiles.append(appFile)
+    #
 
+    if projectName != MASTER_PROJECT_NAME:
+        latestVersion = _getVersionOfAPackage(getProjectInternalPackagesPath(projectName, platformName),
+                                              'mMecoSettings')
+        if latestVersion:
+            appDirectoryPaths.append(os.path.join(getProjectInternalPackagesPath(projectName, platformName),
+                                                  'mMecoSettings',
+                                                  latestVersion,
+                                                  appPath))
 
     if os.environ.get(MECO_USE_PROJECT_APPS_ONLY) is None:
-        latestVersion = mMeco.core.packageLib.getVersionOfAPackage(getMasterProjectInternalPackagesPath(platformName),
-                                                                   'mMecoSettings')
+        latestVersion = _getVersionOfAPackage(getMasterProjectInternalPackagesPath(platformName),
+                                              'mMecoSettings')
         if latestVersion:
-            appPath = os.path.join('mMecoSettings', latestVersion, 'mMecoSettings', 'resources', 'apps')
-            appFile = os.path.join(getMasterProjectInternalPackagesPath(platformName),
-                                   appPath,
-                                   '{}.{}'.format(app, appFileExtension))
-            if os.path.isfile(appFile):
-                return appFile
-            else:
-                missingAppFiles.append(appFile)
+            appDirectoryPaths.append(os.path.join(getMasterProjectInternalPackagesPath(platformName),
+                                                  'mMecoSettings',
+                                                  latestVersion,
+                                                  appPath))
 
-    raise IOError('None of the following app file exist: {}'.format(', '.join(missingAppFiles)))
+    return appDirectoryPaths
 
 #
 ## @brief Get absolute path of a script file.
@@ -530,6 +599,7 @@ def getAppFilePath(projectName, developerName, developmentEnvName, stageEnvName,
 #  @exception N/A
 #
 #  @return str - Absolute path of the environment script file.
+@mMecoSettings.profileLib.profile
 def getScriptFilePath(projectName, userName, developmentEnvName, stageEnvName, platformName, appFile):
 
     # sys.stdout.write('\n')
@@ -552,8 +622,8 @@ def getScriptFilePath(projectName, userName, developmentEnvName, stageEnvName, p
                               'env',
                               'script')
 
-    if not os.path.isdir(scriptPath):
-        os.makedirs(scriptPath)
+    if not mMecoSettings.fileSystemLib.isDir(scriptPath):
+        mMecoSettings.fileSystemLib.makeDirs(scriptPath)
 
     scriptFileBaseName = 'env_{}_{}'.format(projectName, userName)
 
@@ -581,590 +651,446 @@ def getScriptFilePath(projectName, userName, developmentEnvName, stageEnvName, p
 # COLOR SETTINGS
 #-----------------------------------------------------------------------------------------------------
 #
-## @brief Get terminal header display colors.
-#
-#  You can customize the terminal header display colors by changing the return value of this function.
-#
-#  Index   | Description                                                             |
-#  :------ | :---------------------------------------------------------------------- |
-#  0.      | Color of the dashes in headers                                          |
-#  1.      | Color of the text in headers                                            |
-#
-#  @warning Only following colors are available on Windows OS.
-#
-# - Black
-# - DarkBlue
-# - DarkGreen
-# - DarkCyan
-# - DarkRed
-# - DarkMagenta
-# - DarkYellow
-# - Gray
-# - DarkGray
-# - Blue
-# - Green
-# - Cyan
-# - Red
-# - Magenta
-# - Yellow
-# - White
-#
-#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
-#
-#  @exception N/A
-#
-#  @return list of str - Values that represents colors.
-def getTerminalHeaderDisplayColors(platformName):
-
-    # sys.stdout.write('\n')
-    # sys.stdout.write('platformName : {}\n'.format(platformName))
-
-    if platformName == PlatformName.kLinux:
-
-        return ['"\e[37m{}\e[m"',
-                '"\e[97m{}\e[m"']
-
-    elif platformName == PlatformName.kDarwin:
-
-        return ['"\e[37m{}\e[m"',
-                '"\e[97m{}\e[m"']
-
-    elif platformName == PlatformName.kWindows:
+## [ tuple of str ] - Terminal header display colors for Linux and Darwin.
+ANSI_TERMINAL_HEADER_DISPLAY_COLORS     = ('"\e[37m{}\e[m"',
+                                           '"\e[97m{}\e[m"')
 
-        return ['DarkGray', 'Gray']
-
-#
-## @brief Get terminal display colors.
-#
-#  You can customize the terminal display colors by changing the return value of this function.
-#
-#  Index   | Description                                                             |
-#  :------ | :---------------------------------------------------------------------- |
-#  0.      | Color of the development environment                                    |
-#  1.      | Color of the stage environment                                          |
-#  2.      | Color of the project environment                                        |
-#  3.      | Color of the master project environment                                 |
-#  4.      | Color of the before environment                                         |
-#  5.      | Color of the after environment                                          |
-#  6.      | Color of info                                                           |
-#
-#  @warning Only following colors are available on Windows OS.
-#
-# - Black
-# - DarkBlue
-# - DarkGreen
-# - DarkCyan
-# - DarkRed
-# - DarkMagenta
-# - DarkYellow
-# - Gray
-# - DarkGray
-# - Blue
-# - Green
-# - Cyan
-# - Red
-# - Magenta
-# - Yellow
-# - White
-#
-#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
-#
-#  @exception N/A
 #
-#  @return list of str - Values that represents colors.
-def getTerminalDisplayColors(platformName):
-
-    # sys.stdout.write('\n')
-    # sys.stdout.write('platformName : {}\n'.format(platformName))
-
-    if platformName == PlatformName.kLinux:
-
-        return {
-                'pre-build'                 : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;4m{}\e[m'
-                                               },
-
-                'reserved'                  : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
-
-                'development'               : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
-
-                'stage'                     : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
-
-                'project-internal'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
-                                               'packageValue'           :'\e[38;5;3m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;11m{}\e[m'
-                                               },
-
-                'project-external'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
-                                               'packageValue'           :'\e[38;5;3m{}\e[m',
+## [ tuple of str ] - Terminal header display colors for Windows.
+WINDOWS_TERMINAL_HEADER_DISPLAY_COLORS  = ('DarkGray', 'Gray')
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;11m{}\e[m'
-                                               },
-
-                'master-project-internal'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
-                                               'packageValue'           :'\e[38;5;47m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;46m{}\e[m'
-                                               },
-
-                'master-project-external'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
-                                               'packageValue'           :'\e[38;5;47m{}\e[m',
-
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
-
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
-
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;46m{}\e[m'
-                                               },
+#
+## [ mMecoSettings.paletteLib.FrozenDict ] - Terminal display colors for Linux and Darwin.
+ANSI_TERMINAL_DISPLAY_COLORS = mMecoSettings.paletteLib.freeze({
+    'pre-build'                 : {'packageVariable'        :'\e[38;5;9m{}\e[m',
+                                   'packageValue'           :'\e[38;5;9m{}\e[m',
 
-                'post-build'                : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;4m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;4m{}\e[m'
-                                               },
+    'reserved'                  : {'packageVariable'        :'\e[38;5;9m{}\e[m',
+                                   'packageValue'           :'\e[38;5;9m{}\e[m',
 
-                'env'                       : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                'info'                      : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                'product-info'              : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                }
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;9m{}\e[m'
+                                   },
 
-    elif platformName == PlatformName.kDarwin:
+    'development'               : {'packageVariable'        :'\e[38;5;9m{}\e[m',
+                                   'packageValue'           :'\e[38;5;9m{}\e[m',
 
-        return {
-                'pre-build'                 : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;9m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;4m{}\e[m'
-                                               },
+    'stage'                     : {'packageVariable'        :'\e[38;5;9m{}\e[m',
+                                   'packageValue'           :'\e[38;5;9m{}\e[m',
 
-                'reserved'                  : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;9m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
+    'project-internal'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
+                                   'packageValue'           :'\e[38;5;3m{}\e[m',
 
-                'development'               : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;11m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
+    'project-external'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
+                                   'packageValue'           :'\e[38;5;3m{}\e[m',
 
-                'stage'                     : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;11m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;9m{}\e[m'
-                                               },
+    'master-project-internal'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
+                                   'packageValue'           :'\e[38;5;47m{}\e[m',
 
-                'project-internal'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
-                                               'packageValue'           :'\e[38;5;3m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;46m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;11m{}\e[m'
-                                               },
+    'master-project-external'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
+                                   'packageValue'           :'\e[38;5;47m{}\e[m',
 
-                'project-external'          : {'packageVariable'        :'\e[38;5;11m{}\e[m',
-                                               'packageValue'           :'\e[38;5;3m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;46m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;11m{}\e[m'
-                                               },
+    'post-build'                : {'packageVariable'        :'\e[38;5;9m{}\e[m',
+                                   'packageValue'           :'\e[38;5;9m{}\e[m',
 
-                'master-project-internal'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
-                                               'packageValue'           :'\e[38;5;47m{}\e[m',
+                                   'multiVariable'          :'\e[38;5;4m{}\e[m',
+                                   'multiValue'             :'\e[38;5;27m{}\e[m',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'\e[38;5;219m{}\e[m',
+                                   'command'                :'\e[38;5;219m{}\e[m',
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+                                   'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'arrow'                  :'\e[38;5;4m{}\e[m'
+                                   },
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;46m{}\e[m'
-                                               },
+    'env'                       : {'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   },
 
-                'master-project-external'   : {'packageVariable'        :'\e[38;5;46m{}\e[m',
-                                               'packageValue'           :'\e[38;5;47m{}\e[m',
+    'info'                      : {'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   },
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+    'product-info'              : {'colon'                  :'\e[38;5;4m{}\e[m',
+                                   'singleVariable'         :'\e[38;5;4m{}\e[m',
+                                   'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   },
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+    })
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+#
+## [ mMecoSettings.paletteLib.FrozenDict ] - Terminal display colors for Windows.
+WINDOWS_TERMINAL_DISPLAY_COLORS = mMecoSettings.paletteLib.freeze({
+    'pre-build'                 : {'packageVariable'        :'Blue',
+                                   'packageValue'           :'DarkCyan',
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;46m{}\e[m'
-                                               },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-                'post-build'                : {'packageVariable'        :'\e[38;5;9m{}\e[m',
-                                               'packageValue'           :'\e[38;5;9m{}\e[m',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                               'multiVariable'          :'\e[38;5;4m{}\e[m',
-                                               'multiValue'             :'\e[38;5;27m{}\e[m',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Blue'
+                                   },
 
-                                               'script'                 :'\e[38;5;219m{}\e[m',
-                                               'command'                :'\e[38;5;219m{}\e[m',
+    'reserved'                  : {'packageVariable'        :'Red',
+                                   'packageValue'           :'Red',
 
-                                               'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'arrow'                  :'\e[38;5;4m{}\e[m'
-                                               },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-                'env'                       : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                'info'                      : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                'product-info'              : {'colon'                  :'\e[38;5;4m{}\e[m',
-                                               'singleVariable'         :'\e[38;5;4m{}\e[m',
-                                               'singleValue'            :'\e[38;5;27m{}\e[m',
-                                               },
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Red'
+                                   },
 
-                }
+    'development'               : {'packageVariable'        :'Red',
+                                   'packageValue'           :'Red',
 
-    elif platformName == PlatformName.kWindows:
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-        return {
-            'pre-build'                 : {'packageVariable'        :'Blue',
-                                           'packageValue'           :'DarkCyan',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Red'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'stage'                     : {'packageVariable'        :'Red',
+                                   'packageValue'           :'Red',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Blue'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-            'reserved'                  : {'packageVariable'        :'Red',
-                                           'packageValue'           :'Red',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Red'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'project-internal'          : {'packageVariable'        :'Green',
+                                   'packageValue'           :'Green',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Red'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-            'development'               : {'packageVariable'        :'Red',
-                                           'packageValue'           :'Red',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Green'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'project-external'          : {'packageVariable'        :'Green',
+                                   'packageValue'           :'Green',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Red'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-            'stage'                     : {'packageVariable'        :'Red',
-                                           'packageValue'           :'Red',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Green'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'master-project-internal'   : {'packageVariable'        :'Green',
+                                   'packageValue'           :'Green',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Red'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-            'project-internal'          : {'packageVariable'        :'Green',
-                                           'packageValue'           :'Green',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Green'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'master-project-external'   : {'packageVariable'        :'Green',
+                                   'packageValue'           :'Green',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Green'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'Cyan',
 
-            'project-external'          : {'packageVariable'        :'Green',
-                                           'packageValue'           :'Green',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'Cyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Green'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'post-build'                : {'packageVariable'        :'Blue',
+                                   'packageValue'           :'DarkCyan',
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Green'
-                                           },
+                                   'multiVariable'          :'Blue',
+                                   'multiValue'             :'DarkCyan',
 
-            'master-project-internal'   : {'packageVariable'        :'Green',
-                                           'packageValue'           :'Green',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+                                   'script'                 :'Magenta',
+                                   'command'                :'Magenta',
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+                                   'colon'                  :'Blue',
+                                   'arrow'                  :'Blue'
+                                   },
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    'env'                       : {'colon'                  :'Blue',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
+                                   },
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Green'
-                                           },
+    'info'                      : {'colon'                  :'Blue',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
+                                   },
 
-            'master-project-external'   : {'packageVariable'        :'Green',
-                                           'packageValue'           :'Green',
+    'product-info'              : {'colon'                  :'Blue',
+                                   'singleVariable'         :'Blue',
+                                   'singleValue'            :'DarkCyan',
+                                   },
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'Cyan',
+    })
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'Cyan',
+#
+## @brief Get terminal header display colors.
+#
+#  You can customize the terminal header display colors by changing the tables above.
+#
+#  Index   | Description                                                             |
+#  :------ | :---------------------------------------------------------------------- |
+#  0.      | Color of the dashes in headers                                          |
+#  1.      | Color of the text in headers                                            |
+#
+#  @warning Only following colors are available on Windows OS.
+#
+# - Black
+# - DarkBlue
+# - DarkGreen
+# - DarkCyan
+# - DarkRed
+# - DarkMagenta
+# - DarkYellow
+# - Gray
+# - DarkGray
+# - Blue
+# - Green
+# - Cyan
+# - Red
+# - Magenta
+# - Yellow
+# - White
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return list of str - Values that represents colors.
+def getTerminalHeaderDisplayColors(platformName):
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    # sys.stdout.write('\n')
+    # sys.stdout.write('platformName : {}\n'.format(platformName))
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Green'
-                                           },
+    if platformName == PlatformName.kLinux:
 
-            'post-build'                : {'packageVariable'        :'Blue',
-                                           'packageValue'           :'DarkCyan',
+        return list(ANSI_TERMINAL_HEADER_DISPLAY_COLORS)
 
-                                           'multiVariable'          :'Blue',
-                                           'multiValue'             :'DarkCyan',
+    elif platformName == PlatformName.kDarwin:
 
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
+        return list(ANSI_TERMINAL_HEADER_DISPLAY_COLORS)
 
-                                           'script'                 :'Magenta',
-                                           'command'                :'Magenta',
+    elif platformName == PlatformName.kWindows:
 
-                                           'colon'                  :'Blue',
-                                           'arrow'                  :'Blue'
-                                           },
+        return list(WINDOWS_TERMINAL_HEADER_DISPLAY_COLORS)
 
-            'env'                       : {'colon'                  :'Blue',
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
-                                           },
+#
+## @brief Get terminal display colors.
+#
+#  You can customize the terminal display colors by changing the tables above.
+#
+#  Tables are built once when this module is imported and shared by the palettes, the frozen table is returned
+#  without copying, so it can't be modified.
+#
+#  Index   | Description                                                             |
+#  :------ | :---------------------------------------------------------------------- |
+#  0.      | Color of the development environment                                    |
+#  1.      | Color of the stage environment                                          |
+#  2.      | Color of the project environment                                        |
+#  3.      | Color of the master project environment                                 |
+#  4.      | Color of the before environment                                         |
+#  5.      | Color of the after environment                                          |
+#  6.      | Color of info                                                           |
+#
+#  @warning Only following colors are available on Windows OS.
+#
+# - Black
+# - DarkBlue
+# - DarkGreen
+# - DarkCyan
+# - DarkRed
+# - DarkMagenta
+# - DarkYellow
+# - Gray
+# - DarkGray
+# - Blue
+# - Green
+# - Cyan
+# - Red
+# - Magenta
+# - Yellow
+# - White
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.paletteLib.FrozenDict - Values that represents colors.
+def getTerminalDisplayColors(platformName):
 
-            'info'                      : {'colon'                  :'Blue',
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
-                                           },
+    # sys.stdout.write('\n')
+    # sys.stdout.write('platformName : {}\n'.format(platformName))
 
-            'product-info'              : {'colon'                  :'Blue',
-                                           'singleVariable'         :'Blue',
-                                           'singleValue'            :'DarkCyan',
-                                           },
+    palette = mMecoSettings.paletteLib.getPalette(platformName)
+    if palette:
+        return palette.colors()
 
-        }
+#
+# Palettes are built once here, so rendering env lines doesn't parse the color format strings.
+mMecoSettings.paletteLib.registerPalette(PlatformName.kLinux,   ANSI_TERMINAL_DISPLAY_COLORS)
+mMecoSettings.paletteLib.registerPalette(PlatformName.kDarwin,  ANSI_TERMINAL_DISPLAY_COLORS)
+mMecoSettings.paletteLib.registerPalette(PlatformName.kWindows, WINDOWS_TERMINAL_DISPLAY_COLORS)
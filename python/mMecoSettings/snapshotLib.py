@@ -0,0 +1,576 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/snapshotLib.py    @brief [ FILE   ] - Env snapshot module.
+## @package mMecoSettings.snapshotLib       @brief [ MODULE ] - Env snapshot module.
+#
+#  An env snapshot contains the entries added by the pre-build and post-build callbacks and the decisions made by
+#  mMecoSettings.callbackLib.shouldInitializePackage for each package. Render farm tasks of the same submission
+#  can load the snapshot instead of resolving the environment again.
+#
+#  - Set `MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH` to export the snapshot of the environment being resolved.
+#  - Set `MECO_ENV_SNAPSHOT_FILE_PATH` to load a snapshot.
+#
+#  Entries whose values only exist on the host the snapshot has been exported on, such as the Python executable, the
+#  log file, generated scripts, indices and the env view, are recorded as host-local entries, see mMecoSettings.snapshotLib.HostLocal.
+#  Their values are recomputed on replay instead of being copied from the snapshot.
+#
+#  Snapshots are written as JSON unless the file extension is mMecoSettings.snapshotLib.BINARY_EXTENSION,
+#  in which case they are written in zlib compressed binary format.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  os
+import  json
+import  zlib
+import  struct
+
+import  mMecoSettings.envVariablesLib
+import  mMecoSettings.exceptionLib
+import  mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Format name stored in snapshots.
+FORMAT_NAME         = 'mMecoSettings.envSnapshot'
+
+#
+## [ int ] - Format version, snapshots with a different version are rejected.
+FORMAT_VERSION      = 2
+
+#
+## [ bytes ] - Magic of binary snapshots.
+BINARY_MAGIC        = b'MECOSNAP'
+
+#
+## [ str ] - Extension of binary snapshot files.
+BINARY_EXTENSION    = '.snap'
+
+#
+## @brief [ ENUM CLASS ] - Entry kinds.
+class EntryKind(object):
+
+    ## [ str ] - Single entry.
+    kSingle     = 'single'
+
+    ## [ str ] - Multi entry.
+    kMulti      = 'multi'
+
+    ## [ str ] - Script entry.
+    kScript     = 'script'
+
+    ## [ str ] - Command entry.
+    kCommand    = 'command'
+
+    ## [ str ] - Host-local entry, recorded as host-local key, entry kind and arguments.
+    kHostLocal  = 'hostLocal'
+
+#
+## @brief [ ENUM CLASS ] - Keys of host-local entries, values of these entries are recomputed on replay.
+class HostLocal(object):
+
+    ## [ str ] - Python executable.
+    kPythonExecutablePath   = 'pythonExecutablePath'
+
+    ## [ str ] - Log file.
+    kLogFilePath            = 'logFilePath'
+
+    ## [ str ] - Generated pre-build script.
+    kPreScriptPath          = 'preScriptPath'
+
+    ## [ str ] - Generated post-build script.
+    kPostScriptPath         = 'postScriptPath'
+
+    ## [ str ] - Generated completion script.
+    kCompletionScriptPath   = 'completionScriptPath'
+
+    ## [ str ] - Completion index file.
+    kCompletionIndexFilePath = 'completionIndexFilePath'
+
+    ## [ str ] - Import index file.
+    kImportIndexFilePath    = 'importIndexFilePath'
+
+    ## [ str ] - Env view.
+    kEnvViewPath            = 'envViewPath'
+
+    ## [ str ] - Bin directory of the env view.
+    kEnvViewBinPath         = 'envViewBinPath'
+
+    ## [ str ] - Library directory of the env view.
+    kEnvViewLibPath         = 'envViewLibPath'
+
+#
+## @brief [ ENUM CLASS ] - Callback stages.
+class Stage(object):
+
+    ## [ str ] - Pre-build callback.
+    kPreBuild   = 'pre-build'
+
+    ## [ str ] - Post-build callback.
+    kPostBuild  = 'post-build'
+
+#
+## @brief [ CLASS ] - Env snapshot.
+class EnvSnapshot(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param platformName [ str  | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #  @param packages     [ dict | None | in  ] - Keys are absolute package paths, values are whether the package should be initialized.
+    #  @param entries      [ dict | None | in  ] - Keys are stages, values are lists of entries.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, platformName=None, packages=None, entries=None):
+
+        ## [ str ] - Platform name.
+        self._platformName  = platformName
+
+        ## [ dict ] - Keys are absolute package paths, values are whether the package should be initialized.
+        self._packages      = dict(packages or {})
+
+        ## [ dict ] - Keys are stages, values are lists of entries, each entry is a list of kind and arguments.
+        self._entries       = dict(entries or {})
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Platform name.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Platform name.
+    def platformName(self):
+
+        return self._platformName
+
+    #
+    ## @brief Set platform name.
+    #
+    #  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def setPlatformName(self, platformName):
+
+        self._platformName = platformName
+
+    #
+    ## @brief Packages.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are absolute package paths, values are whether the package should be initialized.
+    def packages(self):
+
+        return self._packages
+
+    #
+    ## @brief Record whether given package should be initialized.
+    #
+    #  @param packagePath [ str  | None | in  ] - Absolute path of the root of a package.
+    #  @param result      [ bool | None | in  ] - Whether the package should be initialized.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addPackage(self, packagePath, result):
+
+        self._packages[packagePath] = bool(result)
+
+    #
+    ## @brief Get whether given package should be initialized.
+    #
+    #  @param packagePath [ str | None | in  ] - Absolute path of the root of a package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    #  @return None - If the package is not in the snapshot.
+    def package(self, packagePath):
+
+        return self._packages.get(packagePath)
+
+    #
+    ## @brief Entries of given stage.
+    #
+    #  @param stage [ str | None | in  ] - Stage, see mMecoSettings.snapshotLib.Stage.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Entries.
+    def entries(self, stage):
+
+        return self._entries.setdefault(stage, [])
+
+    #
+    ## @brief Add entries of given stage into given env entry container.
+    #
+    #  Last argument of host-local entries is replaced by the value `resolve` returns for their key.
+    #
+    #  @param stage             [ str                                   | None | in  ] - Stage, see mMecoSettings.snapshotLib.Stage.
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #  @param resolve           [ function                              | None | in  ] - Function, which gets a key of
+    #                                                                                    mMecoSettings.snapshotLib.HostLocal
+    #                                                                                    and returns its value on this host.
+    #
+    #  @exception mMecoSettings.exceptionLib.InvalidSnapshotError - If a host-local entry can't be resolved.
+    #
+    #  @return None - None.
+    def replay(self, stage, envEntryContainer, resolve=None):
+
+        methods = {EntryKind.kSingle    : envEntryContainer.addSingle,
+                   EntryKind.kMulti     : envEntryContainer.addMulti,
+                   EntryKind.kScript    : envEntryContainer.addScript,
+                   EntryKind.kCommand   : envEntryContainer.addCommand}
+
+        for entry in self.entries(stage):
+
+            if entry[0] != EntryKind.kHostLocal:
+                methods[entry[0]](*entry[1:])
+                continue
+
+            key   = entry[1]
+            value = resolve(key) if resolve else None
+            if value is None:
+                raise mMecoSettings.exceptionLib.InvalidSnapshotError('Host-local entry can\'t be resolved: {}'.format(key))
+
+            methods[entry[2]](*(entry[3:-1] + [value]))
+
+    #
+    ## @brief Get content of the snapshot.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Content.
+    def asDict(self):
+
+        return {'format'    : FORMAT_NAME,
+                'version'   : FORMAT_VERSION,
+                'platform'  : self._platformName,
+                'packages'  : self._packages,
+                'entries'   : self._entries}
+
+    #
+    ## @brief Write the snapshot.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the snapshot file, see mMecoSettings.snapshotLib.BINARY_EXTENSION.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the snapshot file.
+    def write(self, path):
+
+        content = json.dumps(self.asDict(), separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+        if path.endswith(BINARY_EXTENSION):
+            content = BINARY_MAGIC + struct.pack('>H', FORMAT_VERSION) + zlib.compress(content)
+
+        temporaryPath = '{}.{}'.format(path, os.getpid())
+
+        with mMecoSettings.fileSystemLib.openFile(temporaryPath, 'wb') as outFile:
+            outFile.write(content)
+
+        # Farm tasks mustn't read partially written snapshots
+        mMecoSettings.fileSystemLib.rename(temporaryPath, path)
+
+        return path
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Read a snapshot.
+    #
+    #  Format is detected by the content, not the extension.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the snapshot file.
+    #
+    #  @exception mMecoSettings.exceptionLib.InvalidSnapshotError - If the file is not a snapshot or its version is not supported.
+    #
+    #  @return mMecoSettings.snapshotLib.EnvSnapshot - Snapshot.
+    @staticmethod
+    def read(path):
+
+        with mMecoSettings.fileSystemLib.openFile(path, 'rb') as inFile:
+            content = inFile.read()
+
+        if content.startswith(BINARY_MAGIC):
+
+            headerSize = len(BINARY_MAGIC) + 2
+            version    = struct.unpack('>H', content[len(BINARY_MAGIC):headerSize])[0]
+            if version != FORMAT_VERSION:
+                raise mMecoSettings.exceptionLib.InvalidSnapshotError('Unsupported snapshot version {}: {}'.format(version, path))
+
+            content = zlib.decompress(content[headerSize:])
+
+        try:
+            data = json.loads(content.decode('utf-8'))
+        except ValueError:
+            raise mMecoSettings.exceptionLib.InvalidSnapshotError('Invalid snapshot file: {}'.format(path))
+
+        if not isinstance(data, dict) or data.get('format') != FORMAT_NAME:
+            raise mMecoSettings.exceptionLib.InvalidSnapshotError('Invalid snapshot file: {}'.format(path))
+
+        if data.get('version') != FORMAT_VERSION:
+            raise mMecoSettings.exceptionLib.InvalidSnapshotError('Unsupported snapshot version {}: {}'.format(data.get('version'), path))
+
+        return EnvSnapshot(data['platform'], packages=data['packages'], entries=data['entries'])
+
+#
+## @brief [ CLASS ] - Env entry container, which records the entries before passing them to the wrapped container.
+class RecordingEnvEntryContainer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #  @param entries           [ list                                  | None | in  ] - List the entries are recorded in.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, envEntryContainer, entries):
+
+        ## [ mMeco.libs.entryLib.EnvEntryContainer ] - Wrapped env entry container.
+        self._envEntryContainer = envEntryContainer
+
+        ## [ list ] - Recorded entries.
+        self._entries           = entries
+
+    #
+    ## @brief Forward everything else to the wrapped container.
+    #
+    #  @param name [ str | None | in  ] - Attribute name.
+    #
+    #  @exception AttributeError - If the wrapped container doesn't have the attribute.
+    #
+    #  @return variant - Attribute.
+    def __getattr__(self, name):
+
+        return getattr(self._envEntryContainer, name)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Record and add single entry.
+    #
+    #  @param name  [ str | None | in  ] - Variable name.
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addSingle(self, name, value):
+
+        self._entries.append([EntryKind.kSingle, name, value])
+        self._envEntryContainer.addSingle(name, value)
+
+    #
+    ## @brief Record and add multi entry.
+    #
+    #  @param name  [ str | None | in  ] - Variable name.
+    #  @param value [ str | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addMulti(self, name, value):
+
+        self._entries.append([EntryKind.kMulti, name, value])
+        self._envEntryContainer.addMulti(name, value)
+
+    #
+    ## @brief Record and add script.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the script.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addScript(self, path):
+
+        self._entries.append([EntryKind.kScript, path])
+        self._envEntryContainer.addScript(path)
+
+    #
+    ## @brief Record and add command.
+    #
+    #  @param command [ str | None | in  ] - Command.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addCommand(self, command):
+
+        self._entries.append([EntryKind.kCommand, command])
+        self._envEntryContainer.addCommand(command)
+
+    #
+    ## @brief Record and add an entry, whose last argument is only valid on this host.
+    #
+    #  @param key  [ str | None | in  ] - Key, see mMecoSettings.snapshotLib.HostLocal.
+    #  @param kind [ str | None | in  ] - Entry kind, see mMecoSettings.snapshotLib.EntryKind.
+    #  @param args [ list | None | in  ] - Arguments of the entry.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addHostLocal(self, key, kind, *args):
+
+        self._entries.append([EntryKind.kHostLocal, key, kind] + list(args))
+        getattr(self._envEntryContainer, _METHOD_NAMES[kind])(*args)
+
+#
+## [ dict ] - Keys are entry kinds, values are names of the env entry container methods.
+_METHOD_NAMES       = {EntryKind.kSingle    : 'addSingle',
+                       EntryKind.kMulti     : 'addMulti',
+                       EntryKind.kScript    : 'addScript',
+                       EntryKind.kCommand   : 'addCommand'}
+
+#
+## [ mMecoSettings.snapshotLib.EnvSnapshot ] - Snapshot loaded from `MECO_ENV_SNAPSHOT_FILE_PATH`, False if there isn't any.
+_LOADED_SNAPSHOT    = None
+
+#
+## [ mMecoSettings.snapshotLib.EnvSnapshot ] - Snapshot being recorded for `MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH`.
+_EXPORT_SNAPSHOT    = None
+
+#
+## @brief Get snapshot loaded from `MECO_ENV_SNAPSHOT_FILE_PATH`.
+#
+#  Snapshot file is read once.
+#
+#  @param platformName [ str | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception mMecoSettings.exceptionLib.InvalidSnapshotError - If the file is not a valid snapshot or it is for another platform.
+#
+#  @return mMecoSettings.snapshotLib.EnvSnapshot - Snapshot.
+#  @return None                                  - If no snapshot is provided.
+def getLoadedSnapshot(platformName):
+
+    global _LOADED_SNAPSHOT
+
+    if _LOADED_SNAPSHOT is None:
+
+        path = os.environ.get(mMecoSettings.envVariablesLib.MECO_ENV_SNAPSHOT_FILE_PATH)
+
+        _LOADED_SNAPSHOT = EnvSnapshot.read(path) if path else False
+
+    if not _LOADED_SNAPSHOT:
+        return None
+
+    if _LOADED_SNAPSHOT.platformName() != platformName:
+        message = 'Snapshot has been exported on {}, it can\'t be loaded on {}.'.format(_LOADED_SNAPSHOT.platformName(), platformName)
+        raise mMecoSettings.exceptionLib.InvalidSnapshotError(message)
+
+    return _LOADED_SNAPSHOT
+
+#
+## @brief Get snapshot being recorded for `MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH`.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.snapshotLib.EnvSnapshot - Snapshot.
+#  @return None                                  - If no snapshot is exported.
+def getExportSnapshot():
+
+    global _EXPORT_SNAPSHOT
+
+    if _EXPORT_SNAPSHOT is None and os.environ.get(mMecoSettings.envVariablesLib.MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH):
+        _EXPORT_SNAPSHOT = EnvSnapshot()
+
+    return _EXPORT_SNAPSHOT
+
+#
+## @brief Wrap given env entry container so its entries are recorded into the exported snapshot.
+#
+#  @param stage             [ str                                   | None | in  ] - Stage, see mMecoSettings.snapshotLib.Stage.
+#  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+#  @param platformName      [ str                                   | None | in  ] - Platform name, one of the following; Linux, Darwin, Windows.
+#
+#  @exception N/A
+#
+#  @return mMecoSettings.snapshotLib.RecordingEnvEntryContainer - If a snapshot is exported.
+#  @return mMeco.libs.entryLib.EnvEntryContainer                - Given container if no snapshot is exported.
+def record(stage, envEntryContainer, platformName):
+
+    snapshot = getExportSnapshot()
+    if not snapshot:
+        return envEntryContainer
+
+    snapshot.setPlatformName(platformName)
+
+    return RecordingEnvEntryContainer(envEntryContainer, snapshot.entries(stage))
+
+#
+## @brief Add an entry, whose last argument is only valid on this host, into given env entry container.
+#
+#  Entry is recorded as host-local if the container records a snapshot, so its value is recomputed on replay.
+#
+#  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+#  @param key               [ str                                   | None | in  ] - Key, see mMecoSettings.snapshotLib.HostLocal.
+#  @param kind              [ str                                   | None | in  ] - Entry kind, see mMecoSettings.snapshotLib.EntryKind.
+#  @param args              [ list                                  | None | in  ] - Arguments of the entry.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def addHostLocal(envEntryContainer, key, kind, *args):
+
+    if isinstance(envEntryContainer, RecordingEnvEntryContainer):
+        envEntryContainer.addHostLocal(key, kind, *args)
+    else:
+        getattr(envEntryContainer, _METHOD_NAMES[kind])(*args)
+
+#
+## @brief Write the exported snapshot.
+#
+#  @exception N/A
+#
+#  @return str  - Absolute path of the snapshot file.
+#  @return None - If no snapshot is exported.
+def export():
+
+    snapshot = getExportSnapshot()
+    if not snapshot:
+        return None
+
+    return snapshot.write(os.environ[mMecoSettings.envVariablesLib.MECO_ENV_SNAPSHOT_EXPORT_FILE_PATH])
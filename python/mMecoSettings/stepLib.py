@@ -0,0 +1,254 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/stepLib.py    @brief [ FILE   ] - Step module.
+## @package mMecoSettings.stepLib       @brief [ MODULE ] - Step module.
+#
+#  Callbacks declare their file system operations as steps with dependencies. Steps which don't depend on each other
+#  are run at the same time on a thread pool, results are returned by step name so the callbacks can add their
+#  entries in a deterministic order.
+#
+#  Step functions run on other threads, so they mustn't use objects which aren't thread-safe such as
+#  `mMeco.libs.allLib.All`; values they need are read on the calling thread before the steps are run.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import  sys
+import  threading
+
+from    multiprocessing.pool import ThreadPool
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Number of threads of the shared thread pool.
+THREAD_COUNT    = 8
+
+#
+## [ multiprocessing.pool.ThreadPool ] - Thread pool shared by all step runners, created when it is needed first.
+_THREAD_POOL    = None
+
+#
+## [ threading.Lock ] - Lock protecting creation of the thread pool.
+_LOCK           = threading.Lock()
+
+#
+## @brief [ CLASS ] - Step.
+class Step(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param name         [ str         | None | in  ] - Name of the step.
+    #  @param function     [ callable    | None | in  ] - Function, results of the dependencies are passed to it in the given order.
+    #  @param dependencies [ list of str | None | in  ] - Names of the steps this step depends on.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, name, function, dependencies=None):
+
+        ## [ str ] - Name.
+        self._name          = name
+
+        ## [ callable ] - Function.
+        self._function      = function
+
+        ## [ list of str ] - Dependencies.
+        self._dependencies  = list(dependencies or [])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Name.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name.
+    def name(self):
+
+        return self._name
+
+    #
+    ## @brief Dependencies.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the steps this step depends on.
+    def dependencies(self):
+
+        return self._dependencies
+
+    #
+    ## @brief Run the step.
+    #
+    #  @param results [ dict | None | in  ] - Results of the steps run so far.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Result and exception info, exception info is None if the step succeeded.
+    def run(self, results):
+
+        try:
+            return (self._function(*[results[x] for x in self._dependencies]), None)
+        except Exception:
+            return (None, sys.exc_info())
+
+#
+## @brief [ CLASS ] - Run steps concurrently respecting their dependencies.
+class StepRunner(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ list of mMecoSettings.stepLib.Step ] - Steps in declaration order.
+        self._steps = []
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add a step.
+    #
+    #  @param name         [ str         | None | in  ] - Name of the step.
+    #  @param function     [ callable    | None | in  ] - Function, results of the dependencies are passed to it in the given order.
+    #  @param dependencies [ list of str | None | in  ] - Names of the steps this step depends on, they must be added before.
+    #
+    #  @exception ValueError - If a step with the same name exists or a dependency is missing.
+    #
+    #  @return None - None.
+    def add(self, name, function, dependencies=None):
+
+        names = [x.name() for x in self._steps]
+
+        if name in names:
+            raise ValueError('Step already exists: {}'.format(name))
+
+        for dependency in dependencies or []:
+            if not dependency in names:
+                raise ValueError('Dependency of step {} doesn\'t exist: {}'.format(name, dependency))
+
+        self._steps.append(Step(name, function, dependencies))
+
+    #
+    ## @brief Run the steps.
+    #
+    #  Steps are run in waves, each wave contains the steps whose dependencies have been run. Steps of a wave are
+    #  run at the same time. If steps fail, exception of the first failed step in declaration order is raised.
+    #
+    #  @exception Exception - Exception raised by a step.
+    #
+    #  @return dict - Keys are step names, values are their results.
+    def run(self):
+
+        results = {}
+        pending = list(self._steps)
+
+        while pending:
+
+            wave    = [x for x in pending if all(y in results for y in x.dependencies())]
+            pending = [x for x in pending if not x in wave]
+
+            if len(wave) == 1:
+                outcomes = [wave[0].run(results)]
+            else:
+                outcomes = getThreadPool().map(lambda step: step.run(results), wave)
+
+            for step, outcome in zip(wave, outcomes):
+
+                if outcome[1]:
+                    _reraise(outcome[1])
+
+                results[step.name()] = outcome[0]
+
+        return results
+
+#
+## @brief Get the shared thread pool.
+#
+#  @exception N/A
+#
+#  @return multiprocessing.pool.ThreadPool - Thread pool.
+def getThreadPool():
+
+    global _THREAD_POOL
+
+    if _THREAD_POOL is None:
+        with _LOCK:
+            if _THREAD_POOL is None:
+                _THREAD_POOL = ThreadPool(THREAD_COUNT)
+
+    return _THREAD_POOL
+
+#
+## @brief Close the shared thread pool.
+#
+#  Threads of the pool are stopped, a new pool is created if it is needed again.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def closeThreadPool():
+
+    global _THREAD_POOL
+
+    with _LOCK:
+        threadPool   = _THREAD_POOL
+        _THREAD_POOL = None
+
+    if threadPool is not None:
+        threadPool.close()
+        threadPool.join()
+
+#
+## @brief Raise given exception with its original traceback.
+#
+#  @param excInfo [ tuple | None | in  ] - Exception info returned by `sys.exc_info`.
+#
+#  @exception Exception - Given exception.
+#
+#  @return None - None.
+def _reraise(excInfo):
+
+    exception = excInfo[1]
+
+    if hasattr(exception, 'with_traceback'):
+        raise exception.with_traceback(excInfo[2])
+
+    raise exception
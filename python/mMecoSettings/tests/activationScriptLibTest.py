@@ -0,0 +1,144 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/activationScriptLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.activationScriptLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.activationScriptLib
+import mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ActivationScriptTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_getScript(self):
+
+        for kind, platformName in mMecoSettings.activationScriptLib.SCRIPTS:
+
+            path = mMecoSettings.activationScriptLib.getScript(kind, platformName, self._directory)
+
+            with open(path, 'r') as inFile:
+                content = inFile.read()
+
+            self.assertNotIn('BASH_SOURCE', content)
+            self.assertNotIn('source ', content)
+            self.assertNotIn('MyInvocation', content)
+
+    def test_getScriptMissingDirectory(self):
+
+        directory = os.path.join(self._directory, 'missing', 'scripts')
+        path      = mMecoSettings.activationScriptLib.getScript('pre', 'Linux', directory)
+
+        self.assertEqual(os.path.dirname(path), directory)
+        self.assertTrue(os.path.isfile(path))
+
+    def test_reuse(self):
+
+        path    = mMecoSettings.activationScriptLib.getScript('pre', 'Darwin', self._directory)
+        flatten = mMecoSettings.activationScriptLib.flatten
+
+        def fail(path, sources=None):
+            raise AssertionError('Scripts are flattened again: {}'.format(path))
+
+        mMecoSettings.activationScriptLib._SCRIPTS.clear()
+        mMecoSettings.activationScriptLib.flatten = fail
+
+        try:
+            self.assertEqual(mMecoSettings.activationScriptLib.getScript('pre', 'Darwin', self._directory), path)
+        finally:
+            mMecoSettings.activationScriptLib.flatten = flatten
+            mMecoSettings.activationScriptLib._SCRIPTS.clear()
+
+        # Script is generated again once one of the inlined scripts changes
+        sourcesPath = path + mMecoSettings.activationScriptLib.SOURCES_EXTENSION
+
+        with open(sourcesPath, 'r') as inFile:
+            states = json.loads(inFile.read())
+
+        self.assertGreater(len(states), 1)
+        states[-1][2] += 1
+
+        with open(sourcesPath, 'w') as outFile:
+            outFile.write(json.dumps(states))
+
+        with open(path, 'w') as outFile:
+            outFile.write('stale\n')
+
+        self.assertFalse(mMecoSettings.activationScriptLib.isUpToDate(path))
+        self.assertEqual(mMecoSettings.activationScriptLib.getScript('pre', 'Darwin', self._directory), path)
+        self.assertTrue(mMecoSettings.activationScriptLib.isUpToDate(path))
+
+        with open(path, 'r') as inFile:
+            self.assertNotEqual(inFile.read(), 'stale\n')
+
+        mMecoSettings.activationScriptLib._SCRIPTS.clear()
+
+    def test_privateDirectory(self):
+
+        path = mMecoSettings.activationScriptLib.getScript('pre', 'Linux')
+
+        self.assertEqual(os.path.dirname(path), mMecoSettings.fileSystemLib.getUserTemporaryPath())
+        self.assertTrue(mMecoSettings.fileSystemLib.isPrivateDir(os.path.dirname(path)))
+
+    def test_flattenShellScript(self):
+
+        path  = os.path.join(mMecoSettings.activationScriptLib.SCRIPT_PATH, 'shell', 'mmecosettings-entry-point.sh')
+        lines = mMecoSettings.activationScriptLib.flattenShellScript(path)
+
+        self.assertIn('    local pythonPath="{}";'.format(os.path.join(os.path.dirname(mMecoSettings.activationScriptLib.SCRIPT_PATH), 'python')), lines)
+        self.assertEqual(len([x for x in lines if x.startswith('#!')]), 1)
+
+    def test_cycle(self):
+
+        for name, other in (('a.sh', 'b.sh'), ('b.sh', 'a.sh')):
+            with open(os.path.join(self._directory, name), 'w') as outFile:
+                outFile.write('source "${{BASH_SOURCE%/*}}/{}"\n'.format(other))
+
+        self.assertRaises(IOError, mMecoSettings.activationScriptLib.flatten, os.path.join(self._directory, 'a.sh'))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
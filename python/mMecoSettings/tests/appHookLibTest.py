@@ -0,0 +1,107 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/appHookLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.appHookLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.appHookLib
+import mMecoSettings.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class AppHookTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+        self._hooks     = mMecoSettings.appHookLib.getHooks()
+
+        for name in ('testNukeHookLib', 'testMayaHookLib'):
+            with open(os.path.join(self._directory, '{}.py'.format(name)), 'w') as outFile:
+                outFile.write('def setEnvironment(allLib, envEntryContainer, appData):\n    appData["hook"] = __name__\n')
+
+        sys.path.insert(0, self._directory)
+
+        mMecoSettings.appHookLib.register('nuke', 'testNukeHookLib')
+        mMecoSettings.appHookLib.register('maya', 'testMayaHookLib')
+
+    def tearDown(self):
+
+        sys.path.remove(self._directory)
+
+        for name in ('testNukeHookLib', 'testMayaHookLib'):
+            sys.modules.pop(name, None)
+
+        mMecoSettings.appHookLib._HOOKS.clear()
+        mMecoSettings.appHookLib._HOOKS.update(self._hooks)
+
+        shutil.rmtree(self._directory)
+
+    def test_run(self):
+
+        appData = {'application': 'nuke'}
+
+        self.assertTrue(mMecoSettings.appHookLib.run('nuke', None, None, appData))
+        self.assertEqual(appData['hook'], 'testNukeHookLib')
+
+        # Hooks of the other applications aren't imported
+        self.assertIn('testNukeHookLib', sys.modules)
+        self.assertNotIn('testMayaHookLib', sys.modules)
+
+    def test_runWithoutHook(self):
+
+        self.assertFalse(mMecoSettings.appHookLib.run('atom', None, None, {'application': 'atom'}))
+
+    def test_profile(self):
+
+        profiler = mMecoSettings.profileLib.Profiler()
+        default  = mMecoSettings.profileLib._PROFILER
+
+        mMecoSettings.profileLib._PROFILER = profiler
+        profiler.enable()
+
+        try:
+            mMecoSettings.appHookLib.run('maya', None, None, {'application': 'maya'})
+        finally:
+            profiler.disable()
+            mMecoSettings.profileLib._PROFILER = default
+
+        self.assertEqual([x.rsplit(' ', 1)[0] for x in profiler.stacks()], ['run[maya]'])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
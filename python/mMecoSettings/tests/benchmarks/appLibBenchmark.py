@@ -0,0 +1,46 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/appLibBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mMecoSettings.tests.benchmarks.appLibBenchmark    @brief [ MODULE ] - Benchmark module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mMecoSettings.appLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ListBenchmark(object):
+
+    # App files of this package, without and with a keyword
+    params = [None, 'maya']
+
+    def setup(self, keyword):
+
+        mMecoSettings.appLib._CATALOG.clear()
+
+    def time_list(self, keyword):
+
+        mMecoSettings.appLib.AppFile.list(keyword)
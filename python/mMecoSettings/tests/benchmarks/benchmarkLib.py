@@ -0,0 +1,320 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/benchmarkLib.py @brief [ FILE   ] - Benchmark runner module.
+## @package mMecoSettings.tests.benchmarks.benchmarkLib    @brief [ MODULE ] - Benchmark runner module.
+#
+#  Benchmarks are classes in `*Benchmark.py` modules of this directory, in the style of asv. Each class may have;
+#
+#  - `params`   : List of parameters, each benchmark method is run once for each parameter.
+#  - `setup`    : Invoked with the parameter before the benchmark methods of the parameter are run.
+#  - `teardown` : Invoked with the parameter after the benchmark methods of the parameter are run.
+#  - `repeat`   : Number of samples, mMecoSettings.tests.benchmarks.benchmarkLib.REPEAT is used if not given.
+#  - `time_*`   : Benchmark methods, invoked with the parameter.
+#
+#  Results are written as JSON, so running the benchmarks and committing the results file shows performance changes
+#  in review. A previous results file can be compared with the current run;
+#
+#  @code
+#  python -m mMecoSettings.tests.benchmarks.benchmarkLib --output results.json --compare previous.json
+#  @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import timeit
+import platform
+import argparse
+import traceback
+
+from importlib import import_module
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Version of the results format.
+FORMAT_VERSION      = 1
+
+#
+## [ str ] - Absolute path of the benchmarks directory.
+BENCHMARKS_PATH     = os.path.dirname(os.path.abspath(__file__))
+
+#
+## [ str ] - Default absolute path of the results file.
+RESULTS_FILE_PATH   = os.path.join(BENCHMARKS_PATH, 'results.json')
+
+#
+## [ float ] - Minimum duration of one sample in seconds, number of calls per sample is increased until it is reached.
+MINIMUM_DURATION    = 0.05
+
+#
+## [ int ] - Number of samples of each benchmark.
+REPEAT              = 5
+
+#
+## [ float ] - Ratio above which a benchmark is reported as a regression or an improvement.
+THRESHOLD           = 1.2
+
+#
+## @brief Get benchmark modules.
+#
+#  @exception N/A
+#
+#  @return list of str - Module names.
+def getModuleNames():
+
+    return ['mMecoSettings.tests.benchmarks.{}'.format(x[:-3])
+            for x in sorted(os.listdir(BENCHMARKS_PATH)) if x.endswith('Benchmark.py')]
+
+#
+## @brief Time given function.
+#
+#  @param function [ callable | None   | in  ] - Function without arguments.
+#  @param repeat   [ int      | REPEAT | in  ] - Number of samples.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are number, which is the number of calls per sample, min and median, which are seconds per call.
+def timeFunction(function, repeat=REPEAT):
+
+    timer  = timeit.Timer(function)
+    number = 1
+
+    # Calibrate the number of calls, so each sample takes long enough to be measured reliably
+    while True:
+        duration = timer.timeit(number)
+        if duration >= MINIMUM_DURATION or number >= 1000000:
+            break
+        number *= 10 if duration < MINIMUM_DURATION / 10.0 else 2
+
+    samples = sorted(x / number for x in timer.repeat(repeat, number))
+
+    return {'number': number,
+            'min'   : samples[0],
+            'median': samples[len(samples) // 2]}
+
+#
+## @brief Run benchmarks of given module.
+#
+#  @param moduleName [ str | None | in  ] - Module name.
+#  @param pattern    [ str | None | in  ] - Only benchmarks which contain this pattern in their names are run.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are benchmark names, values are dicts whose keys are parameters and values are timings, or
+#                 error messages if the benchmark failed.
+def runModule(moduleName, pattern=None):
+
+    results = {}
+
+    module = import_module(moduleName)
+
+    for className in sorted(dir(module)):
+
+        cls = getattr(module, className)
+        if not isinstance(cls, type) or not cls.__module__ == moduleName or not className.endswith('Benchmark'):
+            continue
+
+        methodNames = [x for x in sorted(dir(cls)) if x.startswith('time_')]
+        methodNames = [x for x in methodNames
+                       if not pattern or pattern in '{}.{}.{}'.format(moduleName.split('.')[-1], className, x)]
+        if not methodNames:
+            continue
+
+        for param in getattr(cls, 'params', [None]):
+
+            instance = cls()
+
+            try:
+                if hasattr(instance, 'setup'):
+                    instance.setup(param)
+            except Exception:
+                for methodName in methodNames:
+                    results.setdefault('{}.{}'.format(className, methodName), {})[str(param)] = {'error': traceback.format_exc()}
+                continue
+
+            try:
+                for methodName in methodNames:
+
+                    method = getattr(instance, methodName)
+
+                    try:
+                        timing = timeFunction(lambda: method(param), getattr(cls, 'repeat', REPEAT))
+                    except Exception:
+                        timing = {'error': traceback.format_exc()}
+
+                    results.setdefault('{}.{}'.format(className, methodName), {})[str(param)] = timing
+            finally:
+                if hasattr(instance, 'teardown'):
+                    instance.teardown(param)
+
+    return results
+
+#
+## @brief Run all benchmarks.
+#
+#  @param pattern [ str | None | in  ] - Only benchmarks which contain this pattern in their names are run.
+#
+#  @exception N/A
+#
+#  @return dict - Results.
+def run(pattern=None):
+
+    results = {'version'    : FORMAT_VERSION,
+               'machine'    : {'system'     : platform.system(),
+                               'machine'    : platform.machine(),
+                               'python'     : platform.python_version()},
+               'benchmarks' : {}}
+
+    for moduleName in getModuleNames():
+
+        try:
+            moduleResults = runModule(moduleName, pattern)
+        except ImportError:
+            # Benchmarks of the modules, which can't be imported in this environment, are reported as errors
+            moduleResults = {'import': {'None': {'error': traceback.format_exc()}}}
+
+        for name, timings in moduleResults.items():
+            results['benchmarks']['{}.{}'.format(moduleName.split('.')[-1], name)] = timings
+
+    return results
+
+#
+## @brief Compare two results.
+#
+#  @param previous  [ dict  | None      | in  ] - Previous results.
+#  @param current   [ dict  | None      | in  ] - Current results.
+#  @param threshold [ float | THRESHOLD | in  ] - Ratio above which a benchmark is reported.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Each item is a tuple of benchmark name, parameter, previous median, current median and ratio,
+#                          sorted from the worst regression to the best improvement.
+def compare(previous, current, threshold=THRESHOLD):
+
+    changes = []
+
+    for name, timings in current['benchmarks'].items():
+        for param, timing in timings.items():
+
+            previousTiming = previous['benchmarks'].get(name, {}).get(param, {})
+            if not 'median' in timing or not previousTiming.get('median'):
+                continue
+
+            ratio = timing['median'] / previousTiming['median']
+            if ratio >= threshold or ratio <= 1.0 / threshold:
+                changes.append((name, param, previousTiming['median'], timing['median'], ratio))
+
+    return sorted(changes, key=lambda x: -x[4])
+
+#
+## @brief Get report of given results.
+#
+#  @param results [ dict          | None | in  ] - Results.
+#  @param changes [ list of tuple | None | in  ] - Changes, see mMecoSettings.tests.benchmarks.benchmarkLib.compare.
+#
+#  @exception N/A
+#
+#  @return list of str - Lines.
+def getReport(results, changes=None):
+
+    lines = []
+
+    for name in sorted(results['benchmarks']):
+        for param, timing in sorted(results['benchmarks'][name].items()):
+
+            if 'error' in timing:
+                lines.append('{:<70} {:>8} {}'.format(name, param, timing['error'].strip().splitlines()[-1]))
+            else:
+                lines.append('{:<70} {:>8} {:>12.1f} us'.format(name, param, timing['median'] * 1000000))
+
+    if changes is not None:
+
+        lines.append('')
+        lines.append('{} change(s) above {}x'.format(len(changes), THRESHOLD))
+
+        for name, param, previousMedian, currentMedian, ratio in changes:
+            lines.append('{:<70} {:>8} {:>12.1f} us -> {:>12.1f} us {:>6.2f}x {}'.format(name,
+                                                                                     param,
+                                                                                     previousMedian * 1000000,
+                                                                                     currentMedian * 1000000,
+                                                                                     ratio,
+                                                                                     'SLOWER' if ratio > 1 else 'faster'))
+
+    return lines
+
+#
+## @brief Run the benchmarks from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    parser = argparse.ArgumentParser(description='Run mMecoSettings benchmarks')
+
+    parser.add_argument('-o',
+                        '--output',
+                        type=str,
+                        default=RESULTS_FILE_PATH,
+                        help='Absolute path of the results file')
+
+    parser.add_argument('-c',
+                        '--compare',
+                        type=str,
+                        default=None,
+                        help='Absolute path of previous results to compare with')
+
+    parser.add_argument('-k',
+                        '--pattern',
+                        type=str,
+                        default=None,
+                        help='Only run benchmarks which contain this pattern in their names')
+
+    _args = parser.parse_args()
+
+    results = run(_args.pattern)
+
+    changes = None
+    if _args.compare:
+        with open(_args.compare, 'r') as inFile:
+            changes = compare(json.loads(inFile.read()), results)
+
+    with open(_args.output, 'w') as outFile:
+        outFile.write(json.dumps(results, indent=4, sort_keys=True))
+        outFile.write('\n')
+
+    sys.stdout.write('\n'.join(getReport(results, changes)))
+    sys.stdout.write('\n')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,81 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/callbackLibBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mMecoSettings.tests.benchmarks.callbackLibBenchmark    @brief [ MODULE ] - Benchmark module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import shutil
+import tempfile
+
+import mMecoSettings.callbackLib
+import mMecoSettings.fileSystemLib
+import mMecoSettings.importIndexLib
+
+import mMecoSettings.tests.benchmarks.standInLib
+import mMecoSettings.tests.projectTreeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ShouldInitializePackageBenchmark(object):
+
+    params = [10, 1000, 10000]
+
+    repeat = 3
+
+    def setup(self, count):
+
+        self._path          = tempfile.mkdtemp()
+        self._packagePaths  = mMecoSettings.tests.projectTreeLib.generate(self._path,
+                                                                          packageCount=count,
+                                                                          externalCount=0,
+                                                                          developerCount=0).packagePaths(layer='internal')
+        self._allLib        = mMecoSettings.tests.benchmarks.standInLib.AllLib()
+
+    def teardown(self, count):
+
+        mMecoSettings.importIndexLib.clearPackages()
+
+        shutil.rmtree(self._path)
+
+    def time_shouldInitializePackage(self, count):
+
+        for packagePath in self._packagePaths:
+            mMecoSettings.callbackLib.shouldInitializePackage(self._allLib, packagePath)
+
+class ShouldInitializePackageInMemoryBenchmark(ShouldInitializePackageBenchmark):
+
+    def setup(self, count):
+
+        super(ShouldInitializePackageInMemoryBenchmark, self).setup(count)
+
+        self._fileSystem = mMecoSettings.fileSystemLib.setFileSystem(mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory(self._path))
+
+    def teardown(self, count):
+
+        mMecoSettings.fileSystemLib.setFileSystem(self._fileSystem)
+
+        super(ShouldInitializePackageInMemoryBenchmark, self).teardown(count)
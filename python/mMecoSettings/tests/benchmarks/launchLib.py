@@ -0,0 +1,543 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/launchLib.py @brief [ FILE   ] - Launch latency module.
+## @package mMecoSettings.tests.benchmarks.launchLib    @brief [ MODULE ] - Launch latency module.
+#
+#  Runs the whole launch sequence of an environment against a synthetic project tree, see
+#  mMecoSettings.tests.projectTreeLib;
+#
+#  - Settings are resolved by mMecoSettings.settingsLib.
+#  - mMecoSettings.callbackLib.getPreBuild.
+#  - Packages are filtered by mMecoSettings.callbackLib.shouldInitializePackage.
+#  - mMecoSettings.callbackLib.getPostBuild.
+#  - Env script is generated from the entries.
+#
+#  Each sample is a new interpreter with an empty temporary directory. Its first launch is the cold launch, its
+#  following launches are warm launches, which reuse the caches of the process and the generated files. Wall time
+#  and the number of file system calls, which are counted by mMecoSettings.profileLib.Profiler, are compared with
+#  the baseline in `launchBaseline.json`;
+#
+#  @code
+#  python -m mMecoSettings.tests.benchmarks.launchLib
+#  python -m mMecoSettings.tests.benchmarks.launchLib --update-baseline
+#  @endcode
+#
+#  Page cache of the operating system is not dropped, so cold launches measure the caches of mMecoSettings only.
+#  Functions of mMeco are replaced by the stand-ins of mMecoSettings.tests.benchmarks.standInLib if mMeco is not
+#  available.
+#
+#  Storage latency can be simulated with mMecoSettings.fileSystemLib.LatencyFileSystem. Each scenario is then run
+#  once per latency, and the number of calls routed through mMecoSettings.fileSystemLib is reported as well;
+#
+#  @code
+#  python -m mMecoSettings.tests.benchmarks.launchLib --latency 0,2,5,10
+#  @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import shutil
+import getpass
+import platform
+import argparse
+import tempfile
+import subprocess
+
+import mMecoSettings.envVariablesLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ int ] - Version of the baseline format.
+FORMAT_VERSION      = 1
+
+#
+## [ str ] - Default absolute path of the baseline file.
+BASELINE_FILE_PATH  = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'launchBaseline.json')
+
+#
+## [ str ] - Absolute path of the Python directory of this package.
+PYTHON_PATH         = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+#
+## [ dict ] - Keys are scenario names, values are app names, scenarios without an app launch a shell.
+SCENARIOS           = {'shell'  : '',
+                       'app'    : 'app00000'}
+
+#
+## [ float ] - Ratio of wall time above the baseline, which is reported as a regression.
+TIME_THRESHOLD      = 1.25
+
+#
+## [ float ] - Ratio of file system calls above the baseline, which is reported as a regression.
+CALL_THRESHOLD      = 1.05
+
+#
+## [ str ] - Name of the developer of the launches.
+DEVELOPER_NAME      = 'developer000'
+
+#
+## @brief Get the env script of given entries.
+#
+#  @param entries [ list of tuple | None | in  ] - Entries of mMecoSettings.tests.envDeltaLibTest.EnvEntryContainer.
+#
+#  @exception N/A
+#
+#  @return str - Content.
+def getScript(entries):
+
+    lines = []
+
+    for entry in entries:
+
+        if entry[0] == 'single':
+            lines.append('export {}={}'.format(entry[1], entry[2]))
+
+        elif entry[0] == 'multi':
+            lines.append('export {0}="{1}${{{0}:+:${0}}}"'.format(entry[1], entry[2]))
+
+        elif entry[0] == 'script':
+            lines.append('source "{}"'.format(entry[1]))
+
+        elif entry[0] == 'command':
+            lines.append(entry[1])
+
+    return '\n'.join(lines) + '\n'
+
+#
+## @brief Launch an environment.
+#
+#  @param projectsPath [ str | None | in  ] - Absolute path of the projects of a synthetic tree.
+#  @param app          [ str | None | in  ] - App name, a shell is launched if not given.
+#
+#  @exception N/A
+#
+#  @return int - Number of initialized packages.
+def launch(projectsPath, app=''):
+
+    import mMecoSettings.tests.benchmarks.standInLib
+    import mMecoSettings.tests.envDeltaLibTest
+
+    # mMeco is only available in a Meco environment
+    mMecoSettings.tests.benchmarks.standInLib.installMeco()
+
+    import mMecoSettings.callbackLib
+    import mMecoSettings.importIndexLib
+    import mMecoSettings.settingsLib
+
+    platformName = platform.system()
+    projectName  = mMecoSettings.settingsLib.MASTER_PROJECT_NAME
+    userName     = getpass.getuser()
+
+    # Tree contains a package named mMecoSettings, which is filtered like any other package
+    settingsModule = sys.modules['mMecoSettings']
+
+    mMecoSettings.tests.benchmarks.standInLib.setProjectsPath(projectsPath)
+
+    try:
+        # SETTINGS
+        appFilePath    = mMecoSettings.settingsLib.getAppFilePath(projectName, DEVELOPER_NAME, '', '', platformName, app)
+        logFilePath    = mMecoSettings.settingsLib.getLogFilePath(projectName, userName, '', '', platformName)
+        scriptFilePath = mMecoSettings.settingsLib.getScriptFilePath(projectName, userName, '', '', platformName, appFilePath)
+
+        allLib = mMecoSettings.tests.benchmarks.standInLib.AllLib(
+                    mMecoSettings.tests.benchmarks.standInLib.Request(platform=platformName,
+                                                                      developer=DEVELOPER_NAME,
+                                                                      app=app,
+                                                                      command='meco',
+                                                                      pythonVersion=platform.python_version()),
+                    mMecoSettings.tests.benchmarks.standInLib.SettingsOperator(projectNameInUse=projectName,
+                                                                               appFilePath=appFilePath,
+                                                                               logFilePath=logFilePath,
+                                                                               scriptFilePath=scriptFilePath))
+
+        envEntryContainer = mMecoSettings.tests.envDeltaLibTest.EnvEntryContainer()
+
+        mMecoSettings.importIndexLib.clearPackages()
+
+        # PRE BUILD
+        mMecoSettings.callbackLib.getPreBuild(allLib, envEntryContainer)
+
+        # PACKAGES
+        packagesPaths = [mMecoSettings.settingsLib.getProjectInternalPackagesPath(projectName, platformName),
+                         mMecoSettings.settingsLib.getProjectExternalPackagesPath(projectName, platformName)]
+
+        packageCount = 0
+
+        for packagesPath in packagesPaths:
+            for name in sorted(os.listdir(packagesPath)):
+                for version in sorted(os.listdir(os.path.join(packagesPath, name))):
+                    if mMecoSettings.callbackLib.shouldInitializePackage(allLib, os.path.join(packagesPath, name, version, name)):
+                        packageCount += 1
+
+        # POST BUILD
+        mMecoSettings.callbackLib.getPostBuild(allLib, envEntryContainer)
+
+        # SCRIPT
+        with open(scriptFilePath, 'w') as outFile:
+            outFile.write(getScript(envEntryContainer.entries))
+
+    finally:
+        mMecoSettings.tests.benchmarks.standInLib.setProjectsPath()
+        sys.modules['mMecoSettings'] = settingsModule
+
+    return packageCount
+
+#
+## @brief Launch an environment several times and measure each launch, invoked in a new interpreter.
+#
+#  @param projectsPath [ str | None | in  ] - Absolute path of the projects of a synthetic tree.
+#  @param app          [ str | None | in  ] - App name, a shell is launched if not given.
+#  @param count        [ int | None | in  ] - Number of launches.
+#
+#  @exception N/A
+#
+#  @return list of dict - Measurements, keys are seconds, fileSystemCalls, routedCalls and packages. routedCalls is
+#                         None unless latency is simulated.
+def measure(projectsPath, app, count):
+
+    import mMecoSettings.profileLib
+    import mMecoSettings.fileSystemLib
+
+    fileSystem   = mMecoSettings.fileSystemLib.getFileSystem()
+    latency      = isinstance(fileSystem, mMecoSettings.fileSystemLib.LatencyFileSystem)
+    measurements = []
+
+    for _ in range(count):
+
+        if latency:
+            fileSystem.reset()
+
+        profiler = mMecoSettings.profileLib.Profiler()
+        profiler.enable()
+
+        startTime = time.time()
+
+        try:
+            packageCount = launch(projectsPath, app)
+        finally:
+            seconds = time.time() - startTime
+            profiler.disable()
+
+        measurements.append({'seconds'          : seconds,
+                             'fileSystemCalls'  : profiler.fileSystemCalls(),
+                             'routedCalls'      : fileSystem.callCount() if latency else None,
+                             'packages'         : packageCount})
+
+    return measurements
+
+#
+## @brief Run a sample in a new interpreter with an empty temporary directory.
+#
+#  @param projectsPath [ str | None | in  ] - Absolute path of the projects of a synthetic tree.
+#  @param app          [ str | None | in  ] - App name, a shell is launched if not given.
+#  @param count        [ int   | None | in  ] - Number of launches, first one is cold.
+#  @param latency      [ float | None | in  ] - Latency of each file system call in milliseconds, not simulated if
+#                                               not given.
+#
+#  @exception RuntimeError - If the sample fails.
+#
+#  @return list of dict - Measurements, see mMecoSettings.tests.benchmarks.launchLib.measure.
+def runSample(projectsPath, app, count, latency=None):
+
+    temporaryPath = tempfile.mkdtemp(prefix='mmecosettings-launch-')
+
+    environ = dict(os.environ)
+    environ['PYTHONPATH']   = os.pathsep.join([PYTHON_PATH] + [x for x in [environ.get('PYTHONPATH')] if x])
+    environ['TMPDIR']       = temporaryPath
+    environ['TEMP']         = temporaryPath
+    environ['TMP']          = temporaryPath
+
+    environ.pop(mMecoSettings.envVariablesLib.MECO_FILE_SYSTEM_LATENCY, None)
+    if latency is not None:
+        environ[mMecoSettings.envVariablesLib.MECO_FILE_SYSTEM_LATENCY] = str(latency)
+
+    code = ('import sys, json, mMecoSettings.tests.benchmarks.launchLib as launchLib;'
+            'sys.stdout.write(json.dumps(launchLib.measure(sys.argv[1], sys.argv[2], int(sys.argv[3]))))')
+
+    try:
+        process = subprocess.Popen([sys.executable, '-c', code, projectsPath, app, str(count)],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE,
+                                   env=environ)
+        stdout, stderr = process.communicate()
+    finally:
+        shutil.rmtree(temporaryPath, ignore_errors=True)
+
+    if process.returncode:
+        raise RuntimeError('Launch failed:\n{}'.format(stderr.decode('utf-8')))
+
+    return json.loads(stdout.decode('utf-8').strip().splitlines()[-1])
+
+#
+## @brief Get median of given values.
+#
+#  @param values [ list of float | None | in  ] - Values.
+#
+#  @exception N/A
+#
+#  @return float - Median.
+#  @return None  - If no values are given.
+def _median(values):
+
+    if not values:
+        return None
+
+    values = sorted(values)
+
+    return values[len(values) // 2]
+
+#
+## @brief Run all scenarios.
+#
+#  @param projectsPath [ str | None | in  ] - Absolute path of the projects of a synthetic tree.
+#  @param samples      [ int | 5    | in  ] - Number of samples of each scenario.
+#  @param warmCount    [ int           | 5       | in  ] - Number of warm launches of each sample.
+#  @param latencies    [ list of float | [None]  | in  ] - Latencies in milliseconds, each scenario is run once per
+#                                                          latency, None runs it without simulated latency.
+#
+#  @exception RuntimeError - If a sample fails.
+#
+#  @return dict - Keys are scenario names, values are dicts of cold and warm measurements, warm measurements are
+#                 left out if warmCount is 0. Names of the scenarios run with simulated latency are suffixed with the
+#                 latency, such as `shell@5ms`.
+def run(projectsPath, samples=5, warmCount=5, latencies=None):
+
+    results = {}
+
+    for scenario, app in sorted(SCENARIOS.items()):
+        for latency in latencies or [None]:
+
+            colds = []
+            warms = []
+
+            for _ in range(samples):
+                measurements = runSample(projectsPath, app, warmCount + 1, latency)
+                colds.append(measurements[0])
+                warms.extend(measurements[1:])
+
+            name = scenario if latency is None else '{}@{:g}ms'.format(scenario, latency)
+
+            results[name] = {}
+
+            for cache, measurements in (('cold', colds), ('warm', warms)):
+
+                if not measurements:
+                    continue
+
+                results[name][cache] = {'seconds'         : _median([x['seconds'] for x in measurements]),
+                                        'fileSystemCalls' : _median([x['fileSystemCalls'] for x in measurements]),
+                                        'packages'        : measurements[0]['packages']}
+                if latency is not None:
+                    results[name][cache]['latency']     = latency
+                    results[name][cache]['routedCalls'] = _median([x['routedCalls'] for x in measurements])
+
+    return results
+
+#
+## @brief Get the report of how the launches scale with simulated latency.
+#
+#  Cost of each millisecond of latency is the difference in wall time from the smallest latency divided by the
+#  difference in latency, it approaches the number of file system calls on the critical path of the launch.
+#
+#  @param results [ dict | None | in  ] - Results, see mMecoSettings.tests.benchmarks.launchLib.run.
+#
+#  @exception N/A
+#
+#  @return list of str - Lines, empty if no scenario was run with simulated latency.
+def getLatencyReport(results):
+
+    lines  = []
+    series = {}
+
+    for name, caches in results.items():
+        for cache, result in caches.items():
+            if 'latency' in result:
+                series.setdefault((name.split('@')[0], cache), []).append(result)
+
+    if not series:
+        return lines
+
+    lines.append('{:<8} {:<6} {:>12} {:>14} {:>10} {:>12}'.format('SCENARIO', 'CACHE', 'LATENCY (ms)',
+                                                                  'TIME (ms)', 'ROUTED', 'MS PER MS'))
+
+    for (scenario, cache), measurements in sorted(series.items()):
+
+        measurements = sorted(measurements, key=lambda x: x['latency'])
+        first        = measurements[0]
+
+        for result in measurements:
+
+            cost = '-'
+            if result['latency'] > first['latency']:
+                cost = '{:.1f}'.format((result['seconds'] - first['seconds']) * 1000.0 / (result['latency'] - first['latency']))
+
+            lines.append('{:<8} {:<6} {:>12g} {:>14.1f} {:>10} {:>12}'.format(scenario,
+                                                                              cache,
+                                                                              result['latency'],
+                                                                              result['seconds'] * 1000.0,
+                                                                              result['routedCalls'],
+                                                                              cost))
+
+    return lines
+
+#
+## @brief Compare results with the baseline.
+#
+#  @param baseline [ dict | None | in  ] - Baseline results.
+#  @param results  [ dict | None | in  ] - Current results.
+#
+#  @exception N/A
+#
+#  @return tuple - List of str, which are the lines of the report, and bool, which is whether there is a regression.
+def compare(baseline, results):
+
+    lines      = ['{:<12} {:<6} {:>14} {:>14} {:>8} {:>10} {:>10} {:>8}'.format('SCENARIO', 'CACHE',
+                                                                             'BASE (ms)', 'TIME (ms)', 'RATIO',
+                                                                             'BASE FS', 'FS', 'RATIO')]
+    regression = False
+
+    for scenario in sorted(results):
+        for cache in ('cold', 'warm'):
+
+            if not cache in results[scenario]:
+                continue
+
+            current  = results[scenario][cache]
+            previous = baseline.get(scenario, {}).get(cache)
+
+            if not previous:
+                lines.append('{:<12} {:<6} {:>14} {:>14.1f} {:>8} {:>10} {:>10} {:>8}'.format(scenario, cache, '-',
+                                                                                         current['seconds'] * 1000.0, '-',
+                                                                                         '-', current['fileSystemCalls'], '-'))
+                continue
+
+            timeRatio = current['seconds'] / previous['seconds'] if previous['seconds'] else 1.0
+            callRatio = float(current['fileSystemCalls']) / previous['fileSystemCalls'] if previous['fileSystemCalls'] else 1.0
+
+            flags = []
+            if timeRatio > TIME_THRESHOLD:
+                flags.append('TIME')
+            if callRatio > CALL_THRESHOLD:
+                flags.append('FS')
+
+            regression = regression or bool(flags)
+
+            lines.append('{:<12} {:<6} {:>14.1f} {:>14.1f} {:>8.2f} {:>10} {:>10} {:>8.2f} {}'.format(scenario,
+                                                                                                  cache,
+                                                                                                  previous['seconds'] * 1000.0,
+                                                                                                  current['seconds'] * 1000.0,
+                                                                                                  timeRatio,
+                                                                                                  previous['fileSystemCalls'],
+                                                                                                  current['fileSystemCalls'],
+                                                                                                  callRatio,
+                                                                                                  ' '.join('REGRESSION({})'.format(x) for x in flags)).rstrip())
+
+    return lines, regression
+
+#
+## @brief Run the launch benchmark from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    import mMecoSettings.tests.projectTreeLib
+
+    parser = argparse.ArgumentParser(description='Measure launch latency of mMecoSettings against a synthetic project tree')
+
+    parser.add_argument('--packages',           type=int, default=1000,                 help='Number of internal packages of the tree')
+    parser.add_argument('--samples',            type=int, default=5,                    help='Number of samples of each scenario')
+    parser.add_argument('--warm',               type=int, default=5,                    help='Number of warm launches of each sample')
+    parser.add_argument('--baseline',           type=str, default=BASELINE_FILE_PATH,   help='Absolute path of the baseline file')
+    parser.add_argument('--latency',            type=str, default=None,                 help='Comma separated latencies of file system calls in milliseconds')
+    parser.add_argument('--update-baseline',    action='store_true',                    help='Write the results as the new baseline')
+
+    _args = parser.parse_args()
+
+    latencies = None
+    if _args.latency:
+        try:
+            latencies = [float(x) for x in _args.latency.split(',') if x.strip()]
+        except ValueError:
+            parser.error('Latencies must be numbers: {}'.format(_args.latency))
+
+    treePath = tempfile.mkdtemp(prefix='mmecosettings-tree-')
+
+    try:
+        tree    = mMecoSettings.tests.projectTreeLib.generate(treePath, packageCount=_args.packages)
+        results = run(tree.projectsPath(), _args.samples, _args.warm, latencies)
+    finally:
+        shutil.rmtree(treePath, ignore_errors=True)
+
+    results = {'version'    : FORMAT_VERSION,
+               'machine'    : {'system'     : platform.system(),
+                               'machine'    : platform.machine(),
+                               'python'     : platform.python_version()},
+               'packages'   : _args.packages,
+               'scenarios'  : results}
+
+    baseline = {}
+    if os.path.isfile(_args.baseline):
+        with open(_args.baseline, 'r') as inFile:
+            baseline = json.loads(inFile.read())
+
+    if baseline.get('packages') not in (None, _args.packages):
+        sys.stdout.write('Baseline was recorded with {} packages, scenarios are not compared.\n'.format(baseline['packages']))
+        baseline = {}
+
+    lines, regression = compare(baseline.get('scenarios', {}), results['scenarios'])
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+    latencyLines = getLatencyReport(results['scenarios'])
+    if latencyLines:
+        sys.stdout.write('\n' + '\n'.join(latencyLines) + '\n')
+
+    if _args.update_baseline:
+        with open(_args.baseline, 'w') as outFile:
+            outFile.write(json.dumps(results, indent=4, sort_keys=True) + '\n')
+        sys.stdout.write('Baseline has been updated: {}\n'.format(_args.baseline))
+        return
+
+    if not baseline:
+        sys.stdout.write('No baseline to compare with, run with --update-baseline to record one.\n')
+        return
+
+    if regression:
+        sys.exit(1)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,119 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/settingsLibBenchmark.py @brief [ FILE   ] - Benchmark module.
+## @package mMecoSettings.tests.benchmarks.settingsLibBenchmark    @brief [ MODULE ] - Benchmark module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import shutil
+import tempfile
+
+import mMecoSettings.fileSystemLib
+import mMecoSettings.settingsLib
+
+import mMecoSettings.tests.benchmarks.standInLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+PLATFORMS       = ['Linux', 'Darwin', 'Windows']
+
+PROJECT_NAME    = 'show'
+
+DEVELOPER_NAME  = 'developer'
+
+ENV_NAME        = 'feature'
+
+APP_NAME        = 'maya2020'
+
+# Layers of getAppFilePath in the order they are searched
+LAYERS          = ['development', 'stage', 'project', 'master']
+
+class GetProjectsPathBenchmark(object):
+
+    params = PLATFORMS
+
+    def time_getProjectsPath(self, platformName):
+
+        mMecoSettings.settingsLib.getProjectsPath(platformName, PROJECT_NAME)
+
+class GetTerminalDisplayColorsBenchmark(object):
+
+    params = PLATFORMS
+
+    def time_getTerminalDisplayColors(self, platformName):
+
+        mMecoSettings.settingsLib.getTerminalDisplayColors(platformName)
+
+class GetAppFilePathBenchmark(object):
+
+    params = LAYERS
+
+    def setup(self, layer):
+
+        self._projectsPath = tempfile.mkdtemp()
+
+        # App file only exists in the given layer, so all the layers before it are searched
+        appPaths = {'development'   : [PROJECT_NAME, 'developers', DEVELOPER_NAME, 'development', ENV_NAME, 'mMecoSettings'],
+                    'stage'         : [PROJECT_NAME, 'developers', DEVELOPER_NAME, 'stage', ENV_NAME, 'mMecoSettings'],
+                    'project'       : [PROJECT_NAME, 'internal', 'mMecoSettings', '1.0.0', 'mMecoSettings'],
+                    'master'        : [mMecoSettings.settingsLib.MASTER_PROJECT_NAME, 'internal', 'mMecoSettings', '1.0.0', 'mMecoSettings']}
+
+        for name, path in appPaths.items():
+
+            appPath = os.path.join(self._projectsPath, *(path + ['resources', 'apps']))
+            os.makedirs(appPath)
+
+            if name == layer:
+                with open(os.path.join(appPath, '{}.json'.format(APP_NAME)), 'w') as outFile:
+                    outFile.write(json.dumps({'application': 'maya'}))
+
+        mMecoSettings.tests.benchmarks.standInLib.setProjectsPath(self._projectsPath)
+
+    def teardown(self, layer):
+
+        mMecoSettings.tests.benchmarks.standInLib.setProjectsPath()
+
+        shutil.rmtree(self._projectsPath)
+
+    def time_getAppFilePath(self, layer):
+
+        mMecoSettings.settingsLib.getAppFilePath(PROJECT_NAME, DEVELOPER_NAME, ENV_NAME, ENV_NAME, 'Linux', APP_NAME)
+
+class GetAppFilePathInMemoryBenchmark(GetAppFilePathBenchmark):
+
+    def setup(self, layer):
+
+        super(GetAppFilePathInMemoryBenchmark, self).setup(layer)
+
+        self._fileSystem = mMecoSettings.fileSystemLib.setFileSystem(mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory(self._projectsPath))
+
+    def teardown(self, layer):
+
+        mMecoSettings.fileSystemLib.setFileSystem(self._fileSystem)
+
+        super(GetAppFilePathInMemoryBenchmark, self).teardown(layer)
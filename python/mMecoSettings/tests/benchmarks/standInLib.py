@@ -0,0 +1,270 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/benchmarks/standInLib.py @brief [ FILE   ] - Stand-in module.
+## @package mMecoSettings.tests.benchmarks.standInLib    @brief [ MODULE ] - Stand-in module.
+#
+#  Objects, which provide the parts of `mMeco.libs.allLib.All` used by mMecoSettings.callbackLib, so the callbacks can
+#  be benchmarked without Meco building an environment.
+#
+#  mMecoSettings.callbackLib imports mMeco, which is only available in a Meco environment.
+#  mMecoSettings.tests.benchmarks.standInLib.installMeco provides stand-ins of the mMeco functions used by
+#  mMecoSettings, it must be invoked before they are imported, so this module imports them lazily.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import types
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Request of an environment.
+class Request(object):
+
+    def __init__(self,
+                 platform='Linux',
+                 developer='developer',
+                 development='',
+                 stage='',
+                 app='',
+                 command='',
+                 pythonVersion='3.7.7',
+                 unknownArgs=None):
+
+        self._platform      = platform
+        self._developer     = developer
+        self._development   = development
+        self._stage         = stage
+        self._app           = app
+        self._command       = command
+        self._pythonVersion = pythonVersion
+        self._unknownArgs   = unknownArgs or []
+
+    def platform(self):
+
+        return self._platform
+
+    def developer(self):
+
+        return self._developer
+
+    def development(self):
+
+        return self._development
+
+    def stage(self):
+
+        return self._stage
+
+    def app(self):
+
+        return self._app
+
+    def command(self):
+
+        return self._command
+
+    def pythonVersion(self):
+
+        return self._pythonVersion
+
+    def unknownArgs(self):
+
+        return self._unknownArgs
+
+#
+## @brief [ CLASS ] - Settings resolved for an environment.
+class SettingsOperator(object):
+
+    def __init__(self,
+                 projectNameInUse='master',
+                 appFilePath='',
+                 logFilePath='',
+                 scriptFilePath='',
+                 reservedPackagesPath='',
+                 developmentPackagesPath='',
+                 stagePackagesPath=''):
+
+        self._projectNameInUse          = projectNameInUse
+        self._appFilePath               = appFilePath
+        self._logFilePath               = logFilePath
+        self._scriptFilePath            = scriptFilePath
+        self._reservedPackagesPath      = reservedPackagesPath
+        self._developmentPackagesPath   = developmentPackagesPath
+        self._stagePackagesPath         = stagePackagesPath
+
+    def projectNameInUse(self):
+
+        return self._projectNameInUse
+
+    def appFilePath(self):
+
+        return self._appFilePath
+
+    def logFilePath(self):
+
+        return self._logFilePath
+
+    def scriptFilePath(self):
+
+        return self._scriptFilePath
+
+    def reservedPackagesPath(self):
+
+        return self._reservedPackagesPath
+
+    def developmentPackagesPath(self):
+
+        return self._developmentPackagesPath
+
+    def stagePackagesPath(self):
+
+        return self._stagePackagesPath
+
+#
+## @brief [ CLASS ] - Logger, which keeps the failures.
+class Logger(object):
+
+    def __init__(self):
+
+        self.failures = []
+
+    def addFailure(self, message):
+
+        self.failures.append(message)
+
+#
+## @brief [ CLASS ] - All libraries.
+class AllLib(object):
+
+    def __init__(self, request=None, settingsOperator=None):
+
+        self._request           = request or Request()
+        self._settingsOperator  = settingsOperator or SettingsOperator()
+        self._logger            = Logger()
+
+    def request(self):
+
+        return self._request
+
+    def settingsOperator(self):
+
+        return self._settingsOperator
+
+    def logger(self):
+
+        return self._logger
+
+#
+## [ function ] - Original mMecoSettings.settingsLib.getProjectsPath function, set when it is replaced first.
+_GET_PROJECTS_PATH = None
+
+#
+## @brief Resolve projects from given directory instead of the directory derived from the location of mMecoSettings.
+#
+#  @param path [ str | None | in  ] - Absolute path of a directory, which contains projects, original function is
+#                                     restored if not given.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def setProjectsPath(path=None):
+
+    global _GET_PROJECTS_PATH
+
+    import mMecoSettings.settingsLib
+
+    if _GET_PROJECTS_PATH is None:
+        _GET_PROJECTS_PATH = mMecoSettings.settingsLib.getProjectsPath
+
+    if not path:
+        mMecoSettings.settingsLib.getProjectsPath = _GET_PROJECTS_PATH
+        return
+
+    mMecoSettings.settingsLib.getProjectsPath = lambda platformName, projectName=None: path
+
+#
+## @brief Stand-in of `mMeco.libs.aboutLib.getVersion`.
+#
+#  @exception N/A
+#
+#  @return str - Version.
+def getVersion():
+
+    return '0.0.0'
+
+#
+## @brief Stand-in of `mMeco.core.packageLib.getVersionOfAPackage`.
+#
+#  Latest version is picked by mMecoSettings.settingsLib.getLatestVersion, so the stand-in orders versions the same
+#  way mMecoSettings does.
+#
+#  @param packagesPath [ str | None | in  ] - Absolute path of the directory, which contains the packages.
+#  @param packageName  [ str | None | in  ] - Package name.
+#
+#  @exception N/A
+#
+#  @return str - Version, empty if the package has no versions.
+def getVersionOfAPackage(packagesPath, packageName):
+
+    import mMecoSettings.settingsLib
+
+    packagePath = os.path.join(packagesPath, packageName)
+    if not os.path.isdir(packagePath):
+        return ''
+
+    return mMecoSettings.settingsLib.getLatestVersion([x for x in os.listdir(packagePath)
+                                                       if os.path.isdir(os.path.join(packagePath, x))])
+
+#
+## @brief Install stand-ins of the mMeco modules used by mMecoSettings unless mMeco is available.
+#
+#  @exception N/A
+#
+#  @return bool - Whether the stand-ins have been installed.
+def installMeco():
+
+    try:
+        import mMeco.core.packageLib
+        import mMeco.libs.aboutLib
+        return False
+    except ImportError:
+        pass
+
+    modules = dict((x, types.ModuleType(x)) for x in ('mMeco', 'mMeco.core', 'mMeco.core.packageLib', 'mMeco.libs', 'mMeco.libs.aboutLib'))
+
+    modules['mMeco'].core                                 = modules['mMeco.core']
+    modules['mMeco'].libs                                 = modules['mMeco.libs']
+    modules['mMeco.core'].packageLib                      = modules['mMeco.core.packageLib']
+    modules['mMeco.libs'].aboutLib                        = modules['mMeco.libs.aboutLib']
+
+    modules['mMeco.core.packageLib'].getVersionOfAPackage = getVersionOfAPackage
+    modules['mMeco.libs.aboutLib'].getVersion             = getVersion
+
+    sys.modules.update(modules)
+
+    return True
@@ -0,0 +1,174 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/completionLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.completionLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.completionLib
+import mMecoSettings.envVariablesLib
+import mMecoSettings.fileSystemLib
+import mMecoSettings.settingsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class GetAppNamesTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._useProjectAppsOnly = os.environ.pop(mMecoSettings.envVariablesLib.MECO_USE_PROJECT_APPS_ONLY, None)
+
+        projectsPath     = mMecoSettings.settingsLib.getProjectsPath('Linux')
+        appPath          = os.path.join('mMecoSettings', 'resources', 'apps')
+        self._fileSystem = mMecoSettings.fileSystemLib.MemoryFileSystem()
+
+        for path in [os.path.join('master', 'internal', 'mMecoSettings', '1.0.0', appPath, 'maya.json'),
+                     os.path.join('master', 'internal', 'mMecoSettings', '1.2.0', appPath, 'nuke.json'),
+                     os.path.join('master', 'internal', 'mMecoSettings', '1.10.0', appPath, 'houdini.json'),
+                     os.path.join('show', 'internal', 'mMecoSettings', '2.0.0', appPath, 'katana.json'),
+                     os.path.join('show', 'developers', 'safak', 'development', 'feature', appPath, 'mari.json')]:
+            self._fileSystem.addFile(os.path.join(projectsPath, path))
+
+        self._fileSystem.addDir(os.path.join(projectsPath, 'show', 'developers', 'safak', 'stage', 'lighting'))
+
+        mMecoSettings.fileSystemLib.setFileSystem(self._fileSystem)
+
+    def tearDown(self):
+
+        mMecoSettings.fileSystemLib.setFileSystem()
+
+        if self._useProjectAppsOnly is not None:
+            os.environ[mMecoSettings.envVariablesLib.MECO_USE_PROJECT_APPS_ONLY] = self._useProjectAppsOnly
+
+    def test_master(self):
+
+        # Latest version of mMecoSettings provides the apps
+        self.assertEqual(mMecoSettings.completionLib.getAppNames('master', 'safak', None, None, 'Linux'), ['houdini'])
+
+    def test_project(self):
+
+        self.assertEqual(mMecoSettings.completionLib.getAppNames('show', 'safak', 'feature', None, 'Linux'),
+                         ['houdini', 'katana', 'mari'])
+
+        os.environ[mMecoSettings.envVariablesLib.MECO_USE_PROJECT_APPS_ONLY] = '1'
+
+        try:
+            self.assertEqual(mMecoSettings.completionLib.getAppNames('show', 'safak', None, None, 'Linux'), ['katana'])
+        finally:
+            del os.environ[mMecoSettings.envVariablesLib.MECO_USE_PROJECT_APPS_ONLY]
+
+    def test_getIndex(self):
+
+        lines = mMecoSettings.completionLib.getIndex('show', 'safak', None, 'lighting', 'Linux')
+
+        self.assertIn('app katana', lines)
+        self.assertIn('project show', lines)
+        self.assertIn('stage lighting', lines)
+        self.assertIn('development feature', lines)
+
+class WriteTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_write(self):
+
+        path = os.path.join(self._directory, 'index')
+
+        self.assertEqual(mMecoSettings.completionLib.write(['app maya', 'project master'], path), path)
+
+        with open(path, 'r') as inFile:
+            self.assertEqual(inFile.read(), 'app maya\nproject master\n')
+
+        oldTime = time.time() - 60
+        os.utime(path, (oldTime, oldTime))
+
+        # Unchanged content isn't written, but the index isn't stale anymore
+        mMecoSettings.completionLib.write(['app maya', 'project master'], path)
+        self.assertGreater(os.stat(path).st_mtime, oldTime)
+
+        mMecoSettings.completionLib.write(['app nuke'], path)
+
+        with open(path, 'r') as inFile:
+            self.assertEqual(inFile.read(), 'app nuke\n')
+
+        self.assertEqual(os.listdir(self._directory), ['index'])
+
+    def test_isStale(self):
+
+        path       = os.path.join(self._directory, 'index')
+        sourcePath = os.path.join(self._directory, 'apps')
+
+        self.assertTrue(mMecoSettings.completionLib.isStale(path, [sourcePath]))
+
+        os.makedirs(sourcePath)
+
+        oldTime = time.time() - 60
+        os.utime(sourcePath, (oldTime, oldTime))
+
+        mMecoSettings.completionLib.write(['app maya'], path)
+
+        self.assertFalse(mMecoSettings.completionLib.isStale(path, [sourcePath, os.path.join(self._directory, 'missing')]))
+
+        open(os.path.join(sourcePath, 'nuke.json'), 'w').close()
+        os.utime(sourcePath, None)
+
+        self.assertTrue(mMecoSettings.completionLib.isStale(path, [sourcePath]))
+
+    def test_update(self):
+
+        path = mMecoSettings.completionLib.update('show', 'safak', None, None, 'Linux', self._directory)
+
+        with open(os.path.join(self._directory, mMecoSettings.completionLib.DEFAULT_FILE_NAME), 'r') as inFile:
+            self.assertEqual(inFile.read(), '{}\n'.format(path))
+
+    def test_getIndexFilePath(self):
+
+        path = mMecoSettings.completionLib.getIndexFilePath('show', 'safak', 'feature', None, 'Linux', self._directory)
+
+        self.assertEqual(os.path.dirname(path), self._directory)
+        self.assertTrue(os.path.basename(path).startswith('show-'))
+        self.assertNotEqual(path, mMecoSettings.completionLib.getIndexFilePath('show', 'safak', None, 'lighting', 'Linux', self._directory))
+        self.assertNotEqual(path, mMecoSettings.completionLib.getIndexFilePath('master', 'safak', 'feature', None, 'Linux', self._directory))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
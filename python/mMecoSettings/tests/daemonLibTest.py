@@ -0,0 +1,229 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/daemonLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.daemonLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import socket
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mMecoSettings.daemonLib
+import mMecoSettings.fileSystemLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def echo():
+
+    sys.stdout.write('{}\n'.format(' '.join(sys.argv)))
+
+def records():
+
+    for index in range(3):
+        sys.stdout.write('{{"index": {}}}\n'.format(index))
+
+class Stream(object):
+
+    def __init__(self):
+
+        self.chunks = []
+
+    def write(self, text):
+
+        self.chunks.append(text)
+
+    def flush(self):
+
+        pass
+
+def serveOnce(path, response):
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+
+    def respond():
+
+        connection, _ = server.accept()
+        mMecoSettings.daemonLib._readLine(connection)
+        connection.sendall(response)
+        connection.close()
+
+    thread = threading.Thread(target=respond)
+    thread.start()
+
+    return server, thread
+
+@unittest.skipUnless(mMecoSettings.daemonLib.isSupported(), 'Unix domain sockets are not supported on this platform')
+class DaemonTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+        self._path      = os.path.join(self._directory, 'daemon.sock')
+        self._commands  = mMecoSettings.daemonLib.COMMANDS
+
+        mMecoSettings.daemonLib.COMMANDS = {'list'   : ('mmecosettings-echo', __name__, 'echo'),
+                                            'search' : ('mmecosettings-records', __name__, 'records')}
+
+        self._daemon = mMecoSettings.daemonLib.Daemon(self._path, idleTimeout=10)
+        self._thread = threading.Thread(target=self._daemon.serve)
+        self._thread.start()
+
+        self.assertTrue(self._daemon.waitUntilReady(5))
+
+    def tearDown(self):
+
+        mMecoSettings.daemonLib.request(mMecoSettings.daemonLib.STOP_COMMAND, path=self._path)
+
+        self._thread.join(5)
+
+        mMecoSettings.daemonLib.COMMANDS = self._commands
+
+        shutil.rmtree(self._directory)
+
+    def test_request(self):
+
+        response = mMecoSettings.daemonLib.request('list', ['-d'], self._path)
+
+        self.assertEqual(response, {'exitCode': 0, 'output': 'mmecosettings-echo -d\n'})
+
+    def test_requestUnknownCommand(self):
+
+        self.assertIsNone(mMecoSettings.daemonLib.request('unknown', path=self._path))
+
+    def test_requestOtherEnviron(self):
+
+        environ = dict(os.environ)
+        environ['MECO_DEVELOPMENT_PACKAGES_PATH'] = os.path.join(self._directory, 'packages')
+
+        self.assertIsNone(mMecoSettings.daemonLib.request('list', path=self._path, environ=environ))
+
+    def test_requestOtherDirectory(self):
+
+        data = {'command'   : 'list',
+                'args'      : [],
+                'package'   : mMecoSettings.daemonLib.PACKAGE_PATH,
+                'environ'   : mMecoSettings.daemonLib.getEnviron(),
+                'cwd'       : self._directory}
+
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            connection.connect(self._path)
+            connection.sendall(json.dumps(data).encode('utf-8') + b'\n')
+            response = json.loads(mMecoSettings.daemonLib._readLine(connection).decode('utf-8'))
+        finally:
+            connection.close()
+
+        self.assertIsNone(response['exitCode'])
+
+    def test_stream(self):
+
+        stream   = Stream()
+        response = mMecoSettings.daemonLib.request('search', path=self._path, stream=stream)
+
+        # Each record arrives as it is written
+        self.assertEqual(response, {'exitCode': 0, 'output': ''})
+        self.assertEqual(stream.chunks, ['{{"index": {}}}\n'.format(x) for x in range(3)])
+
+    def test_requestOtherOwner(self):
+
+        isOwned = mMecoSettings.fileSystemLib.isOwned
+        mMecoSettings.fileSystemLib.isOwned = lambda x: False
+
+        try:
+            self.assertIsNone(mMecoSettings.daemonLib.request('list', path=self._path))
+        finally:
+            mMecoSettings.fileSystemLib.isOwned = isOwned
+
+    def test_socketPath(self):
+
+        environ = dict(os.environ)
+        os.environ.pop('MECO_SETTINGS_DAEMON_SOCKET_PATH', None)
+
+        try:
+            path = mMecoSettings.daemonLib.getSocketPath()
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+
+        self.assertTrue(mMecoSettings.fileSystemLib.isPrivateDir(os.path.dirname(path)))
+
+    def test_malformedResponse(self):
+
+        path           = os.path.join(self._directory, 'malformed.sock')
+        server, thread = serveOnce(path, b'{"exitCode": 0, "outp\n')
+
+        try:
+            self.assertIsNone(mMecoSettings.daemonLib.request('list', path=path))
+        finally:
+            thread.join(5)
+            server.close()
+
+    def test_connectionLost(self):
+
+        path           = os.path.join(self._directory, 'lost.sock')
+        server, thread = serveOnce(path, b'{"output": "partial\\n"}\n')
+
+        try:
+            response = mMecoSettings.daemonLib.request('list', path=path)
+        finally:
+            thread.join(5)
+            server.close()
+
+        # Output has been written, so the command isn't run again in-process
+        self.assertEqual(response['exitCode'], 1)
+        self.assertEqual(response['output'], 'partial\n')
+        self.assertTrue(response['error'])
+
+    def test_requestWithoutDaemon(self):
+
+        self.assertIsNone(mMecoSettings.daemonLib.request('list', path=os.path.join(self._directory, 'missing.sock')))
+
+    def test_stop(self):
+
+        mMecoSettings.daemonLib.request(mMecoSettings.daemonLib.STOP_COMMAND, path=self._path)
+
+        self._thread.join(5)
+
+        self.assertFalse(self._thread.is_alive())
+        self.assertFalse(os.path.exists(self._path))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,186 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/envDeltaLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.envDeltaLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mMecoSettings.envDeltaLib
+import mMecoSettings.envVariablesLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class EnvEntryContainer(object):
+
+    def __init__(self):
+
+        self.entries = []
+
+    def addSingle(self, name, value):
+
+        self.entries.append(('single', name, value))
+
+    def addMulti(self, name, value):
+
+        self.entries.append(('multi', name, value))
+
+    def addScript(self, path):
+
+        self.entries.append(('script', path))
+
+    def addCommand(self, command):
+
+        self.entries.append(('command', command))
+
+    def sort(self):
+
+        pass
+
+class Request(object):
+
+    def platform(self):
+
+        return 'Linux'
+
+class AllLib(object):
+
+    def request(self):
+
+        return Request()
+
+class DeltaEnvEntryContainerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._environ = {'MECO_PROJECT_NAME'                                        : 'master',
+                         'MECO_USE_PROJECT_APPS_ONLY'                               : '0',
+                         'MECO_STAGE_ENV_NAME'                                      : 'lighting',
+                         'PATH'                                                     : '/opt/old:/usr/bin:/bin',
+                         mMecoSettings.envVariablesLib.MECO_ENV_DELTA_NAMES         : 'MECO_PROJECT_NAME|MECO_STAGE_ENV_NAME',
+                         mMecoSettings.envVariablesLib.MECO_ENV_DELTA_SCRIPTS       : '/post.sh',
+                         mMecoSettings.envVariablesLib.MECO_ENV_DELTA_PATHS         : 'PATH=/opt/old:/bin'
+                         }
+
+        self._envEntryContainer = EnvEntryContainer()
+
+        self._container = mMecoSettings.envDeltaLib.DeltaEnvEntryContainer(self._envEntryContainer,
+                                                                           'Linux',
+                                                                           self._environ)
+
+    def test_addSingle(self):
+
+        self._container.addSingle('MECO_PROJECT_NAME', 'master')
+        self._container.addSingle('MECO_USE_PROJECT_APPS_ONLY', '"0"')
+        self._container.addSingle('MECO_DEVELOPER_NAME', 'safak')
+
+        self.assertEqual(self._envEntryContainer.entries, [('single', 'MECO_DEVELOPER_NAME', 'safak')])
+        self.assertEqual(self._container.skipped(), ['MECO_PROJECT_NAME', 'MECO_USE_PROJECT_APPS_ONLY'])
+
+    def test_addMulti(self):
+
+        self._container.addMulti('PATH', '/bin')
+        self._container.addMulti('PATH', '/opt/bin')
+
+        self.assertEqual(self._envEntryContainer.entries, [('multi', 'PATH', '/opt/bin')])
+
+    def test_addScript(self):
+
+        self._container.addScript('/post.sh')
+        self._container.addScript('/pre.sh')
+
+        self.assertEqual(self._envEntryContainer.entries, [('script', '/pre.sh')])
+
+    def test_finalize(self):
+
+        self._container.addSingle('MECO_PROJECT_NAME', 'master')
+        self._container.addScript('/post.sh')
+
+        self.assertEqual(self._container.finalize(), ['MECO_STAGE_ENV_NAME'])
+
+        self.assertIn(('command', 'unset MECO_STAGE_ENV_NAME;'), self._envEntryContainer.entries)
+        self.assertNotIn('MECO_ENV_DELTA_SCRIPTS', [x[1] for x in self._envEntryContainer.entries])
+
+    def test_finalizePaths(self):
+
+        self._container.addMulti('PATH', '/bin')
+        self._container.addMulti('PATH', '/opt/new')
+
+        self._container.finalize()
+
+        self.assertIn(('command', mMecoSettings.envDeltaLib.getRemovePathCommand('PATH', '/opt/old', 'Linux')),
+                      self._envEntryContainer.entries)
+        self.assertIn(('single', mMecoSettings.envVariablesLib.MECO_ENV_DELTA_PATHS, '\'PATH=/bin:/opt/new\''),
+                      self._envEntryContainer.entries)
+
+        # Entries, which weren't added by the previous environment, are never removed
+        self.assertEqual(len([x for x in self._envEntryContainer.entries if x[0] == 'command' and 'PATH=' in x[1]]), 1)
+
+    def test_separateBuilds(self):
+
+        self._container.addSingle('MECO_DEVELOPER_NAME', 'safak')
+
+        envEntryContainer = EnvEntryContainer()
+        container         = mMecoSettings.envDeltaLib.DeltaEnvEntryContainer(envEntryContainer, 'Linux', {})
+        container.finalize()
+
+        names = [x[2] for x in envEntryContainer.entries if x[1] == mMecoSettings.envVariablesLib.MECO_ENV_DELTA_NAMES]
+        self.assertNotIn('MECO_DEVELOPER_NAME', names[0])
+
+    def test_getContainer(self):
+
+        allLib           = AllLib()
+        preContainer     = mMecoSettings.envDeltaLib.getContainer(allLib, EnvEntryContainer(), self._environ)
+        preContainer.addSingle('MECO_STAGE_ENV_NAME', 'modeling')
+
+        postEntries      = EnvEntryContainer()
+        postContainer    = mMecoSettings.envDeltaLib.getContainer(allLib, postEntries, self._environ)
+
+        self.assertIs(preContainer, postContainer)
+        self.assertEqual(postContainer.finalize(), ['MECO_PROJECT_NAME'])
+        self.assertIsNot(mMecoSettings.envDeltaLib.getContainer(AllLib(), postEntries, self._environ), postContainer)
+
+    def test_getRemovePathCommand(self):
+
+        self.assertEqual(mMecoSettings.envDeltaLib.getRemovePathCommand('PATH', '/opt/$x', 'Linux'),
+                         'PATH=:${PATH}:; PATH=${PATH//:"/opt/\\$x":/:}; PATH=${PATH#:}; PATH=${PATH%:}; export PATH;')
+
+        self.assertEqual(mMecoSettings.envDeltaLib.getRemovePathCommand('PATH', 'C:\\it\'s', 'Windows'),
+                         '$env:PATH = (($env:PATH -split \';\') | Where-Object { $_ -ne \'C:\\it\'\'s\' }) -join \';\';')
+
+    def test_isEnabled(self):
+
+        self.assertFalse(mMecoSettings.envDeltaLib.isEnabled({}))
+        self.assertTrue(mMecoSettings.envDeltaLib.isEnabled({mMecoSettings.envVariablesLib.MECO_ENV_DELTA: '1'}))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,100 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/envTemplateLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.envTemplateLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+from platform import system
+
+import mMecoSettings.envTemplateLib
+import mMecoSettings.packageGlobalEnvLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class TemplateTableTest(unittest.TestCase):
+
+    def test_expand(self):
+
+        table = mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Linux')
+        paths = table.expand(['/packages/a', '/packages/b/'], folderName='maya', version='2020')
+
+        self.assertEqual(paths['PYTHONPATH'], ['/packages/a/maya/2020/python', '/packages/b/maya/2020/python'])
+        self.assertEqual(paths['MAYA_PLUG_IN_PATH'], ['/packages/a/maya/2020/plugin/{}'.format(system().lower()),
+                                                      '/packages/b/maya/2020/plugin/{}'.format(system().lower())])
+
+    def test_expandPackage(self):
+
+        table = mMecoSettings.envTemplateLib.getTemplateTable('Package', 'Darwin')
+        paths = table.expand(['/packages/a'])
+
+        self.assertNotIn('LD_LIBRARY_PATH', paths)
+        self.assertEqual(paths['PATH'], ['/packages/a/bin/{}'.format(system().lower()), '/packages/a/python/bin'])
+
+    def test_expandWindows(self):
+
+        table = mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Windows')
+        paths = table.expand(['C:\\packages\\a'], folderName='maya', version='2020')
+
+        self.assertEqual(paths['XBMLANGPATH'], ['C:\\packages\\a\\maya\\2020\\xbm'])
+
+    def test_missingValue(self):
+
+        table = mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Linux')
+
+        self.assertRaises(ValueError, table.expand, ['/packages/a'], folderName='maya')
+
+    def test_envViewTable(self):
+
+        mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(True)
+
+        try:
+            paths = mMecoSettings.envTemplateLib.getEnvViewTable('Darwin').expand(['/packages/a'])
+        finally:
+            mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(False)
+
+        self.assertEqual(sorted(paths), ['DYLD_FALLBACK_LIBRARY_PATH', 'PATH'])
+        self.assertEqual(paths['PATH'], ['/packages/a/bin/{}'.format(system().lower()), '/packages/a/python/bin'])
+
+        paths = mMecoSettings.envTemplateLib.getEnvViewTable('Linux').expand(['/packages/a'])
+
+        self.assertEqual(paths['LD_LIBRARY_PATH'], ['/packages/a/lib/{}'.format(system().lower())])
+
+    def test_compileOnce(self):
+
+        self.assertIs(mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Linux'),
+                      mMecoSettings.envTemplateLib.getTemplateTable('Maya', 'Linux'))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
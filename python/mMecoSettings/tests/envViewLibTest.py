@@ -0,0 +1,200 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/envViewLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.envViewLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+from platform import system
+
+import mMecoSettings.envViewLib
+import mMecoSettings.envVariablesLib
+import mMecoSettings.fileSystemLib
+import mMecoSettings.packageGlobalEnvLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+@unittest.skipUnless(system() in mMecoSettings.envViewLib.PLATFORMS, 'Env views are not supported on this platform')
+class EnvViewTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._packageA = self._createPackage('a', ['bin/{}/tool'.format(system().lower()), 'lib/{}/libA.so'.format(system().lower())])
+        self._packageB = self._createPackage('b', ['bin/{}/tool'.format(system().lower()), 'python/bin/script'])
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _createPackage(self, name, files):
+
+        packagePath = os.path.join(self._directory, 'packages', name)
+
+        for relativePath in files:
+
+            path = os.path.join(packagePath, relativePath)
+
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            open(path, 'w').close()
+
+        return packagePath
+
+    def test_staleTemporaryView(self):
+
+        directory     = os.path.join(self._directory, 'views')
+        temporaryPath = '{}.{}'.format(os.path.join(directory, mMecoSettings.envViewLib.getFingerprint([self._packageA])), os.getpid())
+
+        os.makedirs(os.path.join(temporaryPath, 'bin'))
+
+        envView = mMecoSettings.envViewLib.build([self._packageA], directory)
+
+        self.assertEqual(os.listdir(envView.binPath()), ['tool'])
+        self.assertFalse(os.path.isdir(temporaryPath))
+
+    def test_build(self):
+
+        envView = mMecoSettings.envViewLib.build([self._packageA, self._packageB], os.path.join(self._directory, 'views'))
+
+        self.assertFalse(envView.isCached())
+        self.assertEqual(sorted(os.listdir(envView.binPath())), ['script', 'tool'])
+        self.assertEqual(os.listdir(envView.libPath()), ['libA.so'])
+        self.assertEqual(os.path.realpath(os.path.join(envView.binPath(), 'tool')),
+                         os.path.realpath(os.path.join(self._packageA, 'bin', system().lower(), 'tool')))
+
+        self.assertEqual(len(envView.collisions()), 1)
+        self.assertEqual(envView.collisions()[0][2], os.path.join(self._packageB, 'bin', system().lower(), 'tool'))
+
+        cachedEnvView = mMecoSettings.envViewLib.build([self._packageA, self._packageB], os.path.join(self._directory, 'views'))
+
+        self.assertTrue(cachedEnvView.isCached())
+        self.assertEqual(cachedEnvView.path(), envView.path())
+        self.assertEqual(cachedEnvView.collisions(), envView.collisions())
+
+    def test_pathOrder(self):
+
+        # Package accepted last comes first in PATH, so its file is linked
+        packagePaths = mMecoSettings.envViewLib.getPathOrder([self._packageA, self._packageB])
+        envView      = mMecoSettings.envViewLib.build(packagePaths, os.path.join(self._directory, 'views'))
+
+        self.assertEqual(packagePaths, [self._packageB, self._packageA])
+        self.assertEqual(os.path.realpath(os.path.join(envView.binPath(), 'tool')),
+                         os.path.realpath(os.path.join(self._packageB, 'bin', system().lower(), 'tool')))
+
+    def test_removeStaleViews(self):
+
+        directory = os.path.join(self._directory, 'views')
+        oldTime   = time.time() - mMecoSettings.envViewLib.MAX_AGE - 60
+
+        usedView  = mMecoSettings.envViewLib.build([self._packageA], directory)
+        staleView = mMecoSettings.envViewLib.build([self._packageB], directory)
+
+        for path in (usedView.path(), staleView.path()):
+            os.utime(path, (oldTime, oldTime))
+
+        # Using a view keeps it
+        self.assertTrue(mMecoSettings.envViewLib.build([self._packageA], directory).isCached())
+
+        envView = mMecoSettings.envViewLib.build([self._packageA, self._packageB], directory)
+
+        self.assertEqual(sorted(os.listdir(directory)), sorted(os.path.basename(x.path()) for x in (usedView, envView)))
+
+        for path in (usedView.path(), envView.path()):
+            os.utime(path, (oldTime, oldTime))
+
+        self.assertEqual(mMecoSettings.envViewLib.removeStaleViews(directory, [envView.path()]), [usedView.path()])
+        self.assertTrue(os.path.isdir(envView.path()))
+
+    def test_privateDirectory(self):
+
+        envView = mMecoSettings.envViewLib.build([self._packageA])
+
+        try:
+            self.assertEqual(os.path.dirname(envView.path()),
+                             mMecoSettings.fileSystemLib.getUserTemporaryPath(mMecoSettings.envViewLib.DIRECTORY_NAME))
+        finally:
+            shutil.rmtree(envView.path())
+
+    def test_sourceDirectories(self):
+
+        directories = dict(mMecoSettings.envViewLib.getSourceDirectories([self._packageA, self._packageB, self._packageA + os.sep]))
+
+        self.assertEqual(directories['bin'], [os.path.join(self._packageA, 'bin', system().lower()),
+                                              os.path.join(self._packageB, 'bin', system().lower()),
+                                              os.path.join(self._packageB, 'python', 'bin')])
+        self.assertEqual(directories['lib'], [os.path.join(self._packageA, 'lib', system().lower())])
+
+    def test_fingerprint(self):
+
+        self.assertNotEqual(mMecoSettings.envViewLib.getFingerprint([self._packageA, self._packageB]),
+                            mMecoSettings.envViewLib.getFingerprint([self._packageB, self._packageA]))
+
+    def test_isEnabled(self):
+
+        self.assertFalse(mMecoSettings.envViewLib.isEnabled({}))
+        self.assertFalse(mMecoSettings.envViewLib.isEnabled({mMecoSettings.envVariablesLib.MECO_ENV_VIEW: '1'}, 'Windows'))
+        self.assertTrue(mMecoSettings.envViewLib.isEnabled({mMecoSettings.envVariablesLib.MECO_ENV_VIEW: '1'}, 'Linux'))
+
+class SetEnvViewEnabledTest(unittest.TestCase):
+
+    def tearDown(self):
+
+        mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(False)
+
+    def test_setEnvViewEnabled(self):
+
+        path = mMecoSettings.packageGlobalEnvLib.PackageLinux.PATH
+
+        mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(True)
+
+        self.assertIsNone(mMecoSettings.packageGlobalEnvLib.PackageLinux.PATH)
+        self.assertIsNone(mMecoSettings.packageGlobalEnvLib.PackageLinux.LD_LIBRARY_PATH)
+        self.assertIsNone(mMecoSettings.packageGlobalEnvLib.PackageDarwin.DYLD_FALLBACK_LIBRARY_PATH)
+        self.assertEqual(mMecoSettings.packageGlobalEnvLib.PackageLinux.PYTHONPATH, ['python'])
+
+        # Next request of a daemon may not use the env view
+        mMecoSettings.packageGlobalEnvLib.setEnvViewEnabled(False)
+
+        self.assertEqual(mMecoSettings.packageGlobalEnvLib.PackageLinux.PATH, path)
+        self.assertIsNone(mMecoSettings.packageGlobalEnvLib.PackageDarwin.LD_LIBRARY_PATH)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,383 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/fileSystemLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.fileSystemLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.envVariablesLib
+import mMecoSettings.fileSystemLib
+
+import mMecoSettings.tests.projectTreeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _checkChanges(testCase, fileSystem, path):
+
+    filePath    = os.path.join(path, 'file.txt')
+    renamedPath = os.path.join(path, 'renamed.txt')
+    linkPath    = os.path.join(path, 'link.txt')
+    treePath    = os.path.join(path, 'tree')
+
+    fileSystem.makeDirs(os.path.join(treePath, 'a'))
+
+    with fileSystem.openFile(filePath, 'wb') as outFile:
+        outFile.write(b'\x00content')
+
+    with fileSystem.openFile(filePath, 'rb') as inFile:
+        testCase.assertEqual(inFile.read(), b'\x00content')
+
+    fileSystem.utime(filePath, (1000.0, 1000.0))
+    testCase.assertEqual(fileSystem.stat(filePath).st_mtime, 1000.0)
+
+    fileSystem.rename(filePath, renamedPath)
+
+    testCase.assertFalse(fileSystem.exists(filePath))
+    testCase.assertEqual(fileSystem.stat(renamedPath).st_mtime, 1000.0)
+    testCase.assertRaises(OSError, fileSystem.rename, filePath, renamedPath)
+
+    fileSystem.symlink(renamedPath, linkPath)
+
+    with fileSystem.openFile(linkPath, 'rb') as inFile:
+        testCase.assertEqual(inFile.read(), b'\x00content')
+
+    testCase.assertRaises(OSError, fileSystem.symlink, renamedPath, linkPath)
+
+    fileSystem.rename(treePath, os.path.join(path, 'moved'))
+
+    testCase.assertTrue(fileSystem.isDir(os.path.join(path, 'moved', 'a')))
+    testCase.assertFalse(fileSystem.exists(treePath))
+
+    fileSystem.removeTree(os.path.join(path, 'moved'))
+    fileSystem.remove(linkPath)
+    fileSystem.remove(renamedPath)
+
+    testCase.assertEqual(fileSystem.listDir(path), [])
+    testCase.assertRaises(OSError, fileSystem.remove, renamedPath)
+    testCase.assertRaises(OSError, fileSystem.removeTree, treePath)
+    testCase.assertRaises(OSError, fileSystem.utime, renamedPath)
+
+class FileSystemTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_fileSystem(self):
+
+        fileSystem  = mMecoSettings.fileSystemLib.FileSystem()
+        path        = os.path.join(self._directory, 'a', 'b')
+        filePath    = os.path.join(path, 'file.txt')
+
+        self.assertFalse(fileSystem.isDir(path))
+
+        fileSystem.makeDirs(path)
+
+        with fileSystem.openFile(filePath, 'w') as outFile:
+            outFile.write('content')
+
+        self.assertTrue(fileSystem.isDir(path))
+        self.assertTrue(fileSystem.isFile(filePath))
+        self.assertTrue(fileSystem.exists(filePath))
+        self.assertEqual(fileSystem.listDir(path), ['file.txt'])
+        self.assertEqual(fileSystem.stat(filePath).st_size, 7)
+
+        with fileSystem.openFile(filePath) as inFile:
+            self.assertEqual(inFile.read(), 'content')
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'Symlinks are not supported on this platform')
+    def test_changes(self):
+
+        _checkChanges(self, mMecoSettings.fileSystemLib.FileSystem(), self._directory)
+
+    def test_latencyFileSystem(self):
+
+        fileSystem = mMecoSettings.fileSystemLib.LatencyFileSystem(latency=0.01)
+
+        startTime = time.time()
+
+        self.assertTrue(fileSystem.isDir(self._directory))
+        self.assertFalse(fileSystem.isFile(self._directory))
+        self.assertFalse(fileSystem.isFile(os.path.join(self._directory, 'missing')))
+
+        self.assertGreaterEqual(time.time() - startTime, 0.03)
+        self.assertEqual(fileSystem.calls(), {'isDir': 1, 'isFile': 2})
+        self.assertEqual(fileSystem.callCount(), 3)
+
+        fileSystem.reset()
+
+        self.assertEqual(fileSystem.callCount(), 0)
+
+    def test_setFileSystem(self):
+
+        fileSystem = mMecoSettings.fileSystemLib.LatencyFileSystem()
+        previous   = mMecoSettings.fileSystemLib.setFileSystem(fileSystem)
+
+        try:
+            self.assertIs(mMecoSettings.fileSystemLib.getFileSystem(), fileSystem)
+            self.assertTrue(mMecoSettings.fileSystemLib.isDir(self._directory))
+            self.assertEqual(fileSystem.calls(), {'isDir': 1})
+        finally:
+            mMecoSettings.fileSystemLib.setFileSystem(previous)
+
+        self.assertIs(mMecoSettings.fileSystemLib.getFileSystem(), previous)
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'Ownership is not checked on this platform')
+    def test_getUserTemporaryPath(self):
+
+        temporaryPath = tempfile.tempdir
+        tempfile.tempdir = self._directory
+
+        try:
+            path = mMecoSettings.fileSystemLib.getUserTemporaryPath('file.txt')
+
+            self.assertEqual(os.path.dirname(os.path.dirname(path)), self._directory)
+            self.assertTrue(mMecoSettings.fileSystemLib.isPrivateDir(os.path.dirname(path)))
+            self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o777, 0o700)
+
+            # Directory, which other users can write into, is never used
+            os.chmod(os.path.dirname(path), 0o777)
+            self.assertRaises(OSError, mMecoSettings.fileSystemLib.getUserTemporaryPath)
+
+            # Symbolic link to a private directory is never used either
+            os.rmdir(os.path.dirname(path))
+            os.mkdir(os.path.join(self._directory, 'other'), 0o700)
+            os.symlink(os.path.join(self._directory, 'other'), os.path.dirname(path))
+            self.assertRaises(OSError, mMecoSettings.fileSystemLib.getUserTemporaryPath)
+        finally:
+            tempfile.tempdir = temporaryPath
+
+        self.assertFalse(mMecoSettings.fileSystemLib.isOwned(os.path.join(self._directory, 'missing')))
+
+    def test_getRequestedLatency(self):
+
+        name = mMecoSettings.envVariablesLib.MECO_FILE_SYSTEM_LATENCY
+
+        self.assertIsNone(mMecoSettings.fileSystemLib.getRequestedLatency({}))
+        self.assertIsNone(mMecoSettings.fileSystemLib.getRequestedLatency({name: 'slow'}))
+        self.assertEqual(mMecoSettings.fileSystemLib.getRequestedLatency({name: '5'}), 0.005)
+        self.assertEqual(mMecoSettings.fileSystemLib.getRequestedLatency({name: '-1'}), 0.0)
+
+class CachingFileSystemTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory  = tempfile.mkdtemp()
+        self._backend    = mMecoSettings.fileSystemLib.LatencyFileSystem()
+        self._fileSystem = mMecoSettings.fileSystemLib.CachingFileSystem(self._backend)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_cache(self):
+
+        filePath = os.path.join(self._directory, 'file.txt')
+
+        for _ in range(3):
+            self.assertFalse(self._fileSystem.isFile(filePath))
+            self.assertEqual(self._fileSystem.listDir(self._directory), [])
+
+        self.assertEqual(self._backend.calls(), {'isFile': 1, 'listDir': 1})
+
+        # Writing through the cache clears it
+        with self._fileSystem.openFile(filePath, 'w') as outFile:
+            outFile.write('content')
+
+        for _ in range(3):
+            self.assertTrue(self._fileSystem.isFile(filePath))
+            with self._fileSystem.openFile(filePath) as inFile:
+                self.assertEqual(inFile.read(), 'content')
+
+        self.assertEqual(self._backend.calls(), {'isFile': 2, 'listDir': 1, 'openFile': 2})
+
+        # Missing paths raise every time
+        for _ in range(2):
+            self.assertRaises(OSError, self._fileSystem.stat, os.path.join(self._directory, 'missing'))
+
+        self.assertEqual(self._backend.calls()['stat'], 2)
+
+    def test_changes(self):
+
+        filePath = os.path.join(self._directory, 'file.txt')
+
+        with self._fileSystem.openFile(filePath, 'w') as outFile:
+            outFile.write('content')
+
+        self.assertTrue(self._fileSystem.isFile(filePath))
+
+        # Changing a path through the cache clears it
+        self._fileSystem.rename(filePath, os.path.join(self._directory, 'renamed.txt'))
+
+        self.assertFalse(self._fileSystem.isFile(filePath))
+
+    def test_isInMemory(self):
+
+        self.assertFalse(mMecoSettings.fileSystemLib.isInMemory(self._fileSystem))
+        self.assertTrue(mMecoSettings.fileSystemLib.isInMemory(
+            mMecoSettings.fileSystemLib.CachingFileSystem(mMecoSettings.fileSystemLib.MemoryFileSystem())))
+
+class MemoryFileSystemTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory  = tempfile.mkdtemp()
+        self._fileSystem = mMecoSettings.fileSystemLib.MemoryFileSystem()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_fileSystem(self):
+
+        path     = os.path.join(os.sep, 'projects', 'master')
+        filePath = os.path.join(path, 'file.txt')
+
+        self.assertFalse(self._fileSystem.exists(path))
+        self.assertRaises(OSError, self._fileSystem.listDir, path)
+        self.assertRaises(IOError, self._fileSystem.openFile, filePath, 'w')
+
+        self._fileSystem.makeDirs(path)
+
+        self.assertRaises(OSError, self._fileSystem.makeDirs, path)
+        self.assertTrue(self._fileSystem.isDir(os.path.dirname(path)))
+        self.assertEqual(self._fileSystem.listDir(os.path.dirname(path)), ['master'])
+
+        with self._fileSystem.openFile(filePath, 'w') as outFile:
+            outFile.write('con')
+
+        with self._fileSystem.openFile(filePath, 'a') as outFile:
+            outFile.write('tent')
+
+        self.assertTrue(self._fileSystem.isFile(filePath))
+        self.assertFalse(self._fileSystem.isDir(filePath))
+        self.assertEqual(self._fileSystem.listDir(path), ['file.txt'])
+        self.assertEqual(self._fileSystem.stat(filePath).st_size, 7)
+        self.assertRaises(OSError, self._fileSystem.listDir, filePath)
+
+        with self._fileSystem.openFile(filePath) as inFile:
+            self.assertEqual(inFile.read(), 'content')
+
+        # Content of the file is missing
+        self._fileSystem.addFile(filePath, None)
+
+        self.assertTrue(self._fileSystem.isFile(filePath))
+        self.assertRaises(IOError, self._fileSystem.openFile, filePath)
+
+    def test_changes(self):
+
+        path = os.path.join(os.sep, 'projects')
+
+        self._fileSystem.makeDirs(path)
+
+        _checkChanges(self, self._fileSystem, path)
+
+    def test_modificationTime(self):
+
+        path     = os.path.join(os.sep, 'projects')
+        filePath = os.path.join(path, 'file.txt')
+
+        self._fileSystem.makeDirs(path)
+        self._fileSystem.utime(path, (1000.0, 1000.0))
+
+        with self._fileSystem.openFile(filePath, 'w') as outFile:
+            outFile.write('content')
+
+        # Written file and its directory are newer than the other paths
+        self.assertGreater(self._fileSystem.stat(filePath).st_mtime, 1000.0)
+        self.assertGreater(self._fileSystem.stat(path).st_mtime, 1000.0)
+
+    def test_binaryContent(self):
+
+        path     = os.path.join(os.sep, 'projects')
+        filePath = os.path.join(path, 'file.gz')
+
+        self._fileSystem.makeDirs(path)
+
+        with self._fileSystem.openFile(filePath, 'wb') as outFile:
+            outFile.write(b'\x1f\x8b\xff')
+
+        # Binary content, which isn't text, is written as missing content
+        self.assertIsNone(self._fileSystem.asDict()['files'][filePath])
+
+    def test_fromDirectory(self):
+
+        tree       = mMecoSettings.tests.projectTreeLib.generate(os.path.join(self._directory, 'tree'),
+                                                                 packageCount=5,
+                                                                 externalCount=1,
+                                                                 appCount=2)
+        fileSystem = mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory(tree.path())
+        diskSystem = mMecoSettings.fileSystemLib.FileSystem()
+
+        for directoryPath, directoryNames, fileNames in os.walk(tree.path()):
+
+            self.assertTrue(fileSystem.isDir(directoryPath))
+            self.assertEqual(fileSystem.listDir(directoryPath), sorted(directoryNames + fileNames))
+
+            for name in fileNames:
+
+                filePath = os.path.join(directoryPath, name)
+
+                self.assertTrue(fileSystem.isFile(filePath))
+
+                if name.endswith(mMecoSettings.fileSystemLib.CONTENT_EXTENSIONS):
+                    with fileSystem.openFile(filePath) as inFile, diskSystem.openFile(filePath) as diskFile:
+                        self.assertEqual(inFile.read(), diskFile.read())
+
+        # Snapshot is relocated to another root
+        filePath = os.path.join(self._directory, 'tree.json')
+        fileSystem.write(filePath)
+
+        relocated = mMecoSettings.fileSystemLib.MemoryFileSystem.read(filePath, os.path.join(os.sep, 'elsewhere'))
+
+        for packagePath in tree.packagePaths():
+            self.assertEqual(relocated.listDir(os.path.join(os.sep, 'elsewhere', os.path.relpath(packagePath, tree.path()))),
+                             fileSystem.listDir(packagePath))
+
+        self.assertEqual(mMecoSettings.fileSystemLib.MemoryFileSystem.read(filePath).asDict(), fileSystem.asDict())
+
+    def test_fromDict(self):
+
+        self.assertRaises(ValueError, mMecoSettings.fileSystemLib.MemoryFileSystem.fromDict, {'version': 0})
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,121 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/flagLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.flagLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mMecoSettings.flagLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class Request(object):
+
+    def __init__(self, platformName, unknownArgs):
+
+        self._platformName  = platformName
+        self._unknownArgs   = unknownArgs
+
+    def platform(self):
+
+        return self._platformName
+
+    def unknownArgs(self):
+
+        return self._unknownArgs
+
+class AllLib(object):
+
+    def __init__(self, platformName, unknownArgs):
+
+        self._request = Request(platformName, unknownArgs)
+
+    def request(self):
+
+        return self._request
+
+class FlagRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._registry = mMecoSettings.flagLib.FlagRegistry()
+        self._registry.register('custom-flag', action='store_true', default=False)
+        self._registry.register('name',        default='none')
+
+    def test_register(self):
+
+        self.assertEqual(self._registry.names(), ['custom-flag', 'name'])
+
+        with self.assertRaises(ValueError):
+            self._registry.register('custom-flag', action='store_true')
+
+    def test_parse(self):
+
+        flags = self._registry.parse('Linux', ['--custom-flag', '--name', 'shot'])
+
+        self.assertTrue(flags.custom_flag)
+        self.assertEqual(flags.name, 'shot')
+
+        flags = self._registry.parse('Windows', ['-custom-flag'])
+
+        self.assertTrue(flags.custom_flag)
+        self.assertEqual(flags.name, 'none')
+
+    def test_unregisteredFlags(self):
+
+        flags = self._registry.parse('Linux', ['--unknown', 'value', '--custom-flag'])
+
+        self.assertTrue(flags.custom_flag)
+        self.assertFalse(hasattr(flags, 'unknown'))
+
+        # Prefix of another platform isn't recognized
+        self.assertFalse(self._registry.parse('Linux', ['-custom-flag']).custom_flag)
+
+    def test_cache(self):
+
+        self.assertIs(self._registry.parse('Linux', ['--custom-flag']), self._registry.parse('Linux', ['--custom-flag']))
+
+        self._registry.register('other', default=None)
+
+        self.assertTrue(hasattr(self._registry.parse('Linux', ['--custom-flag']), 'other'))
+
+class GetFlagsTest(unittest.TestCase):
+
+    def test_getFlags(self):
+
+        self.assertTrue(mMecoSettings.flagLib.getFlags(AllLib('Linux', ['--custom-flag'])).custom_flag)
+        self.assertFalse(mMecoSettings.flagLib.getFlags(AllLib('Linux', None)).custom_flag)
+        self.assertFalse(mMecoSettings.flagLib.getFlags(AllLib('Darwin', ['--unknown'])).custom_flag)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,200 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/importIndexLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.importIndexLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.fileSystemLib
+import mMecoSettings.importIndexLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ImportIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        # Package with PYTHON_PACKAGES
+        self._packageA = self._createPackage('mIndexPackageA', ['mIndexPackageA', 'mIndexModuleA'])
+        self._write(self._packageA, 'python', 'mIndexModuleA.py', 'VALUE = "a"\n')
+
+        # Package without package info module
+        self._packageB = os.path.join(self._directory, 'mIndexPackageB')
+        self._write(self._packageB, 'python', 'mIndexModuleB', '__init__.py', 'VALUE = "b"\n')
+        self._write(self._packageB, 'python', 'mIndexModuleA.py', 'VALUE = "shadowed"\n')
+
+    def tearDown(self):
+
+        sys.meta_path[:] = [x for x in sys.meta_path if not isinstance(x, mMecoSettings.importIndexLib.IndexFinder)]
+
+        for name in ['mIndexPackageA', 'mIndexModuleA', 'mIndexModuleB']:
+            sys.modules.pop(name, None)
+
+        shutil.rmtree(self._directory)
+
+    def _write(self, *args):
+
+        path = os.path.join(*args[:-1])
+
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, 'w') as outFile:
+            outFile.write(args[-1])
+
+    def _createPackage(self, name, pythonPackages):
+
+        packagePath = os.path.join(self._directory, name)
+
+        self._write(packagePath, 'python', name, '__init__.py', '')
+        self._write(packagePath, 'python', name, 'packageInfoLib.py', 'PYTHON_PACKAGES = {}\n'.format(pythonPackages))
+
+        return packagePath
+
+    def test_build(self):
+
+        modules = mMecoSettings.importIndexLib.build([self._packageA, self._packageB])
+
+        self.assertEqual(modules, {'mIndexPackageA' : [os.path.join(self._packageA, 'python')],
+                                   'mIndexModuleA'  : [os.path.join(self._packageA, 'python'),
+                                                       os.path.join(self._packageB, 'python')],
+                                   'mIndexModuleB'  : [os.path.join(self._packageB, 'python')]})
+
+    def test_resolve(self):
+
+        pythonPathA = os.path.join(self._packageA, 'python')
+        pythonPathB = os.path.join(self._packageB, 'python')
+
+        # Order of the search path decides, not the order the packages have been accepted in
+        for packagePaths in ([self._packageA, self._packageB], [self._packageB, self._packageA]):
+
+            modules = mMecoSettings.importIndexLib.build(packagePaths)
+
+            self.assertEqual(mMecoSettings.importIndexLib.resolve(modules, [pythonPathB, pythonPathA]),
+                             {'mIndexPackageA'  : pythonPathA,
+                              'mIndexModuleA'   : pythonPathB,
+                              'mIndexModuleB'   : pythonPathB})
+
+            self.assertEqual(mMecoSettings.importIndexLib.resolve(modules, [pythonPathA + os.sep])['mIndexModuleA'], pythonPathA)
+
+        # Modules, which aren't in the search path, are left to the regular path finder
+        self.assertEqual(mMecoSettings.importIndexLib.resolve(modules, [pythonPathA]), {'mIndexPackageA': pythonPathA,
+                                                                                       'mIndexModuleA' : pythonPathA})
+
+    def test_addPackage(self):
+
+        packages = mMecoSettings.importIndexLib._PACKAGES.copy()
+        mMecoSettings.importIndexLib._PACKAGES.clear()
+
+        try:
+            for packagePath in [self._packageB, self._packageA, self._packageB]:
+                mMecoSettings.importIndexLib.addPackage(packagePath)
+
+            self.assertEqual(mMecoSettings.importIndexLib.getPackages(), [self._packageB, self._packageA])
+
+            mMecoSettings.importIndexLib.clearPackages()
+
+            self.assertEqual(mMecoSettings.importIndexLib.getPackages(), [])
+        finally:
+            mMecoSettings.importIndexLib._PACKAGES.clear()
+            mMecoSettings.importIndexLib._PACKAGES.update(packages)
+
+    def test_findModule(self):
+
+        finder = mMecoSettings.importIndexLib.IndexFinder({'mIndexModuleA': os.path.join(self._packageA, 'python')})
+
+        self.assertIsNotNone(finder.find_module('mIndexModuleA'))
+        self.assertIsNone(finder.find_module('mIndexModuleB'))
+        self.assertIsNone(finder.find_module('mIndexModuleA', ['/path']))
+
+    def test_writeAndRead(self):
+
+        modules = mMecoSettings.importIndexLib.build([self._packageA])
+        path    = mMecoSettings.importIndexLib.write(modules, self._directory)
+
+        self.assertEqual(mMecoSettings.importIndexLib.write(modules, self._directory), path)
+        self.assertEqual(mMecoSettings.importIndexLib.read(path), modules)
+
+    def test_writeDefaultDirectory(self):
+
+        path = mMecoSettings.importIndexLib.write(mMecoSettings.importIndexLib.build([self._packageA]))
+
+        try:
+            self.assertEqual(os.path.dirname(path), mMecoSettings.fileSystemLib.getUserTemporaryPath())
+        finally:
+            os.remove(path)
+
+    def test_install(self):
+
+        modules = mMecoSettings.importIndexLib.build([self._packageA, self._packageB])
+        path    = mMecoSettings.importIndexLib.write(modules, self._directory)
+
+        # Search path of the session puts package B first, like PYTHONPATH would
+        sysPath  = list(sys.path)
+        sys.path = [os.path.join(self._packageB, 'python'), os.path.join(self._packageA, 'python')] + sys.path
+
+        try:
+            finder = mMecoSettings.importIndexLib.install(path)
+
+            self.assertIs(mMecoSettings.importIndexLib.install(), finder)
+            self.assertEqual(finder.modules()['mIndexModuleA'], os.path.join(self._packageB, 'python'))
+
+            import mIndexModuleA
+            import mIndexModuleB
+        finally:
+            sys.path = sysPath
+
+        self.assertEqual(mIndexModuleA.VALUE, 'shadowed')
+        self.assertEqual(mIndexModuleB.VALUE, 'b')
+
+    def test_installOtherOwner(self):
+
+        path    = mMecoSettings.importIndexLib.write(mMecoSettings.importIndexLib.build([self._packageA]), self._directory)
+        isOwned = mMecoSettings.fileSystemLib.isOwned
+
+        mMecoSettings.fileSystemLib.isOwned = lambda x: False
+
+        try:
+            self.assertIsNone(mMecoSettings.importIndexLib.install(path))
+        finally:
+            mMecoSettings.fileSystemLib.isOwned = isOwned
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,190 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/importTimeTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.importTimeTest    @brief [ MODULE ] - Unit test module.
+
+#
+#  Cold start of each command in `bin/linux` is measured with `python -X importtime` while displaying its help.
+#  Test fails if the number of imported modules goes over the budget stored in `importTimeBudget.json`, if the
+#  cumulative import time goes over `importTimeRatio` times the import time of `baselineCode`, or if one of the
+#  forbidden modules is imported before the arguments are parsed. Import time is compared to a baseline measured on
+#  the same machine, since absolute times depend on the machine and its load. Every command in `bin/linux` must have
+#  a budget. Module budgets are the counts measured with Python 3.11 plus a headroom of 5 modules.
+#
+#  Displaying the help doesn't reach the code, which does the work. Invocations listed for a command are run against
+#  a generated project tree, see mMecoSettings.tests.projectTreeLib, and checked against their own budget and
+#  forbidden modules. They need the dependencies of the commands, so they are skipped if these are not available.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+
+import mMecoSettings.tests.projectTreeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+TESTS_PATH      = os.path.dirname(os.path.abspath(__file__))
+PYTHON_PATH     = os.path.abspath(os.path.join(TESTS_PATH, '..', '..'))
+BIN_PATH        = os.path.abspath(os.path.join(PYTHON_PATH, '..', 'bin', 'linux'))
+BUDGET_PATH     = os.path.join(TESTS_PATH, 'importTimeBudget.json')
+
+# Python code given to the interpreter by a command
+CODE_PATTERN    = re.compile(r'-c\s+"([^"]+)"')
+
+# Line of `-X importtime` output, self and cumulative times in microseconds and the indented module name
+LINE_PATTERN    = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( +)(\S+)\s*$')
+
+# Number of runs of each measurement, the fastest one is used to reduce the noise of the machine load
+RUN_COUNT       = 3
+
+# Modules the invocations need, besides the ones of this package
+DEPENDENCIES    = ('mFileSystem', 'mMecoPackage')
+
+# Python code run before an invocation, it makes mMecoSettings.settingsLib.getProjectsPath return the first argument
+TREE_CODE       = ('import sys; import mMecoSettings.settingsLib; projectsPath = sys.argv.pop(1); '
+                   'mMecoSettings.settingsLib.getProjectsPath = lambda platformName, projectName=None: projectsPath; ')
+
+def getImportTimes(code, args):
+
+    environ = dict(os.environ)
+    environ['PYTHONPATH'] = os.pathsep.join([PYTHON_PATH] + ([environ['PYTHONPATH']] if environ.get('PYTHONPATH') else []))
+
+    # Commands mustn't be answered by a running settings daemon
+    environ['MECO_SETTINGS_DAEMON_SOCKET_PATH'] = os.path.join(TESTS_PATH, 'missing.sock')
+
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', code] + args,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE,
+                               env=environ)
+    _, stderr = process.communicate()
+
+    modules     = []
+    cumulative  = 0
+
+    for line in stderr.decode('utf-8').splitlines():
+
+        match = LINE_PATTERN.match(line)
+        if not match:
+            continue
+
+        modules.append(match.group(4))
+
+        # Top-level imports include the time of their nested imports
+        if len(match.group(3)) == 1:
+            cumulative += int(match.group(2))
+
+    return process.returncode, modules, cumulative
+
+def getFastestImportTimes(code, args):
+
+    return min((getImportTimes(code, args) for _ in range(RUN_COUNT)), key=lambda x: x[2])
+
+def getCode(name):
+
+    with open(os.path.join(BIN_PATH, name), 'r') as inFile:
+        return CODE_PATTERN.search(inFile.read()).group(1)
+
+def hasDependencies():
+
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        return False
+
+    return all(find_spec(x) for x in DEPENDENCIES)
+
+@unittest.skipUnless(sys.version_info >= (3, 7), '-X importtime requires Python 3.7 or later')
+class ImportTimeTest(unittest.TestCase):
+
+    def setUp(self):
+
+        with open(BUDGET_PATH, 'r') as inFile:
+            self._budget = json.loads(inFile.read())
+
+    def test_commands(self):
+
+        names = sorted(x for x in os.listdir(BIN_PATH) if x.startswith('mmecosettings-'))
+
+        self.assertEqual(sorted(self._budget['commands']), names, 'Every command must have a budget')
+
+        _, _, baseline = getFastestImportTimes(self._budget['baselineCode'], [])
+        maxCumulative  = baseline * self._budget['importTimeRatio']
+
+        for name in names:
+
+            returnCode, modules, cumulative = getFastestImportTimes(getCode(name), ['--help'])
+
+            self.assertEqual(returnCode, 0, name)
+
+            for module in self._budget['forbiddenModules']:
+                self.assertNotIn(module, modules, '{} imports {} before parsing its arguments'.format(name, module))
+
+            self.assertLessEqual(len(modules), self._budget['commands'][name]['modules'],
+                                 '{} imports too many modules'.format(name))
+
+            self.assertLessEqual(cumulative, maxCumulative,
+                                 '{} imports take {} us, more than {} times the baseline of {} us'.format(
+                                     name, cumulative, self._budget['importTimeRatio'], baseline))
+
+    @unittest.skipUnless(hasDependencies(), 'Dependencies of the commands are not available')
+    def test_invocations(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            tree = mMecoSettings.tests.projectTreeLib.generate(directory, packageCount=10, externalCount=2)
+
+            for name, budget in sorted(self._budget['commands'].items()):
+                for invocation in budget.get('invocations', []):
+
+                    label = '{} {}'.format(name, ' '.join(invocation['args']))
+
+                    returnCode, modules, _ = getImportTimes(TREE_CODE + getCode(name), [tree.projectsPath()] + invocation['args'])
+
+                    self.assertEqual(returnCode, 0, label)
+
+                    for module in invocation['forbiddenModules']:
+                        self.assertNotIn(module, modules, '{} imports {}'.format(label, module))
+
+                    self.assertLessEqual(len(modules), invocation['modules'], '{} imports too many modules'.format(label))
+
+        finally:
+            shutil.rmtree(directory)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
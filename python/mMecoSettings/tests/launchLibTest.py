@@ -0,0 +1,86 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/launchLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.launchLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.tests.projectTreeLib
+import mMecoSettings.tests.benchmarks.launchLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class LaunchLibTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path          = tempfile.mkdtemp()
+
+        self._projectsPath  = mMecoSettings.tests.projectTreeLib.generate(self._path, packageCount=10).projectsPath()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._path)
+
+    def test_runSample(self):
+
+        for app in sorted(mMecoSettings.tests.benchmarks.launchLib.SCENARIOS.values()):
+
+            measurements = mMecoSettings.tests.benchmarks.launchLib.runSample(self._projectsPath, app, 3)
+
+            # Warm launches filter the same packages as the cold one
+            self.assertEqual(len(measurements), 3)
+            self.assertTrue(measurements[0]['packages'])
+            self.assertEqual(len(set(x['packages'] for x in measurements)), 1)
+
+    def test_runWithoutWarmLaunches(self):
+
+        results = mMecoSettings.tests.benchmarks.launchLib.run(self._projectsPath, samples=1, warmCount=0)
+
+        self.assertEqual(sorted(results), sorted(mMecoSettings.tests.benchmarks.launchLib.SCENARIOS))
+        self.assertEqual([sorted(x) for x in results.values()], [['cold'], ['cold']])
+
+        lines, regression = mMecoSettings.tests.benchmarks.launchLib.compare(results, results)
+
+        self.assertEqual(len(lines), 3)
+        self.assertFalse(regression)
+
+    def test_median(self):
+
+        self.assertIsNone(mMecoSettings.tests.benchmarks.launchLib._median([]))
+        self.assertEqual(mMecoSettings.tests.benchmarks.launchLib._median([3, 1, 2]), 2)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,246 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/logLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.logLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import gzip
+import time
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+import mMecoSettings.logLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class RotateTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._logPath       = tempfile.mkdtemp()
+
+        self._logFile       = os.path.join(self._logPath, 'log_master_user.txt')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._logPath)
+
+    def test_rotateBySize(self):
+
+        for index in range(30):
+
+            mMecoSettings.logLib.rotate(self._logFile, maxBytes=100, background=False)
+            mMecoSettings.logLib.append(self._logFile, 'line {}\n'.format(index))
+
+        segments = mMecoSettings.logLib.getSegments(self._logFile)
+
+        self.assertTrue(segments)
+        self.assertTrue(all(x.endswith('.txt.gz') for x in segments))
+
+        with gzip.open(segments[0], 'rb') as inFile:
+            self.assertTrue(inFile.read().decode().startswith('line 0\n'))
+
+    def test_maxCompressionBytes(self):
+
+        with open(self._logFile, 'w') as outFile:
+            outFile.write('x' * 100)
+
+        maxCompressionBytes = mMecoSettings.logLib.MAX_COMPRESSION_BYTES
+        mMecoSettings.logLib.MAX_COMPRESSION_BYTES = 10
+
+        try:
+            self.assertTrue(mMecoSettings.logLib.rotate(self._logFile, maxBytes=1, background=False))
+        finally:
+            mMecoSettings.logLib.MAX_COMPRESSION_BYTES = maxCompressionBytes
+
+        segments = mMecoSettings.logLib.getSegments(self._logFile)
+
+        self.assertEqual(len(segments), 1)
+        self.assertTrue(segments[0].endswith('.txt'))
+
+    def test_staleTemporarySegments(self):
+
+        segmentPath = mMecoSettings.logLib.getSegmentPath(self._logFile, time.time())
+        stalePath   = '{}.{}.12345'.format(segmentPath, mMecoSettings.logLib.COMPRESSED_EXTENSION)
+        recentPath  = '{}.{}.12346'.format(segmentPath, mMecoSettings.logLib.COMPRESSED_EXTENSION)
+
+        for path in (stalePath, recentPath):
+            with open(path, 'w') as outFile:
+                outFile.write('partial')
+
+        oldTime = time.time() - mMecoSettings.logLib.STALE_TEMPORARY_AGE - 60
+        os.utime(stalePath, (oldTime, oldTime))
+
+        self.assertEqual(mMecoSettings.logLib.getTemporarySegments(self._logFile), [stalePath, recentPath])
+
+        with open(self._logFile, 'w') as outFile:
+            outFile.write('line\n')
+
+        self.assertTrue(mMecoSettings.logLib.rotate(self._logFile, maxBytes=1, background=False))
+
+        # Temporary file of a compression, which may still be running, is kept
+        self.assertEqual(mMecoSettings.logLib.getTemporarySegments(self._logFile), [recentPath])
+
+    def test_startCompression(self):
+
+        segmentPath = mMecoSettings.logLib.getSegmentPath(self._logFile, time.time())
+
+        with open(segmentPath, 'w') as outFile:
+            outFile.write('line\n')
+
+        process = mMecoSettings.logLib.startCompression(self._logFile)
+
+        self.assertTrue(process)
+        self.assertEqual(process.wait(), 0)
+        self.assertEqual(mMecoSettings.logLib.getSegments(self._logFile), [segmentPath + '.gz'])
+
+        with gzip.open(segmentPath + '.gz', 'rb') as inFile:
+            self.assertEqual(inFile.read().decode(), 'line\n')
+
+    def test_rotateInBackground(self):
+
+        with open(self._logFile, 'w') as outFile:
+            outFile.write('line\n')
+
+        self.assertTrue(mMecoSettings.logLib.rotate(self._logFile, maxBytes=1))
+        self.assertFalse(os.path.isfile(self._logFile))
+
+        self.assertEqual(mMecoSettings.logLib._COMPRESSION_PROCESSES[-1].wait(), 0)
+
+        segments = mMecoSettings.logLib.getSegments(self._logFile)
+
+        self.assertEqual(len(segments), 1)
+        self.assertTrue(segments[0].endswith('.txt.gz'))
+
+    def test_rotateByAge(self):
+
+        with open(self._logFile, 'w') as outFile:
+            outFile.write('old\n')
+
+        oldTime = time.time() - mMecoSettings.logLib.MAX_AGE - 60
+        os.utime(self._logFile, (oldTime, oldTime))
+
+        self.assertTrue(mMecoSettings.logLib.rotate(self._logFile, background=False))
+        self.assertFalse(os.path.isfile(self._logFile))
+
+    def test_backupCount(self):
+
+        for index in range(4):
+
+            with open(self._logFile, 'w') as outFile:
+                outFile.write('{}\n'.format(index))
+
+            mMecoSettings.logLib.rotate(self._logFile, maxBytes=1, backupCount=2, background=False)
+
+        self.assertEqual(len(mMecoSettings.logLib.getSegments(self._logFile)), 2)
+
+class AppendLogWriterTest(unittest.TestCase):
+
+    ## [ int ] - Number of writer processes.
+    PROCESS_COUNT   = 16
+
+    ## [ int ] - Number of records written by each process.
+    RECORD_COUNT    = 200
+
+    ## [ str ] - Code run by each writer process, records are large so partial writes would show up.
+    WRITER_CODE     = '''
+import sys
+import mMecoSettings.logLib
+
+processIndex = int(sys.argv[2])
+
+with mMecoSettings.logLib.AppendLogWriter(sys.argv[1]) as writer:
+    for index in range({recordCount}):
+        payload = str(processIndex) * (1000 + (index * 37) % 9000)
+        if index % 2:
+            writer.writeLine('{{}} {{}} {{}}'.format(processIndex, index, payload))
+        else:
+            writer.writeLines(['{{}} {{}} {{}}'.format(processIndex, index, payload)])
+'''
+
+    def setUp(self):
+
+        self._logPath       = tempfile.mkdtemp()
+
+        self._logFile       = os.path.join(self._logPath, 'log_master_user.txt')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._logPath)
+
+    def test_concurrentWriters(self):
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')),
+                                             env.get('PYTHONPATH', '')])
+
+        code = AppendLogWriterTest.WRITER_CODE.format(recordCount=AppendLogWriterTest.RECORD_COUNT)
+
+        processes = [subprocess.Popen([sys.executable, '-c', code, self._logFile, str(x)], env=env)
+                     for x in range(AppendLogWriterTest.PROCESS_COUNT)]
+
+        for process in processes:
+            self.assertEqual(process.wait(), 0)
+
+        #
+
+        with open(self._logFile, 'r') as inFile:
+            lines = inFile.read().splitlines()
+
+        self.assertEqual(len(lines), AppendLogWriterTest.PROCESS_COUNT * AppendLogWriterTest.RECORD_COUNT)
+
+        records = set()
+
+        for line in lines:
+
+            processIndex, index, payload = line.split(' ')
+
+            self.assertEqual(payload, processIndex * (1000 + (int(index) * 37) % 9000))
+
+            records.add((processIndex, index))
+
+        self.assertEqual(len(records), len(lines))
+
+    def test_append(self):
+
+        mMecoSettings.logLib.append(self._logFile, 'first\n')
+        mMecoSettings.logLib.append(self._logFile, 'second\n')
+
+        with open(self._logFile, 'r') as inFile:
+            self.assertEqual(inFile.read(), 'first\nsecond\n')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
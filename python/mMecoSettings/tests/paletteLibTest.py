@@ -0,0 +1,95 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/paletteLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.paletteLibTest    @brief [ MODULE ] - Unit test module.
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mMecoSettings.paletteLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+COLORS = {'development' : {'singleVariable' : '\\e[38;5;4m{}\\e[m',
+                           'colon'          : 'DarkGray'}}
+
+class PaletteLibTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._palettes = dict(mMecoSettings.paletteLib._PALETTES)
+
+        mMecoSettings.paletteLib._PALETTES.clear()
+
+    def tearDown(self):
+
+        mMecoSettings.paletteLib._PALETTES.clear()
+        mMecoSettings.paletteLib._PALETTES.update(self._palettes)
+
+    def test_freeze(self):
+
+        colors = mMecoSettings.paletteLib.freeze(COLORS)
+
+        self.assertEqual(colors, COLORS)
+        self.assertIs(mMecoSettings.paletteLib.freeze(colors), colors)
+        self.assertRaises(TypeError, colors.__setitem__, 'stage', {})
+        self.assertRaises(TypeError, colors['development'].update, {})
+
+    def test_thaw(self):
+
+        colors = mMecoSettings.paletteLib.thaw(mMecoSettings.paletteLib.freeze(COLORS))
+        colors['development']['colon'] = 'Gray'
+
+        self.assertEqual(type(colors['development']), dict)
+        self.assertEqual(COLORS['development']['colon'], 'DarkGray')
+
+    def test_palette(self):
+
+        frozen  = mMecoSettings.paletteLib.freeze(COLORS)
+        linux   = mMecoSettings.paletteLib.registerPalette('Linux', frozen)
+        darwin  = mMecoSettings.paletteLib.registerPalette('Darwin', frozen)
+
+        self.assertIs(linux, darwin)
+        self.assertIs(mMecoSettings.paletteLib.getPalette('Linux'), linux)
+        self.assertIsNone(mMecoSettings.paletteLib.getPalette('Unknown'))
+
+        self.assertEqual(linux.pair('development', 'singleVariable'), ('\\e[38;5;4m', '\\e[m'))
+        self.assertEqual(linux.pair('development', 'colon'), ('', ''))
+        self.assertEqual(linux.colorize('development', 'singleVariable', 'PATH'), '\\e[38;5;4mPATH\\e[m')
+        self.assertRaises(KeyError, linux.colorize, 'stage', 'colon', ':')
+
+        colors = linux.copyColors()
+        colors['development']['colon'] = 'Gray'
+
+        self.assertEqual(linux.colors()['development']['colon'], 'DarkGray')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
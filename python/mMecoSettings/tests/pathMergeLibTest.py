@@ -0,0 +1,92 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/pathMergeLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.pathMergeLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.pathMergeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class MergeTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._bin    = os.path.join(self._directory, 'bin')
+        self._python = os.path.join(self._directory, 'python')
+        self._lib    = os.path.join(self._directory, 'lib')
+
+        os.mkdir(self._bin)
+        os.mkdir(self._python)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_merge(self):
+
+        result = mMecoSettings.pathMergeLib.merge([self._bin, self._lib, self._python, self._bin + os.sep, self._bin])
+
+        self.assertEqual(result.paths(), [self._bin, self._python])
+        self.assertEqual(result.duplicates(), [self._bin + os.sep, self._bin])
+        self.assertEqual(result.missing(), [self._lib])
+        self.assertEqual(result.join('Linux'), '{}:{}'.format(self._bin, self._python))
+
+    def test_mergeWithoutPruning(self):
+
+        result = mMecoSettings.pathMergeLib.merge([self._lib, self._lib], prune=False)
+
+        self.assertEqual(result.paths(), [self._lib])
+        self.assertEqual(result.missing(), [])
+
+    def test_mergeVariables(self):
+
+        results = mMecoSettings.pathMergeLib.mergeVariables({'PATH'             : [self._bin, self._bin],
+                                                             'LD_LIBRARY_PATH'  : [self._lib],
+                                                             'PYTHONPATH'       : [self._python]})
+
+        self.assertEqual(results['PATH'].paths(), [self._bin])
+        self.assertEqual(results['LD_LIBRARY_PATH'].paths(), [])
+        self.assertEqual(mMecoSettings.pathMergeLib.getReport(results),
+                         ['LD_LIBRARY_PATH: missing: {}'.format(self._lib),
+                          'PATH: duplicate: {}'.format(self._bin)])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,196 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/profileLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.profileLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import atexit
+import shutil
+import tempfile
+import unittest
+import importlib
+import subprocess
+
+import mMecoSettings.envVariablesLib
+import mMecoSettings.flagLib
+import mMecoSettings.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+@mMecoSettings.profileLib.profile
+def getPreBuild(path):
+
+    os.path.isfile(path)
+
+    return shouldInitializePackage(path)
+
+@mMecoSettings.profileLib.profile(detail=lambda path: os.path.basename(path))
+def shouldInitializePackage(path):
+
+    return os.path.isdir(path)
+
+@mMecoSettings.profileLib.profile
+def importPackageInfo(path, name):
+
+    # Package info modules are removed once they are read, like mMecoSettings.callbackLib.shouldInitializePackage does
+    sys.path.insert(0, path)
+
+    try:
+        return importlib.import_module(name).VALUE
+    finally:
+        sys.path.remove(path)
+        del sys.modules[name]
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._profiler  = mMecoSettings.profileLib.Profiler()
+        self._default   = mMecoSettings.profileLib._PROFILER
+        self._directory = tempfile.mkdtemp()
+
+        mMecoSettings.profileLib._PROFILER = self._profiler
+
+    def tearDown(self):
+
+        self._profiler.disable()
+
+        mMecoSettings.profileLib._PROFILER = self._default
+
+        shutil.rmtree(self._directory)
+
+    def test_disabled(self):
+
+        self.assertTrue(getPreBuild(self._directory))
+        self.assertEqual(self._profiler.stacks(), [])
+
+    def test_profile(self):
+
+        self._profiler.enable()
+
+        self.assertTrue(getPreBuild(self._directory))
+
+        self._profiler.disable()
+
+        self.assertEqual(self._profiler.fileSystemCalls(), 2)
+
+        packageName = os.path.basename(self._directory)
+
+        self.assertEqual([x.rsplit(' ', 1)[0] for x in self._profiler.stacks()],
+                         ['getPreBuild', 'getPreBuild;shouldInitializePackage[{}]'.format(packageName)])
+
+        summary = dict((x.split()[0], x.split()[1:]) for x in self._profiler.summary()[1:])
+
+        # Calls and file system calls
+        self.assertEqual((summary['getPreBuild'][0], summary['getPreBuild'][3]), ('1', '2'))
+        self.assertEqual((summary['shouldInitializePackage'][0], summary['shouldInitializePackage'][3]), ('1', '1'))
+
+        files = self._profiler.write(os.path.join(self._directory, 'profile'))
+        self.assertTrue(all(os.path.isfile(x) for x in files))
+
+    def test_imports(self):
+
+        with open(os.path.join(self._directory, 'packageInfo.py'), 'w') as outFile:
+            outFile.write('VALUE = 1\n')
+
+        self._profiler.enable()
+
+        self.assertEqual(importPackageInfo(self._directory, 'packageInfo'), 1)
+
+        self._profiler.disable()
+
+        self.assertNotIn(self._profiler._importCounter, sys.meta_path)
+
+        summary = dict((x.split()[0], x.split()[1:]) for x in self._profiler.summary()[1:])
+
+        # Module is counted although it isn't in sys.modules anymore
+        self.assertGreaterEqual(int(summary['importPackageInfo'][4]), 1)
+
+    def test_start(self):
+
+        registered      = []
+        register        = atexit.register
+        writeRegistered = mMecoSettings.profileLib._WRITE_REGISTERED
+
+        atexit.register = registered.append
+        mMecoSettings.profileLib._WRITE_REGISTERED = False
+
+        try:
+            mMecoSettings.profileLib.start()
+            mMecoSettings.profileLib.start()
+        finally:
+            atexit.register = register
+            mMecoSettings.profileLib._WRITE_REGISTERED = writeRegistered
+
+        self.assertTrue(self._profiler.isEnabled())
+        self.assertEqual(registered, [mMecoSettings.profileLib._write])
+
+    def test_startAtImport(self):
+
+        environ = dict((x, y) for x, y in os.environ.items() if not x.startswith('MECO_'))
+        environ['PYTHONPATH']                                             = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        environ[mMecoSettings.envVariablesLib.MECO_PROFILE_FILE_PATH]     = os.path.join(self._directory, 'profile')
+
+        code = 'import mMecoSettings.profileLib;print(mMecoSettings.profileLib.getProfiler().isEnabled())'
+
+        for args, env in (([], {mMecoSettings.envVariablesLib.MECO_PROFILE: '1'}),
+                          (['--profile'], {}),
+                          ([], {})):
+
+            environ.update(env)
+
+            process = subprocess.Popen([sys.executable, '-c', code] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=environ)
+            stdout, stderr = process.communicate()
+
+            environ.pop(mMecoSettings.envVariablesLib.MECO_PROFILE, None)
+
+            self.assertEqual(process.returncode, 0, stderr)
+            self.assertEqual(stdout.decode('utf-8').strip(), str(bool(env or args)))
+
+        self.assertTrue(os.path.isfile(os.path.join(self._directory, 'profile{}'.format(mMecoSettings.profileLib.SUMMARY_EXTENSION))))
+
+    def test_isRequested(self):
+
+        registry = mMecoSettings.flagLib.FlagRegistry()
+        registry.register('profile', action='store_true', default=False)
+
+        self.assertFalse(mMecoSettings.profileLib.isRequested({}))
+        self.assertFalse(mMecoSettings.profileLib.isRequested({}, registry.parse('Linux', ['-e', 'main'])))
+        self.assertTrue(mMecoSettings.profileLib.isRequested({}, registry.parse('Linux', ['--profile'])))
+        self.assertTrue(mMecoSettings.profileLib.isRequested({}, registry.parse('Windows', ['-profile'])))
+        self.assertTrue(mMecoSettings.profileLib.isRequested({mMecoSettings.envVariablesLib.MECO_PROFILE: '1'}))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
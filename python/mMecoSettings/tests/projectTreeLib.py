@@ -0,0 +1,475 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/projectTreeLib.py @brief [ FILE   ] - Synthetic project tree module.
+## @package mMecoSettings.tests.projectTreeLib    @brief [ MODULE ] - Synthetic project tree module.
+#
+#  Generates Meco project trees for benchmarks and stress tests. Each project has the layout, which
+#  mMecoSettings.settingsLib expects;
+#
+#  @code
+#  meco/PROJECT_NAME/internal/PACKAGE_NAME/VERSION/PACKAGE_NAME
+#  meco/PROJECT_NAME/external/PACKAGE_NAME/VERSION/PACKAGE_NAME
+#  meco/PROJECT_NAME/developers/DEVELOPER_NAME/development/ENV_NAME/PACKAGE_NAME
+#  meco/PROJECT_NAME/developers/DEVELOPER_NAME/stage/ENV_NAME/PACKAGE_NAME
+#  meco/PROJECT_NAME/users/USER_NAME
+#  @endcode
+#
+#  Packages are created from `resources/templates/package`. `PLATFORMS`, `APPLICATIONS`, `PYTHON_VERSIONS` and
+#  `IS_ACTIVE` of their package info modules vary, and mMecoSettings packages contain app files in `resources/apps`.
+#  Trees are deterministic, same parameters and seed generate the same tree.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import json
+import random
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Absolute path of the package template.
+TEMPLATE_PATH       = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'resources', 'templates', 'package'))
+
+#
+## [ str ] - Name of the master project.
+MASTER_PROJECT_NAME = 'master'
+
+#
+## [ str ] - Name of the package, which contains the app files.
+SETTINGS_PACKAGE    = 'mMecoSettings'
+
+#
+## [ list of tuple ] - Platforms of the packages, picked by weight.
+PLATFORMS           = [(['Linux', 'Darwin', 'Windows'], 6),
+                       (['Linux', 'Darwin'], 2),
+                       (['Linux'], 1),
+                       (['Windows'], 1)]
+
+#
+## [ list of tuple ] - Applications of the packages, picked by weight.
+APPLICATIONS        = [(['all'], 6),
+                       (['maya'], 1),
+                       (['nuke'], 1),
+                       (['mari'], 1),
+                       (['standalone'], 1)]
+
+#
+## [ list of tuple ] - Python versions of the packages, picked by weight.
+PYTHON_VERSIONS     = [(['2', '3'], 6),
+                       (['3'], 3),
+                       (['2'], 1)]
+
+#
+## [ list of str ] - Applications of the app files, each app file gets one of them in turn.
+APP_APPLICATIONS    = ['maya', 'nuke', 'mari', 'standalone']
+
+#
+## [ dict ] - Keys are names of the template files, values are paths relative to the root of a package.
+TEMPLATE_FILES      = {'README.md'          : 'README.md',
+                       'gitignore'          : '.gitignore',
+                       'packageInfoLib'     : 'python/PACKAGE_NAME/packageInfoLib.py',
+                       'packageEnvLib'      : 'python/PACKAGE_NAME/packageEnvLib.py'}
+
+#
+## [ dict ] - Keys are names of the template files, values are contents.
+_TEMPLATES          = {}
+
+#
+## @brief [ CLASS ] - Generated project tree.
+class ProjectTree(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # BUILT-IN METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the directory of the tree.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path):
+
+        ## [ str ] - Absolute path of the directory of the tree.
+        self._path      = path
+
+        ## [ dict ] - Keys are tuples of project name and layer, values are lists of absolute paths of package roots.
+        self._packages  = {}
+
+        ## [ list of str ] - Absolute paths of app files.
+        self._appFiles  = []
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Absolute path of the directory of the tree.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Absolute path of the projects, which is the value mMecoSettings.settingsLib.getProjectsPath returns.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def projectsPath(self):
+
+        return os.path.join(self._path, 'meco')
+
+    #
+    ## @brief Project names.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names.
+    def projectNames(self):
+
+        return sorted(set(x[0] for x in self._packages))
+
+    #
+    ## @brief Absolute paths of the roots of the packages.
+    #
+    #  @param projectName     [ str  | None  | in  ] - Project name, packages of all projects are returned if not given.
+    #  @param layer           [ str  | None  | in  ] - Layer, one of the following; internal, external, development,
+    #                                                 stage, packages of all layers are returned if not given.
+    #  @param settingsPackage [ bool | False | in  ] - Whether the settings package is included. It has the name of the
+    #                                                 package in use, so filtering it would replace mMecoSettings in
+    #                                                 sys.modules.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    def packagePaths(self, projectName=None, layer=None, settingsPackage=False):
+
+        paths = []
+
+        for key in sorted(self._packages):
+            if (projectName is None or key[0] == projectName) and (layer is None or key[1] == layer):
+                paths.extend(x for x in self._packages[key] if settingsPackage or os.path.basename(x) != SETTINGS_PACKAGE)
+
+        return paths
+
+    #
+    ## @brief Absolute paths of the app files.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    def appFiles(self):
+
+        return list(self._appFiles)
+
+    #
+    ## @brief Add a package.
+    #
+    #  @param projectName [ str | None | in  ] - Project name.
+    #  @param layer       [ str | None | in  ] - Layer.
+    #  @param packagePath [ str | None | in  ] - Absolute path of the root of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addPackage(self, projectName, layer, packagePath):
+
+        self._packages.setdefault((projectName, layer), []).append(packagePath)
+
+    #
+    ## @brief Add an app file.
+    #
+    #  @param appFile [ str | None | in  ] - Absolute path of an app file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addAppFile(self, appFile):
+
+        self._appFiles.append(appFile)
+
+#
+## @brief Get content of given template file.
+#
+#  @param name [ str | None | in  ] - Name of a file in TEMPLATE_PATH.
+#
+#  @exception N/A
+#
+#  @return str - Content.
+def _getTemplate(name):
+
+    if not name in _TEMPLATES:
+        with open(os.path.join(TEMPLATE_PATH, name), 'r') as inFile:
+            _TEMPLATES[name] = inFile.read()
+
+    return _TEMPLATES[name]
+
+#
+## @brief Pick an item by weight.
+#
+#  @param generator [ random.Random | None | in  ] - Random number generator.
+#  @param items     [ list of tuple | None | in  ] - Each item is a tuple of a value and its weight.
+#
+#  @exception N/A
+#
+#  @return variant - Value.
+def _pick(generator, items):
+
+    number = generator.randint(1, sum(x[1] for x in items))
+
+    for value, weight in items:
+        number -= weight
+        if number <= 0:
+            return value
+
+#
+## @brief Get content of the package info module of a package.
+#
+#  @param name        [ str  | None | in  ] - Package name.
+#  @param version     [ str  | None | in  ] - Package version.
+#  @param external    [ bool | None | in  ] - Whether the package is external.
+#  @param info        [ dict | None | in  ] - Keys are PLATFORMS, APPLICATIONS, PYTHON_VERSIONS and IS_ACTIVE.
+#
+#  @exception N/A
+#
+#  @return str - Content.
+def getPackageInfo(name, version, external, info):
+
+    content = _getTemplate('packageInfoLib')
+    content = content.replace('PACKAGE_NAME', name)
+    content = content.replace('PACKAGE_VERSION', version)
+    content = content.replace('PACKAGE_DESCRIPTION', 'Synthetic package {}'.format(name))
+    content = content.replace('IS_PACKAGE_EXTERNAL', str(external))
+    content = content.replace('DEVELOPER_EMAIL_ADDRESS', 'developer@company.com')
+
+    for key, value in sorted(info.items()):
+        content = re.sub(r'^{}(\s*)=.*$'.format(key), lambda x: '{}{}= {!r}'.format(key, x.group(1), value), content, flags=re.M)
+
+    return content
+
+#
+## @brief Create a package.
+#
+#  @param packagePath [ str  | None | in  ] - Absolute path of the root of the package.
+#  @param version     [ str  | None | in  ] - Package version.
+#  @param external    [ bool | None | in  ] - Whether the package is external.
+#  @param info        [ dict | None | in  ] - Keys are PLATFORMS, APPLICATIONS, PYTHON_VERSIONS and IS_ACTIVE.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def createPackage(packagePath, version, external, info):
+
+    name = os.path.basename(packagePath)
+
+    os.makedirs(os.path.join(packagePath, 'python', name))
+
+    open(os.path.join(packagePath, 'python', name, '__init__.py'), 'w').close()
+
+    for templateName, relativePath in TEMPLATE_FILES.items():
+
+        if templateName == 'packageInfoLib':
+            content = getPackageInfo(name, version, external, info)
+        else:
+            content = _getTemplate(templateName).replace('PACKAGE_NAME', name).replace('PACKAGE_DESCRIPTION', 'Synthetic package {}'.format(name))
+
+        with open(os.path.join(packagePath, *relativePath.replace('PACKAGE_NAME', name).split('/')), 'w') as outFile:
+            outFile.write(content)
+
+#
+## @brief Create app files in given mMecoSettings package.
+#
+#  @param packagePath [ str | None | in  ] - Absolute path of the root of the package.
+#  @param appCount    [ int | None | in  ] - Number of app files.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the app files.
+def createAppFiles(packagePath, appCount):
+
+    appPath = os.path.join(packagePath, 'resources', 'apps')
+    os.makedirs(appPath)
+
+    appFiles = []
+
+    for index in range(appCount):
+
+        application = APP_APPLICATIONS[index % len(APP_APPLICATIONS)]
+        appFile     = os.path.join(appPath, 'app{:05d}.json'.format(index))
+
+        with open(appFile, 'w') as outFile:
+            outFile.write(json.dumps({'developer'           : 'developer@company.com',
+                                      'description'         : 'Synthetic {} app {}'.format(application, index),
+                                      'darwinExecutable'    : '',
+                                      'linuxExecutable'     : application,
+                                      'windowsExecutable'   : '',
+                                      'globalEnvClassName'  : '',
+                                      'application'         : application,
+                                      'folderName'          : application,
+                                      'version'             : '{}.0'.format(index % 3 + 1),
+                                      'packages'            : []}, indent=4))
+
+        appFiles.append(appFile)
+
+    return appFiles
+
+#
+## @brief Generate a project tree.
+#
+#  @param path             [ str         | None       | in  ] - Absolute path of an empty or nonexistent directory.
+#  @param projectNames     [ list of str | ['master'] | in  ] - Project names, master project is always created.
+#  @param packageCount     [ int         | 100        | in  ] - Number of internal packages of each project.
+#  @param externalCount    [ int         | 10         | in  ] - Number of external packages of each project.
+#  @param versionCount     [ int         | 1          | in  ] - Number of versions of each package.
+#  @param developerCount   [ int         | 1          | in  ] - Number of developers of each project.
+#  @param envPackageCount  [ int         | 5          | in  ] - Number of packages in the development and stage env of
+#                                                               each developer.
+#  @param appCount         [ int         | 10         | in  ] - Number of app files of each version of mMecoSettings.
+#  @param inactiveRatio    [ float       | 0.05       | in  ] - Ratio of the packages, which are not active.
+#  @param seed             [ int         | 0          | in  ] - Seed of the random number generator.
+#
+#  @exception OSError - If the tree already exists in given directory.
+#
+#  @return mMecoSettings.tests.projectTreeLib.ProjectTree - Tree.
+def generate(path,
+             projectNames=None,
+             packageCount=100,
+             externalCount=10,
+             versionCount=1,
+             developerCount=1,
+             envPackageCount=5,
+             appCount=10,
+             inactiveRatio=0.05,
+             seed=0):
+
+    generator    = random.Random(seed)
+    tree         = ProjectTree(path)
+    projectNames = [MASTER_PROJECT_NAME] + [x for x in (projectNames or []) if x != MASTER_PROJECT_NAME]
+    versions     = ['1.0.{}'.format(x) for x in range(versionCount)]
+
+    for projectName in projectNames:
+
+        projectPath = os.path.join(tree.projectsPath(), projectName)
+
+        for layer, count, external in (('internal', packageCount, False), ('external', externalCount, True)):
+
+            names = ['{}{}{:05d}'.format(projectName, 'External' if external else 'Package', x) for x in range(count)]
+
+            # Every project has its own settings package, so app files are resolved from all layers
+            if not external:
+                names.insert(0, SETTINGS_PACKAGE)
+                internalNames = names
+
+            for name in names:
+
+                info = {'PLATFORMS'         : _pick(generator, PLATFORMS),
+                        'APPLICATIONS'      : _pick(generator, APPLICATIONS),
+                        'PYTHON_VERSIONS'   : _pick(generator, PYTHON_VERSIONS),
+                        'IS_ACTIVE'         : generator.random() >= inactiveRatio}
+
+                if name == SETTINGS_PACKAGE:
+                    info.update({'PLATFORMS': ['Linux', 'Darwin', 'Windows'], 'APPLICATIONS': ['all'], 'IS_ACTIVE': True})
+
+                for version in versions:
+
+                    packagePath = os.path.join(projectPath, layer, name, version, name)
+                    createPackage(packagePath, version, external, info)
+                    tree.addPackage(projectName, layer, packagePath)
+
+                    if name == SETTINGS_PACKAGE:
+                        for appFile in createAppFiles(packagePath, appCount):
+                            tree.addAppFile(appFile)
+
+
+        for index in range(developerCount):
+
+            developerName = 'developer{:03d}'.format(index)
+
+            for layer in ('development', 'stage'):
+
+                envPath = os.path.join(projectPath, 'developers', developerName, layer, '{}Env'.format(layer))
+
+                for name in sorted(generator.sample(internalNames, min(envPackageCount, len(internalNames)))):
+
+                    packagePath = os.path.join(envPath, name)
+                    createPackage(packagePath, versions[-1], False, {'IS_ACTIVE': True})
+                    tree.addPackage(projectName, layer, packagePath)
+
+            os.makedirs(os.path.join(projectPath, 'users', developerName))
+
+    return tree
+
+#
+## @brief Generate a project tree from command line.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main():
+
+    import sys
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='Generate a synthetic Meco project tree')
+
+    parser.add_argument('-p', '--path',         type=str,   default=None,   help='Absolute path of the tree, a temporary directory is used if not given')
+    parser.add_argument('--projects',           type=str,   default='',     help='Comma separated project names in addition to the master project')
+    parser.add_argument('--packages',           type=int,   default=100,    help='Number of internal packages of each project')
+    parser.add_argument('--externals',          type=int,   default=10,     help='Number of external packages of each project')
+    parser.add_argument('--versions',           type=int,   default=1,      help='Number of versions of each package')
+    parser.add_argument('--developers',         type=int,   default=1,      help='Number of developers of each project')
+    parser.add_argument('--env-packages',       type=int,   default=5,      help='Number of packages in each development and stage env')
+    parser.add_argument('--apps',               type=int,   default=10,     help='Number of app files of each version of mMecoSettings')
+    parser.add_argument('--seed',               type=int,   default=0,      help='Seed of the random number generator')
+
+    _args = parser.parse_args()
+
+    tree = generate(_args.path or tempfile.mkdtemp(prefix='mmecosettings-tree-'),
+                    projectNames=[x for x in _args.projects.split(',') if x],
+                    packageCount=_args.packages,
+                    externalCount=_args.externals,
+                    versionCount=_args.versions,
+                    developerCount=_args.developers,
+                    envPackageCount=_args.env_packages,
+                    appCount=_args.apps,
+                    seed=_args.seed)
+
+    sys.stdout.write('{}\n'.format(tree.projectsPath()))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,197 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/projectTreeLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.projectTreeLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import ast
+import json
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.tests.projectTreeLib
+
+# Callbacks import mMeco, which is only available in a Meco environment
+try:
+    import mMecoSettings.callbackLib as callbackLib
+    import mMecoSettings.tests.benchmarks.standInLib as standInLib
+except ImportError:
+    callbackLib = None
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _readTree(path):
+
+    files = {}
+
+    for root, _, names in os.walk(path):
+        for name in names:
+            with open(os.path.join(root, name), 'r') as inFile:
+                files[os.path.relpath(os.path.join(root, name), path)] = inFile.read()
+
+    return files
+
+def _readPackageInfo(packagePath):
+
+    name = os.path.basename(packagePath)
+
+    with open(os.path.join(packagePath, 'python', name, 'packageInfoLib.py'), 'r') as inFile:
+        tree = ast.parse(inFile.read())
+
+    return dict((x.targets[0].id, ast.literal_eval(x.value)) for x in tree.body if isinstance(x, ast.Assign))
+
+class ProjectTreeLibTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path = tempfile.mkdtemp()
+
+        self._tree = mMecoSettings.tests.projectTreeLib.generate(os.path.join(self._path, 'a'),
+                                                                 projectNames=['show'],
+                                                                 packageCount=20,
+                                                                 externalCount=3,
+                                                                 versionCount=2,
+                                                                 appCount=4)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._path)
+
+    def test_layout(self):
+
+        projectsPath = self._tree.projectsPath()
+
+        self.assertEqual(self._tree.projectNames(), ['master', 'show'])
+
+        # 20 packages and mMecoSettings, each with 2 versions
+        self.assertEqual(len(self._tree.packagePaths('show', 'internal', settingsPackage=True)), 42)
+        self.assertEqual(len(self._tree.packagePaths('show', 'external', settingsPackage=True)), 6)
+        self.assertEqual(len(self._tree.packagePaths('show', 'development', settingsPackage=True)), 5)
+        self.assertEqual(len(self._tree.packagePaths('show', 'stage', settingsPackage=True)), 5)
+
+        self.assertTrue(os.path.isdir(os.path.join(projectsPath, 'show', 'internal', 'showPackage00000', '1.0.1', 'showPackage00000', 'python', 'showPackage00000')))
+        self.assertTrue(os.path.isdir(os.path.join(projectsPath, 'show', 'developers', 'developer000', 'development', 'developmentEnv')))
+        self.assertTrue(os.path.isdir(os.path.join(projectsPath, 'master', 'users', 'developer000')))
+
+        appFile = os.path.join(projectsPath, 'master', 'internal', 'mMecoSettings', '1.0.0', 'mMecoSettings', 'resources', 'apps', 'app00000.json')
+        self.assertIn(appFile, self._tree.appFiles())
+        self.assertEqual(len(self._tree.appFiles()), 16)
+
+        with open(appFile, 'r') as inFile:
+            self.assertEqual(json.loads(inFile.read())['application'], 'maya')
+
+    def test_packageInfo(self):
+
+        packagePaths = self._tree.packagePaths('master', 'internal', settingsPackage=True)
+        infos        = [_readPackageInfo(x) for x in packagePaths]
+
+        self.assertEqual(infos[0]['NAME'], 'mMecoSettings')
+        self.assertEqual(infos[0]['APPLICATIONS'], ['all'])
+
+        self.assertEqual(infos[-1]['NAME'], 'masterPackage00019')
+        self.assertEqual(infos[-1]['VERSION'], '1.0.1')
+        self.assertEqual(infos[-1]['PYTHON_PACKAGES'], ['masterPackage00019'])
+
+        self.assertTrue(len(set(tuple(x['PLATFORMS']) for x in infos)) > 1)
+        self.assertTrue(len(set(tuple(x['APPLICATIONS']) for x in infos)) > 1)
+
+    def test_settingsPackage(self):
+
+        packagePaths = self._tree.packagePaths()
+
+        self.assertTrue(packagePaths)
+        self.assertNotIn('mMecoSettings', [os.path.basename(x) for x in packagePaths])
+        self.assertEqual(len(self._tree.packagePaths('show', 'internal')), 40)
+
+    def test_deterministic(self):
+
+        tree = mMecoSettings.tests.projectTreeLib.generate(os.path.join(self._path, 'b'),
+                                                           projectNames=['show'],
+                                                           packageCount=20,
+                                                           externalCount=3,
+                                                           versionCount=2,
+                                                           appCount=4)
+
+        self.assertEqual(_readTree(self._tree.path()), _readTree(tree.path()))
+
+@unittest.skipUnless(callbackLib, 'mMeco is not available')
+class ShouldInitializePackageTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path = tempfile.mkdtemp()
+
+        self._tree = mMecoSettings.tests.projectTreeLib.generate(self._path,
+                                                                 projectNames=['show'],
+                                                                 packageCount=20,
+                                                                 externalCount=3,
+                                                                 versionCount=2)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._path)
+
+    def test_filterTwice(self):
+
+        allLib  = standInLib.AllLib()
+        module  = sys.modules['mMecoSettings']
+
+        results = [[callbackLib.shouldInitializePackage(allLib, x) for x in self._tree.packagePaths()] for _ in range(2)]
+
+        # Package info modules of the first pass don't leak into the second one
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(any(results[0]))
+        self.assertFalse(all(results[0]))
+        self.assertEqual(allLib.logger().failures, [])
+
+        self.assertIs(sys.modules['mMecoSettings'], module)
+        self.assertIs(sys.modules['mMecoSettings.settingsLib'], callbackLib.mMecoSettings.settingsLib)
+
+    def test_filterSettingsPackage(self):
+
+        allLib  = standInLib.AllLib()
+        module  = sys.modules['mMecoSettings']
+
+        for _ in range(2):
+            for packagePath in self._tree.packagePaths(settingsPackage=True):
+                callbackLib.shouldInitializePackage(allLib, packagePath)
+
+        # Settings package has the name of the package in use, which is kept loaded
+        self.assertIs(sys.modules['mMecoSettings'], module)
+        self.assertIs(sys.modules['mMecoSettings.settingsLib'], callbackLib.mMecoSettings.settingsLib)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
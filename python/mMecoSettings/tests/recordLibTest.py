@@ -0,0 +1,123 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/recordLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.recordLibTest    @brief [ MODULE ] - Unit test module.
+
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import json
+import errno
+import unittest
+
+import mMecoSettings.recordLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class _AppFile(object):
+
+    def developer(self):
+
+        return 'developer@company.com'
+
+    def packages(self):
+
+        return ['mCore', 'mMecoSettings']
+
+    def description(self):
+
+        return 'Text\twith\ttabs'
+
+class _ClosedPipe(object):
+
+    def write(self, text):
+
+        raise IOError(errno.EPIPE, 'Broken pipe')
+
+    def flush(self):
+
+        pass
+
+class RecordLibTest(unittest.TestCase):
+
+    def test_parseFields(self):
+
+        self.assertEqual(mMecoSettings.recordLib.parseFields(), list(mMecoSettings.recordLib.FIELDS))
+        self.assertEqual(mMecoSettings.recordLib.parseFields('name, version'), ['name', 'version'])
+
+        with self.assertRaises(ValueError):
+            mMecoSettings.recordLib.parseFields('name,missing')
+
+    def test_requiresContent(self):
+
+        self.assertFalse(mMecoSettings.recordLib.requiresContent(['name', 'file']))
+        self.assertTrue(mMecoSettings.recordLib.requiresContent(['name', 'developer']))
+
+    def test_getRecord(self):
+
+        record = mMecoSettings.recordLib.getRecord('/apps/maya2020.json', ['name', 'file'])
+        self.assertEqual(record, [('name', 'maya2020'), ('file', '/apps/maya2020.json')])
+
+        record = mMecoSettings.recordLib.getRecord('/apps/maya2020.json', ['developer', 'name'], _AppFile())
+        self.assertEqual(record, [('developer', 'developer@company.com'), ('name', 'maya2020')])
+
+    def test_formatJSONL(self):
+
+        record = mMecoSettings.recordLib.getRecord('/apps/atom.json', ['packages', 'name'], _AppFile())
+        line   = mMecoSettings.recordLib.formatJSONL(record)
+
+        self.assertEqual(json.loads(line), {'name': 'atom', 'packages': ['mCore', 'mMecoSettings']})
+        self.assertTrue(line.startswith('{"packages"'))
+
+    def test_formatTSV(self):
+
+        record = mMecoSettings.recordLib.getRecord('/apps/atom.json', ['name', 'packages', 'description'], _AppFile())
+
+        self.assertEqual(mMecoSettings.recordLib.formatTSV(record), 'atom\tmCore,mMecoSettings\tText\\twith\\ttabs')
+
+    def test_write(self):
+
+        fields  = ['name']
+        records = (mMecoSettings.recordLib.getRecord(x, fields) for x in ['/apps/atom.json', '/apps/nuke12.json'])
+        stream  = io.StringIO()
+
+        self.assertEqual(mMecoSettings.recordLib.write(records, fields, mMecoSettings.recordLib.FORMAT_TSV, stream), 2)
+        self.assertEqual(stream.getvalue(), u'name\natom\nnuke12\n')
+
+    def test_writeClosedPipe(self):
+
+        records = [mMecoSettings.recordLib.getRecord('/apps/atom.json', ['name'])]
+
+        self.assertEqual(mMecoSettings.recordLib.write(records, ['name'], mMecoSettings.recordLib.FORMAT_JSONL, _ClosedPipe()), 0)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
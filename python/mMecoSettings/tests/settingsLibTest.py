@@ -0,0 +1,118 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/settingsLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.settingsLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.fileSystemLib
+import mMecoSettings.paletteLib
+import mMecoSettings.settingsLib
+
+import mMecoSettings.tests.projectTreeLib
+import mMecoSettings.tests.benchmarks.standInLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class GetLatestVersionTest(unittest.TestCase):
+
+    def test_getLatestVersion(self):
+
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion([]), '')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['1.9.0', '1.10.0', '1.2.0']), '1.10.0')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['1.2.0', '1.2.0.1']), '1.2.0.1')
+
+    def test_skipNames(self):
+
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['1.2.0', '1.10.0', '.snapshot']), '1.10.0')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['1.2.0', 'dev']), '1.2.0')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['1.2.0', '1.2.0.bak']), '1.2.0')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['2.0.0', '10.0.0-beta', '3.0']), '2.0.0')
+        self.assertEqual(mMecoSettings.settingsLib.getLatestVersion(['.snapshot', 'dev']), '')
+
+class GetTerminalDisplayColorsTest(unittest.TestCase):
+
+    def test_getTerminalDisplayColors(self):
+
+        colors = mMecoSettings.settingsLib.getTerminalDisplayColors('Linux')
+
+        # Shared table is returned without copying, it can't be modified
+        self.assertIs(colors, mMecoSettings.settingsLib.getTerminalDisplayColors('Linux'))
+        self.assertIsInstance(colors, mMecoSettings.paletteLib.FrozenDict)
+        self.assertRaises(TypeError, colors.__setitem__, 'development', {})
+
+class GetVersionOfAPackageTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path          = tempfile.mkdtemp()
+
+        self._packagesPath  = os.path.join(mMecoSettings.tests.projectTreeLib.generate(self._path,
+                                                                                       packageCount=0,
+                                                                                       externalCount=0,
+                                                                                       versionCount=11,
+                                                                                       developerCount=0,
+                                                                                       appCount=0).projectsPath(),
+                                           mMecoSettings.tests.projectTreeLib.MASTER_PROJECT_NAME,
+                                           'internal')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._path)
+
+    def test_fileSystems(self):
+
+        name = mMecoSettings.tests.projectTreeLib.SETTINGS_PACKAGE
+
+        # Directories, which aren't versions, are never resolved
+        for directoryName in ('.snapshot', 'dev', '1.0.10.bak'):
+            os.makedirs(os.path.join(self._packagesPath, name, directoryName))
+
+        self.assertEqual(mMecoSettings.settingsLib._getVersionOfAPackage(self._packagesPath, name), '1.0.10')
+        self.assertEqual(mMecoSettings.settingsLib._getVersionOfAPackage(self._packagesPath, 'missing'), '')
+
+        # Disk, memory and the stand-in of mMeco resolve the same version
+        self.assertEqual(mMecoSettings.tests.benchmarks.standInLib.getVersionOfAPackage(self._packagesPath, name), '1.0.10')
+
+        fileSystem = mMecoSettings.fileSystemLib.setFileSystem(mMecoSettings.fileSystemLib.MemoryFileSystem.fromDirectory(self._path))
+
+        try:
+            self.assertEqual(mMecoSettings.settingsLib._getVersionOfAPackage(self._packagesPath, name), '1.0.10')
+        finally:
+            mMecoSettings.fileSystemLib.setFileSystem(fileSystem)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
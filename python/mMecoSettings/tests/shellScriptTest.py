@@ -0,0 +1,166 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/shellScriptTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.shellScriptTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+try:
+    from shutil import which
+except ImportError:
+    from distutils.spawn import find_executable as which
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## [ str ] - Absolute path of the shell script directory.
+SHELL_SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'script', 'shell'))
+
+#
+## [ str ] - Absolute path of bash, None if it isn't available.
+BASH_PATH         = which('bash')
+
+@unittest.skipUnless(BASH_PATH, 'bash is not available')
+class ShellScriptTest(unittest.TestCase):
+
+    def _run(self, code, env=None):
+
+        environ = dict((x, y) for x, y in os.environ.items() if not x.startswith('MECO_'))
+        environ.update(env or {})
+
+        return subprocess.check_output([BASH_PATH, '--norc', '--noprofile', '-c', code],
+                                       env=environ,
+                                       cwd=SHELL_SCRIPT_PATH).decode('utf-8').splitlines()
+
+class PostEnvLinuxTest(ShellScriptTest):
+
+    def test_prompt(self):
+
+        code = '''
+source postEnv/mmecosettings-post-env-linux.sh
+printf '%s\\n' "$PS1"
+unset MECO_DEVELOPMENT_ENV_NAME
+MECO_PROJECT_NAME=other
+MECO_STAGE_ENV_NAME=lighting
+$PROMPT_COMMAND
+printf '%s\\n' "$PS1"
+'''
+
+        lines = self._run(code, {'MECO_PROJECT_NAME'            : 'master',
+                                 'MECO_DEVELOPER_NAME'          : 'safak',
+                                 'MECO_DEVELOPMENT_ENV_NAME'    : 'modeling'})
+
+        self.assertEqual(len(lines), 2)
+        self.assertIn('[ master - safak/development/modeling ]', lines[0])
+
+        # Prompt follows an environment switch without the script being sourced again
+        self.assertIn('[ other - safak/stage/lighting ]', lines[1])
+        self.assertNotIn('modeling', lines[1])
+
+class EnvTest(ShellScriptTest):
+
+    def setUp(self):
+
+        rootPath            = os.path.dirname(os.path.dirname(SHELL_SCRIPT_PATH))
+
+        self._pythonPath    = os.path.join(rootPath, 'python')
+        self._binPath       = os.path.join(rootPath, 'bin', 'linux')
+
+    def test_sourceTwice(self):
+
+        code = '''
+source "$PWD/mmecosettings-env.sh"
+source "$PWD/mmecosettings-env.sh"
+printf '%s\\n' "$PYTHONPATH" "$PATH"
+'''
+
+        lines = self._run(code, {'PYTHONPATH'   : '/opt/a::/opt/a:{}'.format(self._pythonPath),
+                                 'PATH'         : '{}:/usr/bin:/bin:/usr/bin:'.format(self._binPath)})
+
+        # Prepended entry appears once at the front, other entries including empty ones are kept as they are
+        self.assertEqual(lines, ['{}:/opt/a::/opt/a'.format(self._pythonPath),
+                                 '{}:/usr/bin:/bin:/usr/bin:'.format(self._binPath)])
+
+    def test_emptyVariable(self):
+
+        lines = self._run('source "$PWD/mmecosettings-env.sh"; printf \'%s\\n\' "$PYTHONPATH"', {'PYTHONPATH': ''})
+
+        self.assertEqual(lines, [self._pythonPath])
+
+class CompletionTest(ShellScriptTest):
+
+    def setUp(self):
+
+        self._home = tempfile.mkdtemp()
+
+        indexPath = os.path.join(self._home, '.mmecosettings-completion')
+        os.makedirs(indexPath)
+
+        self._indexFilePath = os.path.join(indexPath, 'master-index')
+
+        with open(self._indexFilePath, 'w') as outFile:
+            outFile.write('app maya2020\napp nuke\nproject master\n')
+
+        with open(os.path.join(indexPath, 'default'), 'w') as outFile:
+            outFile.write('{}\n'.format(self._indexFilePath))
+
+    def tearDown(self):
+
+        shutil.rmtree(self._home)
+
+    def test_entryPoint(self):
+
+        code = '''
+source "$PWD/mmecosettings-entry-point.sh"
+COMP_WORDS=(meco -a ma)
+COMP_CWORD=2
+_mMecoSettingsCompletion
+printf '%s\\n' "${COMPREPLY[@]}"
+'''
+
+        # Index of the environment built last is used until an environment is built in the shell
+        self.assertEqual(self._run(code, {'HOME': self._home}), ['maya2020'])
+
+        otherIndexFilePath = os.path.join(self._home, 'other-index')
+        with open(otherIndexFilePath, 'w') as outFile:
+            outFile.write('app mari\n')
+
+        self.assertEqual(self._run(code, {'HOME'                            : self._home,
+                                          'MECO_COMPLETION_INDEX_FILE_PATH' : otherIndexFilePath}), ['mari'])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
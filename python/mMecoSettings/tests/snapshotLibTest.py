@@ -0,0 +1,155 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/snapshotLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.snapshotLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoSettings.exceptionLib
+import mMecoSettings.snapshotLib
+
+from mMecoSettings.tests.envDeltaLibTest import EnvEntryContainer
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class EnvSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._snapshotPath  = tempfile.mkdtemp()
+
+        self._snapshot      = mMecoSettings.snapshotLib.EnvSnapshot()
+
+        envEntryContainer   = EnvEntryContainer()
+        container           = mMecoSettings.snapshotLib.RecordingEnvEntryContainer(envEntryContainer,
+                                                                                   self._snapshot.entries(mMecoSettings.snapshotLib.Stage.kPostBuild))
+
+        container.addScript('/post.sh')
+        container.addSingle('MECO_PROJECT_NAME', 'master')
+        container.addMulti('PATH', '/opt/bin')
+        container.addCommand('cd "$MECO_DEVELOPMENT_PACKAGES_PATH";')
+
+        self._entries       = envEntryContainer.entries
+
+        self._snapshot.setPlatformName('Linux')
+        self._snapshot.addPackage('/meco/master/internal/mCore/1.0.0', True)
+        self._snapshot.addPackage('/meco/master/internal/mMaya/1.0.0', False)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._snapshotPath)
+
+    def _assertReplay(self, path):
+
+        snapshot = mMecoSettings.snapshotLib.EnvSnapshot.read(self._snapshot.write(path))
+
+        self.assertEqual(snapshot.platformName(), 'Linux')
+        self.assertEqual(snapshot.package('/meco/master/internal/mCore/1.0.0'), True)
+        self.assertEqual(snapshot.package('/meco/master/internal/mMaya/1.0.0'), False)
+        self.assertEqual(snapshot.package('/meco/master/internal/mNuke/1.0.0'), None)
+
+        envEntryContainer = EnvEntryContainer()
+        snapshot.replay(mMecoSettings.snapshotLib.Stage.kPostBuild, envEntryContainer)
+
+        self.assertEqual(envEntryContainer.entries, self._entries)
+
+    def test_json(self):
+
+        self._assertReplay(os.path.join(self._snapshotPath, 'env.json'))
+
+    def test_binary(self):
+
+        self._assertReplay(os.path.join(self._snapshotPath, 'env{}'.format(mMecoSettings.snapshotLib.BINARY_EXTENSION)))
+
+    def test_hostLocal(self):
+
+        envEntryContainer   = EnvEntryContainer()
+        entries             = self._snapshot.entries(mMecoSettings.snapshotLib.Stage.kPreBuild)
+        container           = mMecoSettings.snapshotLib.RecordingEnvEntryContainer(envEntryContainer, entries)
+
+        mMecoSettings.snapshotLib.addHostLocal(container,
+                                               mMecoSettings.snapshotLib.HostLocal.kPythonExecutablePath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               'MECO_PYTHON_EXECUTABLE_PATH',
+                                               '/exporter/bin/python')
+
+        mMecoSettings.snapshotLib.addHostLocal(container,
+                                               mMecoSettings.snapshotLib.HostLocal.kPreScriptPath,
+                                               mMecoSettings.snapshotLib.EntryKind.kScript,
+                                               '/exporter/tmp/pre.sh')
+
+        self.assertEqual(envEntryContainer.entries, [('single', 'MECO_PYTHON_EXECUTABLE_PATH', '/exporter/bin/python'),
+                                                     ('script', '/exporter/tmp/pre.sh')])
+
+        snapshot = mMecoSettings.snapshotLib.EnvSnapshot.read(self._snapshot.write(os.path.join(self._snapshotPath, 'env.json')))
+
+        values = {mMecoSettings.snapshotLib.HostLocal.kPythonExecutablePath : '/farm/bin/python',
+                  mMecoSettings.snapshotLib.HostLocal.kPreScriptPath        : '/farm/tmp/pre.sh'}
+
+        envEntryContainer = EnvEntryContainer()
+        snapshot.replay(mMecoSettings.snapshotLib.Stage.kPreBuild, envEntryContainer, values.get)
+
+        self.assertEqual(envEntryContainer.entries, [('single', 'MECO_PYTHON_EXECUTABLE_PATH', '/farm/bin/python'),
+                                                     ('script', '/farm/tmp/pre.sh')])
+
+        # Values of the exporter host are never replayed
+        with self.assertRaises(mMecoSettings.exceptionLib.InvalidSnapshotError):
+            snapshot.replay(mMecoSettings.snapshotLib.Stage.kPreBuild, EnvEntryContainer())
+
+    def test_addHostLocal(self):
+
+        envEntryContainer = EnvEntryContainer()
+
+        mMecoSettings.snapshotLib.addHostLocal(envEntryContainer,
+                                               mMecoSettings.snapshotLib.HostLocal.kLogFilePath,
+                                               mMecoSettings.snapshotLib.EntryKind.kSingle,
+                                               'MECO_ENV_LOG_FILE_PATH',
+                                               '/tmp/log.txt')
+
+        self.assertEqual(envEntryContainer.entries, [('single', 'MECO_ENV_LOG_FILE_PATH', '/tmp/log.txt')])
+
+    def test_invalid(self):
+
+        path = os.path.join(self._snapshotPath, 'env.json')
+
+        with open(path, 'w') as outFile:
+            outFile.write('{"format": "mMecoSettings.envSnapshot", "version": 0}')
+
+        with self.assertRaises(mMecoSettings.exceptionLib.InvalidSnapshotError):
+            mMecoSettings.snapshotLib.EnvSnapshot.read(path)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
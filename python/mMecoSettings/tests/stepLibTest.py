@@ -0,0 +1,117 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoSettings/tests/stepLibTest.py @brief [ FILE   ] - Unit test module.
+## @package mMecoSettings.tests.stepLibTest    @brief [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import time
+import threading
+import unittest
+
+import mMecoSettings.stepLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class StepRunnerTest(unittest.TestCase):
+
+    def test_run(self):
+
+        stepRunner = mMecoSettings.stepLib.StepRunner()
+        stepRunner.add('a', lambda: 1)
+        stepRunner.add('b', lambda: 2)
+        stepRunner.add('c', lambda a, b: a + b, ['a', 'b'])
+
+        self.assertEqual(stepRunner.run(), {'a': 1, 'b': 2, 'c': 3})
+
+    def test_concurrent(self):
+
+        barrier = threading.Event()
+        threads = set()
+
+        def wait():
+            threads.add(threading.current_thread().ident)
+            if len(threads) == 2:
+                barrier.set()
+            return barrier.wait(5)
+
+        stepRunner = mMecoSettings.stepLib.StepRunner()
+        stepRunner.add('a', wait)
+        stepRunner.add('b', wait)
+
+        start   = time.time()
+        results = stepRunner.run()
+
+        self.assertTrue(results['a'] and results['b'])
+        self.assertLess(time.time() - start, 5)
+
+    def test_exception(self):
+
+        def fail(message):
+            raise IOError(message)
+
+        stepRunner = mMecoSettings.stepLib.StepRunner()
+        stepRunner.add('a', lambda: fail('a'))
+        stepRunner.add('b', lambda: fail('b'))
+
+        with self.assertRaises(IOError) as context:
+            stepRunner.run()
+
+        self.assertEqual(str(context.exception), 'a')
+
+    def test_add(self):
+
+        stepRunner = mMecoSettings.stepLib.StepRunner()
+        stepRunner.add('a', lambda: 1)
+
+        self.assertRaises(ValueError, stepRunner.add, 'a', lambda: 1)
+        self.assertRaises(ValueError, stepRunner.add, 'b', lambda x: x, ['c'])
+
+    def test_closeThreadPool(self):
+
+        threadPool = mMecoSettings.stepLib.getThreadPool()
+
+        mMecoSettings.stepLib.closeThreadPool()
+        mMecoSettings.stepLib.closeThreadPool()
+
+        self.assertRaises(ValueError, threadPool.map, len, ['a'])
+
+        stepRunner = mMecoSettings.stepLib.StepRunner()
+        stepRunner.add('a', lambda: 1)
+        stepRunner.add('b', lambda: 2)
+
+        self.assertEqual(stepRunner.run(), {'a': 1, 'b': 2})
+        self.assertIsNot(mMecoSettings.stepLib.getThreadPool(), threadPool)
+
+        mMecoSettings.stepLib.closeThreadPool()
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
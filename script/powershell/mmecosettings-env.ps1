@@ -27,24 +27,42 @@
 $Script:scriptPath = split-path -parent $MyInvocation.MyCommand.Definition
 
 
+#
+# Entries are prepended idempotently; re-sourcing the script moves the entry to the front by removing its other
+# occurrences, other entries of the variable are kept as they are.
+function script:_mMecoSettingsEnvPrepend($name, $value)
+{
+    $Local:current = [Environment]::GetEnvironmentVariable($name, 'Process')
+    $Local:entries = New-Object System.Collections.Generic.List[string]
+
+    $entries.Add($value)
+
+    # Only other occurrences of the prepended entry are removed, other entries are kept as they are
+    if ($current)
+    {
+        foreach ($entry in "$current".Split(';'))
+        {
+            if (-not [string]::Equals($entry.TrimEnd('\'), $value.TrimEnd('\'), [StringComparison]::OrdinalIgnoreCase))
+            {
+                $entries.Add($entry)
+            }
+        }
+    }
+
+    [Environment]::SetEnvironmentVariable($name, ($entries -join ';'), 'Process')
+}
+
 function script:_mMecoSettingsEnvMain
 {
     $Local:mecoPackageRootPath = (get-item $scriptPath).parent.parent.FullName
 
     $Local:pythonPath = "$mecoPackageRootPath\python"
-    if ($env:PYTHONPATH)
-    {
-        $env:PYTHONPATH="$pythonPath;$env:PYTHONPATH"
-    }
-    else
-    {
-        $env:PYTHONPATH=$pythonPath
-    }
+    _mMecoSettingsEnvPrepend 'PYTHONPATH' $pythonPath
 
     $Local:binPath = "$mecoPackageRootPath\bin\windows"
     if (Test-Path $binPath)
     {
-        $env:PATH="$binPath;$env:PATH"
+        _mMecoSettingsEnvPrepend 'PATH' $binPath
     }
 }
 _mMecoSettingsEnvMain
\ No newline at end of file
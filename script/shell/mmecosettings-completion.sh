@@ -0,0 +1,74 @@
+#!/usr/bin/env bash
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file mMecoSettings/script/shell/mmecosettings-completion.sh @brief [ FILE ] - Shell script file.
+#
+#  Completion of app, project, development and stage env names for meco. Names are read from the index written by
+#  mMecoSettings.completionLib with shell builtins only, so no interpreter or subprocess is started on TAB.
+#
+#  The script is sourced by the entry-point script, so completion works in a fresh shell. Until an environment is
+#  built in the shell, `MECO_COMPLETION_INDEX_FILE_PATH` isn't set and the index of the environment built last,
+#  whose path is in `~/.mmecosettings-completion/default`, is used.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# CODE
+# ----------------------------------------------------------------------------------------------------
+function _mMecoSettingsCompletion()
+{
+    local current="${COMP_WORDS[COMP_CWORD]}";
+    local previous="";
+    if (( COMP_CWORD > 0 )); then
+        previous="${COMP_WORDS[COMP_CWORD-1]}";
+    fi
+
+    local kind="";
+    case "$previous" in
+        -a|-app|--app)                  kind="app";;
+        -p|-project|--project)          kind="project";;
+        -d|-development|--development)  kind="development";;
+        -s|-stage|--stage)              kind="stage";;
+        *)                              return 0;;
+    esac
+
+    local indexFilePath="$MECO_COMPLETION_INDEX_FILE_PATH";
+    if [[ ! "$indexFilePath" && -f "$HOME/.mmecosettings-completion/default" ]]; then
+        read -r indexFilePath < "$HOME/.mmecosettings-completion/default";
+    fi
+
+    if [[ ! "$indexFilePath" || ! -f "$indexFilePath" ]]; then
+        return 0;
+    fi
+
+    local names=();
+    local lineKind="";
+    local name="";
+
+    while read -r lineKind name || [[ "$lineKind" ]]; do
+        if [[ "$lineKind" == "$kind" && "$name" == "$current"* ]]; then
+            names+=("$name");
+        fi
+        lineKind="";
+    done < "$indexFilePath"
+
+    COMPREPLY=("${names[@]}");
+}
+complete -o default -F _mMecoSettingsCompletion meco
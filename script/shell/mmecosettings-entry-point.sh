@@ -26,3 +26,6 @@
 # CODE
 # ----------------------------------------------------------------------------------------------------
 source "${BASH_SOURCE%/*}/mmecosettings-env.sh"
+
+# Completion of meco is available before any environment is built
+source "${BASH_SOURCE%/*}/mmecosettings-completion.sh"
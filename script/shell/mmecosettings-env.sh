@@ -25,6 +25,38 @@
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+#
+# Entries are prepended idempotently; re-sourcing the script, for instance in nested envs or tmux panes, moves the
+# entry to the front by removing its other occurrences, using builtins only. Other entries are kept as they are,
+# including duplicates and empty entries, which stand for the current directory.
+function _mMecoSettingsEnvPrepend()
+{
+    local name="$1";
+    local value="$2";
+    local current="${!name}";
+
+    if [[ ! "$current" ]]; then
+        export "$name=$value";
+        return;
+    fi
+
+    local result="$value";
+    local rest="$current:";
+    local entry="";
+
+    while [[ "$rest" ]]; do
+
+        entry="${rest%%:*}";
+        rest="${rest#*:}";
+
+        if [[ "$entry" != "$value" ]]; then
+            result="$result:$entry";
+        fi
+    done
+
+    export "$name=$result";
+}
+
 function _mMecoSettingsEnvMain()
 {
     local platformName="linux";
@@ -39,16 +71,12 @@ function _mMecoSettingsEnvMain()
     local pythonPath="${BASH_SOURCE%/*/*/*}/python";
 
     if [[ -d "$pythonPath" ]]; then
-        if [[ "$PYTHONPATH" ]]; then
-            export PYTHONPATH="$pythonPath:$PYTHONPATH"
-        else
-            export PYTHONPATH="$pythonPath"
-        fi
+        _mMecoSettingsEnvPrepend PYTHONPATH "$pythonPath";
     fi
 
     local binPath="${BASH_SOURCE%/*/*/*}/bin/$platformName";
     if [[ -d "$binPath" ]]; then
-        export PATH="$binPath:$PATH";
+        _mMecoSettingsEnvPrepend PATH "$binPath";
     fi
 }
 _mMecoSettingsEnvMain
\ No newline at end of file
@@ -25,24 +25,106 @@
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+#
+# Prompt is rebuilt before every prompt, so no subprocess is started here. Static parts of PS1 are built once when
+# the environment is activated. Project and development or stage env segment is built from the current variables
+# before every prompt, since they change when another environment is activated in delta mode without this script
+# being sourced again. Git branch is found by walking up to .git/HEAD with shell builtins; the HEAD file
+# of the current directory is cached and re-read with the read builtin, which detects branch switches without a
+# stat of every parent directory.
+_MECO_PS1_HEAD="";
+_MECO_PS1_ENV="";
+_MECO_PS1_CWD="";
+_MECO_PS1_TAIL="";
+_MECO_GIT_DIRECTORY="";
+_MECO_GIT_HEAD_FILE="";
+
+function _mMecoPostEnvLinuxFindGitHeadFile()
+{
+    local directory="$PWD";
+    local gitDir="";
+
+    while [[ "$directory" ]]; do
+
+        if [[ -f "$directory/.git/HEAD" ]]; then
+            _MECO_GIT_HEAD_FILE="$directory/.git/HEAD";
+            return 0;
+        fi
+
+        # Work trees and submodules have a .git file, which contains the path of the git directory
+        if [[ -f "$directory/.git" ]]; then
+
+            read -r gitDir < "$directory/.git" || [[ "$gitDir" ]];
+            gitDir="${gitDir#gitdir: }";
+
+            if [[ "$gitDir" != /* ]]; then
+                gitDir="$directory/$gitDir";
+            fi
+
+            if [[ -f "$gitDir/HEAD" ]]; then
+                _MECO_GIT_HEAD_FILE="$gitDir/HEAD";
+                return 0;
+            fi
+        fi
+
+        directory="${directory%/*}";
+    done
+
+    # Root directory
+    if [[ -f "/.git/HEAD" ]]; then
+        _MECO_GIT_HEAD_FILE="/.git/HEAD";
+        return 0;
+    fi
+
+    _MECO_GIT_HEAD_FILE="";
+    return 1;
+}
+
 function _mMecoPostEnvLinuxGetCurrentGitBranch()
 {
-    git branch 2> /dev/null | sed -e '/^[^*]/d' -e 's/* \(.*\)/ \1/';
+    # Walk up only when the directory has changed
+    if [[ "$PWD" != "$_MECO_GIT_DIRECTORY" ]]; then
+        _MECO_GIT_DIRECTORY="$PWD";
+        _mMecoPostEnvLinuxFindGitHeadFile;
+    fi
+
+    _MECO_GIT_BRANCH="";
+
+    if [[ ! "$_MECO_GIT_HEAD_FILE" ]]; then
+        return;
+    fi
+
+    local head="";
+    read -r head < "$_MECO_GIT_HEAD_FILE" 2> /dev/null || [[ "$head" ]] || return;
+
+    if [[ "$head" == "ref: refs/heads/"* ]]; then
+        _MECO_GIT_BRANCH=" ${head#ref: refs/heads/}";
+    else
+        # Detached HEAD
+        _MECO_GIT_BRANCH=" (HEAD detached at ${head:0:7})";
+    fi
 }
 
-function _mMecoPostEnvLinuxMain()
+function _mMecoPostEnvLinuxBuildStaticPrompt()
 {
     # ╔═
-    PS1="\n\[\e[37m\]╔═";
+    _MECO_PS1_HEAD="\n\[\e[37m\]╔═";
 
     # user @ host
-    PS1=$PS1"\[\e[35m\] [ \u @ \h ] ";
+    _MECO_PS1_HEAD=$_MECO_PS1_HEAD"\[\e[35m\] [ \u @ \h ] ";
 
     # date - time
-    PS1=$PS1"[ \d - \t ] ";
+    _MECO_PS1_HEAD=$_MECO_PS1_HEAD"[ \d - \t ] ";
+
+    # Current working directory
+    _MECO_PS1_CWD="\[\033[38;5;7m\]\n╠═ \[\e[34m\]\w";
 
-    #
+    # ╚═ Command prompt
+    _MECO_PS1_TAIL="\n\[\e[37m\]╚═ \[\e[37m\]";
+}
 
+function _mMecoPostEnvLinuxBuildEnvPrompt()
+{
     local developmentOrStageState="";
     local developmentOrStageEnvName="";
 
@@ -63,36 +145,37 @@ function _mMecoPostEnvLinuxMain()
     fi
 
     # Project start
-    PS1=$PS1"\[\e[31m\][ $MECO_PROJECT_NAME ";
+    _MECO_PS1_ENV="\[\e[31m\][ $MECO_PROJECT_NAME ";
 
     # Development or stage
     if [[ "$developmentOrStageState" ]]; then
-        PS1=$PS1"- $MECO_DEVELOPER_NAME/$developmentOrStageState/$developmentOrStageEnvName $envName";
+        _MECO_PS1_ENV=$_MECO_PS1_ENV"- $MECO_DEVELOPER_NAME/$developmentOrStageState/$developmentOrStageEnvName $envName";
     else
-        PS1=$PS1"$envName";
+        _MECO_PS1_ENV=$_MECO_PS1_ENV"$envName";
     fi
 
     # Project end
-    PS1=$PS1"] "
-
-    #
+    _MECO_PS1_ENV=$_MECO_PS1_ENV"] "
+}
 
-    # Current working directory
-    PS1=$PS1"\[\033[38;5;7m\]\n╠═ \[\e[34m\]\w";
+function _mMecoPostEnvLinuxMain()
+{
+    # [ project - developer/development/env ]
+    _mMecoPostEnvLinuxBuildEnvPrompt;
 
     # ╠═ git branch
-    local gitBranch=$(_mMecoPostEnvLinuxGetCurrentGitBranch)
-    if [[ "$gitBranch" ]]; then
-        PS1=$PS1"\n\[\e[37m\]╠═\[\e[31m\]$gitBranch";
-    fi
+    _mMecoPostEnvLinuxGetCurrentGitBranch;
 
-    # ╚═ Command prompt
-    PS1=$PS1"\n\[\e[37m\]╚═ \[\e[37m\]";
+    if [[ "$_MECO_GIT_BRANCH" ]]; then
+        PS1=$_MECO_PS1_HEAD$_MECO_PS1_ENV$_MECO_PS1_CWD"\n\[\e[37m\]╠═\[\e[31m\]$_MECO_GIT_BRANCH"$_MECO_PS1_TAIL;
+    else
+        PS1=$_MECO_PS1_HEAD$_MECO_PS1_ENV$_MECO_PS1_CWD$_MECO_PS1_TAIL;
+    fi
 
     export PS1
 }
+_mMecoPostEnvLinuxBuildStaticPrompt
 _mMecoPostEnvLinuxMain
 PROMPT_COMMAND=_mMecoPostEnvLinuxMain
 
 #printf "\nPost env script has been executed.\n"
-